@@ -0,0 +1,157 @@
+from ai_librarian_apis.core.settings import settings
+from ai_librarian_core.agents.deep_search.asynchronous import AsyncDeepSearchAgent
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
+from ai_librarian_core.agents.react.cascade import ModelCascade
+from ai_librarian_core.agents.react.hedging import HedgePolicy
+from ai_librarian_core.blobs.offload import ToolOutputOffloader
+from ai_librarian_core.blobs.store import SQLiteBlobStore
+from ai_librarian_core.cache.answer_cache import AnswerCache
+from ai_librarian_core.catalog.index import SQLiteCatalogIndex
+from ai_librarian_core.catalog.rendering import DEFAULT_TOOL_TOKEN_BUDGETS, RecordRenderer
+from ai_librarian_core.jobs.runner import JobRunner
+from ai_librarian_core.jobs.store import SQLiteJobStore
+from ai_librarian_core.scheduling.llm_scheduler import DEFAULT_PROVIDER_LIMITS, LLMScheduler
+from ai_librarian_core.scheduling.thread_runs import SQLiteThreadLeases, ThreadRunCoordinator
+from ai_librarian_core.testing.cassette import CassetteRecorder
+from ai_librarian_core.tools.concurrency import DEFAULT_TOOL_CONCURRENCY_LIMITS, ToolConcurrencyLimiter
+from ai_librarian_core.tools.resilience import make_resilient
+from ai_librarian_core.tools.selection import ToolSelector
+from ai_librarian_core.tools.tools import get_built_in_tools
+from langchain_core.tools import BaseTool
+from langgraph.checkpoint.base import BaseCheckpointSaver
+
+
+def build_tools(cassette_recorder: CassetteRecorder | None = None) -> list[BaseTool]:
+    catalog_index = (
+        SQLiteCatalogIndex(settings.catalog_index_path, stale_after_seconds=settings.catalog_stale_after_seconds)
+        if settings.catalog_index_path
+        else None
+    )
+    renderer = RecordRenderer(
+        fields=tuple(settings.tool_output_fields),
+        max_description_tokens=settings.tool_output_max_description_tokens,
+        token_budgets={**DEFAULT_TOOL_TOKEN_BUDGETS, **settings.tool_output_token_budgets},
+    )
+    if cassette_recorder is None:
+        return get_built_in_tools(catalog_index=catalog_index, renderer=renderer)
+    # Records the raw tool calls, deadlines and circuit breakers still apply on top.
+    recorded_tools: list[BaseTool] = [
+        *cassette_recorder.record_tools(
+            get_built_in_tools(resilient=False, catalog_index=catalog_index, renderer=renderer)
+        )
+    ]
+    return make_resilient(recorded_tools)
+
+
+def build_blob_store() -> SQLiteBlobStore | None:
+    if not settings.tool_output_blob_path:
+        return None
+    return SQLiteBlobStore(settings.tool_output_blob_path, ttl_seconds=settings.tool_output_blob_ttl_seconds)
+
+
+def build_react_agent(
+    tools: list[BaseTool],
+    checkpointer: BaseCheckpointSaver,
+    cassette_recorder: CassetteRecorder | None = None,
+    blob_store: SQLiteBlobStore | None = None,
+) -> AsyncReactAgent:
+    """Builds the agent of one worker process from the settings.
+
+    Provider budgets are split between the workers, tool limits and caches are per worker.
+    """
+    answer_cache = (
+        AnswerCache(
+            mode=settings.answer_cache_mode,
+            ttl_seconds=settings.answer_cache_ttl_seconds,
+            max_entries=settings.answer_cache_max_entries,
+            similarity_threshold=settings.answer_cache_similarity_threshold,
+        )
+        if settings.answer_cache_mode != "off"
+        else None
+    )
+    tool_selector = ToolSelector(top_k=settings.tool_selection_top_k) if settings.tool_selection_enabled else None
+    model_cascade = ModelCascade(fast_models=settings.cascade_fast_models, signals=frozenset(settings.cascade_signals))
+    hedge_policy = (
+        HedgePolicy(
+            backups=settings.hedge_backups,
+            percentile=settings.hedge_percentile,
+            initial_deadline=settings.hedge_initial_deadline_seconds,
+        )
+        if settings.hedge_backups
+        else None
+    )
+    llm_scheduler = (
+        LLMScheduler(
+            limits={
+                provider: limits.per_worker(settings.workers)
+                for provider, limits in {**DEFAULT_PROVIDER_LIMITS, **settings.llm_provider_limits}.items()
+            },
+            max_queue_depth={
+                "interactive": settings.llm_max_queue_depth_interactive,
+                "batch": settings.llm_max_queue_depth_batch,
+            },
+        )
+        if settings.llm_scheduler_enabled
+        else None
+    )
+    tool_output_offloader = (
+        ToolOutputOffloader(
+            store=blob_store,
+            max_inline_chars=settings.tool_output_max_inline_chars,
+            preview_chars=min(settings.tool_output_preview_chars, settings.tool_output_max_inline_chars),
+        )
+        if blob_store is not None
+        else None
+    )
+    run_coordinator = ThreadRunCoordinator(
+        policy=settings.thread_run_policy,
+        queue_timeout_seconds=settings.thread_run_queue_timeout_seconds,
+        leases=SQLiteThreadLeases(path=settings.thread_lease_path) if settings.thread_lease_path else None,
+    )
+    return AsyncReactAgent(
+        tools=tools,
+        checkpointer=checkpointer,
+        chat_model_factory=cassette_recorder.chat_model_factory() if cassette_recorder is not None else None,
+        tool_limiter=ToolConcurrencyLimiter(
+            max_concurrency=settings.tool_max_concurrency,
+            per_tool_limits={**DEFAULT_TOOL_CONCURRENCY_LIMITS, **settings.tool_concurrency_limits},
+        ),
+        answer_cache=answer_cache,
+        tool_selector=tool_selector,
+        model_cascade=model_cascade,
+        hedge_policy=hedge_policy,
+        llm_scheduler=llm_scheduler,
+        run_coordinator=run_coordinator,
+        tool_output_offloader=tool_output_offloader,
+    )
+
+
+def build_job_runner(react_agent: AsyncReactAgent) -> JobRunner | None:
+    if not settings.job_store_path:
+        return None
+    return JobRunner(
+        agent=react_agent,
+        store=SQLiteJobStore(path=settings.job_store_path, result_ttl_seconds=settings.job_result_ttl_seconds),
+        max_concurrent_jobs=settings.job_max_concurrency,
+        max_queued_jobs=settings.job_max_queued,
+    )
+
+
+def build_deep_search_agent(
+    react_agent: AsyncReactAgent, checkpointer: BaseCheckpointSaver, cassette_recorder: CassetteRecorder | None = None
+) -> AsyncDeepSearchAgent:
+    """Builds the deep search agent of one worker process from the settings.
+
+    It shares the tool limits and the LLM scheduler of the ReAct agent, so both agents stay within one budget.
+    """
+    return AsyncDeepSearchAgent(
+        tools=[tool for tool in react_agent.tools if tool.name in settings.deep_search_tools],
+        checkpointer=checkpointer,
+        chat_model_factory=cassette_recorder.chat_model_factory() if cassette_recorder is not None else None,
+        tool_limiter=react_agent.tool_limiter,
+        llm_scheduler=react_agent.llm_scheduler,
+        max_sub_queries=settings.deep_search_max_sub_queries,
+        max_parallel_searches=settings.deep_search_max_parallel_searches,
+        max_parallel_summaries=settings.deep_search_max_parallel_summaries,
+        summary_batch_size=settings.deep_search_summary_batch_size,
+    )
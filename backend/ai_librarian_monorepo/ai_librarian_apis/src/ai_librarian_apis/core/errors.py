@@ -0,0 +1,30 @@
+from ai_librarian_apis.schemas.error import ErrorResponse
+from ai_librarian_core.jobs.runner import JobQueueFullError
+from ai_librarian_core.scheduling.llm_scheduler import LLMOverloadedError
+from ai_librarian_core.scheduling.thread_runs import ThreadBusyError
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+async def llm_overloaded_handler(request: Request, exc: LLMOverloadedError) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content=ErrorResponse(detail=str(exc)).model_dump(),
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+async def thread_busy_handler(request: Request, exc: ThreadBusyError) -> JSONResponse:
+    return JSONResponse(status_code=409, content=ErrorResponse(detail=str(exc)).model_dump())
+
+
+async def job_queue_full_handler(request: Request, exc: JobQueueFullError) -> JSONResponse:
+    return JSONResponse(
+        status_code=503, content=ErrorResponse(detail=str(exc)).model_dump(), headers={"Retry-After": "60"}
+    )
+
+
+def setup_exception_handlers(app: FastAPI):
+    app.add_exception_handler(LLMOverloadedError, llm_overloaded_handler)
+    app.add_exception_handler(ThreadBusyError, thread_busy_handler)
+    app.add_exception_handler(JobQueueFullError, job_queue_full_handler)
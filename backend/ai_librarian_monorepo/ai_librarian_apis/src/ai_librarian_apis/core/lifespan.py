@@ -1,15 +1,73 @@
 from contextlib import asynccontextmanager
+from pathlib import Path
 
+from ai_librarian_apis.core.agent import (
+    build_blob_store,
+    build_deep_search_agent,
+    build_job_runner,
+    build_react_agent,
+    build_tools,
+)
 from ai_librarian_apis.core.logger import setup_logging
+from ai_librarian_apis.core.loop_monitor import LoopLagMonitor
 from ai_librarian_apis.core.openapi import custom_openapi
-
-# from ai_librarian_core.tools.tools import get_built_in_tools
+from ai_librarian_apis.core.settings import settings
+from ai_librarian_core.memory.checkpointer import open_checkpointer
+from ai_librarian_core.observability.tracing import configure_tracing
+from ai_librarian_core.testing.cassette import CassetteRecorder
+from ai_librarian_core.wrapper.http import aclose_async_client, configure_async_client
+from ai_librarian_core.wrapper.ncl_search import configure_browser_pool
 from fastapi import FastAPI
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    setup_logging()
+    setup_logging(
+        level=settings.effective_log_level,
+        json_format=settings.log_json,
+        debug_sample_rate=settings.log_debug_sample_rate,
+        quiet_third_party=settings.is_production,
+    )
     custom_openapi(app)
-    # app.state.tools = get_built_in_tools()
-    yield
+    configure_tracing(
+        enabled=settings.trace_enabled,
+        max_traces=settings.trace_max_traces,
+        jsonl_path=settings.trace_jsonl_path,
+    )
+    app.state.loop_monitor = LoopLagMonitor(slow_callback_threshold=settings.loop_slow_callback_ms / 1000)
+    if settings.loop_monitor_enabled:
+        app.state.loop_monitor.start()
+    configure_async_client(max_connections=settings.per_worker(settings.http_max_connections))
+    configure_browser_pool(size=settings.per_worker(settings.ncl_browser_pool_size))
+    # Every worker process builds its own agent, only the checkpointer's threads are shared between them.
+    cassette_recorder = (
+        CassetteRecorder(path=Path(settings.cassette_record_path)) if settings.cassette_record_path else None
+    )
+    try:
+        async with open_checkpointer(settings.checkpointer, settings.checkpointer_url) as checkpointer:
+            app.state.tools = build_tools(cassette_recorder)
+            app.state.blob_store = build_blob_store()
+            app.state.react_agent = build_react_agent(
+                app.state.tools, checkpointer, cassette_recorder, blob_store=app.state.blob_store
+            )
+            app.state.deep_search_agent = build_deep_search_agent(
+                app.state.react_agent, checkpointer, cassette_recorder
+            )
+            app.state.job_runner = build_job_runner(app.state.react_agent)
+            if app.state.job_runner is not None:
+                await app.state.job_runner.start()
+            try:
+                yield
+            finally:
+                if app.state.job_runner is not None:
+                    await app.state.job_runner.stop()
+    finally:
+        # Every step runs even when the one before it fails, so no connection, thread or cassette is left open.
+        try:
+            await aclose_async_client()
+        finally:
+            try:
+                await app.state.loop_monitor.stop()
+            finally:
+                if cassette_recorder is not None:
+                    cassette_recorder.close()
@@ -1,14 +1,76 @@
+import atexit
 import json
 import logging.config
 import logging.handlers
+import random
 from pathlib import Path
+from typing import Any
 
 LOGGING_CONFIG_PATH = Path(__file__).resolve().parents[1] / "logging_configs" / "config.json"
 
+# Third-party loggers that are chatty at DEBUG/INFO, they are capped at WARNING in production.
+NOISY_LOGGERS = ("httpx", "httpcore", "openai", "anthropic", "urllib3", "langsmith")
+
+# Attributes every `LogRecord` has, anything else on a record was passed through `extra=`.
+_RECORD_ATTRIBUTES = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime", "taskName"}
+
 logger = logging.getLogger(__name__)
 
+# The listener started by the last `setup_logging` call, it is stopped before reconfiguring and at exit.
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats records as one JSON object per line, including any `extra=` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            payload["stack_info"] = self.formatStack(record.stack_info)
+        payload.update({key: value for key, value in record.__dict__.items() if key not in _RECORD_ATTRIBUTES})
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class DebugSamplingFilter(logging.Filter):
+    """Keeps only a random `rate` fraction of DEBUG records, records above DEBUG are never dropped."""
+
+    def __init__(self, rate: float = 1.0):
+        """Initializes the filter with a sampling rate between 0 and 1."""
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or self.rate >= 1.0 or random.random() < self.rate
 
-def setup_logging():
+
+def setup_logging(
+    level: str = "DEBUG",
+    json_format: bool = False,
+    debug_sample_rate: float = 1.0,
+    quiet_third_party: bool = False,
+    queued: bool = True,
+):
+    """Configures logging from `logging_configs/config.json`.
+
+    By default records are handed to a `QueueHandler` on the calling thread and written to stderr and the log
+    file by a `QueueListener` thread, so a log call on the event loop never waits for disk or terminal I/O.
+
+    Args:
+        level (str): The level of the root logger (default: "DEBUG").
+        json_format (bool): Whether to write one JSON object per line instead of plain text (default: False).
+        debug_sample_rate (float): The fraction of DEBUG records that are kept (default: 1.0).
+        quiet_third_party (bool): Whether to cap noisy third-party loggers at WARNING (default: False).
+        queued (bool): Whether to write records from a background thread (default: True).
+    """
     config_file = LOGGING_CONFIG_PATH
     with open(config_file) as f:
         config = json.load(f)
@@ -20,10 +82,41 @@ def setup_logging():
             log_file_path.mkdir(parents=True, exist_ok=True)
             config["handlers"]["file"]["filename"] = str(log_file_path / Path(log_filename).name)
 
+    if json_format:
+        for handler_name in ("stderr", "file"):
+            config["handlers"][handler_name]["formatter"] = "json"
+    config["filters"]["debug_sampling"]["rate"] = debug_sample_rate
+    config["loggers"]["root"]["level"] = level.upper()
+    if not queued:
+        queue_handler = config["handlers"].pop("queue_handler")
+        config["loggers"]["root"]["handlers"] = queue_handler["handlers"]
+        for handler_name in queue_handler["handlers"]:
+            config["handlers"][handler_name]["filters"] = queue_handler["filters"]
+
+    _stop_queue_listener()
     logging.config.dictConfig(config)
+    for noisy_logger in NOISY_LOGGERS:
+        logging.getLogger(noisy_logger).setLevel(logging.WARNING if quiet_third_party else logging.NOTSET)
+
+    global _queue_listener
+    queue_handler = logging.getHandlerByName("queue_handler")
+    if isinstance(queue_handler, logging.handlers.QueueHandler) and queue_handler.listener is not None:
+        _queue_listener = queue_handler.listener
+        _queue_listener.start()
     return logger
 
 
+def _stop_queue_listener():
+    # Flushes the records still in the queue, also called before reconfiguring so the old listener is not leaked.
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 if __name__ == "__main__":
 
     def test_logging():
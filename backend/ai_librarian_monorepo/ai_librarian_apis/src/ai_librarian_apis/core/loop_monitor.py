@@ -0,0 +1,142 @@
+"""Detects anything that blocks the event loop, such as a sync tool called from a coroutine.
+
+A ticker task on the loop measures how late each of its wake-ups is (the loop lag) and refreshes a heartbeat.
+A watchdog thread checks the heartbeat, and when the loop has not come back within the threshold it captures the
+stack of the loop thread while the blocking call is still running, so the culprit is visible in the report.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+
+from ai_librarian_apis.core.logger import logger
+from ai_librarian_core.observability.metrics import Counter, Gauge, Histogram
+
+LOOP_LAG_SECONDS = Histogram(
+    "ai_librarian_event_loop_lag_seconds",
+    "How late the event loop woke up the lag monitor, a proxy for how long every other task was delayed.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+LOOP_LAG_MAX_SECONDS = Gauge(
+    "ai_librarian_event_loop_lag_max_seconds",
+    "The largest event loop lag observed since the last scrape.",
+)
+SLOW_CALLBACKS = Counter(
+    "ai_librarian_event_loop_slow_callbacks_total",
+    "Callbacks that blocked the event loop for longer than the slow callback threshold.",
+)
+
+
+@dataclass
+class SlowCallback:
+    started_at: float
+    duration_ms: float | None
+    stack: list[str]
+
+
+@dataclass
+class LoopLagMonitor:
+    """Measures event loop lag and records the stack of callbacks that block the loop.
+
+    Attributes:
+        interval (float): The number of seconds between two lag measurements (default: 0.1).
+        slow_callback_threshold (float): The number of seconds the loop may stay blocked before the blocking
+            stack is captured and a warning is logged (default: 0.1).
+        max_slow_callbacks (int): The number of most recent slow callbacks kept in memory (default: 100).
+
+    Example:
+        >>> monitor = LoopLagMonitor(slow_callback_threshold=0.2)
+        >>> monitor.start()  # From inside the running loop, e.g. the FastAPI lifespan.
+        >>> ...
+        >>> await monitor.stop()
+    """
+
+    interval: float = 0.1
+    slow_callback_threshold: float = 0.1
+    max_slow_callbacks: int = 100
+    slow_callbacks: deque[SlowCallback] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.slow_callbacks = deque(maxlen=self.max_slow_callbacks)
+        self._heartbeat = time.monotonic()
+        self._max_lag = 0.0
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._loop_thread_id: int | None = None
+        self._pending: SlowCallback | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None
+
+    def start(self):
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.get_running_loop().create_task(self._tick(), name="loop-lag-monitor")
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+        LOOP_LAG_MAX_SECONDS.set_function(self._collect_max_lag)
+
+    async def stop(self):
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+
+    def _collect_max_lag(self) -> float:
+        max_lag, self._max_lag = self._max_lag, 0.0
+        return max_lag
+
+    async def _tick(self):
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+            self._heartbeat = now
+            LOOP_LAG_SECONDS.observe(lag)
+            self._max_lag = max(self._max_lag, lag)
+            if (pending := self._pending) is not None:
+                self._pending = None
+                pending.duration_ms = round(lag * 1000, 3)
+                logger.warning(
+                    "Event loop was blocked for %.0fms, blocking stack:\n%s",
+                    pending.duration_ms,
+                    "".join(pending.stack),
+                )
+
+    def _watch(self):
+        loop_thread_id = self._loop_thread_id
+        if loop_thread_id is None:
+            return
+        # The loop is considered blocked once the heartbeat is overdue by more than the threshold.
+        while not self._stopped.wait(self.slow_callback_threshold / 2):
+            overdue = time.monotonic() - self._heartbeat - self.interval
+            if overdue < self.slow_callback_threshold or self._pending is not None:
+                continue
+            frame = sys._current_frames().get(loop_thread_id)
+            if frame is None:
+                continue
+            slow_callback = SlowCallback(
+                started_at=time.time() - overdue,
+                duration_ms=None,
+                stack=traceback.format_stack(frame),
+            )
+            self._pending = slow_callback
+            self.slow_callbacks.append(slow_callback)
+            SLOW_CALLBACKS.inc()
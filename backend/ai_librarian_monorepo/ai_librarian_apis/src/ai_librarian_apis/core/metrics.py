@@ -0,0 +1,45 @@
+import math
+import os
+import sys
+
+from ai_librarian_core.observability.metrics import Gauge, Histogram
+
+REQUEST_SECONDS = Histogram(
+    "ai_librarian_request_seconds",
+    "End-to-end latency of agent requests, measured until the last event is sent for streams.",
+    labelnames=("endpoint",),
+)
+STREAM_TTFT_SECONDS = Histogram(
+    "ai_librarian_stream_ttft_seconds",
+    "Time from receiving a stream request until the first LLM token is sent.",
+    labelnames=("endpoint",),
+)
+ACTIVE_STREAMS = Gauge(
+    "ai_librarian_active_streams",
+    "Number of SSE streams currently open.",
+    labelnames=("endpoint",),
+)
+PROCESS_RESIDENT_MEMORY_BYTES = Gauge(
+    "process_resident_memory_bytes",
+    "Resident memory size of this worker process in bytes.",
+)
+
+
+def resident_memory_bytes() -> float:
+    """Reads the current RSS on Linux, other platforms report the peak RSS instead."""
+    try:
+        with open("/proc/self/statm") as f:
+            return float(int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE"))
+    except OSError:
+        if sys.platform == "win32":
+            return math.nan
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if not peak:
+            return math.nan
+        # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+        return float(peak if sys.platform == "darwin" else peak * 1024)
+
+
+PROCESS_RESIDENT_MEMORY_BYTES.set_function(resident_memory_bytes)
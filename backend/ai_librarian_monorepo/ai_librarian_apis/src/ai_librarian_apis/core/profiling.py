@@ -0,0 +1,127 @@
+import asyncio
+import os
+import secrets
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+
+from ai_librarian_apis.core.settings import settings
+from ai_librarian_core.observability.profiler import Profile, SamplingProfiler
+from fastapi import Header, HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+PROFILE_REQUEST_HEADER = "x-profile"
+PROFILE_ID_HEADER = "x-profile-id"
+ADMIN_TOKEN_HEADER = "x-admin-token"
+
+# Set for the duration of a marked request, tasks spawned by the request inherit it.
+_profile_id: ContextVar[str | None] = ContextVar("profile_id", default=None)
+
+# Only one profiling session may run at a time so two sessions never sample each other's threads.
+_session_lock = threading.Lock()
+
+
+class ProfileStore:
+    """Keeps the most recent profiles of marked requests in memory."""
+
+    def __init__(self, max_profiles: int = 20):
+        """Initializes the store with the number of profiles to keep."""
+        self.max_profiles = max_profiles
+        self._profiles: OrderedDict[str, Profile] = OrderedDict()
+
+    def add(self, profile_id: str, profile: Profile):
+        self._profiles[profile_id] = profile
+        while len(self._profiles) > self.max_profiles:
+            self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Profile | None:
+        return self._profiles.get(profile_id)
+
+
+PROFILES = ProfileStore()
+
+
+def is_admin_token(token: str | None) -> bool:
+    return (
+        settings.admin_token is not None and token is not None and secrets.compare_digest(token, settings.admin_token)
+    )
+
+
+def verify_profiler_access(x_admin_token: str | None = Header(default=None, description="The admin token.")):
+    # A disabled profiler is indistinguishable from a missing route.
+    if not settings.profiler_enabled:
+        raise HTTPException(404, "Not Found")
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(403, "A valid X-Admin-Token header is required.")
+
+
+async def profile_for(seconds: float, interval: float, loop_only: bool = False) -> Profile:
+    """Samples the worker for `seconds` without blocking the event loop.
+
+    Raises:
+        RuntimeError: If another profiling session is already running.
+    """
+    if not _session_lock.acquire(blocking=False):
+        raise RuntimeError("Another profiling session is already running.")
+    try:
+        profiler = SamplingProfiler(interval=interval, thread_ids={threading.get_ident()} if loop_only else None)
+        profiler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profile = profiler.stop()
+        return profile
+    finally:
+        _session_lock.release()
+
+
+class RequestProfilingMiddleware:
+    """Profiles single requests marked with both `X-Profile: 1` and a valid `X-Admin-Token` header.
+
+    Only the event loop samples taken while a task of the marked request is running are kept, so concurrent
+    requests on the same worker do not pollute the profile. The profile id is returned in the `X-Profile-Id`
+    response header and the collapsed stacks can be downloaded from `/v1/admin/profiles/{profile_id}` once the
+    response has completed. This middleware is only installed when the profiler is enabled.
+    """
+
+    def __init__(self, app: ASGIApp, interval: float = 0.002):
+        """Wraps the ASGI app."""
+        self.app = app
+        self.interval = interval
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope["headers"])
+        if headers.get(PROFILE_REQUEST_HEADER.encode()) not in (b"1", b"true"):
+            await self.app(scope, receive, send)
+            return
+        admin_token = headers.get(ADMIN_TOKEN_HEADER.encode())
+        if not is_admin_token(admin_token.decode() if admin_token else None) or not _session_lock.acquire(False):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = os.urandom(8).hex()
+        loop = asyncio.get_running_loop()
+
+        def is_profiled_task() -> bool:
+            task = asyncio.current_task(loop)
+            return task is not None and task.get_context().get(_profile_id) == profile_id
+
+        async def send_with_profile_id(message: Message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), (PROFILE_ID_HEADER.encode(), profile_id.encode())]
+            await send(message)
+
+        profiler = SamplingProfiler(
+            interval=self.interval, thread_ids={threading.get_ident()}, should_sample=is_profiled_task
+        )
+        token = _profile_id.set(profile_id)
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            PROFILES.add(profile_id, profiler.stop())
+            _profile_id.reset(token)
+            _session_lock.release()
@@ -1,6 +1,13 @@
 from pathlib import Path
 from typing import Literal, Self
 
+from ai_librarian_core.agents.deep_search.asynchronous import DEFAULT_SEARCH_TOOLS
+from ai_librarian_core.agents.react.cascade import EscalationSignal
+from ai_librarian_core.catalog.rendering import DEFAULT_RECORD_FIELDS, RecordField
+from ai_librarian_core.memory.checkpointer import CheckpointerBackend
+from ai_librarian_core.models.llm_config import Model
+from ai_librarian_core.scheduling.llm_scheduler import ProviderLimits
+from ai_librarian_core.scheduling.thread_runs import RunPolicy
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -16,9 +23,11 @@ class Settings(BaseSettings):
     )
 
     # API settings
-    # TODO(youkwan): Add a way to switch between development and production mode.
+    environment: Literal["development", "production"] = "development"
     host: str = "0.0.0.0"
     port: int = 8000
+    debug: bool = False  # Uvicorn auto-reload, runs a single worker.
+    workers: int = Field(default=1, ge=1)  # Worker processes, each builds its own agent, tools and limits.
     allowed_origins: list[str] | None = Field(default_factory=list)
 
     # LLM API keys
@@ -36,10 +45,114 @@ class Settings(BaseSettings):
     langsmith_project: str | None = None
     langsmith_endpoint: str = "https://api.smith.langchain.com"
 
+    # Logging settings
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] | None = None  # Defaults by environment.
+    log_json: bool = False
+    log_debug_sample_rate: float = Field(default=1.0, ge=0, le=1)  # Fraction of DEBUG records that are kept.
+
+    # Admin settings
+    admin_token: str | None = None  # Required by the /v1/admin endpoints.
+    profiler_enabled: bool = False  # Enables the on-demand sampling profiler, requires admin_token.
+
+    # Event loop monitor settings
+    loop_monitor_enabled: bool = True
+    loop_slow_callback_ms: float = Field(default=100, gt=0)  # Log the stack of anything blocking the loop longer.
+
+    # Tracing settings
+    trace_enabled: bool = True
+    trace_max_traces: int = 1000  # Number of recent traces kept in memory for the /v1/traces endpoints.
+    trace_jsonl_path: str | None = None  # Also append every span to this JSONL file when set.
+
+    # Checkpointer settings, more than one worker needs "sqlite" (one host) or "postgres" to share the threads.
+    checkpointer: CheckpointerBackend = "memory"
+    checkpointer_url: str | None = None  # The SQLite file or the Postgres connection string.
+
+    # Tool settings, per worker since e.g. every ncl_search call starts its own Chromium.
+    tool_max_concurrency: int = Field(default=8, ge=1)
+    tool_concurrency_limits: dict[str, int] = Field(default_factory=dict)  # Merged over the defaults per tool.
+
+    # Connection and browser pools of the host, split between the workers.
+    http_max_connections: int = Field(default=32, ge=1)  # Pooled connections of the Wikipedia, arXiv and YouTube tools.
+    ncl_browser_pool_size: int = Field(default=2, ge=1)  # Chromium browsers of ncl_search and catalog_search at once.
+
+    # Tool output settings, how the records of the book and catalog tools are rendered for the chat model.
+    tool_output_fields: list[RecordField] = Field(default_factory=lambda: list(DEFAULT_RECORD_FIELDS))
+    tool_output_max_description_tokens: int = Field(default=40, ge=0)
+    tool_output_token_budgets: dict[str, int] = Field(default_factory=dict)  # Merged over the defaults per tool.
+
+    # Tool output blob settings, longer outputs are kept in the blob store and truncated to a preview in the state.
+    tool_output_blob_path: str | None = None  # e.g. data/blobs.sqlite, outputs are kept whole when None.
+    tool_output_max_inline_chars: int = Field(default=4000, ge=0)
+    tool_output_preview_chars: int = Field(default=2000, ge=0)  # At most tool_output_max_inline_chars.
+    tool_output_blob_ttl_seconds: float = Field(default=7 * 24 * 3600, gt=0)  # After the last write of a blob.
+
+    # Answer cache settings
+    answer_cache_mode: Literal["off", "exact", "semantic"] = "off"
+    answer_cache_ttl_seconds: float = Field(default=3600, gt=0)
+    answer_cache_max_entries: int = Field(default=1024, ge=1)
+    answer_cache_similarity_threshold: float = Field(default=0.85, ge=0, le=1)  # Only used in semantic mode.
+
+    # Tool selection settings
+    tool_selection_enabled: bool = False  # Bind only the tools that match the latest question.
+    tool_selection_top_k: int = Field(default=3, ge=1)
+
+    # Model cascade settings, used by requests with `llm_config.cascade` set.
+    cascade_fast_models: list[Model] = Field(default_factory=lambda: [Model.LLAMA_3_1_8B_INSTANT])
+    cascade_signals: set[EscalationSignal] = Field(default_factory=lambda: {"error", "tool_error", "empty_answer"})
+
+    # Hedging settings, a model with a backup is also sent to the backup when slow or failing.
+    hedge_backups: dict[Model, Model] = Field(default_factory=dict)
+    hedge_percentile: float = Field(default=95, gt=0, le=100)  # Of recent times to first token, the hedging deadline.
+    hedge_initial_deadline_seconds: float = Field(default=2.0, gt=0)  # Used until enough requests were observed.
+
+    # LLM scheduler settings, budgets are merged over the defaults per provider (openai, anthropic, ...) and split
+    # between the workers.
+    llm_scheduler_enabled: bool = True
+    llm_provider_limits: dict[str, ProviderLimits] = Field(default_factory=dict)
+    llm_max_queue_depth_interactive: int = Field(default=256, ge=0)  # Queued requests per provider before a 503.
+    llm_max_queue_depth_batch: int = Field(default=64, ge=0)
+
+    # Thread run settings, what a run does when its thread already has one: "queue", "reject" (409) or "cancel".
+    thread_run_policy: RunPolicy = "queue"
+    thread_run_queue_timeout_seconds: float = Field(default=60, gt=0)
+    thread_lease_path: str | None = None  # A SQLite file to coordinate runs across workers sharing a checkpointer.
+
+    # Deep search settings, the tools every planned query is sent to.
+    deep_search_tools: list[str] = Field(default_factory=lambda: list(DEFAULT_SEARCH_TOOLS))
+    deep_search_max_sub_queries: int = Field(default=4, ge=1)
+    deep_search_max_parallel_searches: int = Field(default=8, ge=1)  # Also bound by the tool limits.
+    deep_search_max_parallel_summaries: int = Field(default=4, ge=1)
+    deep_search_summary_batch_size: int = Field(default=4, ge=1)  # Sources summarized by one chat model call.
+
+    # Background job settings, the store is shared by the workers of one host.
+    job_store_path: str | None = None  # e.g. data/jobs.sqlite, /v1/jobs is disabled when None.
+    job_max_concurrency: int = Field(default=4, ge=1)  # Jobs run at once per worker.
+    job_max_queued: int = Field(default=1000, ge=1)  # Queued jobs before submissions get a 503.
+    job_result_ttl_seconds: float = Field(default=3600, gt=0)  # How long finished jobs and their events are kept.
+
+    # Local catalog index settings, the index is filled by catalog_search and read by the local_catalog tool.
+    catalog_index_path: str | None = None  # e.g. data/catalog.sqlite, local_catalog is disabled when None.
+    catalog_stale_after_seconds: float = Field(default=7 * 24 * 3600, gt=0)  # Older records trigger a remote search.
+
+    # Record every chat model and tool call to this cassette file (.jsonl or .jsonl.gz) for offline replay.
+    cassette_record_path: str | None = None
+
     # Tools credentials
     google_cse_id: str | None = None
     openweathermap_api_key: str | None = None
 
+    @property
+    def is_production(self) -> bool:
+        return self.environment == "production"
+
+    @property
+    def effective_log_level(self) -> str:
+        return self.log_level or ("INFO" if self.is_production else "DEBUG")
+
+    def per_worker(self, total: int) -> int:
+        """The share of one worker process of a pool sized for the whole host."""
+        return max(1, total // self.workers)
+
     @model_validator(mode="after")
     def validate_at_least_one_llm__key(self) -> Self:
         if all(
@@ -57,12 +170,27 @@ class Settings(BaseSettings):
             )
         return self
 
+    @model_validator(mode="after")
+    def validate_profiler_settings(self) -> Self:
+        if self.profiler_enabled and not self.admin_token:
+            raise ValueError("admin_token is required when profiler_enabled is set.")
+        return self
+
     @model_validator(mode="after")
     def validate_langsmith_settings(self) -> Self:
         if self.langsmith_tracing == "true" and self.langsmith_api_key is None:
             raise ValueError("langsmith_api_key is required when langsmith_tracing is enabled.")
         return self
 
+    @model_validator(mode="after")
+    def validate_worker_settings(self) -> Self:
+        # With per-process checkpointers, the next message of a thread may land on a worker that never saw it.
+        if self.workers > 1 and self.checkpointer == "memory":
+            raise ValueError('checkpointer must be "sqlite" or "postgres" when workers is more than 1.')
+        if self.checkpointer != "memory" and not self.checkpointer_url:
+            raise ValueError(f"checkpointer_url is required when checkpointer is {self.checkpointer}.")
+        return self
+
 
 def setup_settings():
     if not DOTENV_PATH.is_file():
@@ -5,11 +5,18 @@ from dotenv import load_dotenv
 from fastapi import FastAPI
 
 from ai_librarian_apis.core.cors import setup_cors
+from ai_librarian_apis.core.errors import setup_exception_handlers
 from ai_librarian_apis.core.lifespan import lifespan
+from ai_librarian_apis.core.profiling import RequestProfilingMiddleware
 from ai_librarian_apis.core.settings import settings
+from ai_librarian_apis.routes.admin import admin_router
+from ai_librarian_apis.routes.blobs import blobs_router
+from ai_librarian_apis.routes.deep_search import deep_search_router
+from ai_librarian_apis.routes.jobs import jobs_router
 from ai_librarian_apis.routes.react import react_router
 from ai_librarian_apis.routes.system import system_router
 from ai_librarian_apis.routes.tools import tools_router
+from ai_librarian_apis.routes.traces import traces_router
 
 
 def create_app() -> FastAPI:
@@ -17,19 +24,34 @@ def create_app() -> FastAPI:
     __version__ = metadata.version("ai-librarian-apis")
     app = FastAPI(title="AI Librarian APIs", version=__version__, lifespan=lifespan)
     setup_cors(app)
+    setup_exception_handlers(app)
+    if settings.profiler_enabled:
+        app.add_middleware(RequestProfilingMiddleware)
 
     app.include_router(system_router)
     app.include_router(tools_router, prefix="/v1")
     app.include_router(react_router, prefix="/v1")
+    app.include_router(deep_search_router, prefix="/v1")
+    app.include_router(jobs_router, prefix="/v1")
+    app.include_router(blobs_router, prefix="/v1")
+    app.include_router(traces_router, prefix="/v1")
+    app.include_router(admin_router, prefix="/v1")
     return app
 
 
 app = create_app()
 
-if __name__ == "__main__":
+
+def serve():
+    """Runs the API with `settings.workers` worker processes, each building its own agent in lifespan."""
     uvicorn.run(
         "ai_librarian_apis.main:app",
         host=settings.host,
         port=settings.port,
-        reload=True,
+        reload=settings.debug,
+        workers=settings.workers,
     )
+
+
+if __name__ == "__main__":
+    serve()
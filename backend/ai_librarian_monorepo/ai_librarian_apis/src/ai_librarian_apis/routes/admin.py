@@ -0,0 +1,71 @@
+from typing import Literal
+
+from ai_librarian_apis.core.profiling import PROFILES, profile_for, verify_profiler_access
+from ai_librarian_apis.schemas.error import ErrorResponse
+from ai_librarian_core.observability.profiler import Profile
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+admin_router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(verify_profiler_access)])
+
+_PROFILE_RESPONSES = {
+    200: {"content": {"text/plain": {}}, "description": "Collapsed stacks, one `frame;frame;frame count` per line."},
+    403: {"model": ErrorResponse, "description": "Missing or invalid admin token."},
+    404: {"model": ErrorResponse, "description": "The profiler is disabled."},
+    500: {"model": ErrorResponse},
+}
+
+
+def _collapsed_response(profile: Profile, filename: str) -> PlainTextResponse:
+    return PlainTextResponse(
+        profile.to_collapsed(),
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.collapsed"',
+            "X-Profile-Samples": str(profile.sample_count),
+            "X-Profile-Duration": f"{profile.duration:.3f}",
+        },
+    )
+
+
+@admin_router.post(
+    "/profile",
+    description=(
+        "Runs an in-process sampling profiler on this worker for the given number of seconds and returns the "
+        "collapsed stacks, ready for speedscope or `flamegraph.pl`. The agent graph, SSE serialization and tool "
+        "wrappers show up as regular frames. Requires the `X-Admin-Token` header and `PROFILER_ENABLED=true`; "
+        "nothing is sampled outside of a profiling session. To profile a single request instead, send it with "
+        "`X-Profile: 1` and the admin token, then fetch `/v1/admin/profiles/{profile_id}`."
+    ),
+    summary="Profile the Worker",
+    response_class=PlainTextResponse,
+    responses={**_PROFILE_RESPONSES, 409: {"model": ErrorResponse, "description": "A profile is already running."}},
+)
+async def profile_worker(
+    seconds: float = Query(default=10, gt=0, le=60, description="How long to sample for."),
+    interval_ms: float = Query(default=5, ge=1, le=100, description="The sampling interval in milliseconds."),
+    threads: Literal["all", "loop"] = Query(
+        default="all", description="Sample every thread, or only the event loop thread."
+    ),
+) -> PlainTextResponse:
+    try:
+        profile = await profile_for(seconds, interval_ms / 1000, loop_only=threads == "loop")
+    except RuntimeError as e:
+        raise HTTPException(409, str(e)) from e
+    return _collapsed_response(profile, f"profile-{int(profile.started_at)}")
+
+
+@admin_router.get(
+    "/profiles/{profile_id}",
+    description=(
+        "Returns the collapsed stacks of a single request that was sent with the `X-Profile: 1` header. "
+        "The profile id is returned in the `X-Profile-Id` response header of that request."
+    ),
+    summary="Get a Request Profile",
+    response_class=PlainTextResponse,
+    responses={**_PROFILE_RESPONSES, 404: {"model": ErrorResponse, "description": "Profile not found."}},
+)
+async def get_request_profile(profile_id: str) -> PlainTextResponse:
+    profile = PROFILES.get(profile_id)
+    if profile is None:
+        raise HTTPException(404, f"Profile {profile_id} not found")
+    return _collapsed_response(profile, f"profile-{profile_id}")
@@ -0,0 +1,35 @@
+from ai_librarian_apis.schemas.error import ErrorResponse
+from ai_librarian_apis.utils.deps import get_blob_store
+from ai_librarian_core.blobs.store import SQLiteBlobStore
+from fastapi import APIRouter, Depends, Header, HTTPException, Path
+from fastapi.responses import PlainTextResponse, Response
+
+blobs_router = APIRouter(prefix="/blobs", tags=["Blobs"])
+
+
+@blobs_router.get(
+    "/{blob_id}",
+    description=(
+        "Returns the full output of a tool call that was truncated to a preview. The `blob_id` is the one of the "
+        "`used_tools` entry or the `tool_output` event. A blob never changes, so it can be cached by its id."
+    ),
+    summary="Get Tool Output Blob",
+    response_class=PlainTextResponse,
+    responses={
+        200: {"content": {"text/plain": {}}, "description": "The full tool output."},
+        404: {"model": ErrorResponse, "description": "Blob not found or expired."},
+        500: {"model": ErrorResponse},
+    },
+)
+async def get_blob(
+    blob_id: str = Path(pattern="^[0-9a-f]{64}$", description="The SHA-256 of the tool output."),
+    if_none_match: str | None = Header(default=None),
+    blob_store: SQLiteBlobStore | None = Depends(get_blob_store),
+) -> Response:
+    headers = {"ETag": f'"{blob_id}"', "Cache-Control": "private, max-age=86400, immutable"}
+    if if_none_match == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    content = await blob_store.aget(blob_id) if blob_store is not None else None
+    if content is None:
+        raise HTTPException(404, f"Blob {blob_id} not found")
+    return PlainTextResponse(content, headers=headers)
@@ -0,0 +1,103 @@
+import time
+
+from ai_librarian_apis.core.logger import logger
+from ai_librarian_apis.core.metrics import ACTIVE_STREAMS, REQUEST_SECONDS
+from ai_librarian_apis.schemas.deep_search import DeepSearchEventPayload
+from ai_librarian_apis.schemas.error import ErrorResponse
+from ai_librarian_apis.schemas.react import AgentRequest, AgentResponse, FlowchartResponse, OpenAIMessage
+from ai_librarian_apis.utils.deps import get_deep_search_agent
+from ai_librarian_core.agents.deep_search.asynchronous import AsyncDeepSearchAgent
+from ai_librarian_core.agents.react.cascade import MODEL_METADATA_KEY
+from ai_librarian_core.models.llm_config import LLMConfig
+from ai_librarian_core.observability.tracing import TRACER
+from ai_librarian_core.utils.uuid import get_thread_id
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+
+deep_search_router = APIRouter(prefix="/deep_search", tags=["Deep Search Agent"])
+
+
+@deep_search_router.get(
+    "/flowchart",
+    description="Retrieves the flowchart of the Deep Search Agent in Mermaid format.",
+    summary="Retrieve the flowchart of the Deep Search Agent",
+    responses={500: {"model": ErrorResponse}},
+)
+def get_flowchart(deep_search_agent: AsyncDeepSearchAgent = Depends(get_deep_search_agent)) -> FlowchartResponse:
+    return FlowchartResponse(mermaid=deep_search_agent.plot())
+
+
+@deep_search_router.post(
+    "/run",
+    description=(
+        "Researches the latest question of the request in depth. The agent plans several search queries, sends "
+        "them to the catalog and web tools at once, summarizes the results in parallel and answers from the "
+        "summaries. Slower and more expensive than `/v1/react/run`, but it consults more sources in about the "
+        "time of one ReAct tool round. Threads work like in `/v1/react/run`, but are not shared with the ReAct Agent."
+    ),
+    summary="Run the Deep Search Agent",
+    responses={500: {"model": ErrorResponse}, 503: {"model": ErrorResponse}},
+)
+async def run_deep_search_agent(
+    request: AgentRequest, deep_search_agent: AsyncDeepSearchAgent = Depends(get_deep_search_agent)
+) -> AgentResponse:
+    # An explicit null gets the defaults of an omitted field.
+    llm_config = request.llm_config or LLMConfig()
+    thread_id = request.thread_id or get_thread_id()
+    with (
+        REQUEST_SECONDS.labels(endpoint="deep_search_run").time(),
+        TRACER.span("run_deep_search_agent", thread_id=thread_id, model=llm_config.model),
+    ):
+        message, used_tools = await deep_search_agent.run(
+            request.get_langchain_messages(), thread_id=thread_id, llm_config=llm_config
+        )
+    return AgentResponse(
+        thread_id=thread_id,
+        llm_config=llm_config,
+        messages=[OpenAIMessage.from_langchain_message(message)],
+        model=message.response_metadata.get(MODEL_METADATA_KEY),
+        used_tools=used_tools,
+    )
+
+
+@deep_search_router.post(
+    "/stream",
+    description=(
+        "Streams the progress and answer of a deep search as server-sent events: `planned` with the search "
+        "queries, `searched` per tool and query, `summarized` per batch of sources, `answer_delta` per answer "
+        "token and a final `answered` event. Note that Swagger UI does not support SSE demo, it is recommended to "
+        "use Postman to test this endpoint."
+    ),
+    summary="Stream the Deep Search Agent",
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "Stream data using Server-Sent Events."},
+        500: {"model": ErrorResponse},
+        503: {"model": ErrorResponse},
+    },
+)
+async def stream_deep_search_agent(
+    agent_request: AgentRequest,
+    request: Request,
+    deep_search_agent: AsyncDeepSearchAgent = Depends(get_deep_search_agent),
+):
+    start = time.perf_counter()
+    llm_config = agent_request.llm_config or LLMConfig()
+    thread_id = agent_request.thread_id or get_thread_id()
+
+    async def stream_events():
+        ACTIVE_STREAMS.labels(endpoint="deep_search_stream").inc()
+        with TRACER.span("stream_deep_search_agent", thread_id=thread_id, model=llm_config.model):
+            try:
+                stream = await deep_search_agent.stream(
+                    agent_request.get_langchain_messages(), thread_id=thread_id, llm_config=llm_config
+                )
+                async for event in stream:
+                    if await request.is_disconnected():
+                        logger.info("Client disconnected.")
+                        break
+                    yield DeepSearchEventPayload.to_sse_format(thread_id, event)
+            finally:
+                ACTIVE_STREAMS.labels(endpoint="deep_search_stream").dec()
+                REQUEST_SECONDS.labels(endpoint="deep_search_stream").observe(time.perf_counter() - start)
+
+    return StreamingResponse(stream_events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
@@ -0,0 +1,98 @@
+from ai_librarian_apis.schemas.error import ErrorResponse
+from ai_librarian_apis.schemas.jobs import JobEventPayload, JobResponse
+from ai_librarian_apis.schemas.react import AgentRequest
+from ai_librarian_apis.utils.deps import get_job_runner
+from ai_librarian_core.jobs.runner import JobRunner
+from ai_librarian_core.models.llm_config import LLMConfig
+from ai_librarian_core.utils.uuid import get_thread_id
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+jobs_router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+@jobs_router.post(
+    "",
+    description=(
+        "Submits an agent request to run in the background, for questions that take longer than a proxy holds a "
+        "request open. Returns the job right away, poll it or subscribe to its events for the progress and result. "
+        "The request runs on its conversation thread like a `/v1/react/run` request."
+    ),
+    summary="Submit a Job",
+    status_code=202,
+    responses={
+        404: {"model": ErrorResponse, "description": "Background jobs are disabled."},
+        500: {"model": ErrorResponse},
+        503: {"model": ErrorResponse, "description": "Too many queued jobs."},
+    },
+)
+async def submit_job(request: AgentRequest, job_runner: JobRunner = Depends(get_job_runner)) -> JobResponse:
+    job = await job_runner.submit(
+        request.get_langchain_messages(), request.thread_id or get_thread_id(), request.llm_config or LLMConfig()
+    )
+    return JobResponse.from_job(job)
+
+
+@jobs_router.get(
+    "/{job_id}",
+    description="Returns the status of a job, and the agent's response once it succeeded.",
+    summary="Get a Job",
+    responses={
+        404: {"model": ErrorResponse, "description": "Job not found or expired."},
+        500: {"model": ErrorResponse},
+    },
+)
+async def get_job(job_id: str, job_runner: JobRunner = Depends(get_job_runner)) -> JobResponse:
+    job = await job_runner.get(job_id)
+    if job is None:
+        raise HTTPException(404, f"Job {job_id} not found")
+    return JobResponse.from_job(job)
+
+
+@jobs_router.get(
+    "/{job_id}/events",
+    description=(
+        "Streams the progress of a job as server-sent events: `queued`, `running`, `tool_chosen`, `tool_output` "
+        "and a final `succeeded`, `failed` or `cancelled` event, after which the stream ends. Past events are sent "
+        "first. A reconnecting client resumes after the `Last-Event-ID` header or the `after` parameter."
+    ),
+    summary="Stream Job Events",
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "Stream data using Server-Sent Events."},
+        404: {"model": ErrorResponse, "description": "Job not found or expired."},
+        500: {"model": ErrorResponse},
+    },
+)
+async def stream_job_events(
+    job_id: str,
+    after: int = Query(default=0, ge=0, description="Only send the events after this event id."),
+    last_event_id: int | None = Header(default=None),
+    job_runner: JobRunner = Depends(get_job_runner),
+):
+    if await job_runner.get(job_id) is None:
+        raise HTTPException(404, f"Job {job_id} not found")
+
+    async def stream_events():
+        async for event in job_runner.events(job_id, after=max(after, last_event_id or 0)):
+            yield JobEventPayload.to_sse_format(job_id, event)
+
+    return StreamingResponse(stream_events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+@jobs_router.post(
+    "/{job_id}/cancel",
+    description=(
+        "Cancels a queued or running job. A queued job is cancelled right away, a running job is stopped by its "
+        "worker within seconds and then reports `cancelled`. A finished job is returned unchanged."
+    ),
+    summary="Cancel a Job",
+    responses={
+        404: {"model": ErrorResponse, "description": "Job not found or expired."},
+        500: {"model": ErrorResponse},
+    },
+)
+async def cancel_job(job_id: str, job_runner: JobRunner = Depends(get_job_runner)) -> JobResponse:
+    job = await job_runner.cancel(job_id)
+    if job is None:
+        raise HTTPException(404, f"Job {job_id} not found")
+    return JobResponse.from_job(job)
@@ -1,14 +1,21 @@
-from ai_librarian_apis.core.global_vars import react_agent
+import time
+
 from ai_librarian_apis.core.logger import logger
+from ai_librarian_apis.core.metrics import ACTIVE_STREAMS, REQUEST_SECONDS, STREAM_TTFT_SECONDS
 from ai_librarian_apis.schemas.error import ErrorResponse
 from ai_librarian_apis.schemas.react import AgentRequest, AgentResponse, FlowchartResponse, ModelResponse, OpenAIMessage
 from ai_librarian_apis.schemas.sse import EventPayload, LLMChunkPayload, SSEEvent, ToolPayload
+from ai_librarian_apis.utils.deps import get_react_agent
 from ai_librarian_apis.utils.sse_example import get_sse_response_example
-from ai_librarian_core.models.llm_config import Model
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
+from ai_librarian_core.agents.react.cascade import MODEL_METADATA_KEY
+from ai_librarian_core.models.llm_config import LLMConfig, Model
 from ai_librarian_core.models.used_tool import UsedTool
-from fastapi import APIRouter, Request
+from ai_librarian_core.observability.tracing import TRACER
+from ai_librarian_core.utils.uuid import get_thread_id
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import StreamingResponse
-from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.messages import AIMessage, AIMessageChunk, ToolMessage
 
 react_router = APIRouter(prefix="/react", tags=["ReAct Agent"])
 
@@ -32,7 +39,7 @@ def get_models() -> ModelResponse:
     summary="Retrieve the flowchart of the Agent",
     responses={500: {"model": ErrorResponse}},
 )
-def get_flowchart() -> FlowchartResponse:
+def get_flowchart(react_agent: AsyncReactAgent = Depends(get_react_agent)) -> FlowchartResponse:
     return FlowchartResponse(mermaid=react_agent.plot())
 
 
@@ -45,18 +52,26 @@ def get_flowchart() -> FlowchartResponse:
         "If not provided, a new conversation thread will be created automatically."
     ),
     summary="Run the ReAct Agent",
-    responses={500: {"model": ErrorResponse}},
+    responses={500: {"model": ErrorResponse}, 409: {"model": ErrorResponse}, 503: {"model": ErrorResponse}},
 )
-async def run_react_agent(request: AgentRequest) -> AgentResponse:
-    message, used_tools = await react_agent.run(
-        request.get_langchain_messages(),
-        thread_id=request.thread_id,
-        llm_config=request.llm_config,
-    )
+async def run_react_agent(
+    request: AgentRequest, react_agent: AsyncReactAgent = Depends(get_react_agent)
+) -> AgentResponse:
+    # An explicit null gets the defaults of an omitted field.
+    llm_config = request.llm_config or LLMConfig()
+    thread_id = request.thread_id or get_thread_id()
+    with (
+        REQUEST_SECONDS.labels(endpoint="run").time(),
+        TRACER.span("run_react_agent", thread_id=thread_id, model=llm_config.model),
+    ):
+        message, used_tools = await react_agent.run(
+            request.get_langchain_messages(), thread_id=thread_id, llm_config=llm_config
+        )
     return AgentResponse(
-        thread_id=request.thread_id,
-        llm_config=request.llm_config,
+        thread_id=thread_id,
+        llm_config=llm_config,
         messages=[OpenAIMessage.from_langchain_message(message)],
+        model=message.response_metadata.get(MODEL_METADATA_KEY),
         used_tools=used_tools,
     )
 
@@ -64,46 +79,46 @@ async def run_react_agent(request: AgentRequest) -> AgentResponse:
 def _process_tool_message(message: ToolMessage, thread_id: str, llm_config: dict) -> str:
     return SSEEvent(
         event=EventPayload.TOOL_OUTPUT,
-        data=ToolPayload(
-            thread_id=thread_id, llm_config=llm_config, used_tools=UsedTool(name=message.name, output=message.content)
-        ),
+        data=ToolPayload(thread_id=thread_id, llm_config=llm_config, used_tools=UsedTool.from_message(message)),
     ).to_sse_format()
 
 
 def _process_ai_message(
-    message: AIMessage, thread_id: str, llm_config: dict, has_llm_started: bool
+    message: AIMessage, thread_id: str, llm_config: dict, has_llm_started: bool, model: str | None = None
 ) -> tuple[str, bool] | None:
-    if message.tool_calls and (tool_name := message.tool_calls[0].get("name")):
+    # A single turn may choose several tools at once, each one is reported as its own event.
+    tool_names = [tool_call["name"] for tool_call in message.tool_calls if tool_call["name"]]
+    if tool_names:
+        events = [
+            SSEEvent(
+                event=EventPayload.TOOL_CHOSEN,
+                data=ToolPayload(
+                    thread_id=thread_id,
+                    llm_config=llm_config,
+                    used_tools=UsedTool(name=tool_name, output=message.content),
+                ),
+            )
+            for tool_name in tool_names
+        ]
+        return "".join(event.to_sse_format() for event in events), has_llm_started
+    elif message.content:
         event = SSEEvent(
-            event=EventPayload.TOOL_CHOSEN,
-            data=ToolPayload(
+            event=EventPayload.LLM_DELTA if has_llm_started else EventPayload.LLM_START,
+            data=LLMChunkPayload(
                 thread_id=thread_id,
                 llm_config=llm_config,
-                used_tools=UsedTool(name=tool_name, output=message.content),
+                message_chunk=message.content,
+                model=model,
             ),
         )
-        return event.to_sse_format(), has_llm_started
-    elif message.content:
-        if has_llm_started:
-            event = SSEEvent(
-                event=EventPayload.LLM_DELTA,
-                data=LLMChunkPayload(
-                    thread_id=thread_id,
-                    llm_config=llm_config,
-                    message_chunk=message.content,
-                ),
-            )
-            return event.to_sse_format(), True
-        else:
-            event = SSEEvent(
-                event=EventPayload.LLM_START,
-                data=LLMChunkPayload(
-                    thread_id=thread_id,
-                    llm_config=llm_config,
-                    message_chunk=message.content,
-                ),
-            )
+        if isinstance(message, AIMessageChunk):
             return event.to_sse_format(), True
+        # A whole message, e.g. the checked answer of a model cascade tier, is its first and last token at once.
+        end_event = SSEEvent(
+            event=EventPayload.LLM_END,
+            data=LLMChunkPayload(thread_id=thread_id, llm_config=llm_config, message_chunk="", model=model),
+        )
+        return event.to_sse_format() + end_event.to_sse_format(), True
     elif message.response_metadata.get("finish_reason") == "stop":
         event = SSEEvent(
             event=EventPayload.LLM_END,
@@ -111,6 +126,7 @@ def _process_ai_message(
                 thread_id=thread_id,
                 llm_config=llm_config,
                 message_chunk=message.content,
+                model=model,
             ),
         )
         return event.to_sse_format(), False
@@ -142,32 +158,65 @@ def _process_ai_message(
             "description": "Stream data using Server-Sent Events.",
         },
         500: {"model": ErrorResponse},
+        409: {"model": ErrorResponse},
+        503: {"model": ErrorResponse},
     },
 )
-async def stream_react_agent(agent_request: AgentRequest, request: Request):
+async def stream_react_agent(
+    agent_request: AgentRequest, request: Request, react_agent: AsyncReactAgent = Depends(get_react_agent)
+):
+    start = time.perf_counter()
+    llm_config = agent_request.llm_config or LLMConfig()
+    thread_id = agent_request.thread_id or get_thread_id()
+    llm_config_dict = llm_config.model_dump(mode="json")
+    # Sheds the request while a 409 or 503 can still be sent, before the stream starts.
+    react_agent.check_admission(llm_config, thread_id)
+
     # TODO(youkwan): Add heartbeat.
     async def stream_chunk():
         has_llm_started = False
-        stream = await react_agent.stream(
-            agent_request.get_langchain_messages(),
-            thread_id=agent_request.thread_id,
-            llm_config=agent_request.llm_config,
-        )
-        async for chunk in stream:
-            if await request.is_disconnected():
-                logger.info("Client disconnected.")
-                break
-
-            message = chunk[0]
-            llm_config_dict = agent_request.llm_config.model_dump(mode="json")
-
-            if isinstance(message, ToolMessage):
-                yield _process_tool_message(message, agent_request.thread_id, llm_config_dict)
-            elif isinstance(message, AIMessage):
-                result = _process_ai_message(message, agent_request.thread_id, llm_config_dict, has_llm_started)
-                if result:
-                    event_str, has_llm_started = result
-                    yield event_str
+        is_first_token = True
+        stream_models: dict[str, str] = {}
+        serialization_seconds = 0.0
+        ACTIVE_STREAMS.labels(endpoint="stream").inc()
+        with TRACER.span("stream_react_agent", thread_id=thread_id, model=llm_config.model) as span:
+            try:
+                stream = await react_agent.stream(
+                    agent_request.get_langchain_messages(), thread_id=thread_id, llm_config=llm_config
+                )
+                async for chunk in stream:
+                    if await request.is_disconnected():
+                        logger.info("Client disconnected.")
+                        break
+
+                    message = chunk[0]
+                    serialization_start = time.perf_counter()
+
+                    if isinstance(message, ToolMessage):
+                        event_str = _process_tool_message(message, thread_id, llm_config_dict)
+                        serialization_seconds += time.perf_counter() - serialization_start
+                        yield event_str
+                    elif isinstance(message, AIMessage):
+                        # A hedged stream names the model that won in its first chunk only.
+                        if model := message.response_metadata.get(MODEL_METADATA_KEY):
+                            stream_models[message.id or ""] = model
+                        model = stream_models.get(message.id or "") or chunk[1].get(MODEL_METADATA_KEY)
+                        result = _process_ai_message(message, thread_id, llm_config_dict, has_llm_started, model)
+                        serialization_seconds += time.perf_counter() - serialization_start
+                        if result:
+                            event_str, has_llm_started = result
+                            if has_llm_started and is_first_token:
+                                ttft = time.perf_counter() - start
+                                STREAM_TTFT_SECONDS.labels(endpoint="stream").observe(ttft)
+                                if span:
+                                    span.set_attribute("ttft_ms", round(ttft * 1000, 3))
+                                is_first_token = False
+                            yield event_str
+            finally:
+                ACTIVE_STREAMS.labels(endpoint="stream").dec()
+                REQUEST_SECONDS.labels(endpoint="stream").observe(time.perf_counter() - start)
+                if span:
+                    span.set_attribute("sse_serialization_ms", round(serialization_seconds * 1000, 3))
 
     return StreamingResponse(
         stream_chunk(),
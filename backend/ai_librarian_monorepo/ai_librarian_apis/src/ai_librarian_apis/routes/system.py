@@ -1,5 +1,10 @@
-from ai_librarian_apis.schemas.system import HealthResponse
-from fastapi import APIRouter
+from dataclasses import asdict
+
+from ai_librarian_apis.core.loop_monitor import LoopLagMonitor
+from ai_librarian_apis.schemas.system import HealthResponse, SlowCallbackInfo, SlowCallbackListResponse
+from ai_librarian_core.observability.metrics import PROMETHEUS_CONTENT_TYPE, REGISTRY
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
 
 system_router = APIRouter(tags=["System"])
 
@@ -12,3 +17,39 @@ system_router = APIRouter(tags=["System"])
 )
 def check_health() -> HealthResponse:
     return HealthResponse()
+
+
+@system_router.get(
+    "/metrics",
+    description=(
+        "Exposes agent, tool and stream metrics in the Prometheus text exposition format. "
+        "Includes request latency, time-to-first-token, graph node timings, tool latency and errors, "
+        "LLM token usage per model, active streams and checkpointer size."
+    ),
+    summary="Prometheus Metrics",
+    response_class=PlainTextResponse,
+    responses={200: {"content": {PROMETHEUS_CONTENT_TYPE: {}}}, 500: {}},
+)
+async def get_metrics() -> PlainTextResponse:
+    # Async on purpose: rendering runs on the event loop so it never races the agent updating its state, only the
+    # blocking gauges, like the checkpointer size, are computed on a worker thread first.
+    return PlainTextResponse(await REGISTRY.arender(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@system_router.get(
+    "/loop/slow_callbacks",
+    description=(
+        "Lists the most recent calls that blocked the event loop for longer than the configured threshold, "
+        "such as a sync tool or blocking I/O called from a coroutine, together with the stack of the event loop "
+        "thread captured while it was blocked. Event loop lag is also exported at `/metrics`."
+    ),
+    summary="List Slow Callbacks",
+    responses={500: {}},
+)
+async def list_slow_callbacks(request: Request) -> SlowCallbackListResponse:
+    monitor: LoopLagMonitor = request.app.state.loop_monitor
+    return SlowCallbackListResponse(
+        enabled=monitor.is_running,
+        threshold_ms=monitor.slow_callback_threshold * 1000,
+        slow_callbacks=[SlowCallbackInfo.model_validate(asdict(cb)) for cb in reversed(monitor.slow_callbacks)],
+    )
@@ -1,7 +1,15 @@
 from ai_librarian_apis.core.logger import logger
 from ai_librarian_apis.schemas.error import ErrorResponse
-from ai_librarian_apis.schemas.tools import ToolArg, ToolInfo, ToolListResponse, ToolRunRequest, ToolRunResponse
+from ai_librarian_apis.schemas.tools import (
+    CircuitBreakerListResponse,
+    ToolArg,
+    ToolInfo,
+    ToolListResponse,
+    ToolRunRequest,
+    ToolRunResponse,
+)
 from ai_librarian_apis.utils.deps import get_tools
+from ai_librarian_core.tools.resilience import CircuitBreakerSnapshot, ResilientTool
 from fastapi import APIRouter, Depends, HTTPException
 from langchain_core.tools import BaseTool
 
@@ -50,6 +58,21 @@ def list_tools(tools: list[BaseTool] = Depends(get_tools)) -> ToolListResponse:
         raise HTTPException(500, f"Error listing tools: {e}")
 
 
+@tools_router.get(
+    "/breakers",
+    description=(
+        "Returns the circuit breaker state of each tool. A tool whose breaker is open fails fast "
+        "until its recovery timeout expires, after which a probe call decides whether it closes again."
+    ),
+    summary="List Tool Circuit Breakers",
+    responses={500: {"model": ErrorResponse}},
+)
+def list_breakers(tools: list[BaseTool] = Depends(get_tools)) -> CircuitBreakerListResponse:
+    return CircuitBreakerListResponse(
+        breakers=[CircuitBreakerSnapshot.from_tool(tool) for tool in tools if isinstance(tool, ResilientTool)]
+    )
+
+
 @tools_router.post(
     "/run",
     description="Runs a tool with the given name and input(s).",
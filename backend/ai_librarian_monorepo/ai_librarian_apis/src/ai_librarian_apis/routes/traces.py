@@ -0,0 +1,47 @@
+from ai_librarian_apis.schemas.error import ErrorResponse
+from ai_librarian_apis.schemas.traces import SpanInfo, TraceListResponse, TraceResponse, TraceSummary
+from ai_librarian_core.observability.tracing import TRACER
+from fastapi import APIRouter, HTTPException, Query
+
+traces_router = APIRouter(prefix="/traces", tags=["Traces"])
+
+
+@traces_router.get(
+    "",
+    description=(
+        "Lists the most recent request traces kept in the local ring buffer, newest first. "
+        "Can be filtered by conversation thread."
+    ),
+    summary="List Traces",
+    responses={500: {"model": ErrorResponse}},
+)
+async def list_traces(
+    thread_id: str | None = Query(default=None, description="Only return traces of this conversation thread."),
+    limit: int = Query(default=50, ge=1, le=1000, description="The maximum number of traces to return."),
+) -> TraceListResponse:
+    ring_buffer = TRACER.ring_buffer
+    if ring_buffer is None:
+        return TraceListResponse(traces=[])
+    return TraceListResponse(
+        traces=[
+            TraceSummary.from_spans(spans[0].trace_id, spans)
+            for spans in ring_buffer.list_traces(thread_id=thread_id, limit=limit)
+        ]
+    )
+
+
+@traces_router.get(
+    "/{trace_id}",
+    description=(
+        "Returns the span timeline of a single trace: the request, every graph node, "
+        "each tool call and each checkpoint read and write."
+    ),
+    summary="Get Trace",
+    responses={404: {"model": ErrorResponse, "description": "Trace not found."}, 500: {"model": ErrorResponse}},
+)
+async def get_trace(trace_id: str) -> TraceResponse:
+    ring_buffer = TRACER.ring_buffer
+    spans = ring_buffer.get_trace(trace_id) if ring_buffer else []
+    if not spans:
+        raise HTTPException(404, f"Trace {trace_id} not found")
+    return TraceResponse(trace_id=trace_id, spans=[SpanInfo.from_span(span) for span in spans])
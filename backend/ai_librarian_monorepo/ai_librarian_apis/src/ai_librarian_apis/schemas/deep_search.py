@@ -0,0 +1,16 @@
+from typing import Any
+
+from ai_librarian_core.agents.deep_search.asynchronous import DeepSearchEvent
+from pydantic import BaseModel
+
+
+class DeepSearchEventPayload(BaseModel):
+    """A progress event of a deep search, sent as a server-sent event named after `DeepSearchEvent.event`."""
+
+    thread_id: str
+    data: dict[str, Any]
+
+    @staticmethod
+    def to_sse_format(thread_id: str, event: DeepSearchEvent) -> str:
+        payload = DeepSearchEventPayload(thread_id=thread_id, data=event.data)
+        return f"event: {event.event}\ndata: {payload.model_dump_json()}\n\n"
@@ -0,0 +1,60 @@
+from typing import Any
+
+from ai_librarian_apis.schemas.react import AgentResponse, OpenAIMessage
+from ai_librarian_core.agents.react.cascade import MODEL_METADATA_KEY
+from ai_librarian_core.jobs.store import Job, JobEvent, JobStatus
+from pydantic import BaseModel, Field
+
+
+class JobResponse(BaseModel):
+    """The state of a background job, with the agent's response once it succeeded."""
+
+    job_id: str = Field(description="The unique identifier of the job.", examples=["job-3f6c1b0e-9a1d-4e2f-8b7a"])
+    status: JobStatus = Field(
+        description="One of 'queued', 'running', 'succeeded', 'failed' or 'cancelled'.", examples=["running"]
+    )
+    thread_id: str = Field(
+        description="The conversation thread the job continues.",
+        examples=["thread-ab586827-8c7c-4bf9-a6c9-fea58f43f5fc"],
+    )
+    created_at: float = Field(description="When the job was submitted, as a Unix timestamp.", examples=[1760860800.0])
+    started_at: float | None = Field(description="When a worker picked the job up.", examples=[1760860801.2])
+    finished_at: float | None = Field(description="When the job finished.", examples=[None])
+    expires_at: float | None = Field(description="When the finished job will be deleted.", examples=[None])
+    result: AgentResponse | None = Field(description="The agent's response, once the job succeeded.")
+    error: str | None = Field(description="Why the job failed or was cancelled.", examples=[None])
+
+    @classmethod
+    def from_job(cls, job: Job) -> "JobResponse":
+        result = None
+        if job.answer is not None:
+            result = AgentResponse(
+                thread_id=job.thread_id,
+                llm_config=job.llm_config,
+                messages=[OpenAIMessage.from_langchain_message(job.answer)],
+                model=job.answer.response_metadata.get(MODEL_METADATA_KEY),
+                used_tools=job.used_tools,
+            )
+        return cls(
+            job_id=job.id,
+            status=job.status,
+            thread_id=job.thread_id,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            expires_at=job.expires_at,
+            result=result,
+            error=job.error,
+        )
+
+
+class JobEventPayload(BaseModel):
+    """A progress event of a job, sent as a server-sent event whose id is `seq`."""
+
+    job_id: str
+    data: dict[str, Any]
+
+    @staticmethod
+    def to_sse_format(job_id: str, event: JobEvent) -> str:
+        payload = JobEventPayload(job_id=job_id, data=event.data)
+        return f"id: {event.seq}\nevent: {event.event}\ndata: {payload.model_dump_json()}\n\n"
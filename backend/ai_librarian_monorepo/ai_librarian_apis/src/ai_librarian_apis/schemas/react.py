@@ -187,6 +187,14 @@ class AgentResponse(BaseModel):
             ]
         ],
     )
+    model: Model | None = Field(
+        default=None,
+        description=(
+            "The model that produced the answer. "
+            "Differs from `llm_config.model` when `llm_config.cascade` is set and a faster model answered."
+        ),
+        examples=[Model.OPENAI_GPT_4O_MINI],
+    )
     used_tools: list[UsedTool] = Field(
         default_factory=list,
         description=(
@@ -32,12 +32,15 @@ class ToolPayload(BaseDataPayload):
 
 class LLMChunkPayload(BaseDataPayload):
     message_chunk: str
+    model: str | None = None
 
     @model_serializer(when_used="json")
     def serialize_model(self) -> dict[str, Any]:
         ordered_data = {}
         ordered_data["thread_id"] = self.thread_id
         ordered_data["message_chunk"] = self.message_chunk
+        if self.model is not None:
+            ordered_data["model"] = self.model
         ordered_data["llm_config"] = self.llm_config
         return ordered_data
 
@@ -11,3 +11,25 @@ class HealthResponse(BaseModel):
         description="API operational status indicator. Returns 'ok' when the system is functioning properly.",
         examples=["ok"],
     )
+
+
+class SlowCallbackInfo(BaseModel):
+    """A call that blocked the event loop, with the stack captured while it was still running."""
+
+    started_at: float = Field(description="When the loop became blocked as a Unix timestamp.", examples=[1760860800.0])
+    duration_ms: float | None = Field(
+        description="How long the loop was blocked in milliseconds, null while it is still blocked.",
+        examples=[1250.4],
+    )
+    stack: list[str] = Field(
+        description="The stack of the event loop thread while it was blocked, innermost frame last.",
+        examples=[['  File "wikipedia.py", line 79, in run\n    page_titles = self.wiki_client.search(...)\n']],
+    )
+
+
+class SlowCallbackListResponse(BaseModel):
+    """Returns the most recent calls that blocked the event loop, newest first."""
+
+    enabled: bool = Field(description="Whether the event loop monitor is running.", examples=[True])
+    threshold_ms: float = Field(description="The blocking time that counts as a slow callback.", examples=[100.0])
+    slow_callbacks: list[SlowCallbackInfo] = Field(description="The most recent slow callbacks, newest first.")
@@ -1,5 +1,6 @@
 from typing import Any
 
+from ai_librarian_core.tools.resilience import CircuitBreakerSnapshot, CircuitState
 from pydantic import BaseModel, Field
 
 
@@ -87,3 +88,22 @@ class ToolRunResponse(BaseModel):
             "it supports the day-to-day ..."
         ],
     )
+
+
+class CircuitBreakerListResponse(BaseModel):
+    """Returns the circuit breaker state of every tool guarded by a deadline and a breaker."""
+
+    breakers: list[CircuitBreakerSnapshot] = Field(
+        description="The circuit breaker state of each tool.",
+        examples=[
+            [
+                CircuitBreakerSnapshot(
+                    name="ncl_search",
+                    state=CircuitState.OPEN,
+                    consecutive_failures=3,
+                    retry_after=21.5,
+                    timeout=12.0,
+                )
+            ]
+        ],
+    )
@@ -0,0 +1,63 @@
+from typing import Any
+
+from ai_librarian_core.observability.tracing import Span
+from pydantic import BaseModel, Field
+
+
+class SpanInfo(BaseModel):
+    """A single timed operation within a trace, such as a graph node, a tool call or a checkpoint write."""
+
+    name: str = Field(description="The name of the operation.", examples=["node:invoke_llm"])
+    span_id: str = Field(description="The unique identifier of the span.", examples=["5f1c0e9a7d3b2a41"])
+    parent_id: str | None = Field(description="The identifier of the parent span.", examples=["a3e4b1c2d9f08e77"])
+    thread_id: str | None = Field(
+        description="The conversation thread the span belongs to.",
+        examples=["thread-ab586827-8c7c-4bf9-a6c9-fea58f43f5fc"],
+    )
+    start_time: float = Field(description="The start time of the span as a Unix timestamp.", examples=[1760860800.0])
+    duration_ms: float | None = Field(description="The duration of the span in milliseconds.", examples=[812.4])
+    status: str = Field(description="Either 'ok' or 'error'.", examples=["ok"])
+    attributes: dict[str, Any] = Field(description="Additional attributes of the span.", examples=[{"tool": "arxiv"}])
+
+    @classmethod
+    def from_span(cls, span: Span) -> "SpanInfo":
+        return cls.model_validate(span.to_dict())
+
+
+class TraceSummary(BaseModel):
+    """A summary of one traced request."""
+
+    trace_id: str = Field(description="The unique identifier of the trace.", examples=["9b2f6c1d0e4a7b38"])
+    name: str = Field(description="The name of the root span.", examples=["stream_react_agent"])
+    thread_id: str | None = Field(
+        description="The conversation thread of the request.",
+        examples=["thread-ab586827-8c7c-4bf9-a6c9-fea58f43f5fc"],
+    )
+    start_time: float = Field(description="The start time of the trace as a Unix timestamp.", examples=[1760860800.0])
+    duration_ms: float | None = Field(description="The duration of the root span in milliseconds.", examples=[3120.5])
+    span_count: int = Field(description="The number of spans recorded in the trace.", examples=[14])
+
+    @classmethod
+    def from_spans(cls, trace_id: str, spans: list[Span]) -> "TraceSummary":
+        root = next((span for span in spans if span.parent_id is None), spans[0])
+        return cls(
+            trace_id=trace_id,
+            name=root.name,
+            thread_id=root.thread_id,
+            start_time=root.start_time,
+            duration_ms=root.duration_ms,
+            span_count=len(spans),
+        )
+
+
+class TraceListResponse(BaseModel):
+    """Returns the most recent traces, newest first."""
+
+    traces: list[TraceSummary] = Field(description="The most recent traces, newest first.")
+
+
+class TraceResponse(BaseModel):
+    """Returns the timeline of a single trace, ordered by start time."""
+
+    trace_id: str = Field(description="The unique identifier of the trace.", examples=["9b2f6c1d0e4a7b38"])
+    spans: list[SpanInfo] = Field(description="The spans of the trace ordered by start time.")
@@ -1,8 +1,29 @@
-from ai_librarian_apis.core.global_vars import tools
-from fastapi import Request
+from ai_librarian_core.agents.deep_search.asynchronous import AsyncDeepSearchAgent
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
+from ai_librarian_core.blobs.store import SQLiteBlobStore
+from ai_librarian_core.jobs.runner import JobRunner
+from fastapi import HTTPException, Request
 from langchain_core.tools import BaseTool
 
 
 def get_tools(request: Request) -> list[BaseTool]:
-    return tools
-    # return request.app.state.tools
+    return request.app.state.tools
+
+
+def get_react_agent(request: Request) -> AsyncReactAgent:
+    return request.app.state.react_agent
+
+
+def get_deep_search_agent(request: Request) -> AsyncDeepSearchAgent:
+    return request.app.state.deep_search_agent
+
+
+def get_job_runner(request: Request) -> JobRunner:
+    job_runner: JobRunner | None = request.app.state.job_runner
+    if job_runner is None:
+        raise HTTPException(404, "Background jobs are disabled, set JOB_STORE_PATH to enable them")
+    return job_runner
+
+
+def get_blob_store(request: Request) -> SQLiteBlobStore | None:
+    return request.app.state.blob_store
@@ -0,0 +1,313 @@
+import asyncio
+import re
+import time
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from ai_librarian_core.agents.deep_search.base import BaseDeepSearchAgent, DeepSearchAgentError, MissingAIMessageError
+from ai_librarian_core.agents.deep_search.state import DeepSearchState, Source
+from ai_librarian_core.agents.react.cascade import MODEL_METADATA_KEY
+from ai_librarian_core.models.llm_config import LLMConfig
+from ai_librarian_core.models.used_tool import UsedTool
+from ai_librarian_core.observability.metrics import TOOL_CALL_ERRORS, TOOL_CALL_SECONDS, record_token_usage, timed_node
+from ai_librarian_core.observability.tracing import TRACER, TracingCheckpointSaver, traced_node
+from ai_librarian_core.scheduling.llm_scheduler import (
+    Admission,
+    LLMOverloadedError,
+    LLMScheduler,
+    Priority,
+    estimate_tokens,
+)
+from ai_librarian_core.tools.concurrency import ToolConcurrencyLimiter
+from ai_librarian_core.utils.uuid import get_thread_id
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolCall,
+    ToolMessage,
+)
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool
+from langgraph.config import get_stream_writer
+from langgraph.constants import TAG_NOSTREAM
+from langgraph.graph import StateGraph
+from langgraph.graph.state import CompiledStateGraph
+
+# The catalog and web tools worth fanning a library question out to, the agent searches with all of its tools.
+DEFAULT_SEARCH_TOOLS = ("ncl_search", "google_books", "arxiv", "wikipedia", "duckduckgo_results_json")
+
+PLAN_PROMPT = (
+    "You are a research librarian planning a search. Break the user's latest question down into at most "
+    "{max_sub_queries} short, self-contained search queries that together cover it, e.g. the topic, key authors "
+    "or titles, and related concepts. Write the queries in the language most likely to find sources. Reply with "
+    "one query per line and nothing else."
+)
+SUMMARY_PROMPT = (
+    "You are a research librarian. Summarize what the search results below say about the question "
+    '"{question}". Keep titles, authors, dates, call numbers and links exactly as given, drop anything irrelevant '
+    "to the question and say so if nothing is relevant.\n\n{sources}"
+)
+SYNTHESIS_PROMPT = (
+    "You are a research librarian. Answer the user's latest question from the research notes below, which "
+    "summarize searches of library catalogs and the web. Recommend concrete books, papers or pages with their "
+    "links, and say what the notes do not cover.\n\n{notes}"
+)
+
+_LIST_MARKER = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s*")
+
+
+@dataclass
+class DeepSearchEvent:
+    """A progress event of a deep search.
+
+    Attributes:
+        event (str): "planned", "searched", "summarized", "answer_delta" or "answered".
+        data (dict[str, Any]): The JSON payload of the event.
+    """
+
+    event: str
+    data: dict[str, Any]
+
+
+@dataclass
+class AsyncDeepSearchAgent(BaseDeepSearchAgent):
+    """Researches a question by fanning sub-queries out to many tools at once instead of one tool turn at a time.
+
+    Each turn runs four steps:
+
+    1. plan: the chat model breaks the question down into up to `max_sub_queries` search queries.
+    2. search: every query is sent to every tool of the agent concurrently, up to `max_parallel_searches` calls
+       at once and within the per-tool slots of `tool_limiter`.
+    3. summarize: the sources are summarized in batches of `summary_batch_size`, up to `max_parallel_summaries`
+       chat model calls at once (map).
+    4. synthesize: the chat model answers from the summaries, the only step streamed token by token (reduce).
+
+    A ReAct agent needs a chat model turn per round of tool calls, this agent needs one before and two after all
+    of them, so its wall time grows with the slowest tool instead of the number of searches.
+
+    Attributes:
+        tool_limiter (ToolConcurrencyLimiter): Bounds the tool calls, shared with other agents to keep the bounds
+            process-wide.
+        llm_scheduler (LLMScheduler | None): Queues the chat model calls within per-provider budgets.
+        max_sub_queries (int): The number of search queries planned per question (default: 4).
+        max_parallel_searches (int): The number of tool calls of one turn running at once (default: 8).
+        max_parallel_summaries (int): The number of summary calls of one turn running at once (default: 4).
+        summary_batch_size (int): The number of sources summarized by one chat model call (default: 4).
+        max_source_chars (int): The length sources are cut to before they are summarized (default: 4000).
+
+    Example:
+        >>> agent = AsyncDeepSearchAgent(tools=get_built_in_tools())
+        >>> async for event in await agent.stream([HumanMessage("Books on Taiwanese aboriginal myths")]):
+        ...     print(event.event, event.data)
+    """
+
+    tool_limiter: ToolConcurrencyLimiter = field(default_factory=ToolConcurrencyLimiter)
+    llm_scheduler: LLMScheduler | None = None
+    max_sub_queries: int = 4
+    max_parallel_searches: int = 8
+    max_parallel_summaries: int = 4
+    summary_batch_size: int = 4
+    max_source_chars: int = 4000
+
+    def __post_init__(self):
+        super().__post_init__()
+        if self.max_parallel_searches < 1 or self.max_parallel_summaries < 1:
+            raise ValueError("max_parallel_searches and max_parallel_summaries must be at least 1.")
+        self._search_slots = asyncio.Semaphore(self.max_parallel_searches)
+        self._summary_slots = asyncio.Semaphore(self.max_parallel_summaries)
+        self._workflow: CompiledStateGraph | None = None
+
+    @property
+    def workflow(self) -> CompiledStateGraph:
+        if self._workflow is None:
+            self._workflow = self._init_workflow()
+        return self._workflow
+
+    async def _invoke_llm(
+        self, messages: list[BaseMessage], llm_config: LLMConfig, config: RunnableConfig, streamed: bool = False
+    ) -> AIMessage:
+        try:
+            llm = self._init_llm(llm_config).with_config(metadata={MODEL_METADATA_KEY: str(llm_config.model)})
+            if not streamed:
+                llm = llm.with_config(tags=[TAG_NOSTREAM])
+            async with self._admit(messages, llm_config, config) as admission:
+                response = await llm.ainvoke(messages)
+                if not isinstance(response, AIMessage):
+                    raise MissingAIMessageError("The chat model did not answer with an AI message.")
+                admission.used_tokens = (response.usage_metadata or {}).get("total_tokens")
+        except (DeepSearchAgentError, LLMOverloadedError):
+            raise
+        except Exception as e:
+            raise DeepSearchAgentError("An unexpected error occurred while trying to invoke the chat model.") from e
+        response.response_metadata.setdefault(MODEL_METADATA_KEY, str(llm_config.model))
+        record_token_usage(llm_config.model, response.usage_metadata)
+        return response
+
+    def _admit(
+        self, messages: list[BaseMessage], llm_config: LLMConfig, config: RunnableConfig
+    ) -> AbstractAsyncContextManager[Admission]:
+        if self.llm_scheduler is None:
+            return nullcontext(Admission(provider=LLMScheduler.provider(llm_config.model), reserved_tokens=0))
+        configurable = config.get("configurable", {})
+        return self.llm_scheduler.admit(
+            llm_config.model,
+            thread_id=configurable.get("thread_id", ""),
+            priority=configurable.get("priority", "interactive"),
+            tokens=estimate_tokens(messages, llm_config.max_tokens),
+        )
+
+    @staticmethod
+    def _question(messages: list[BaseMessage]) -> str:
+        return next((message.text() for message in reversed(messages) if isinstance(message, HumanMessage)), "")
+
+    def _parse_sub_queries(self, text: str, question: str) -> list[str]:
+        sub_queries: list[str] = []
+        for line in text.splitlines():
+            query = _LIST_MARKER.sub("", line).strip().strip("\"'")
+            if query and query not in sub_queries:
+                sub_queries.append(query)
+        # An unparsable plan still searches for the question itself.
+        return sub_queries[: self.max_sub_queries] or [question]
+
+    async def _plan(self, state: DeepSearchState, config: RunnableConfig) -> dict[str, list]:
+        question = self._question(state.messages)
+        prompt = [SystemMessage(content=PLAN_PROMPT.format(max_sub_queries=self.max_sub_queries)), *state.messages]
+        response = await self._invoke_llm(prompt, state.llm_config, config)
+        sub_queries = self._parse_sub_queries(response.text(), question)
+        get_stream_writer()({"event": "planned", "sub_queries": sub_queries})
+        return {"sub_queries": sub_queries, "sources": [], "summaries": [], "used_tools": []}
+
+    async def _search(self, state: DeepSearchState, config: RunnableConfig) -> dict[str, list]:
+        sources = await asyncio.gather(
+            *(self._search_tool(tool, query, config) for query in state.sub_queries for tool in self.tools)
+        )
+        sources = [source for source in sources if source is not None]
+        return {
+            "sources": sources,
+            "used_tools": [UsedTool(name=source.tool, output=source.content) for source in sources],
+        }
+
+    async def _search_tool(self, tool: BaseTool, query: str, config: RunnableConfig) -> Source | None:
+        async with self._search_slots, self.tool_limiter.limit(tool.name):
+            with TRACER.span("tool", tool=tool.name) as span:
+                start = time.perf_counter()
+                # Called with a tool call, a tool handling its own errors, like a `ResilientTool`, answers with an
+                # error `ToolMessage` instead of raising.
+                tool_call = ToolCall(
+                    name=tool.name, args={"query": query}, id=f"call-{uuid.uuid4().hex}", type="tool_call"
+                )
+                try:
+                    message = await tool.ainvoke(tool_call, config)
+                    output = message.text() if isinstance(message, ToolMessage) else str(message)
+                    error = output if isinstance(message, ToolMessage) and message.status == "error" else None
+                except Exception as e:
+                    output, error = None, repr(e)
+                TOOL_CALL_SECONDS.labels(tool=tool.name).observe(time.perf_counter() - start)
+                if error is not None:
+                    TOOL_CALL_ERRORS.labels(tool=tool.name).inc()
+                    if span:
+                        span.status = "error"
+        # A failed tool only loses its sources, the other searches still inform the answer.
+        get_stream_writer()({"event": "searched", "tool": tool.name, "query": query, "error": error})
+        if error is not None or not output:
+            return None
+        return Source(tool=tool.name, query=query, content=output[: self.max_source_chars])
+
+    async def _summarize(self, state: DeepSearchState, config: RunnableConfig) -> dict[str, list[str]]:
+        question = self._question(state.messages)
+        batches = [
+            state.sources[start : start + self.summary_batch_size]
+            for start in range(0, len(state.sources), self.summary_batch_size)
+        ]
+        summaries = await asyncio.gather(
+            *(
+                self._summarize_batch(index, batch, question, state.llm_config, config)
+                for index, batch in enumerate(batches)
+            )
+        )
+        return {"summaries": list(summaries)}
+
+    async def _summarize_batch(
+        self, index: int, batch: list[Source], question: str, llm_config: LLMConfig, config: RunnableConfig
+    ) -> str:
+        sources = "\n\n".join(f"[{source.tool}: {source.query}]\n{source.content}" for source in batch)
+        prompt: list[BaseMessage] = [HumanMessage(content=SUMMARY_PROMPT.format(question=question, sources=sources))]
+        async with self._summary_slots:
+            response = await self._invoke_llm(prompt, llm_config, config)
+        get_stream_writer()({"event": "summarized", "batch": index, "tools": [source.tool for source in batch]})
+        return response.text()
+
+    async def _synthesize(self, state: DeepSearchState, config: RunnableConfig) -> dict[str, list]:
+        notes = "\n\n".join(state.summaries) or "No search returned any results."
+        prompt = [SystemMessage(content=SYNTHESIS_PROMPT.format(notes=notes)), *state.messages]
+        response = await self._invoke_llm(prompt, state.llm_config, config, streamed=True)
+        get_stream_writer()(
+            {
+                "event": "answered",
+                "model": response.response_metadata.get(MODEL_METADATA_KEY),
+                "sources": len(state.sources),
+            }
+        )
+        return {"messages": [response]}
+
+    def _instrument_node(self, node: str, func):
+        return timed_node(self.name, node, traced_node(node, func))
+
+    def _init_workflow(self) -> CompiledStateGraph:
+        workflow = StateGraph(state_schema=self.state_schema)
+        workflow.add_node("plan", self._instrument_node("plan", self._plan))
+        workflow.add_node("search", self._instrument_node("search", self._search))
+        workflow.add_node("summarize", self._instrument_node("summarize", self._summarize))
+        workflow.add_node("synthesize", self._instrument_node("synthesize", self._synthesize))
+        workflow.set_entry_point("plan")
+        workflow.add_edge("plan", "search")
+        workflow.add_edge("search", "summarize")
+        workflow.add_edge("summarize", "synthesize")
+        workflow.set_finish_point("synthesize")
+        return workflow.compile(name=self.name, checkpointer=TracingCheckpointSaver(self.checkpointer))
+
+    @staticmethod
+    def _config(thread_id: str | None, priority: Priority) -> RunnableConfig:
+        return {"configurable": {"thread_id": thread_id or get_thread_id(), "priority": priority}}
+
+    async def run(
+        self,
+        messages: list[BaseMessage],
+        thread_id: str | None = None,
+        llm_config: LLMConfig = LLMConfig(),
+        priority: Priority = "interactive",
+    ) -> tuple[AIMessage, list[UsedTool]]:
+        state = DeepSearchState(messages=messages, llm_config=llm_config)
+        result = await self.workflow.ainvoke(state, config=self._config(thread_id, priority))
+        if not isinstance(result["messages"][-1], AIMessage):
+            raise MissingAIMessageError("The deep search ended without an answer.")
+        return result["messages"][-1], result["used_tools"]
+
+    async def stream(
+        self,
+        messages: list[BaseMessage],
+        thread_id: str | None = None,
+        llm_config: LLMConfig = LLMConfig(),
+        priority: Priority = "interactive",
+    ) -> AsyncIterator[DeepSearchEvent]:
+        state = DeepSearchState(messages=messages, llm_config=llm_config)
+        return self._stream(state, self._config(thread_id, priority))
+
+    async def _stream(self, state: DeepSearchState, config: RunnableConfig) -> AsyncIterator[DeepSearchEvent]:
+        async for mode, payload in self.workflow.astream(state, stream_mode=["custom", "messages"], config=config):
+            if mode == "custom":
+                data = dict(cast(dict[str, Any], payload))
+                yield DeepSearchEvent(event=data.pop("event"), data=data)
+                continue
+            message, _ = payload
+            if isinstance(message, AIMessageChunk) and message.content:
+                yield DeepSearchEvent(event="answer_delta", data={"content": message.text()})
+
+    def plot(self) -> str:
+        return self.workflow.get_graph().draw_mermaid()
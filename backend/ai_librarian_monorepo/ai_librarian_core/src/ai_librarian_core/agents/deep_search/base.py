@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
-from ai_librarian_core.agents.react.state import MessagesState
+from ai_librarian_core.agents.deep_search.state import DeepSearchState
 from ai_librarian_core.models.llm_config import LLMConfig
 from langchain.chat_models import init_chat_model
 from langchain.chat_models.base import BaseChatModel
@@ -33,6 +34,8 @@ class BaseDeepSearchAgent(ABC):
     tools: list[BaseTool]
     name: str = "deep_search_agent"
     checkpointer: BaseCheckpointSaver = InMemorySaver()
+    # Builds the chat model for a config instead of `init_chat_model`, e.g. a scripted fake model for benchmarks.
+    chat_model_factory: Callable[[LLMConfig], BaseChatModel] | None = None
 
     @property
     @abstractmethod
@@ -41,21 +44,24 @@ class BaseDeepSearchAgent(ABC):
 
     def __post_init__(self):
         self._llm_cache: dict[LLMConfig, BaseChatModel] = {}
-        self.state_schema: MessagesState = MessagesState
+        self.state_schema: type[DeepSearchState] = DeepSearchState
 
     def _init_llm(self, llm_config: LLMConfig) -> BaseChatModel:
+        # The agent calls its tools itself, the chat model only plans, summarizes and answers.
         if llm_config in self._llm_cache:
             return self._llm_cache[llm_config]
 
         try:
-            llm = init_chat_model(
-                model=llm_config.model,
-                temperature=llm_config.temperature,
-                max_tokens=llm_config.max_tokens,
-            )
-            llm_with_tools = llm.bind_tools(self.tools)
-            self._llm_cache[llm_config] = llm_with_tools
-            return llm_with_tools
+            if self.chat_model_factory is not None:
+                llm = self.chat_model_factory(llm_config)
+            else:
+                llm = init_chat_model(
+                    model=llm_config.model,
+                    temperature=llm_config.temperature,
+                    max_tokens=llm_config.max_tokens,
+                )
+            self._llm_cache[llm_config] = llm
+            return llm
         except ValueError as e:
             raise InvalidChatModelError("Model_provider cannot be inferred or isn’t supported.") from e
         except ImportError as e:
@@ -68,9 +74,13 @@ class BaseDeepSearchAgent(ABC):
         raise NotImplementedError("Subclasses must implement this method.")
 
     @abstractmethod
-    def run(self) -> Any:
+    def run(self, *args: Any, **kwargs: Any) -> Any:
         raise NotImplementedError("Subclasses must implement this method.")
 
     @abstractmethod
-    def stream(self) -> Any:
+    def stream(self, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    @abstractmethod
+    def plot(self) -> str:
         raise NotImplementedError("Subclasses must implement this method.")
@@ -0,0 +1,25 @@
+from typing import Annotated
+
+from ai_librarian_core.models.llm_config import LLMConfig
+from ai_librarian_core.models.used_tool import UsedTool
+from langchain_core.messages import BaseMessage
+from langgraph.graph import add_messages
+from pydantic import BaseModel, Field
+
+
+class Source(BaseModel):
+    """The output of one tool for one sub-query."""
+
+    tool: str
+    query: str
+    content: str
+
+
+class DeepSearchState(BaseModel):
+    messages: Annotated[list[BaseMessage], add_messages] = Field(default_factory=list)
+    llm_config: LLMConfig = Field(default_factory=LLMConfig)
+    used_tools: list[UsedTool] = Field(default_factory=list)
+    # The research of the current turn, replaced by every new question.
+    sub_queries: list[str] = Field(default_factory=list)
+    sources: list[Source] = Field(default_factory=list)
+    summaries: list[str] = Field(default_factory=list)
@@ -1,41 +1,198 @@
+import asyncio
+import hashlib
+import time
 from collections.abc import AsyncIterator
-from dataclasses import dataclass
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
+from dataclasses import dataclass, field
+from functools import cached_property, partial
 from typing import Literal
 
 from ai_librarian_core.agents.react.base import BaseReactAgent, MissingAIMessageError, ReactAgentError
+from ai_librarian_core.agents.react.cascade import MODEL_METADATA_KEY, EscalationSignal, ModelCascade
+from ai_librarian_core.agents.react.hedging import HedgedChatModel, HedgePolicy
 from ai_librarian_core.agents.react.state import MessagesState
-from ai_librarian_core.models.llm_config import LLMConfig
+from ai_librarian_core.blobs.offload import ToolOutputOffloader
+from ai_librarian_core.cache.answer_cache import AnswerCache, CachedAnswer
+from ai_librarian_core.cache.prompt_cache import cache_friendly_messages
+from ai_librarian_core.models.llm_config import LLMConfig, Model
 from ai_librarian_core.models.used_tool import UsedTool
+from ai_librarian_core.observability.metrics import (
+    CHECKPOINTER_BYTES,
+    CHECKPOINTER_THREADS,
+    MODEL_ANSWERS,
+    MODEL_ESCALATIONS,
+    TOOL_CALL_ERRORS,
+    TOOL_CALL_SECONDS,
+    checkpointer_size_bytes,
+    checkpointer_thread_count,
+    record_token_usage,
+    timed_node,
+)
+from ai_librarian_core.observability.tracing import TRACER, TracingCheckpointSaver, traced_node
+from ai_librarian_core.scheduling.llm_scheduler import (
+    Admission,
+    LLMOverloadedError,
+    LLMScheduler,
+    Priority,
+    estimate_tokens,
+)
+from ai_librarian_core.scheduling.thread_runs import ThreadBusyError, ThreadRunCoordinator
+from ai_librarian_core.tools.concurrency import ToolConcurrencyLimiter
 from ai_librarian_core.utils.uuid import get_thread_id
-from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolCall,
+    ToolMessage,
+)
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.tools import BaseTool
+from langgraph.constants import TAG_NOSTREAM
 from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
-from langgraph.prebuilt import ToolNode
+
+# Cached answers are replayed in slices of this many characters so clients still render a stream.
+CACHED_ANSWER_CHUNK_CHARS = 16
 
 
 @dataclass
 class AsyncReactAgent(BaseReactAgent):
+    tool_limiter: ToolConcurrencyLimiter = field(default_factory=ToolConcurrencyLimiter)
+    # Answers opening questions of new threads from earlier answers instead of running the graph.
+    answer_cache: AnswerCache | None = None
+    # Faster models tried first for requests with `LLMConfig.cascade` set.
+    model_cascade: ModelCascade = field(default_factory=ModelCascade)
+    # Sends slow or failing chat model requests to a backup model of another provider as well.
+    hedge_policy: HedgePolicy | None = None
+    # Queues chat model requests within per-provider budgets instead of sending them all at once.
+    llm_scheduler: LLMScheduler | None = None
+    # Keeps concurrent runs of the same thread from interleaving, e.g. when a question is submitted twice.
+    run_coordinator: ThreadRunCoordinator | None = None
+    # Keeps long tool outputs in a blob store, the state and checkpoints only hold a preview and the blob id.
+    tool_output_offloader: ToolOutputOffloader | None = None
+
     def __post_init__(self):
         super().__post_init__()
+        self._tools_by_name = {tool.name: tool for tool in self.tools}
+        CHECKPOINTER_THREADS.labels(agent=self.name).set_function(partial(checkpointer_thread_count, self.checkpointer))
+        CHECKPOINTER_BYTES.labels(agent=self.name).set_function(
+            partial(checkpointer_size_bytes, self.checkpointer), blocking=True
+        )
 
-    @property
+    @cached_property
     def workflow(self) -> CompiledStateGraph:
+        # Compiled once, the graph does not change after construction.
         return self._init_workflow()
 
-    async def _clear_used_tools(self, state: MessagesState) -> dict[str, list[UsedTool]]:
-        return {"used_tools": []}
+    def _bind_tools(self, llm_config: LLMConfig, tools: list[BaseTool]) -> BaseChatModel:
+        llm = super()._bind_tools(llm_config, tools)
+        if self.hedge_policy is None:
+            return llm
+        backup_model = self.hedge_policy.backups.get(llm_config.model)
+        if backup_model is None or backup_model == llm_config.model:
+            return llm
+        return HedgedChatModel(
+            primary=llm,
+            primary_model=llm_config.model,
+            backup=super()._bind_tools(llm_config.model_copy(update={"model": backup_model}), tools),
+            backup_model=backup_model,
+            policy=self.hedge_policy,
+            scheduler=self.llm_scheduler,
+        )
+
+    async def _clear_used_tools(self, state: MessagesState) -> dict[str, list[UsedTool] | int]:
+        return {"used_tools": [], "model_tier": 0}
 
-    async def _invoke_llm(self, state: MessagesState) -> dict[str, list[BaseMessage]]:
+    async def _invoke_llm(self, state: MessagesState, config: RunnableConfig) -> dict[str, list[BaseMessage] | int]:
         llm_config = state.llm_config
-        llm = self._init_llm(llm_config)
-        messages = state.messages
+        tiers = self.model_cascade.tiers(llm_config)
+        tier = min(state.model_tier, len(tiers) - 1)
+        if tier < len(tiers) - 1 and self.model_cascade.should_escalate_after_tools(state.messages):
+            tier = self._escalate(tiers, tier, "tool_error")
+        tools = self._select_tools(state.messages)
+
+        while True:
+            model = tiers[tier]
+            is_last_tier = tier == len(tiers) - 1
+            messages = cache_friendly_messages(state.messages, model)
+            try:
+                llm = self._init_llm(llm_config.model_copy(update={"model": model, "cascade": False}), tools)
+                llm = llm.with_config(metadata={MODEL_METADATA_KEY: str(model)})
+                if not is_last_tier and self.model_cascade.buffers_answers:
+                    # The answer may still be rejected, so it is only emitted once accepted.
+                    llm = llm.with_config(tags=[TAG_NOSTREAM])
+                async with self._admit(model, messages, llm_config, config) as admission:
+                    response = await llm.ainvoke(messages)
+                    if not isinstance(response, AIMessage):
+                        raise MissingAIMessageError(
+                            f"Expected AIMessage from the chat model, but got {type(response).__name__}"
+                        )
+                    admission.used_tokens = (response.usage_metadata or {}).get("total_tokens")
+            except Exception as e:
+                if not is_last_tier and "error" in self.model_cascade.signals:
+                    tier = self._escalate(tiers, tier, "error")
+                    continue
+                if isinstance(e, ReactAgentError | LLMOverloadedError):
+                    raise
+                # TODO(youkwan): Handle specific errors (couldn't find docs).
+                raise ReactAgentError("An unexpected error occurred while trying to invoke the chat model.") from e
+            # A hedged request may have been answered by the backup model.
+            answered_by = response.response_metadata.setdefault(MODEL_METADATA_KEY, str(model))
+            record_token_usage(answered_by, response.usage_metadata)
+
+            if not is_last_tier and not response.tool_calls:
+                signal = self.model_cascade.answer_signal(response)
+                if signal is None and "self_check" in self.model_cascade.signals:
+                    signal = await self._self_check(llm, model, messages, response)
+                if signal is not None:
+                    tier = self._escalate(tiers, tier, signal)
+                    continue
+
+            if not response.tool_calls:
+                MODEL_ANSWERS.labels(model=answered_by).inc()
+            return {"messages": [response], "model_tier": tier}
+
+    def _admit(
+        self, model: Model, messages: list[BaseMessage], llm_config: LLMConfig, config: RunnableConfig
+    ) -> AbstractAsyncContextManager[Admission]:
+        if self.llm_scheduler is None:
+            return nullcontext(Admission(provider=LLMScheduler.provider(model), reserved_tokens=0))
+        configurable = config.get("configurable", {})
+        return self.llm_scheduler.admit(
+            model,
+            thread_id=configurable.get("thread_id", ""),
+            priority=configurable.get("priority", "interactive"),
+            tokens=estimate_tokens(messages, llm_config.max_tokens),
+        )
+
+    def check_admission(self, llm_config: LLMConfig, thread_id: str | None = None, priority: Priority = "interactive"):
+        """Raises if a request would be shed right now, with `LLMOverloadedError` for its first chat model call or
+        `ThreadBusyError` for its thread.
+        """
+        if self.run_coordinator is not None and self.run_coordinator.policy == "reject" and thread_id is not None:
+            if self.run_coordinator.is_busy(thread_id):
+                raise ThreadBusyError(thread_id)
+        if self.llm_scheduler is not None:
+            self.llm_scheduler.check(self.model_cascade.tiers(llm_config)[0], priority)
+
+    def _escalate(self, tiers: list[Model], tier: int, signal: EscalationSignal) -> int:
+        MODEL_ESCALATIONS.labels(from_model=tiers[tier], to_model=tiers[tier + 1], signal=signal).inc()
+        return tier + 1
 
+    async def _self_check(
+        self, llm: Runnable, model: Model, messages: list[BaseMessage], response: AIMessage
+    ) -> EscalationSignal | None:
+        question = HumanMessage(content=self.model_cascade.self_check_prompt)
         try:
-            response = await llm.ainvoke(messages)
-            return {"messages": [response]}
-        # TODO(youkwan): Handle specific errors (couldn't find docs).
-        except Exception as e:
-            raise ReactAgentError("An unexpected error occurred while trying to invoke the chat model.") from e
+            verdict = await llm.with_config(tags=[TAG_NOSTREAM]).ainvoke([*messages, response, question])
+        except Exception:
+            return "self_check"
+        record_token_usage(model, verdict.usage_metadata)
+        return None if self.model_cascade.passed_self_check(verdict) else "self_check"
 
     async def _route(self, state: MessagesState) -> Literal["tools", "__end__"]:
         messages = state.messages
@@ -46,23 +203,67 @@ class AsyncReactAgent(BaseReactAgent):
             return "tools"
         return "__end__"
 
+    async def _execute_tools(self, state: MessagesState, config: RunnableConfig) -> dict[str, list[ToolMessage]]:
+        last_message = state.messages[-1]
+        if not isinstance(last_message, AIMessage):
+            raise MissingAIMessageError(f"Expected AIMessage before tools, but got {type(last_message).__name__}")
+
+        # All tool calls of a turn run concurrently, bounded by the limiter's global and per-tool slots.
+        tool_messages = await asyncio.gather(
+            *(self._execute_tool_call(tool_call, config) for tool_call in last_message.tool_calls)
+        )
+        return {"messages": list(tool_messages)}
+
+    async def _execute_tool_call(self, tool_call: ToolCall, config: RunnableConfig) -> ToolMessage:
+        tool = self._tools_by_name.get(tool_call["name"])
+        if tool is None:
+            return ToolMessage(
+                content=(
+                    f"Error: {tool_call['name']} is not a valid tool, try one of [{', '.join(self._tools_by_name)}]."
+                ),
+                name=tool_call["name"],
+                tool_call_id=tool_call["id"],
+                status="error",
+            )
+
+        async with self.tool_limiter.limit(tool.name):
+            with TRACER.span("tool", tool=tool.name) as span:
+                start = time.perf_counter()
+                try:
+                    tool_message = await tool.ainvoke({**tool_call, "type": "tool_call"}, config)
+                except Exception as e:
+                    tool_message = ToolMessage(
+                        content=f"Error: {e!r}\n Please fix your mistakes.",
+                        name=tool_call["name"],
+                        tool_call_id=tool_call["id"],
+                        status="error",
+                    )
+                TOOL_CALL_SECONDS.labels(tool=tool.name).observe(time.perf_counter() - start)
+                if tool_message.status == "error":
+                    TOOL_CALL_ERRORS.labels(tool=tool.name).inc()
+                    if span:
+                        span.status = "error"
+        if self.tool_output_offloader is not None:
+            return await self.tool_output_offloader.offload(tool_message)
+        return tool_message
+
     async def _catch_tool_massage(self, state: MessagesState) -> dict[str, list[UsedTool]]:
         messages = state.messages
-        used_tools = [
-            UsedTool(name=msg.name, output=msg.content) for msg in reversed(messages) if isinstance(msg, ToolMessage)
-        ]
+        used_tools = [UsedTool.from_message(msg) for msg in reversed(messages) if isinstance(msg, ToolMessage)]
         if used_tools:
             used_tools.reverse()
             return {"used_tools": used_tools}
 
+    def _instrument_node(self, node: str, func):
+        return timed_node(self.name, node, traced_node(node, func))
+
     def _init_workflow(self) -> CompiledStateGraph:
         workflow = StateGraph(state_schema=self.state_schema)
-        invoke_llm = self._invoke_llm
-        workflow.add_node("clear_used_tools", self._clear_used_tools)
+        invoke_llm = self._instrument_node("invoke_llm", self._invoke_llm)
+        workflow.add_node("clear_used_tools", self._instrument_node("clear_used_tools", self._clear_used_tools))
         workflow.add_node("invoke_llm", invoke_llm)
-        tool_node = ToolNode(self.tools)
-        workflow.add_node("catch_tool_massage", self._catch_tool_massage)
-        workflow.add_node("tools", tool_node)
+        workflow.add_node("catch_tool_massage", self._instrument_node("catch_tool_massage", self._catch_tool_massage))
+        workflow.add_node("tools", self._instrument_node("tools", self._execute_tools))
         workflow.set_entry_point("clear_used_tools")
         workflow.add_edge("clear_used_tools", "invoke_llm")
         workflow.add_conditional_edges(
@@ -72,26 +273,149 @@ class AsyncReactAgent(BaseReactAgent):
         workflow.add_edge("catch_tool_massage", "invoke_llm")
         workflow.add_edge("tools", "catch_tool_massage")
         workflow.add_edge("catch_tool_massage", "invoke_llm")
-        return workflow.compile(name=self.name, checkpointer=self.checkpointer)
+        return workflow.compile(name=self.name, checkpointer=TracingCheckpointSaver(self.checkpointer))
 
     async def run(
-        self, messages: list[BaseMessage], thread_id: str | None = None, llm_config: LLMConfig = LLMConfig()
+        self,
+        messages: list[BaseMessage],
+        thread_id: str | None = None,
+        llm_config: LLMConfig = LLMConfig(),
+        priority: Priority = "interactive",
     ) -> tuple[AIMessage, list[UsedTool]]:
         state = MessagesState(messages=messages, llm_config=llm_config)
-        result = await self.workflow.ainvoke(
-            state, config={"configurable": {"thread_id": thread_id or get_thread_id()}}
-        )
+        config = {"configurable": {"thread_id": thread_id or get_thread_id(), "priority": priority}}
+        async with self._thread_turn(config):
+            return await self._run(state, config)
+
+    async def _run(self, state: MessagesState, config: RunnableConfig) -> tuple[AIMessage, list[UsedTool]]:
+        answer_cache = self.answer_cache
+        cache_key = await self._answer_cache_key(state.messages, state.llm_config, config)
+        if answer_cache is not None and cache_key is not None and (answer := answer_cache.lookup(*cache_key)):
+            await self._save_cached_answer(state, answer, config)
+            return answer.message, answer.used_tools
+
+        result = await self.workflow.ainvoke(state, config=config)
+        if answer_cache is not None and cache_key is not None:
+            answer_cache.store(*cache_key, CachedAnswer(result["messages"][-1], result["used_tools"]))
         return result["messages"][-1], result["used_tools"]
 
     async def stream(
-        self, messages: list[BaseMessage], thread_id: str | None = None, llm_config: LLMConfig = LLMConfig()
+        self,
+        messages: list[BaseMessage],
+        thread_id: str | None = None,
+        llm_config: LLMConfig = LLMConfig(),
+        priority: Priority = "interactive",
     ) -> AsyncIterator[tuple[BaseMessage, dict[str, str]]]:
         state = MessagesState(messages=messages, llm_config=llm_config)
-        return self.workflow.astream(
-            state,
-            stream_mode="messages",
-            config={"configurable": {"thread_id": thread_id or get_thread_id()}},
+        config = {"configurable": {"thread_id": thread_id or get_thread_id(), "priority": priority}}
+        if self.run_coordinator is None:
+            return await self._stream(state, config)
+        return self._stream_in_turn(state, config)
+
+    async def _stream(
+        self, state: MessagesState, config: RunnableConfig
+    ) -> AsyncIterator[tuple[BaseMessage, dict[str, str]]]:
+        answer_cache = self.answer_cache
+        cache_key = await self._answer_cache_key(state.messages, state.llm_config, config)
+        if answer_cache is not None and cache_key is not None and (answer := answer_cache.lookup(*cache_key)):
+            await self._save_cached_answer(state, answer, config)
+            return self._stream_cached_answer(answer, config)
+
+        stream = self.workflow.astream(state, stream_mode="messages", config=config)
+        if answer_cache is not None and cache_key is not None:
+            return self._stream_and_store(stream, answer_cache, cache_key, config)
+        return stream
+
+    async def _stream_in_turn(
+        self, state: MessagesState, config: RunnableConfig
+    ) -> AsyncIterator[tuple[BaseMessage, dict[str, str]]]:
+        # The thread is held while the caller reads the stream, not only while it is set up.
+        async with self._thread_turn(config):
+            async for chunk in await self._stream(state, config):
+                yield chunk
+
+    @asynccontextmanager
+    async def _thread_turn(self, config: RunnableConfig) -> AsyncIterator[None]:
+        if self.run_coordinator is None:
+            yield
+            return
+        async with self.run_coordinator.run(config["configurable"]["thread_id"]) as turn:
+            if turn.preempted:
+                await self.close_interrupted_turn(config["configurable"]["thread_id"])
+            yield
+
+    async def close_interrupted_turn(self, thread_id: str):
+        """Answers the tool calls a cancelled run left without results, providers reject such a history."""
+        config = {"configurable": {"thread_id": thread_id}}
+        messages = (await self.workflow.aget_state(config)).values.get("messages", [])
+        if not messages or not isinstance(messages[-1], AIMessage) or not messages[-1].tool_calls:
+            return
+        tool_messages = [
+            ToolMessage(
+                content="Error: cancelled because the question was asked again.",
+                name=tool_call["name"],
+                tool_call_id=tool_call["id"],
+                status="error",
+            )
+            for tool_call in messages[-1].tool_calls
+        ]
+        await self.workflow.aupdate_state(config, {"messages": tool_messages}, as_node="tools")
+
+    async def _answer_cache_key(
+        self, messages: list[BaseMessage], llm_config: LLMConfig, config: RunnableConfig
+    ) -> tuple[str, str] | None:
+        """Returns the (question, model) the answer cache is keyed on, or None if the request is not cacheable.
+
+        Only the opening question of a new thread is cacheable, follow-up questions depend on the conversation.
+        A system prompt changes the answer, so its digest becomes part of the model key.
+        """
+        if self.answer_cache is None or not messages or not isinstance(messages[-1], HumanMessage):
+            return None
+        if any(not isinstance(message, HumanMessage | SystemMessage) for message in messages):
+            return None
+        if await self.checkpointer.aget_tuple(config) is not None:
+            return None
+
+        model = f"{llm_config.model}+cascade" if llm_config.cascade else llm_config.model
+        if system_prompt := "\n".join(message.text() for message in messages if isinstance(message, SystemMessage)):
+            model = f"{model}#{hashlib.sha1(system_prompt.encode()).hexdigest()[:12]}"
+        return messages[-1].text(), model
+
+    async def _save_cached_answer(self, state: MessagesState, answer: CachedAnswer, config: RunnableConfig):
+        # The turn is written to the thread as if the graph had produced it, so follow-up questions see it.
+        message = answer.message.model_copy(update={"id": None})
+        await self.workflow.aupdate_state(
+            config,
+            {"messages": [*state.messages, message], "llm_config": state.llm_config, "used_tools": answer.used_tools},
+            as_node="invoke_llm",
         )
 
+    async def _stream_cached_answer(
+        self, answer: CachedAnswer, config: RunnableConfig
+    ) -> AsyncIterator[tuple[BaseMessage, dict[str, str]]]:
+        metadata = {
+            "langgraph_node": "invoke_llm",
+            "thread_id": config["configurable"]["thread_id"],
+            "cached": True,
+            MODEL_METADATA_KEY: answer.message.response_metadata.get(MODEL_METADATA_KEY),
+        }
+        content = answer.message.text()
+        for start in range(0, len(content), CACHED_ANSWER_CHUNK_CHARS):
+            yield AIMessageChunk(content=content[start : start + CACHED_ANSWER_CHUNK_CHARS]), metadata
+        yield AIMessageChunk(content="", response_metadata={"finish_reason": "stop"}), metadata
+
+    async def _stream_and_store(
+        self,
+        stream: AsyncIterator[tuple[BaseMessage, dict[str, str]]],
+        answer_cache: AnswerCache,
+        cache_key: tuple[str, str],
+        config: RunnableConfig,
+    ) -> AsyncIterator[tuple[BaseMessage, dict[str, str]]]:
+        async for chunk in stream:
+            yield chunk
+        # Only reached when the client read the whole stream, abandoned runs are not cached.
+        values = (await self.workflow.aget_state(config)).values
+        answer_cache.store(*cache_key, CachedAnswer(values["messages"][-1], values.get("used_tools", [])))
+
     def plot(self) -> str:
         return self.workflow.get_graph().draw_mermaid()
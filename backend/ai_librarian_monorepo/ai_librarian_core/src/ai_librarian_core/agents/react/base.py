@@ -1,13 +1,16 @@
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Callable, Iterator
 from dataclasses import dataclass
 
 from ai_librarian_core.agents.react.state import MessagesState
+from ai_librarian_core.cache.prompt_cache import cache_friendly_tools
 from ai_librarian_core.models.llm_config import LLMConfig
 from ai_librarian_core.models.used_tool import UsedTool
+from ai_librarian_core.observability.metrics import BOUND_TOOLS
+from ai_librarian_core.tools.selection import ToolSelector
 from langchain.chat_models import init_chat_model
 from langchain.chat_models.base import BaseChatModel
-from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 from langchain_core.tools import BaseTool
 from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.memory import InMemorySaver
@@ -35,6 +38,10 @@ class BaseReactAgent(ABC):
     tools: list[BaseTool]
     name: str = "react_agent"
     checkpointer: BaseCheckpointSaver = InMemorySaver()
+    # Builds the chat model for a config instead of `init_chat_model`, e.g. a scripted fake model for benchmarks.
+    chat_model_factory: Callable[[LLMConfig], BaseChatModel] | None = None
+    # Binds only the tools relevant to the latest question instead of all of them.
+    tool_selector: ToolSelector | None = None
 
     @property
     @abstractmethod
@@ -42,28 +49,54 @@ class BaseReactAgent(ABC):
         raise NotImplementedError("Subclasses must implement this method.")
 
     def __post_init__(self):
-        self._llm_cache: dict[LLMConfig, BaseChatModel] = {}
+        self._chat_models: dict[LLMConfig, BaseChatModel] = {}
+        self._llm_cache: dict[tuple[LLMConfig, tuple[str, ...]], BaseChatModel] = {}
         self.state_schema: MessagesState = MessagesState
 
-    def _init_llm(self, llm_config: LLMConfig) -> BaseChatModel:
-        if llm_config in self._llm_cache:
-            return self._llm_cache[llm_config]
+    def _select_tools(self, messages: list[BaseMessage]) -> list[BaseTool]:
+        if self.tool_selector is None:
+            return self.tools
+        query = next((message.text() for message in reversed(messages) if isinstance(message, HumanMessage)), "")
+        # Tools called earlier in the thread stay bound, some providers reject tool calls of unknown tools.
+        called = {
+            tool_call["name"]
+            for message in messages
+            if isinstance(message, AIMessage)
+            for tool_call in message.tool_calls
+        }
+        return self.tool_selector.select(self.tools, query, required=called)
+
+    def _init_llm(self, llm_config: LLMConfig, tools: list[BaseTool] | None = None) -> BaseChatModel:
+        tools = self.tools if tools is None else tools
+        key = (llm_config, tuple(sorted(tool.name for tool in tools)))
+        BOUND_TOOLS.observe(len(tools))
+        if key in self._llm_cache:
+            return self._llm_cache[key]
 
         try:
-            llm = init_chat_model(
-                model=llm_config.model,
-                temperature=llm_config.temperature,
-                max_tokens=llm_config.max_tokens,
-            )
-            llm_with_tools = llm.bind_tools(self.tools)
-            self._llm_cache[llm_config] = llm_with_tools
-            return llm_with_tools
+            llm_with_tools = self._bind_tools(llm_config, tools)
         except ValueError as e:
             raise InvalidChatModelError("Model_provider cannot be inferred or isn’t supported.") from e
         except ImportError as e:
             raise ChatModelImportError("Model provider integration package is not installed.") from e
         except Exception as e:
             raise ReactAgentError("An unexpected error occurred while trying to initialize the chat model.") from e
+        self._llm_cache[key] = llm_with_tools
+        return llm_with_tools
+
+    def _bind_tools(self, llm_config: LLMConfig, tools: list[BaseTool]) -> BaseChatModel:
+        llm = self._chat_models.get(llm_config)
+        if llm is None:
+            if self.chat_model_factory is not None:
+                llm = self.chat_model_factory(llm_config)
+            else:
+                llm = init_chat_model(
+                    model=llm_config.model,
+                    temperature=llm_config.temperature,
+                    max_tokens=llm_config.max_tokens,
+                )
+            self._chat_models[llm_config] = llm
+        return llm.bind_tools(cache_friendly_tools(tools, llm_config.model))
 
     @abstractmethod
     def _init_workflow(self) -> CompiledStateGraph:
@@ -0,0 +1,71 @@
+from dataclasses import dataclass, field
+from typing import Literal
+
+from ai_librarian_core.models.llm_config import LLMConfig, Model
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+
+# The model that produced an answer is stored under this key of its `response_metadata` and of the stream metadata.
+MODEL_METADATA_KEY = "ai_librarian_model"
+
+EscalationSignal = Literal["error", "tool_error", "empty_answer", "self_check"]
+
+DEFAULT_SELF_CHECK_PROMPT = (
+    "Does your previous answer fully and correctly answer my question, without guessing? Reply with only YES or NO."
+)
+
+
+@dataclass
+class ModelCascade:
+    """Tries faster models before the requested one and escalates when the answer looks unreliable.
+
+    Only requests whose `LLMConfig.cascade` is set use the cascade, the requested `LLMConfig.model` is the last and
+    strongest tier. A turn starts on the first tier and moves to the next one, for the rest of the turn, on any of
+    the enabled signals:
+
+    - "error": the chat model call failed, e.g. the provider is down or its API key is missing.
+    - "tool_error": a tool called by the current tier returned an error.
+    - "empty_answer": the final answer has no text.
+    - "self_check": the tier answers NO when asked whether its final answer is complete, at the cost of one more
+      call to the fast model.
+
+    Final answers of tiers that may still be rejected ("empty_answer", "self_check") are not streamed token by
+    token, the accepted answer is sent as a whole once it is checked.
+
+    Attributes:
+        fast_models (list[Model]): The models tried before the requested one, fastest first.
+        signals (frozenset[EscalationSignal]): The signals that escalate to the next tier.
+        self_check_prompt (str): The question asked for the "self_check" signal.
+    """
+
+    fast_models: list[Model] = field(default_factory=lambda: [Model.LLAMA_3_1_8B_INSTANT])
+    signals: frozenset[EscalationSignal] = frozenset({"error", "tool_error", "empty_answer"})
+    self_check_prompt: str = DEFAULT_SELF_CHECK_PROMPT
+
+    @property
+    def buffers_answers(self) -> bool:
+        return bool(self.signals & {"empty_answer", "self_check"})
+
+    def tiers(self, llm_config: LLMConfig) -> list[Model]:
+        if not llm_config.cascade:
+            return [llm_config.model]
+        return [model for model in self.fast_models if model != llm_config.model] + [llm_config.model]
+
+    def should_escalate_after_tools(self, messages: list[BaseMessage]) -> bool:
+        """Whether the tool results of the last hop contain an error."""
+        if "tool_error" not in self.signals:
+            return False
+        for message in reversed(messages):
+            if not isinstance(message, ToolMessage):
+                return False
+            if message.status == "error":
+                return True
+        return False
+
+    def answer_signal(self, response: AIMessage) -> EscalationSignal | None:
+        if "empty_answer" in self.signals and not response.tool_calls and not response.text().strip():
+            return "empty_answer"
+        return None
+
+    @staticmethod
+    def passed_self_check(verdict: AIMessage) -> bool:
+        return not verdict.text().strip().upper().startswith("NO")
@@ -0,0 +1,230 @@
+import asyncio
+import contextlib
+import math
+import time
+from collections import defaultdict, deque
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from ai_librarian_core.agents.react.cascade import MODEL_METADATA_KEY
+from ai_librarian_core.cache.prompt_cache import cache_friendly_messages
+from ai_librarian_core.models.llm_config import Model
+from ai_librarian_core.observability.metrics import HEDGE_WINNERS, HEDGED_REQUESTS, LLM_TTFT_SECONDS
+from ai_librarian_core.scheduling.llm_scheduler import Admission, LLMScheduler, estimate_tokens
+from langchain_core.callbacks import (
+    AsyncCallbackManager,
+    AsyncCallbackManagerForLLMRun,
+    BaseCallbackManager,
+    CallbackManager,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.language_models.chat_models import agenerate_from_stream
+from langchain_core.messages import AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import Runnable, RunnableConfig
+from langgraph.constants import TAG_NOSTREAM
+from pydantic import ConfigDict
+
+
+@dataclass
+class HedgePolicy:
+    """When and where to send a second copy of a chat model request.
+
+    A request to a model with a backup is sent to the backup as well when its first token is later than the
+    `percentile` of the model's recent times to first token, or right away when the model fails before its first
+    token. Whichever streams first answers the request and the other one is cancelled. The backup should be a model
+    of another provider, so a latency spike or an outage of one provider does not stall every stream. With a
+    scheduler, the backup request is only sent when its provider has a free slot right away.
+
+    Attributes:
+        backups (dict[Model, Model]): The backup model of each hedged model.
+        percentile (float): The percentile of recent times to first token used as the hedging deadline (default: 95).
+        min_samples (int): The number of observed requests needed before the percentile is trusted (default: 20).
+        initial_deadline (float): The deadline in seconds until `min_samples` requests were observed (default: 2.0).
+        min_deadline (float): The lower bound of the deadline in seconds, so a fast provider is not hedged on every
+            jitter (default: 0.2).
+        window (int): The number of recent times to first token kept per model (default: 200).
+    """
+
+    backups: dict[Model, Model] = field(default_factory=dict)
+    percentile: float = 95
+    min_samples: int = 20
+    initial_deadline: float = 2.0
+    min_deadline: float = 0.2
+    window: int = 200
+
+    def __post_init__(self):
+        self._ttfts: defaultdict[str, deque[float]] = defaultdict(lambda: deque(maxlen=self.window))
+
+    def deadline(self, model: str) -> float:
+        samples = self._ttfts[model]
+        if len(samples) < self.min_samples:
+            return self.initial_deadline
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, math.ceil(self.percentile / 100 * len(ordered)) - 1)
+        return max(self.min_deadline, ordered[index])
+
+    def observe(self, model: str, seconds: float):
+        self._ttfts[model].append(seconds)
+        LLM_TTFT_SECONDS.labels(model=model).observe(seconds)
+
+
+def _child_callbacks(run_manager: AsyncCallbackManagerForLLMRun | CallbackManagerForLLMRun) -> BaseCallbackManager:
+    # Chat model runs have no children of their own, the racing runs are nested under this one for tracing.
+    manager_class = AsyncCallbackManager if isinstance(run_manager, AsyncCallbackManagerForLLMRun) else CallbackManager
+    manager = manager_class(handlers=[], parent_run_id=run_manager.run_id)
+    manager.set_handlers(run_manager.inheritable_handlers)
+    manager.add_tags(run_manager.inheritable_tags)
+    manager.add_metadata(run_manager.inheritable_metadata)
+    return manager
+
+
+class HedgedChatModel(BaseChatModel):
+    """Streams a chat model request from the primary model, hedged and failed over to a backup model.
+
+    Both models are already bound to the tools, the backup gets the messages laid out for its own provider. Only
+    this model's run is streamed, the runs of the primary and the backup are tagged to stay out of LangGraph's
+    message stream. The model that answered is stored in the `response_metadata` of the first chunk. Synchronous
+    calls are sent to the primary model only, without hedging.
+
+    Attributes:
+        primary (Runnable): The requested chat model, bound to the tools.
+        primary_model (str): The name of the requested model.
+        backup (Runnable): The backup chat model, bound to the tools.
+        backup_model (str): The name of the backup model.
+        policy (HedgePolicy): Decides the hedging deadline and keeps the times to first token.
+        scheduler (LLMScheduler | None): Admits the backup request within its provider's budget, the primary
+            request is admitted by the caller (default: None).
+    """
+
+    primary: Runnable
+    primary_model: str
+    backup: Runnable
+    backup_model: str
+    policy: HedgePolicy
+    scheduler: LLMScheduler | None = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @property
+    def _llm_type(self) -> str:
+        return "hedged"
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return await agenerate_from_stream(self._astream(messages, stop=stop, run_manager=run_manager, **kwargs))
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        config: RunnableConfig = {"callbacks": _child_callbacks(run_manager) if run_manager else None}
+        message = self.primary.invoke(messages, config=config, stop=stop, **kwargs)
+        message.response_metadata[MODEL_METADATA_KEY] = self.primary_model
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        def start(llm: Runnable, model: str, model_messages: list[BaseMessage]) -> asyncio.Task:
+            config: RunnableConfig = {
+                "tags": [TAG_NOSTREAM],
+                "callbacks": _child_callbacks(run_manager) if run_manager else None,
+            }
+            # Chat models stream from an async generator, which is closed when its racer loses.
+            stream = cast(
+                AsyncGenerator[AIMessageChunk], llm.astream(model_messages, config=config, stop=stop, **kwargs)
+            )
+            return asyncio.create_task(self._first_chunk(model, stream))
+
+        racers = {start(self.primary, self.primary_model, messages)}
+        # Hedging is decided once, the backup is only raced if the scheduler admits it.
+        hedge_decided = hedged = False
+        winner = None
+        # Racers that streamed their first chunk in the same wait as the winner.
+        losers: list[asyncio.Task] = []
+        errors: list[BaseException] = []
+        # Holds the scheduler slot of the backup request while it races or streams.
+        async with contextlib.AsyncExitStack() as backup_admission:
+            try:
+                done, _ = await asyncio.wait(racers, timeout=self.policy.deadline(self.primary_model))
+                while True:
+                    for task in done:
+                        racers.discard(task)
+                        error = task.exception()
+                        if error is not None:
+                            errors.append(error)
+                        elif winner is None:
+                            winner = task
+                        else:
+                            losers.append(task)
+                    if winner is not None:
+                        break
+                    if not hedge_decided:
+                        hedge_decided = True
+                        backup_messages = cache_friendly_messages(messages, self.backup_model)
+                        if await backup_admission.enter_async_context(self._admit_backup(backup_messages)):
+                            trigger = "error" if errors else "deadline"
+                            HEDGED_REQUESTS.labels(
+                                model=self.primary_model, backup=self.backup_model, trigger=trigger
+                            ).inc()
+                            racers.add(start(self.backup, self.backup_model, backup_messages))
+                            hedged = True
+                    if not racers:
+                        raise errors[0]
+                    done, _ = await asyncio.wait(racers, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                # The loser is cancelled as soon as the winner streamed its first chunk, or closed if it streamed too.
+                for task in racers:
+                    task.cancel()
+                for task in losers:
+                    _, loser_stream, _ = task.result()
+                    with contextlib.suppress(Exception):
+                        await loser_stream.aclose()
+
+            model, stream, first_chunk = winner.result()
+            if model != self.backup_model:
+                # The backup lost, its slot is given back before the primary streams the rest of its answer.
+                await backup_admission.aclose()
+            if hedged:
+                HEDGE_WINNERS.labels(model=model).inc()
+            first_chunk.response_metadata[MODEL_METADATA_KEY] = model
+            try:
+                yield ChatGenerationChunk(message=first_chunk)
+                async for chunk in stream:
+                    yield ChatGenerationChunk(message=chunk)
+            finally:
+                await stream.aclose()
+
+    def _admit_backup(self, messages: list[BaseMessage]) -> AbstractAsyncContextManager[Admission | None]:
+        if self.scheduler is None:
+            return nullcontext(Admission(provider=LLMScheduler.provider(self.backup_model), reserved_tokens=0))
+        return self.scheduler.admit_now(self.backup_model, tokens=estimate_tokens(messages, None))
+
+    async def _first_chunk(
+        self, model: str, stream: AsyncGenerator[AIMessageChunk]
+    ) -> tuple[str, AsyncGenerator[AIMessageChunk], AIMessageChunk]:
+        start = time.perf_counter()
+        try:
+            first_chunk = await anext(stream)
+        except BaseException:
+            with contextlib.suppress(Exception):
+                await stream.aclose()
+            raise
+        self.policy.observe(model, time.perf_counter() - start)
+        return model, stream, first_chunk
@@ -11,3 +11,5 @@ class MessagesState(BaseModel):
     messages: Annotated[list[BaseMessage], add_messages] = Field(default_factory=list)
     llm_config: LLMConfig = Field(default_factory=LLMConfig)
     used_tools: list[UsedTool] = Field(default_factory=list)
+    # Index of the model cascade tier answering the current turn.
+    model_tier: int = 0
@@ -1,9 +1,11 @@
 from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Literal
 
 from ai_librarian_core.agents.react.base import BaseReactAgent, MissingAIMessageError, ReactAgentError
 from ai_librarian_core.agents.react.state import MessagesState
+from ai_librarian_core.cache.prompt_cache import cache_friendly_messages
 from ai_librarian_core.models.llm_config import LLMConfig
 from ai_librarian_core.models.used_tool import UsedTool
 from ai_librarian_core.utils.uuid import get_thread_id
@@ -18,8 +20,9 @@ class ReactAgent(BaseReactAgent):
     def __post_init__(self):
         super().__post_init__()
 
-    @property
+    @cached_property
     def workflow(self) -> CompiledStateGraph:
+        # Compiled once, the graph does not change after construction.
         return self._init_workflow()
 
     def _clear_used_tools(self, state: MessagesState) -> dict[str, list[UsedTool]]:
@@ -27,8 +30,8 @@ class ReactAgent(BaseReactAgent):
 
     def _invoke_llm(self, state: MessagesState) -> dict[str, list[BaseMessage]]:
         llm_config = state.llm_config
-        llm = self._init_llm(llm_config)
-        messages = state.messages
+        llm = self._init_llm(llm_config, self._select_tools(state.messages))
+        messages = cache_friendly_messages(state.messages, llm_config.model)
 
         try:
             response = llm.invoke(messages)
@@ -48,9 +51,7 @@ class ReactAgent(BaseReactAgent):
 
     def _catch_tool_massage(self, state: MessagesState) -> dict[str, list[UsedTool]]:
         messages = state.messages
-        used_tools = [
-            UsedTool(name=msg.name, output=msg.content) for msg in reversed(messages) if isinstance(msg, ToolMessage)
-        ]
+        used_tools = [UsedTool.from_message(msg) for msg in reversed(messages) if isinstance(msg, ToolMessage)]
         if used_tools:
             used_tools.reverse()
             return {"used_tools": used_tools}
@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+
+from ai_librarian_core.blobs.store import SQLiteBlobStore
+from ai_librarian_core.observability.metrics import OFFLOADED_TOOL_OUTPUT_CHARS, OFFLOADED_TOOL_OUTPUTS
+from langchain_core.messages import ToolMessage
+
+# The key of the response metadata of a truncated `ToolMessage` holding the blob id of its full output.
+BLOB_METADATA_KEY = "output_blob_id"
+
+
+@dataclass
+class ToolOutputOffloader:
+    """Moves large tool outputs to a blob store, the agent state keeps a preview and the blob id.
+
+    A Wikipedia page or a page of web search results can be many kilobytes. Kept in the `ToolMessage`, it is sent to
+    the chat model on every later hop, copied into `used_tools`, stored in every checkpoint of the thread and sent in
+    the `tool_output` event. Offloaded, all of them carry the first `preview_chars` characters only, and clients
+    fetch the full output by its blob id when they need it.
+
+    Attributes:
+        store (SQLiteBlobStore): Where the full outputs are kept.
+        max_inline_chars (int): The length above which an output is offloaded (default: 4000).
+        preview_chars (int): The characters of an offloaded output kept in the message (default: 2000).
+
+    Example:
+        >>> offloader = ToolOutputOffloader(store=SQLiteBlobStore("data/blobs.sqlite"))
+        >>> message = await offloader.offload(ToolMessage(content=long_page, name="wikipedia", tool_call_id="1"))
+        >>> message.response_metadata[BLOB_METADATA_KEY]
+        '9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08'
+    """
+
+    store: SQLiteBlobStore
+    max_inline_chars: int = 4000
+    preview_chars: int = 2000
+
+    def __post_init__(self):
+        if not 0 <= self.preview_chars <= self.max_inline_chars:
+            raise ValueError("preview_chars must be between 0 and max_inline_chars.")
+
+    async def offload(self, message: ToolMessage) -> ToolMessage:
+        """Returns `message` with its content cut to a preview if it is too long, errors are kept whole."""
+        content = message.content
+        if message.status == "error" or not isinstance(content, str) or len(content) <= self.max_inline_chars:
+            return message
+        blob_id = await self.store.aput(content)
+        tool = message.name or "unknown"
+        OFFLOADED_TOOL_OUTPUTS.labels(tool=tool).inc()
+        OFFLOADED_TOOL_OUTPUT_CHARS.labels(tool=tool).inc(len(content) - self.preview_chars)
+        preview = content[: self.preview_chars]
+        return message.model_copy(
+            update={
+                "content": f"{preview}\n[Truncated, {len(content) - len(preview)} more characters not shown.]",
+                "response_metadata": {**message.response_metadata, BLOB_METADATA_KEY: blob_id},
+            }
+        )
@@ -0,0 +1,105 @@
+import asyncio
+import contextlib
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+from ai_librarian_core.observability.metrics import BLOB_STORE_BYTES
+
+# Expired blobs are deleted by the next write after this many seconds, so a busy store is not swept on every write.
+SWEEP_INTERVAL_SECONDS = 3600
+
+
+@dataclass
+class SQLiteBlobStore:
+    """Keeps large texts, e.g. tool outputs, out of the agent state in a content-addressed SQLite file.
+
+    A blob is identified by the SHA-256 of its text, so the same output fetched by many threads, like a popular
+    Wikipedia page, is stored once. Texts are zlib-compressed. A blob is kept for `ttl_seconds` after it was last
+    written, every write of the same text extends it.
+
+    Attributes:
+        path (str): The SQLite file, shared by the workers of one host.
+        ttl_seconds (float): How long a blob is kept after its last write (default: 7 days).
+
+    Example:
+        >>> store = SQLiteBlobStore("data/blobs.sqlite")
+        >>> blob_id = store.put(long_wikipedia_page)
+        >>> store.get(blob_id) == long_wikipedia_page
+        True
+    """
+
+    path: str
+    ttl_seconds: float = 7 * 24 * 3600
+
+    def __post_init__(self):
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.closing(self._connect()) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(
+                "CREATE TABLE IF NOT EXISTS blobs ("
+                "id TEXT PRIMARY KEY, content BLOB NOT NULL, size INTEGER NOT NULL, written_at REAL NOT NULL);"
+                "CREATE INDEX IF NOT EXISTS blobs_written_at ON blobs (written_at);"
+            )
+            # Counted once, then kept up to date by `put`, so a metrics scrape does not sum the whole table.
+            self._size_bytes: int = connection.execute(
+                "SELECT coalesce(sum(length(content)), 0) FROM blobs"
+            ).fetchone()[0]
+        self._swept_at = 0.0
+        self._size_lock = threading.Lock()
+        BLOB_STORE_BYTES.set_function(self.size_bytes)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5, isolation_level=None)
+
+    @staticmethod
+    def blob_id(content: str) -> str:
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def put(self, content: str) -> str:
+        """Stores `content` unless it is already stored, and returns its blob id."""
+        blob_id = self.blob_id(content)
+        now = time.time()
+        added_bytes = 0
+        with contextlib.closing(self._connect()) as connection:
+            # A known blob only has its expiry extended, it is not compressed again.
+            if not connection.execute("UPDATE blobs SET written_at = ? WHERE id = ?", (now, blob_id)).rowcount:
+                compressed = zlib.compress(content.encode())
+                if connection.execute(
+                    "INSERT OR IGNORE INTO blobs (id, content, size, written_at) VALUES (?, ?, ?, ?)",
+                    (blob_id, compressed, len(content), now),
+                ).rowcount:
+                    added_bytes += len(compressed)
+            if now - self._swept_at > SWEEP_INTERVAL_SECONDS:
+                self._swept_at = now
+                deleted = connection.execute(
+                    "DELETE FROM blobs WHERE written_at < ? RETURNING length(content)", (now - self.ttl_seconds,)
+                ).fetchall()
+                added_bytes -= sum(size for (size,) in deleted)
+        if added_bytes:
+            with self._size_lock:
+                self._size_bytes += added_bytes
+        return blob_id
+
+    async def aput(self, content: str) -> str:
+        return await asyncio.to_thread(self.put, content)
+
+    def get(self, blob_id: str) -> str | None:
+        with contextlib.closing(self._connect()) as connection:
+            row = connection.execute("SELECT content FROM blobs WHERE id = ?", (blob_id,)).fetchone()
+        return zlib.decompress(row[0]).decode() if row else None
+
+    async def aget(self, blob_id: str) -> str | None:
+        return await asyncio.to_thread(self.get, blob_id)
+
+    def size_bytes(self) -> int:
+        """Returns the compressed size of the stored blobs.
+
+        It is counted when the store is opened and then follows the writes and sweeps of this process, blobs
+        written or swept by other processes sharing the file are only counted by a new store.
+        """
+        return self._size_bytes
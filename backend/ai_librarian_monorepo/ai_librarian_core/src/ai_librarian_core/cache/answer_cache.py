@@ -0,0 +1,218 @@
+"""An in-process cache of final agent answers for frequently asked questions.
+
+Questions are normalized (Unicode NFKC, case folding, punctuation and extra whitespace removed) and keyed together
+with the model, so "What are the opening hours?" and "what are the opening hours" share one entry. In semantic mode a
+miss on the exact key falls back to the most similar cached question of the same model, compared by cosine
+similarity of locally computed embeddings.
+"""
+
+import math
+import re
+import time
+import unicodedata
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Literal
+
+import numpy as np
+from ai_librarian_core.models.used_tool import UsedTool
+from ai_librarian_core.observability.metrics import ANSWER_CACHE_ENTRIES, ANSWER_CACHE_LOOKUPS
+from langchain_core.messages import AIMessage
+
+EMBEDDING_DIMENSIONS = 1024
+CHARACTER_GRAM_WEIGHT = 0.5
+NUMBER_PATTERN = re.compile(r"\d+")
+STOP_WORDS = frozenset("a an the my your our is are do does can could i you me please to of".split())
+
+# Answers built from these tools go stale within minutes, so they are never cached.
+DEFAULT_UNCACHEABLE_TOOLS = frozenset({"date_time", "open_weather_map"})
+
+
+def normalize_question(question: str) -> str:
+    text = unicodedata.normalize("NFKC", question).casefold()
+    text = "".join(" " if unicodedata.category(char).startswith(("P", "S")) else char for char in text)
+    return " ".join(text.split())
+
+
+def _numbers(text: str) -> list[str]:
+    return NUMBER_PATTERN.findall(text)
+
+
+def hashed_ngram_embedding(text: str, dimensions: int = EMBEDDING_DIMENSIONS) -> np.ndarray:
+    """Embeds a normalized question as unit-length hashed word and character n-gram counts.
+
+    English words count once as a whole and at a lower weight as character trigrams, so "e book" and "ebook" stay
+    close. Chinese has no spaces between words and is embedded as character bigrams. Function words are dropped.
+    The result is lexical, not semantic: "books about cats" and "books about bats" score about 0.75.
+    """
+    words = [word for word in text.split() if word not in STOP_WORDS] or text.split()
+    features: list[str] = []
+    weights: list[float] = []
+    for word in words:
+        padded = f" {word} "
+        if word.isascii():
+            grams = [padded[i : i + 3] for i in range(len(padded) - 2)]
+            features.append(word)
+            weights.append(1.0)
+            weights.extend([CHARACTER_GRAM_WEIGHT] * len(grams))
+        else:
+            grams = [padded[i : i + 2] for i in range(len(padded) - 1)]
+            weights.extend([1.0] * len(grams))
+        features.extend(grams)
+    hashes = np.fromiter((zlib.crc32(feature.encode()) for feature in features), dtype=np.uint32, count=len(features))
+    # The top bit picks the sign so colliding features cancel out instead of piling up.
+    signed = np.where(hashes >> 31, -1.0, 1.0) * np.asarray(weights)
+    vector = np.bincount(hashes % dimensions, weights=signed, minlength=dimensions).astype(np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+@dataclass(frozen=True)
+class CachedAnswer:
+    message: AIMessage
+    used_tools: list[UsedTool] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _Entry:
+    answer: CachedAnswer
+    expires_at: float
+    slot: int
+
+
+@dataclass
+class AnswerCache:
+    """Caches final answers by normalized question and model, with a per-entry TTL and LRU eviction.
+
+    The cache lives on the event loop thread and is not safe to share between threads.
+
+    Attributes:
+        mode (Literal["exact", "semantic"]): Whether a miss on the normalized question falls back to the most
+            similar cached question (default: "exact").
+        ttl_seconds (float): How long an answer is served after it was stored (default: 3600).
+        max_entries (int): The number of answers kept, the least recently used one is evicted first (default: 1024).
+        similarity_threshold (float): The cosine similarity a cached question needs to answer a new one in
+            semantic mode (default: 0.85).
+        embed (Callable[[str], np.ndarray]): Embeds a normalized question as a unit vector. Any local embedding
+            model fits, e.g. `embeddings.embed_query` wrapped in `np.asarray` (default: `hashed_ngram_embedding`).
+        uncacheable_tools (frozenset[str]): Answers that used any of these tools are not stored.
+        clock (Callable[[], float]): The time source for TTLs (default: `time.monotonic`).
+
+    Example:
+        >>> cache = AnswerCache(mode="semantic", ttl_seconds=600)
+        >>> cache.store("What are the opening hours?", "gpt-4o-mini", CachedAnswer(AIMessage("9am to 9pm.")))
+        >>> cache.lookup("what are your opening hours", "gpt-4o-mini").message.content
+        '9am to 9pm.'
+    """
+
+    mode: Literal["exact", "semantic"] = "exact"
+    ttl_seconds: float = 3600
+    max_entries: int = 1024
+    similarity_threshold: float = 0.85
+    embed: Callable[[str], np.ndarray] = hashed_ngram_embedding
+    uncacheable_tools: frozenset[str] = DEFAULT_UNCACHEABLE_TOOLS
+    clock: Callable[[], float] = time.monotonic
+
+    def __post_init__(self):
+        if self.max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        if self.ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive.")
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._free_slots = list(range(self.max_entries - 1, -1, -1))
+        # Semantic mode keeps one embedding row per slot, so a lookup is a single matrix-vector product.
+        self._vectors: np.ndarray | None = None
+        self._slot_keys: list[tuple[str, str] | None] = [None] * self.max_entries
+        self._slot_models = np.full(self.max_entries, -1, dtype=np.int32)
+        self._model_ids: dict[str, int] = {}
+        ANSWER_CACHE_ENTRIES.set_function(self.__len__)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, question: str, model: str) -> CachedAnswer | None:
+        normalized = normalize_question(question)
+        if not normalized:
+            return None
+
+        key = (model, normalized)
+        entry = self._entries.get(key)
+        if entry is not None and self._is_fresh(key, entry):
+            self._entries.move_to_end(key)
+            ANSWER_CACHE_LOOKUPS.labels(result="exact_hit").inc()
+            return entry.answer
+
+        if self.mode == "semantic" and (key := self._nearest_key(normalized, model)) is not None:
+            entry = self._entries[key]
+            if self._is_fresh(key, entry):
+                self._entries.move_to_end(key)
+                ANSWER_CACHE_LOOKUPS.labels(result="semantic_hit").inc()
+                return entry.answer
+
+        ANSWER_CACHE_LOOKUPS.labels(result="miss").inc()
+        return None
+
+    def store(self, question: str, model: str, answer: CachedAnswer, ttl_seconds: float | None = None) -> bool:
+        """Stores an answer unless it is empty, asks for tools or was built from an uncacheable tool.
+
+        Returns:
+            bool: Whether the answer was stored.
+        """
+        normalized = normalize_question(question)
+        if not normalized or not answer.message.content or answer.message.tool_calls:
+            return False
+        if any(used_tool.name in self.uncacheable_tools for used_tool in answer.used_tools):
+            return False
+
+        key = (model, normalized)
+        if key in self._entries:
+            self._remove(key)
+        elif len(self._entries) >= self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+        slot = self._free_slots.pop()
+        expires_at = self.clock() + (self.ttl_seconds if ttl_seconds is None else ttl_seconds)
+        self._entries[key] = _Entry(answer=answer, expires_at=expires_at, slot=slot)
+        if self.mode == "semantic":
+            vector = self.embed(normalized)
+            if self._vectors is None:
+                self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+            self._vectors[slot] = vector
+            self._slot_keys[slot] = key
+            self._slot_models[slot] = self._model_ids.setdefault(model, len(self._model_ids))
+        return True
+
+    def clear(self):
+        for key in list(self._entries):
+            self._remove(key)
+
+    def _is_fresh(self, key: tuple[str, str], entry: _Entry) -> bool:
+        if entry.expires_at > self.clock():
+            return True
+        self._remove(key)
+        return False
+
+    def _nearest_key(self, normalized: str, model: str) -> tuple[str, str] | None:
+        model_id = self._model_ids.get(model)
+        if self._vectors is None or model_id is None:
+            return None
+        scores = self._vectors @ self.embed(normalized)
+        scores[self._slot_models != model_id] = -math.inf
+        candidates = np.flatnonzero(scores >= self.similarity_threshold)
+        # "world war 1" and "world war 2" are lexically close, so numbers have to agree exactly.
+        numbers = _numbers(normalized)
+        for slot in candidates[np.argsort(-scores[candidates])]:
+            key = self._slot_keys[slot]
+            if _numbers(key[1]) == numbers:
+                return key
+        return None
+
+    def _remove(self, key: tuple[str, str]):
+        entry = self._entries.pop(key)
+        if self._vectors is not None:
+            self._vectors[entry.slot] = 0
+            self._slot_keys[entry.slot] = None
+            self._slot_models[entry.slot] = -1
+        self._free_slots.append(entry.slot)
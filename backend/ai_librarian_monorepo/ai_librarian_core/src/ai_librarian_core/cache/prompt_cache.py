@@ -0,0 +1,81 @@
+"""Keeps the prompt prefix byte-stable between chat model calls so providers can serve it from their prompt cache.
+
+Every request is laid out as tools, then the system prompt, then the conversation history. Tools are sorted by name
+and the system messages of a thread, which clients may resend on every turn, are merged into one leading message.
+OpenAI, Gemini and Groq cache a repeated prefix on their own. Anthropic only caches up to explicit breakpoints, so
+for Anthropic models the last tool, the system prompt and the latest user message are marked with `cache_control`.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.tools import BaseTool
+from langchain_core.utils.function_calling import convert_to_openai_function
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def supports_cache_breakpoints(model: str) -> bool:
+    return model.startswith("anthropic:")
+
+
+def _with_breakpoint(content: str | list[str | dict]) -> list[str | dict]:
+    blocks: list[str | dict] = [{"type": "text", "text": content}] if isinstance(content, str) else list(content)
+    last = blocks[-1]
+    blocks[-1] = {**({"type": "text", "text": last} if isinstance(last, str) else last), "cache_control": CACHE_CONTROL}
+    return blocks
+
+
+def _without_breakpoint(message: BaseMessage) -> BaseMessage:
+    if isinstance(message.content, str) or not any(
+        isinstance(block, dict) and "cache_control" in block for block in message.content
+    ):
+        return message
+    blocks = [
+        {key: value for key, value in block.items() if key != "cache_control"} if isinstance(block, dict) else block
+        for block in message.content
+    ]
+    return message.model_copy(update={"content": blocks})
+
+
+def cache_friendly_tools(tools: Sequence[BaseTool], model: str) -> list[BaseTool | dict[str, Any]]:
+    """Sorts the tools by name and, for Anthropic, marks the last schema as a cache breakpoint."""
+    by_name = sorted(tools, key=lambda tool: tool.name)
+    ordered: list[BaseTool | dict[str, Any]] = [*by_name]
+    if ordered and supports_cache_breakpoints(model):
+        function = convert_to_openai_function(ordered[-1])
+        ordered[-1] = {
+            "name": function["name"],
+            "description": function["description"],
+            "input_schema": function["parameters"],
+            "cache_control": CACHE_CONTROL,
+        }
+    return ordered
+
+
+def cache_friendly_messages(messages: Sequence[BaseMessage], model: str) -> list[BaseMessage]:
+    """Moves the distinct system prompts to the front as one message, followed by the rest of the history."""
+    system_prompts: list[str] = []
+    history: list[BaseMessage] = []
+    for message in messages:
+        if isinstance(message, SystemMessage):
+            if (text := message.text()) and text not in system_prompts:
+                system_prompts.append(text)
+        else:
+            history.append(message)
+
+    prompt = [SystemMessage("\n\n".join(system_prompts))] if system_prompts else []
+    if not supports_cache_breakpoints(model):
+        # Messages laid out for Anthropic, e.g. before a failover to another provider, lose their breakpoints.
+        return prompt + [_without_breakpoint(message) for message in history]
+
+    if prompt:
+        prompt[0] = SystemMessage(_with_breakpoint(prompt[0].content))
+    # The prefix up to the latest user message stays the same across every tool hop of the turn.
+    for index in range(len(history) - 1, -1, -1):
+        message = history[index]
+        if isinstance(message, HumanMessage) and message.content:
+            history[index] = message.model_copy(update={"content": _with_breakpoint(message.content)})
+            break
+    return prompt + history
@@ -0,0 +1,166 @@
+import asyncio
+import contextlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from ai_librarian_core.cache.answer_cache import normalize_question
+from ai_librarian_core.catalog.records import CatalogRecord, normalize_isbn
+from ai_librarian_core.observability.metrics import CATALOG_INDEX_RECORDS
+
+# The trigram tokenizer matches any substring of at least three characters, Chinese titles have no word breaks.
+MIN_TERM_CHARS = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    key TEXT PRIMARY KEY, title TEXT NOT NULL, authors TEXT NOT NULL, year TEXT, isbn TEXT, links TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_isbn ON records (isbn);
+CREATE VIRTUAL TABLE IF NOT EXISTS records_fts USING fts5(
+    title, authors, isbn, content='records', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS records_insert AFTER INSERT ON records BEGIN
+    INSERT INTO records_fts (rowid, title, authors, isbn) VALUES (new.rowid, new.title, new.authors, new.isbn);
+END;
+-- A record returned again only refreshes its links and timestamp, it is re-indexed only when its text changed.
+CREATE TRIGGER IF NOT EXISTS records_update AFTER UPDATE ON records
+WHEN old.title IS NOT new.title OR old.authors IS NOT new.authors OR old.isbn IS NOT new.isbn BEGIN
+    INSERT INTO records_fts (records_fts, rowid, title, authors, isbn)
+    VALUES ('delete', old.rowid, old.title, old.authors, old.isbn);
+    INSERT INTO records_fts (rowid, title, authors, isbn) VALUES (new.rowid, new.title, new.authors, new.isbn);
+END;
+CREATE TRIGGER IF NOT EXISTS records_delete AFTER DELETE ON records BEGIN
+    INSERT INTO records_fts (records_fts, rowid, title, authors, isbn)
+    VALUES ('delete', old.rowid, old.title, old.authors, old.isbn);
+END;
+"""
+
+_UPSERT = (
+    "INSERT INTO records (key, title, authors, year, isbn, links, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (key) DO UPDATE SET "
+    "authors = CASE WHEN excluded.authors != '' THEN excluded.authors ELSE records.authors END, "
+    "year = coalesce(excluded.year, records.year), isbn = coalesce(excluded.isbn, records.isbn), "
+    "links = json_patch(records.links, excluded.links), updated_at = excluded.updated_at"
+)
+
+_COLUMNS = "records.title, records.authors, records.year, records.isbn, records.links, records.updated_at"
+
+
+@dataclass
+class SQLiteCatalogIndex:
+    """A local full-text index of the books and papers the catalog tools returned, in a SQLite FTS5 file.
+
+    Every record a catalog returns is upserted, keyed on its ISBN or its normalized title and authors, so the
+    index grows with the questions patrons ask and a repeated lookup is answered locally in milliseconds instead
+    of seconds. A record returned again merges its links and refreshes its timestamp, records not returned for
+    `stale_after_seconds` are still found but count as stale.
+
+    Attributes:
+        path (str): The SQLite file, shared by the workers of one host.
+        stale_after_seconds (float): How long a record counts as fresh after a catalog returned it (default: 7
+            days).
+
+    Example:
+        >>> index = SQLiteCatalogIndex("data/catalog.sqlite")
+        >>> index.upsert(records_from_ncl(NCLSearch().search("人工智慧")))
+        >>> index.search("人工智慧")
+        [CatalogRecord(title='人工智慧 : 現代方法', ...), ...]
+    """
+
+    path: str
+    stale_after_seconds: float = 7 * 24 * 3600
+
+    def __post_init__(self):
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.closing(self._connect()) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            # Counted once, then kept up to date by `upsert`, so a metrics scrape does not scan the table.
+            self._count: int = connection.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+        self._count_lock = threading.Lock()
+        CATALOG_INDEX_RECORDS.set_function(self.count)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5, isolation_level=None)
+
+    def upsert(self, records: list[CatalogRecord]):
+        if not records:
+            return
+        now = time.time()
+        keys = list({record.key for record in records})
+        with contextlib.closing(self._connect()) as connection:
+            connection.execute("BEGIN")
+            known = connection.execute(
+                f"SELECT COUNT(*) FROM records WHERE key IN ({', '.join('?' * len(keys))})", keys
+            ).fetchone()[0]
+            connection.executemany(
+                _UPSERT,
+                [
+                    (
+                        record.key,
+                        record.title,
+                        record.authors,
+                        record.year,
+                        record.isbn,
+                        json.dumps(record.links, ensure_ascii=False),
+                        now,
+                    )
+                    for record in records
+                ],
+            )
+            connection.execute("COMMIT")
+        with self._count_lock:
+            self._count += len(keys) - known
+
+    async def aupsert(self, records: list[CatalogRecord]):
+        await asyncio.to_thread(self.upsert, records)
+
+    def search(self, query: str, limit: int = 10) -> list[CatalogRecord]:
+        """Returns the best matching records, every term of `query` must be in the title, authors or ISBN.
+
+        Terms shorter than `MIN_TERM_CHARS` cannot be matched and are ignored, an ISBN is looked up directly.
+        """
+        if isbn := normalize_isbn(query):
+            sql, parameters = f"SELECT {_COLUMNS}, 0 FROM records WHERE isbn = ?", (isbn,)
+        else:
+            terms = [term for term in normalize_question(query).split() if len(term) >= MIN_TERM_CHARS]
+            if not terms:
+                return []
+            sql = (
+                f"SELECT {_COLUMNS}, bm25(records_fts) FROM records_fts "
+                "JOIN records ON records.rowid = records_fts.rowid WHERE records_fts MATCH ? "
+                "ORDER BY bm25(records_fts) LIMIT ?"
+            )
+            parameters = (" AND ".join(f'"{term}"' for term in terms), limit)
+        with contextlib.closing(self._connect()) as connection:
+            rows = connection.execute(sql, parameters).fetchall()
+
+        records: list[CatalogRecord] = []
+        for title, authors, year, isbn, links, updated_at, rank in rows:
+            record = CatalogRecord(
+                title=title, authors=authors, year=year, isbn=isbn, links=json.loads(links), updated_at=updated_at
+            )
+            # The same book may be held under its ISBN and, from a catalog without ISBNs, under its title.
+            if same := next((existing for existing in records if existing.matches(record)), None):
+                same.merge(record)
+                same.updated_at = max(same.updated_at or 0.0, updated_at)
+            else:
+                records.append(record.model_copy(update={"score": -rank}))
+        return records
+
+    async def asearch(self, query: str, limit: int = 10) -> list[CatalogRecord]:
+        return await asyncio.to_thread(self.search, query, limit)
+
+    def is_fresh(self, record: CatalogRecord) -> bool:
+        return record.updated_at is not None and record.updated_at >= time.time() - self.stale_after_seconds
+
+    def count(self) -> int:
+        """Returns the number of records, counted when the index is opened and then following this process's upserts.
+
+        Records added by other processes sharing the file are only counted by a new index.
+        """
+        return self._count
@@ -0,0 +1,127 @@
+import re
+import unicodedata
+
+from pydantic import BaseModel, Field
+
+# Reciprocal rank fusion constant, a larger value flattens the advantage of top-ranked records.
+RRF_K = 60
+
+_NON_WORD = re.compile(r"[\W_]+")
+# Subtitles and statements of responsibility, e.g. "Title : subtitle / author".
+_TITLE_TAIL = re.compile(r"\s*[:：/／].*$")
+
+
+def normalize_title(title: str) -> str:
+    """Returns the main title in lowercase without subtitle, punctuation or spaces, the key records are merged on."""
+    title = unicodedata.normalize("NFKC", title).casefold()
+    return _NON_WORD.sub("", _TITLE_TAIL.sub("", title)) or _NON_WORD.sub("", title)
+
+
+def normalize_isbn(isbn: str) -> str | None:
+    """Returns the ISBN-13 of an ISBN-10 or ISBN-13 in any format, None if it is not one."""
+    isbn = re.sub(r"[^0-9Xx]", "", isbn).upper()
+    if len(isbn) == 13 and isbn.isdigit():
+        return isbn
+    if len(isbn) != 10 or not isbn[:9].isdigit():
+        return None
+    digits = "978" + isbn[:9]
+    check = (10 - sum(int(digit) * (3 if i % 2 else 1) for i, digit in enumerate(digits)) % 10) % 10
+    return digits + str(check)
+
+
+def _authors_match(first: str, second: str) -> bool:
+    first, second = (unicodedata.normalize("NFKC", authors).casefold() for authors in (first, second))
+    if not first or not second:
+        return True
+    # Catalogs write names differently, e.g. "Russell, Stuart J." and "Stuart Russell", or "吳軍著" and "吳軍".
+    if (set(_NON_WORD.split(first)) & set(_NON_WORD.split(second))) - {""}:
+        return True
+    first, second = _NON_WORD.sub("", first), _NON_WORD.sub("", second)
+    return first in second or second in first
+
+
+class CatalogRecord(BaseModel):
+    """A book or paper found by one or more catalogs."""
+
+    title: str
+    authors: str = ""
+    year: str | None = None
+    isbn: str | None = None
+    links: dict[str, str] = Field(default_factory=dict)
+    description: str | None = None
+    score: float = 0
+    # When a catalog last returned the record, as a Unix timestamp, only set for records of the local index.
+    updated_at: float | None = None
+
+    @property
+    def sources(self) -> list[str]:
+        return list(self.links)
+
+    @property
+    def key(self) -> str:
+        """The identity of the record in the local index, its ISBN or its normalized title and authors."""
+        if self.isbn:
+            return f"isbn:{self.isbn}"
+        authors = _NON_WORD.sub("", unicodedata.normalize("NFKC", self.authors).casefold())
+        return f"title:{normalize_title(self.title)}/{authors}"
+
+    def matches(self, other: "CatalogRecord") -> bool:
+        if self.isbn and other.isbn:
+            return self.isbn == other.isbn
+        return normalize_title(self.title) == normalize_title(other.title) and _authors_match(
+            self.authors, other.authors
+        )
+
+    def merge(self, other: "CatalogRecord"):
+        self.authors = self.authors or other.authors
+        self.year = self.year or other.year
+        self.isbn = self.isbn or other.isbn
+        self.description = self.description or other.description
+        self.links = {**self.links, **other.links}
+        self.score += other.score
+
+
+def merge_records(results: dict[str, list[CatalogRecord]], top_k: int) -> list[CatalogRecord]:
+    """Merges the ranked records of several catalogs and ranks them by reciprocal rank fusion.
+
+    Records with the same ISBN, or the same main title and matching authors, are merged. A record ranked high by
+    several catalogs ranks above one found by a single catalog.
+    """
+    merged: list[CatalogRecord] = []
+    for records in results.values():
+        for rank, record in enumerate(records):
+            record = record.model_copy(update={"score": 1 / (RRF_K + rank + 1)})
+            if same := next((existing for existing in merged if existing.matches(record)), None):
+                same.merge(record)
+            else:
+                merged.append(record)
+    return sorted(merged, key=lambda record: record.score, reverse=True)[:top_k]
+
+
+def records_from_ncl(books: list[dict[str, str]]) -> list[CatalogRecord]:
+    """Converts the books of `NCLSearch.search`."""
+    return [
+        CatalogRecord(title=book["title"], authors=book["author"] or "", links={"ncl": book["link"]}) for book in books
+    ]
+
+
+def records_from_google_books(volumes: list[dict]) -> list[CatalogRecord]:
+    """Converts the volumes of `GoogleBooksAPIWrapper.search`."""
+    records = []
+    for volume in volumes:
+        volume_info = volume.get("volumeInfo", {})
+        isbns = [
+            normalize_isbn(identifier.get("identifier", ""))
+            for identifier in volume_info.get("industryIdentifiers", [])
+        ]
+        records.append(
+            CatalogRecord(
+                title=volume_info.get("title", "Unknown Title"),
+                authors=", ".join(volume_info.get("authors", [])),
+                year=(volume_info.get("publishedDate") or "")[:4] or None,
+                isbn=next((isbn for isbn in isbns if isbn), None),
+                links={"google_books": volume_info.get("infoLink", "")},
+                description=volume_info.get("description"),
+            )
+        )
+    return records
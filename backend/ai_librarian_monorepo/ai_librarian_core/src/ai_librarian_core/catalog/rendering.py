@@ -0,0 +1,104 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Literal
+
+from ai_librarian_core.catalog.records import CatalogRecord
+
+RecordField = Literal["title", "authors", "year", "isbn", "sources", "link", "description"]
+
+DEFAULT_RECORD_FIELDS: tuple[RecordField, ...] = ("title", "authors", "year", "isbn", "sources", "link", "description")
+
+DEFAULT_TOKEN_BUDGET = 800
+
+# Tokens of rendered records a tool may return. A tool output is sent again on every later hop of the ReAct loop
+# and stored in every checkpoint of the thread, so a few compact records beat many verbose ones.
+DEFAULT_TOOL_TOKEN_BUDGETS: dict[str, int] = {
+    "ncl_search": 700,
+    "google_books": 700,
+    "catalog_search": 1000,
+    "local_catalog": 1000,
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimates the tokens of `text`, roughly four ASCII characters or one CJK character per token."""
+    ascii_chars = sum(char.isascii() for char in text)
+    return (ascii_chars + 3) // 4 + len(text) - ascii_chars
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """Cuts `text` to about `max_tokens` estimated tokens, marking the cut with an ellipsis."""
+    cost = 0.0
+    for i, char in enumerate(text):
+        cost += 0.25 if char.isascii() else 1
+        if cost > max_tokens:
+            return text[:i].rstrip() + "…"
+    return text
+
+
+@dataclass
+class RecordRenderer:
+    """Renders catalog records as the compact text the chat model reads, the one place tool records become text.
+
+    Each record is one line of the projected fields separated by " | ", records are added in rank order until the
+    tool's token budget is spent and the number of records left out is noted instead.
+
+    Attributes:
+        fields (tuple[RecordField, ...]): The fields rendered, in order (default: all of them).
+        max_description_tokens (int): The tokens of a description kept before it is cut, counted rather than
+            characters so Chinese descriptions are not four times longer than English ones (default: 40).
+        token_budgets (dict[str, int]): The token budget of each tool, by tool name.
+        default_token_budget (int): The token budget of tools missing from `token_budgets` (default: 800).
+
+    Example:
+        >>> renderer = RecordRenderer(fields=("title", "authors", "link"))
+        >>> print(renderer.render("ncl_search", records_from_ncl(NCLSearch().search("人工智慧"))))
+        1. 人工智慧 : 現代方法 | Stuart Russell, Peter Norvig | https://aleweb.ncl.edu.tw/F/...
+        ...
+    """
+
+    fields: tuple[RecordField, ...] = DEFAULT_RECORD_FIELDS
+    max_description_tokens: int = 40
+    token_budgets: dict[str, int] = field(default_factory=lambda: dict(DEFAULT_TOOL_TOKEN_BUDGETS))
+    default_token_budget: int = DEFAULT_TOKEN_BUDGET
+
+    def __post_init__(self):
+        if self.max_description_tokens < 0:
+            raise ValueError("max_description_tokens must not be negative.")
+
+    def _value(self, record: CatalogRecord, name: RecordField) -> str:
+        match name:
+            case "isbn":
+                return f"ISBN {record.isbn}" if record.isbn else ""
+            case "sources":
+                return f"[{', '.join(record.sources)}]" if record.sources else ""
+            case "link":
+                # The NCL record comes first, it tells where the book can be borrowed.
+                return record.links.get("ncl") or next(iter(record.links.values()), "")
+            case "description":
+                return truncate_tokens(" ".join((record.description or "").split()), self.max_description_tokens)
+            case _:
+                return getattr(record, name) or ""
+
+    def render_record(self, record: CatalogRecord) -> str:
+        return " | ".join(value for name in self.fields if (value := self._value(record, name)))
+
+    def render(self, tool: str, records: Sequence[CatalogRecord], empty: str = "", notes: Sequence[str] = ()) -> str:
+        """Renders `records` within the token budget of `tool`, the first record is always rendered.
+
+        Args:
+            tool (str): The name of the tool the records are returned by.
+            records (Sequence[CatalogRecord]): The records, best ranked first.
+            empty (str): The text returned when there are no records (default: "").
+            notes (Sequence[str]): Lines appended after the records, e.g. the catalogs that failed (default: ()).
+        """
+        budget = self.token_budgets.get(tool, self.default_token_budget) - sum(map(estimate_tokens, notes))
+        lines = []
+        for i, record in enumerate(records):
+            line = f"{i + 1}. {self.render_record(record)}"
+            budget -= estimate_tokens(line)
+            if lines and budget < 0:
+                lines.append(f"({len(records) - i} more records left out of the token budget)")
+                break
+            lines.append(line)
+        return "\n".join([*(lines or ([empty] if empty else [])), *notes])
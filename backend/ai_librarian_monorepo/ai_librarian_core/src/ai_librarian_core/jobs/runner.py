@@ -0,0 +1,244 @@
+import asyncio
+import contextlib
+import time
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any, cast
+
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
+from ai_librarian_core.agents.react.base import MissingAIMessageError
+from ai_librarian_core.agents.react.cascade import MODEL_METADATA_KEY
+from ai_librarian_core.jobs.store import FINISHED_STATUSES, Job, JobEvent, SQLiteJobStore
+from ai_librarian_core.models.llm_config import LLMConfig
+from ai_librarian_core.models.used_tool import UsedTool
+from ai_librarian_core.observability.metrics import FINISHED_JOBS, JOB_QUEUE_SECONDS, RUNNING_JOBS
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, ToolMessage, message_chunk_to_message
+from langchain_core.messages.ai import add_ai_message_chunks
+
+
+@dataclass
+class JobQueueFullError(Exception):
+    """Raised instead of queuing a job when the job store already holds `max_queued_jobs` queued jobs."""
+
+    queued: int
+
+    def __str__(self) -> str:
+        return f"Too many queued jobs ({self.queued}), retry later."
+
+
+@dataclass
+class JobRunner:
+    """Runs agent requests in the background, for questions that take longer than a held HTTP request may.
+
+    A submitted job is stored as queued and picked up by one of `max_concurrent_jobs` workers of this process, or
+    of another process sharing the store. The agent runs it with the "batch" priority, so interactive requests are
+    admitted first by the LLM scheduler. Its progress, the tools chosen and their outputs, is stored as events a
+    client can read while the job runs, and its answer is kept for the store's result TTL.
+
+    Attributes:
+        agent (AsyncReactAgent): The agent that runs the jobs.
+        store (SQLiteJobStore): Where jobs and their events are kept.
+        max_concurrent_jobs (int): The number of jobs this process runs at once (default: 4).
+        max_queued_jobs (int): The number of queued jobs above which submissions are rejected (default: 1000).
+        heartbeat_seconds (float): How often a running job's heartbeat is written, which is also how long a
+            cancellation from another process may take to be seen (default: 2).
+        stale_after_seconds (float): How long a running job may go without a heartbeat before it is failed as
+            interrupted (default: 60).
+        poll_seconds (float): How often idle workers and event readers check the store for changes made by other
+            processes (default: 1).
+
+    Example:
+        >>> runner = JobRunner(agent=agent, store=SQLiteJobStore("data/jobs.sqlite"))
+        >>> await runner.start()
+        >>> job = await runner.submit(messages, thread_id, LLMConfig())
+        >>> async for event in runner.events(job.id):
+        ...     print(event.event, event.data)
+    """
+
+    agent: AsyncReactAgent
+    store: SQLiteJobStore
+    max_concurrent_jobs: int = 4
+    max_queued_jobs: int = 1000
+    heartbeat_seconds: float = 2
+    stale_after_seconds: float = 60
+    poll_seconds: float = 1
+
+    def __post_init__(self):
+        if self.max_concurrent_jobs < 1:
+            raise ValueError("max_concurrent_jobs must be at least 1.")
+        self._owner = uuid.uuid4().hex
+        self._workers: list[asyncio.Task] = []
+        self._running: dict[str, asyncio.Task] = {}
+        self._stopping = False
+        self._job_added = asyncio.Event()
+        self._event_added = asyncio.Event()
+        RUNNING_JOBS.set_function(lambda: float(len(self._running)))
+
+    async def start(self):
+        self._stopping = False
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.max_concurrent_jobs)]
+        self._workers.append(asyncio.create_task(self._sweep()))
+
+    async def stop(self):
+        """Stops the workers, jobs still running are failed as interrupted."""
+        self._stopping = True
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(self, messages: list[BaseMessage], thread_id: str, llm_config: LLMConfig) -> Job:
+        """Queues an agent request.
+
+        Raises:
+            JobQueueFullError: If `max_queued_jobs` jobs are already queued.
+        """
+        queued = await self.store.count("queued")
+        if queued >= self.max_queued_jobs:
+            raise JobQueueFullError(queued)
+        job = Job(id=f"job-{uuid.uuid4()}", thread_id=thread_id, messages=messages, llm_config=llm_config)
+        # Emitted first, a worker may claim the job and emit "running" as soon as it is stored.
+        await self._emit(job.id, "queued", {})
+        await self.store.add(job)
+        self._job_added.set()
+        return job
+
+    async def get(self, job_id: str) -> Job | None:
+        return await self.store.get(job_id)
+
+    async def cancel(self, job_id: str) -> Job | None:
+        """Cancels a queued or running job, a finished job is returned unchanged."""
+        before = await self.store.get(job_id)
+        if before is None or before.is_finished:
+            return before
+        job = await self.store.request_cancel(job_id)
+        if job is not None and job.status == "cancelled" and before.status == "queued":
+            FINISHED_JOBS.labels(status="cancelled").inc()
+            await self._emit(job_id, "cancelled", {"error": job.error})
+        elif task := self._running.get(job_id):
+            task.cancel()
+        return job
+
+    async def events(self, job_id: str, after: int = 0) -> AsyncIterator[JobEvent]:
+        """Yields the events of a job after the `after` sequence number, until the job finished."""
+        while True:
+            event_added = self._event_added
+            events = await self.store.events(job_id, after)
+            for event in events:
+                yield event
+                after = event.seq
+                if event.event in FINISHED_STATUSES:
+                    return
+            if not events:
+                job = await self.store.get(job_id)
+                if job is None:
+                    return
+                # The status event is written just after the outcome, it is waited for unless its writer died.
+                if job.is_finished and (job.finished_at or 0) < time.time() - self.poll_seconds:
+                    return
+                # Events of this process wake the readers up right away, other processes are polled.
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(event_added.wait(), timeout=self.poll_seconds)
+
+    async def _emit(self, job_id: str, event: str, data: dict[str, Any]):
+        await self.store.add_event(job_id, event, data)
+        self._event_added.set()
+        self._event_added = asyncio.Event()
+
+    async def _work(self):
+        while True:
+            # Cleared before claiming, so a job submitted in between still wakes this worker up.
+            self._job_added.clear()
+            job = await self.store.claim(self._owner)
+            if job is None:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._job_added.wait(), timeout=self.poll_seconds)
+                continue
+            if job.started_at is not None:
+                JOB_QUEUE_SECONDS.observe(job.started_at - job.created_at)
+            await self._run_job(job)
+
+    async def _sweep(self):
+        while True:
+            for job_id in await self.store.sweep(stale_before=time.time() - self.stale_after_seconds):
+                FINISHED_JOBS.labels(status="failed").inc()
+                await self._emit(job_id, "failed", {"error": "Interrupted, its worker stopped."})
+            await asyncio.sleep(self.heartbeat_seconds)
+
+    async def _run_job(self, job: Job):
+        await self._emit(job.id, "running", {})
+        execution = asyncio.create_task(self._execute(job))
+        self._running[job.id] = execution
+        heartbeat = asyncio.create_task(self._heartbeat(job.id, execution))
+        try:
+            job.answer, job.used_tools = await execution
+            job.status = "succeeded"
+        except asyncio.CancelledError:
+            job.status, job.error = (
+                ("failed", "Interrupted by a shutdown.") if self._stopping else ("cancelled", "Cancelled.")
+            )
+            # The next question on the thread must not follow tool calls without results.
+            await asyncio.shield(self.agent.close_interrupted_turn(job.thread_id))
+        except Exception as e:
+            job.status, job.error = "failed", f"{type(e).__name__}: {e}"
+        finally:
+            heartbeat.cancel()
+            del self._running[job.id]
+        # A shutdown must not cancel the write of the outcome.
+        await asyncio.shield(self._finish(job))
+        if self._stopping:
+            raise asyncio.CancelledError
+
+    async def _finish(self, job: Job):
+        if not await self.store.finish(job, self._owner):
+            # Another process already failed the job as interrupted.
+            return
+        FINISHED_JOBS.labels(status=job.status).inc()
+        data: dict[str, Any] = {"error": job.error} if job.error else {}
+        if job.answer is not None:
+            data = {"answer": job.answer.text(), "model": job.answer.response_metadata.get(MODEL_METADATA_KEY)}
+        await self._emit(job.id, job.status, data)
+
+    async def _heartbeat(self, job_id: str, execution: asyncio.Task):
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            if not await self.store.heartbeat(job_id, self._owner):
+                # Cancelled from another process.
+                execution.cancel()
+                return
+
+    async def _execute(self, job: Job) -> tuple[AIMessage, list[UsedTool]]:
+        answers: dict[str, AIMessage] = {}
+        used_tools: list[UsedTool] = []
+        chosen: set[tuple[str, str]] = set()
+        key: str | None = None
+        stream = await self.agent.stream(job.messages, job.thread_id, job.llm_config, priority="batch")
+        async for message, _ in stream:
+            if isinstance(message, ToolMessage):
+                key = None
+                used_tools.append(used_tool := UsedTool.from_message(message))
+                await self._emit(job.id, "tool_output", used_tool.model_dump(exclude_none=True))
+            elif isinstance(message, AIMessage):
+                # Chunks without an id continue the message streamed before them, other messages start a new one.
+                if message.id is not None:
+                    key = message.id
+                elif key is None or not (
+                    isinstance(message, AIMessageChunk) and isinstance(answers.get(key), AIMessageChunk)
+                ):
+                    key = f"message-{len(answers)}"
+                answer = answers.get(key)
+                if isinstance(answer, AIMessageChunk) and isinstance(message, AIMessageChunk):
+                    answers[key] = add_ai_message_chunks(answer, message)
+                else:
+                    answers[key] = message
+                for tool_call in answers[key].tool_calls:
+                    if tool_call["name"] and (key, tool_call["name"]) not in chosen:
+                        chosen.add((key, tool_call["name"]))
+                        await self._emit(job.id, "tool_chosen", {"name": tool_call["name"]})
+        if not answers:
+            raise MissingAIMessageError("The agent streamed no answer.")
+        answer = list(answers.values())[-1]
+        if isinstance(answer, AIMessageChunk):
+            answer = cast(AIMessage, message_chunk_to_message(answer))
+        return answer, used_tools
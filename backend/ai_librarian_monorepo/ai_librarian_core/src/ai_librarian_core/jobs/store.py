@@ -0,0 +1,243 @@
+import asyncio
+import contextlib
+import json
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal, cast
+
+from ai_librarian_core.models.llm_config import LLMConfig
+from ai_librarian_core.models.used_tool import UsedTool
+from langchain_core.messages import AIMessage, BaseMessage, message_to_dict, messages_from_dict, messages_to_dict
+
+JobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+
+FINISHED_STATUSES: frozenset[JobStatus] = frozenset({"succeeded", "failed", "cancelled"})
+
+
+@dataclass
+class Job:
+    """An agent request run in the background and its outcome.
+
+    Attributes:
+        id (str): The job identifier.
+        thread_id (str): The conversation thread the request continues.
+        messages (list[BaseMessage]): The messages of the request.
+        llm_config (LLMConfig): The chat model configuration of the request.
+        status (JobStatus): Where the job is in its lifecycle (default: "queued").
+        created_at (float): When the job was submitted, as a Unix timestamp.
+        started_at (float | None): When a worker picked the job up.
+        finished_at (float | None): When the job succeeded, failed or was cancelled.
+        expires_at (float | None): When a finished job and its events are deleted.
+        answer (AIMessage | None): The agent's answer, once succeeded.
+        used_tools (list[UsedTool]): The tools the agent called for the answer.
+        error (str | None): Why the job failed or was cancelled.
+    """
+
+    id: str
+    thread_id: str
+    messages: list[BaseMessage]
+    llm_config: LLMConfig
+    status: JobStatus = "queued"
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    expires_at: float | None = None
+    answer: AIMessage | None = None
+    used_tools: list[UsedTool] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+
+@dataclass
+class JobEvent:
+    """A progress event of a job, `seq` increases across all jobs of a store.
+
+    Attributes:
+        seq (int): The position of the event in the store, used to resume reading after it.
+        event (str): The kind of event, e.g. "tool_chosen", "tool_output" or a job status.
+        data (dict[str, Any]): The JSON payload of the event.
+    """
+
+    seq: int
+    event: str
+    data: dict[str, Any]
+
+
+_COLUMNS = (
+    "id, thread_id, messages, llm_config, status, created_at, started_at, finished_at, expires_at, answer, "
+    "used_tools, error"
+)
+
+
+@dataclass
+class SQLiteJobStore:
+    """Keeps background jobs and their progress events in a SQLite file, shared by the workers of one host.
+
+    Jobs survive restarts, a worker claims a queued job with a single conditional update, so each job runs once.
+    A running job is kept alive by its worker's heartbeats, a job whose worker stopped heartbeating is failed by
+    `sweep`, which also deletes finished jobs past their expiry.
+
+    Attributes:
+        path (str): The SQLite file.
+        result_ttl_seconds (float): How long a finished job is kept (default: 3600).
+    """
+
+    path: str
+    result_ttl_seconds: float = 3600
+
+    def __post_init__(self):
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.closing(self._connect()) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, thread_id TEXT NOT NULL, messages TEXT NOT NULL, llm_config TEXT NOT NULL, "
+                "status TEXT NOT NULL, created_at REAL NOT NULL, started_at REAL, finished_at REAL, expires_at REAL, "
+                "answer TEXT, used_tools TEXT, error TEXT, owner TEXT, heartbeat_at REAL, "
+                "cancel_requested INTEGER NOT NULL DEFAULT 0);"
+                "CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at);"
+                "CREATE TABLE IF NOT EXISTS job_events ("
+                "seq INTEGER PRIMARY KEY AUTOINCREMENT, job_id TEXT NOT NULL, event TEXT NOT NULL, data TEXT NOT NULL);"
+                "CREATE INDEX IF NOT EXISTS job_events_job ON job_events (job_id, seq);"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def _execute(self, sql: str, *parameters: object) -> list[sqlite3.Row]:
+        with contextlib.closing(self._connect()) as connection:
+            return connection.execute(sql, parameters).fetchall()
+
+    async def _run(self, sql: str, *parameters: object) -> list[sqlite3.Row]:
+        return await asyncio.to_thread(self._execute, sql, *parameters)
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> Job:
+        return Job(
+            id=row["id"],
+            thread_id=row["thread_id"],
+            messages=messages_from_dict(json.loads(row["messages"])),
+            llm_config=LLMConfig.model_validate_json(row["llm_config"]),
+            status=row["status"],
+            created_at=row["created_at"],
+            started_at=row["started_at"],
+            finished_at=row["finished_at"],
+            expires_at=row["expires_at"],
+            # Only the AIMessage answers of finished jobs are stored.
+            answer=cast(AIMessage, messages_from_dict([json.loads(row["answer"])])[0]) if row["answer"] else None,
+            used_tools=[UsedTool.model_validate(used_tool) for used_tool in json.loads(row["used_tools"] or "[]")],
+            error=row["error"],
+        )
+
+    async def add(self, job: Job):
+        await self._run(
+            "INSERT INTO jobs (id, thread_id, messages, llm_config, status, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            job.id,
+            job.thread_id,
+            json.dumps(messages_to_dict(job.messages)),
+            job.llm_config.model_dump_json(),
+            job.status,
+            job.created_at,
+        )
+
+    async def get(self, job_id: str) -> Job | None:
+        rows = await self._run(f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", job_id)
+        return self._to_job(rows[0]) if rows else None
+
+    async def count(self, status: JobStatus) -> int:
+        return (await self._run("SELECT COUNT(*) FROM jobs WHERE status = ?", status))[0][0]
+
+    async def claim(self, owner: str) -> Job | None:
+        """Marks the oldest queued job as running for `owner` and returns it, None when no job is queued."""
+        now = time.time()
+        rows = await self._run(
+            "UPDATE jobs SET status = 'running', started_at = ?, owner = ?, heartbeat_at = ? "
+            "WHERE id = (SELECT id FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1) "
+            f"AND status = 'queued' RETURNING {_COLUMNS}",
+            now,
+            owner,
+            now,
+        )
+        return self._to_job(rows[0]) if rows else None
+
+    async def heartbeat(self, job_id: str, owner: str) -> bool:
+        """Keeps a running job alive, returns False if it should stop, because it was cancelled or taken away."""
+        rows = await self._run(
+            "UPDATE jobs SET heartbeat_at = ? WHERE id = ? AND owner = ? AND status = 'running' "
+            "RETURNING cancel_requested",
+            time.time(),
+            job_id,
+            owner,
+        )
+        return bool(rows) and not rows[0]["cancel_requested"]
+
+    async def request_cancel(self, job_id: str) -> Job | None:
+        """Cancels a queued job right away and asks the worker of a running one to stop it."""
+        now = time.time()
+        await self._run(
+            "UPDATE jobs SET status = 'cancelled', finished_at = ?, expires_at = ?, "
+            "error = 'Cancelled before it started.' WHERE id = ? AND status = 'queued'",
+            now,
+            now + self.result_ttl_seconds,
+            job_id,
+        )
+        await self._run("UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = 'running'", job_id)
+        return await self.get(job_id)
+
+    async def finish(self, job: Job, owner: str) -> bool:
+        """Stores the outcome of a job, only if it is still running for `owner`, and sets its finish and expiry."""
+        job.finished_at = time.time()
+        job.expires_at = job.finished_at + self.result_ttl_seconds
+        rows = await self._run(
+            "UPDATE jobs SET status = ?, finished_at = ?, expires_at = ?, answer = ?, used_tools = ?, error = ? "
+            "WHERE id = ? AND status = 'running' AND owner = ? RETURNING id",
+            job.status,
+            job.finished_at,
+            job.expires_at,
+            json.dumps(message_to_dict(job.answer)) if job.answer else None,
+            json.dumps([used_tool.model_dump() for used_tool in job.used_tools]),
+            job.error,
+            job.id,
+            owner,
+        )
+        return bool(rows)
+
+    async def add_event(self, job_id: str, event: str, data: dict[str, Any]) -> int:
+        rows = await self._run(
+            "INSERT INTO job_events (job_id, event, data) VALUES (?, ?, ?) RETURNING seq",
+            job_id,
+            event,
+            json.dumps(data, ensure_ascii=False),
+        )
+        return rows[0]["seq"]
+
+    async def events(self, job_id: str, after: int = 0) -> list[JobEvent]:
+        rows = await self._run(
+            "SELECT seq, event, data FROM job_events WHERE job_id = ? AND seq > ? ORDER BY seq", job_id, after
+        )
+        return [JobEvent(seq=row["seq"], event=row["event"], data=json.loads(row["data"])) for row in rows]
+
+    async def sweep(self, stale_before: float) -> list[str]:
+        """Deletes expired jobs and fails running jobs without a heartbeat since `stale_before`.
+
+        Returns:
+            list[str]: The identifiers of the jobs that were failed.
+        """
+        now = time.time()
+        await self._run("DELETE FROM job_events WHERE job_id IN (SELECT id FROM jobs WHERE expires_at < ?)", now)
+        await self._run("DELETE FROM jobs WHERE expires_at < ?", now)
+        rows = await self._run(
+            "UPDATE jobs SET status = 'failed', finished_at = ?, expires_at = ?, "
+            "error = 'Interrupted, its worker stopped.' WHERE status = 'running' AND heartbeat_at < ? RETURNING id",
+            now,
+            now + self.result_ttl_seconds,
+            stale_before,
+        )
+        return [row["id"] for row in rows]
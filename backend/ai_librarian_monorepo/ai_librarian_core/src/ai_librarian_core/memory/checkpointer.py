@@ -0,0 +1,61 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Literal
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+
+CheckpointerBackend = Literal["memory", "sqlite", "postgres"]
+
+
+@asynccontextmanager
+async def open_checkpointer(
+    backend: CheckpointerBackend = "memory", url: str | None = None
+) -> AsyncIterator[BaseCheckpointSaver]:
+    """Opens the checkpointer that stores the conversation threads, and closes its connections on exit.
+
+    "memory" keeps the threads in the process, so every worker of a multi-worker deployment only sees its own.
+    "sqlite" shares them between the workers of one host through a file and "postgres" between hosts. Their
+    LangGraph integration packages are installed by the `sqlite` and `postgres` extras of `ai-librarian-core`.
+
+    Args:
+        backend (CheckpointerBackend): Where the threads are stored (default: "memory").
+        url (str | None): The SQLite file or the Postgres connection string, required by "sqlite" and "postgres".
+
+    Raises:
+        ValueError: If `url` is missing.
+        ImportError: If the extra of `backend` is not installed.
+
+    Example:
+        >>> async with open_checkpointer("sqlite", "data/checkpoints.sqlite") as checkpointer:
+        ...     agent = AsyncReactAgent(tools=tools, checkpointer=checkpointer)
+    """
+    if backend == "memory":
+        yield InMemorySaver()
+        return
+    if not url:
+        raise ValueError(f"The {backend} checkpointer needs a url.")
+
+    if backend == "sqlite":
+        try:
+            from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver  # pyright: ignore[reportMissingImports]
+        except ImportError as e:
+            raise ImportError(
+                "The sqlite checkpointer needs the `sqlite` extra: pip install 'ai-librarian-core[sqlite]'."
+            ) from e
+        Path(url).parent.mkdir(parents=True, exist_ok=True)
+        async with AsyncSqliteSaver.from_conn_string(url) as checkpointer:
+            await checkpointer.setup()
+            yield checkpointer
+        return
+
+    try:
+        from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver  # pyright: ignore[reportMissingImports]
+    except ImportError as e:
+        raise ImportError(
+            "The postgres checkpointer needs the `postgres` extra: pip install 'ai-librarian-core[postgres]'."
+        ) from e
+    async with AsyncPostgresSaver.from_conn_string(url) as checkpointer:
+        await checkpointer.setup()
+        yield checkpointer
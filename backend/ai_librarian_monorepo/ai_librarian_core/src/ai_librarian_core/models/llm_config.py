@@ -72,5 +72,13 @@ class LLMConfig(BaseModel):
         ),
         examples=[2000],
     )
+    cascade: bool = Field(
+        default=False,
+        description=(
+            "Try the agent's faster models first and escalate to `model` only when their answer looks unreliable, "
+            "e.g. a tool failed or the answer is empty. The model that answered is reported in the response."
+        ),
+        examples=[False],
+    )
 
     model_config = ConfigDict(frozen=True)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from ai_librarian_core.blobs.offload import BLOB_METADATA_KEY
+from langchain_core.messages import ToolMessage
 from pydantic import BaseModel, Field
 
 
@@ -28,3 +30,18 @@ class UsedTool(BaseModel):
         description="The result or response returned by the external tool when it was called",
         examples=["The temperature in Tokyo is 20°C"],
     )
+    blob_id: str | None = Field(
+        default=None,
+        description=(
+            "Set when the output was too long and truncated to a preview, the id of the blob holding the full output"
+        ),
+        examples=["9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"],
+    )
+
+    @classmethod
+    def from_message(cls, message: ToolMessage) -> UsedTool:
+        return cls(
+            name=message.name or "",
+            output=message.text(),
+            blob_id=message.response_metadata.get(BLOB_METADATA_KEY),
+        )
@@ -0,0 +1,444 @@
+"""A minimal Prometheus-style metrics registry for the agent hot paths.
+
+Metrics are plain Python objects updated without locks: every update is a handful of attribute writes that
+run on the event loop thread, so the cost on the hot path is a dict lookup plus an addition. Values are only
+aggregated into the Prometheus text exposition format when the registry is scraped.
+"""
+
+import asyncio
+import functools
+import math
+import time
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from langchain_core.messages.ai import UsageMetadata
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return f"{int(value)}.0"
+    return repr(float(value))
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in labels.items()) + "}"
+
+
+@dataclass(slots=True)
+class CounterChild:
+    value: float = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+
+@dataclass(slots=True)
+class GaugeChild:
+    value: float = 0.0
+    function: Callable[[], float] | None = None
+    blocking: bool = False
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+    def set_function(self, function: Callable[[], float], blocking: bool = False):
+        """Computes the gauge lazily at scrape time instead of on the hot path.
+
+        A `blocking` function, e.g. one walking a large data structure, is computed on a worker thread by
+        `MetricsRegistry.arender`, the gauge reports its last computed value in between.
+        """
+        self.function = function
+        self.blocking = blocking
+
+    def refresh(self):
+        if self.function is not None:
+            self.value = self.function()
+
+    def get(self) -> float:
+        return self.function() if self.function is not None and not self.blocking else self.value
+
+
+@dataclass(slots=True)
+class HistogramChild:
+    buckets: Sequence[float]
+    counts: list[int] = field(init=False)
+    sum: float = 0.0
+    count: int = 0
+
+    def __post_init__(self):
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float):
+        # Counts are stored per bucket and only made cumulative at scrape time.
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+type MetricChild = CounterChild | GaugeChild | HistogramChild
+
+
+@dataclass
+class Metric[ChildT: MetricChild]:
+    name: str
+    documentation: str
+    labelnames: Sequence[str] = ()
+    registry: "MetricsRegistry | None" = field(default=None, repr=False)
+
+    type_name = "untyped"
+
+    def __post_init__(self):
+        self.labelnames = tuple(self.labelnames)
+        self._children: dict[tuple[str, ...], ChildT] = {}
+        (REGISTRY if self.registry is None else self.registry).register(self)
+
+    def _new_child(self) -> ChildT:
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    def labels(self, **labels: str) -> ChildT:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _iter_children(self) -> Iterator[tuple[dict[str, str], ChildT]]:
+        for key, child in list(self._children.items()):
+            yield dict(zip(self.labelnames, key, strict=True)), child
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for labels, child in self._iter_children():
+            lines.extend(self._render_child(labels, child))
+        return lines
+
+    def _render_child(self, labels: dict[str, str], child: ChildT) -> list[str]:
+        raise NotImplementedError("Subclasses must implement this method.")
+
+
+@dataclass
+class Counter(Metric[CounterChild]):
+    type_name = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def _render_child(self, labels: dict[str, str], child: CounterChild) -> list[str]:
+        return [f"{self.name}{_format_labels(labels)} {_format_value(child.value)}"]
+
+
+@dataclass
+class Gauge(Metric[GaugeChild]):
+    type_name = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self.labels().dec(amount)
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+    def set_function(self, function: Callable[[], float], blocking: bool = False):
+        self.labels().set_function(function, blocking)
+
+    def _render_child(self, labels: dict[str, str], child: GaugeChild) -> list[str]:
+        return [f"{self.name}{_format_labels(labels)} {_format_value(child.get())}"]
+
+
+@dataclass
+class Histogram(Metric[HistogramChild]):
+    buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+
+    type_name = "histogram"
+
+    def __post_init__(self):
+        self.buckets = tuple(sorted(self.buckets))
+        super().__post_init__()
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def time(self) -> AbstractContextManager[None]:
+        return self.labels().time()
+
+    def _render_child(self, labels: dict[str, str], child: HistogramChild) -> list[str]:
+        lines = []
+        cumulative = 0
+        for upper_bound, count in zip((*self.buckets, math.inf), list(child.counts), strict=True):
+            cumulative += count
+            bucket_labels = _format_labels({**labels, "le": _format_value(upper_bound)})
+            lines.append(f"{self.name}_bucket{bucket_labels} {_format_value(cumulative)}")
+        lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(child.sum)}")
+        lines.append(f"{self.name}_count{_format_labels(labels)} {_format_value(cumulative)}")
+        return lines
+
+
+@dataclass
+class MetricsRegistry:
+    _metrics: dict[str, Metric[Any]] = field(default_factory=dict)
+
+    def register(self, metric: Metric[Any]):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered.")
+        self._metrics[metric.name] = metric
+
+    def get(self, name: str) -> Metric[Any] | None:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _refresh_blocking_gauges(self):
+        for metric in list(self._metrics.values()):
+            if isinstance(metric, Gauge):
+                for _, child in metric._iter_children():
+                    if child.blocking:
+                        child.refresh()
+
+    async def arender(self) -> str:
+        """Renders the registry on the event loop after computing the blocking gauges on a worker thread."""
+        await asyncio.to_thread(self._refresh_blocking_gauges)
+        return self.render()
+
+
+REGISTRY = MetricsRegistry()
+
+GRAPH_NODE_SECONDS = Histogram(
+    "ai_librarian_graph_node_seconds",
+    "Time spent in each node of the agent graph.",
+    labelnames=("agent", "node"),
+)
+TOOL_CALL_SECONDS = Histogram(
+    "ai_librarian_tool_call_seconds",
+    "Latency of a single tool call.",
+    labelnames=("tool",),
+)
+TOOL_CALL_ERRORS = Counter(
+    "ai_librarian_tool_call_errors_total",
+    "Tool calls that returned an error, timed out or were rejected by an open circuit breaker.",
+    labelnames=("tool",),
+)
+LLM_TOKENS = Counter(
+    "ai_librarian_llm_tokens_total",
+    "Tokens consumed by the chat models, by model and token type (input, output, cache_read, cache_creation).",
+    labelnames=("model", "type"),
+)
+MODEL_ANSWERS = Counter(
+    "ai_librarian_model_answers_total",
+    "Final answers by the model that produced them, cascaded requests count under the tier that answered.",
+    labelnames=("model",),
+)
+MODEL_ESCALATIONS = Counter(
+    "ai_librarian_model_escalations_total",
+    "Model cascade escalations by tier and the signal that triggered them.",
+    labelnames=("from_model", "to_model", "signal"),
+)
+LLM_TTFT_SECONDS = Histogram(
+    "ai_librarian_llm_ttft_seconds",
+    "Time to the first streamed chunk of hedged chat models, the input of their hedging deadline.",
+    labelnames=("model",),
+)
+HEDGED_REQUESTS = Counter(
+    "ai_librarian_hedged_requests_total",
+    "Chat model requests also sent to the backup model, after the hedging deadline or an error of the model.",
+    labelnames=("model", "backup", "trigger"),
+)
+HEDGE_WINNERS = Counter(
+    "ai_librarian_hedge_winners_total",
+    "Hedged chat model requests by the model that streamed first.",
+    labelnames=("model",),
+)
+LLM_IN_FLIGHT = Gauge(
+    "ai_librarian_llm_in_flight",
+    "Chat model requests admitted by the scheduler and not finished yet, by provider.",
+    labelnames=("provider",),
+)
+LLM_QUEUE_DEPTH = Gauge(
+    "ai_librarian_llm_queue_depth",
+    "Chat model requests waiting for a provider's concurrency or token budget.",
+    labelnames=("provider", "priority"),
+)
+LLM_QUEUE_SECONDS = Histogram(
+    "ai_librarian_llm_queue_seconds",
+    "Time chat model requests waited in the scheduler queue before being admitted.",
+    labelnames=("provider", "priority"),
+)
+LLM_REJECTED_REQUESTS = Counter(
+    "ai_librarian_llm_rejected_requests_total",
+    "Chat model requests shed because the provider's queue was too deep.",
+    labelnames=("provider", "priority"),
+)
+ACTIVE_THREAD_RUNS = Gauge(
+    "ai_librarian_active_thread_runs",
+    "Threads with a run in progress or queued in this process.",
+)
+THREAD_RUN_CONFLICTS = Counter(
+    "ai_librarian_thread_run_conflicts_total",
+    "Runs started on a thread that already had one, by the policy that handled them (queue, reject or cancel).",
+    labelnames=("policy",),
+)
+RUNNING_JOBS = Gauge(
+    "ai_librarian_running_jobs",
+    "Background jobs running in this process.",
+)
+JOB_QUEUE_SECONDS = Histogram(
+    "ai_librarian_job_queue_seconds",
+    "Time background jobs waited in the job store before a worker picked them up.",
+)
+FINISHED_JOBS = Counter(
+    "ai_librarian_finished_jobs_total",
+    "Background jobs finished by status (succeeded, failed or cancelled).",
+    labelnames=("status",),
+)
+BOUND_TOOLS = Histogram(
+    "ai_librarian_bound_tools",
+    "Number of tool schemas bound to each chat model call.",
+    buckets=(1, 2, 3, 4, 6, 8, 12, 16),
+)
+CHECKPOINTER_THREADS = Gauge(
+    "ai_librarian_checkpointer_threads",
+    "Number of conversation threads held by the checkpointer.",
+    labelnames=("agent",),
+)
+CHECKPOINTER_BYTES = Gauge(
+    "ai_librarian_checkpointer_bytes",
+    "Serialized size of all checkpoints, writes and channel blobs held by the checkpointer.",
+    labelnames=("agent",),
+)
+ANSWER_CACHE_LOOKUPS = Counter(
+    "ai_librarian_answer_cache_lookups_total",
+    "Answer cache lookups by result (exact_hit, semantic_hit or miss).",
+    labelnames=("result",),
+)
+ANSWER_CACHE_ENTRIES = Gauge(
+    "ai_librarian_answer_cache_entries",
+    "Number of answers held by the answer cache.",
+)
+LOCAL_CATALOG_LOOKUPS = Counter(
+    "ai_librarian_local_catalog_lookups_total",
+    "Local catalog lookups by result (hit, remote, or stale when the remote search failed and local records answered).",
+    labelnames=("result",),
+)
+CATALOG_INDEX_RECORDS = Gauge(
+    "ai_librarian_catalog_index_records",
+    "Number of records held by the local catalog index.",
+)
+OFFLOADED_TOOL_OUTPUTS = Counter(
+    "ai_librarian_offloaded_tool_outputs_total",
+    "Tool outputs moved to the blob store and replaced by a preview in the agent state.",
+    labelnames=("tool",),
+)
+OFFLOADED_TOOL_OUTPUT_CHARS = Counter(
+    "ai_librarian_offloaded_tool_output_chars_total",
+    "Characters of tool outputs kept out of the agent state by the blob store.",
+    labelnames=("tool",),
+)
+BLOB_STORE_BYTES = Gauge(
+    "ai_librarian_blob_store_bytes",
+    "Compressed size of the blobs held by the blob store.",
+)
+
+
+def timed_node(agent: str, node: str, func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Wraps an async graph node so its duration is observed in `GRAPH_NODE_SECONDS`."""
+    histogram = GRAPH_NODE_SECONDS.labels(agent=agent, node=node)
+
+    # functools.wraps keeps the node signature visible, LangGraph inspects it to inject the runnable config.
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - start)
+
+    return wrapper
+
+
+def record_token_usage(model: str, usage_metadata: UsageMetadata | None):
+    if not usage_metadata:
+        return
+    for token_type in ("input_tokens", "output_tokens"):
+        if tokens := usage_metadata.get(token_type):
+            LLM_TOKENS.labels(model=model, type=token_type.removesuffix("_tokens")).inc(tokens)
+    # Prompt cache hits and writes, both already included in the input tokens.
+    input_token_details = usage_metadata.get("input_token_details") or {}
+    for token_type in ("cache_read", "cache_creation"):
+        if tokens := input_token_details.get(token_type):
+            LLM_TOKENS.labels(model=model, type=token_type).inc(tokens)
+
+
+def checkpointer_thread_count(checkpointer: BaseCheckpointSaver) -> float:
+    if isinstance(checkpointer, InMemorySaver):
+        return float(len(checkpointer.storage))
+    return math.nan
+
+
+def checkpointer_size_bytes(checkpointer: BaseCheckpointSaver) -> float:
+    """Sums the serialized payloads of an `InMemorySaver`, other savers report NaN.
+
+    It walks every checkpoint, so it is registered as a blocking gauge function. Every dict is copied with `list`
+    first, which is atomic under the GIL, so the walk can run on a worker thread while the agent writes checkpoints.
+    """
+    if not isinstance(checkpointer, InMemorySaver):
+        return math.nan
+
+    size = 0
+    for namespaces in list(checkpointer.storage.values()):
+        for checkpoints in list(namespaces.values()):
+            for checkpoint, metadata, _ in list(checkpoints.values()):
+                size += len(checkpoint[1]) + len(metadata[1])
+    for writes in list(checkpointer.writes.values()):
+        for write in list(writes.values()):
+            size += len(write[2][1])
+    for blob in list(checkpointer.blobs.values()):
+        size += len(blob[1])
+    return float(size)
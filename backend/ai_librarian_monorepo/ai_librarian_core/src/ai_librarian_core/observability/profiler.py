@@ -0,0 +1,112 @@
+"""An in-process sampling profiler that produces collapsed stacks.
+
+A background thread periodically reads the current frame of the sampled threads with `sys._current_frames()`.
+Nothing is hooked into the interpreter, so the profiled code runs unmodified and there is no cost at all while no
+profile is being taken. The output is in the collapsed stack format (`frame;frame;frame count`), which can be
+loaded in speedscope or turned into a flamegraph with `flamegraph.pl`.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Collection
+from dataclasses import dataclass, field
+from types import FrameType
+
+
+@dataclass
+class Profile:
+    """The samples collected by one profiling session."""
+
+    started_at: float
+    duration: float = 0.0
+    interval: float = 0.005
+    sample_count: int = 0
+    stacks: Counter[str] = field(default_factory=Counter)
+
+    def to_collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def _format_frame(frame: FrameType) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    if (index := filename.rfind("site-packages" + os.sep)) != -1:
+        filename = filename[index + len("site-packages") + 1 :]
+    # Semicolons separate frames in the collapsed format.
+    return f"{code.co_qualname} ({filename}:{code.co_firstlineno})".replace(";", ":")
+
+
+def _collapse(frame: FrameType | None) -> str:
+    frames = []
+    while frame is not None:
+        frames.append(_format_frame(frame))
+        frame = frame.f_back
+    return ";".join(reversed(frames))
+
+
+@dataclass
+class SamplingProfiler:
+    """Samples the stacks of running threads at a fixed interval.
+
+    Attributes:
+        interval (float): The number of seconds between two samples (default: 0.005).
+        thread_ids (Collection[int] | None): Only sample these threads, all threads when None (default: None).
+        should_sample (Callable[[], bool] | None): Checked before every sample, the sample is skipped when it
+            returns False. Used to only record the samples of one request (default: None).
+
+    Example:
+        >>> profiler = SamplingProfiler(interval=0.01)
+        >>> profiler.start()
+        >>> ...
+        >>> print(profiler.stop().to_collapsed())
+    """
+
+    interval: float = 0.005
+    thread_ids: Collection[int] | None = None
+    should_sample: Callable[[], bool] | None = None
+
+    def __post_init__(self):
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._profile: Profile | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        if self._thread is not None:
+            raise RuntimeError("The profiler is already running.")
+        profile = self._profile = Profile(started_at=time.time(), interval=self.interval)
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._sample_loop, args=(profile,), name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> Profile:
+        if self._thread is None or self._profile is None:
+            raise RuntimeError("The profiler is not running.")
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        self._profile.duration = time.time() - self._profile.started_at
+        return self._profile
+
+    def _sample_loop(self, profile: Profile):
+        own_thread_id = threading.get_ident()
+        thread_names = {}
+        while not self._stopped.wait(self.interval):
+            if self.should_sample is not None and not self.should_sample():
+                continue
+            for thread in threading.enumerate():
+                thread_names[thread.ident] = thread.name
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread_id or (self.thread_ids is not None and thread_id not in self.thread_ids):
+                    continue
+                thread_name = thread_names.get(thread_id, str(thread_id))
+                profile.stacks[f"{thread_name};{_collapse(frame)}"] += 1
+            profile.sample_count += 1
@@ -0,0 +1,264 @@
+"""Lightweight in-process span tracing for agent requests.
+
+Spans are kept in a bounded in-memory ring buffer and can optionally be appended to a local JSONL file by a
+background writer thread. Nothing is sent to LangSmith or any other external service.
+"""
+
+import functools
+import json
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Protocol
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    thread_id: str | None
+    start_time: float
+    duration_ms: float | None = None
+    status: str = "ok"
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span): ...
+
+
+@dataclass
+class RingBufferExporter:
+    """Keeps the spans of the most recent `max_traces` traces in memory."""
+
+    max_traces: int = 1000
+
+    def __post_init__(self):
+        self._traces: OrderedDict[str, list[Span]] = OrderedDict()
+
+    def export(self, span: Span):
+        spans = self._traces.get(span.trace_id)
+        if spans is None:
+            spans = self._traces[span.trace_id] = []
+            while len(self._traces) > self.max_traces:
+                self._traces.popitem(last=False)
+        spans.append(span)
+
+    def get_trace(self, trace_id: str) -> list[Span]:
+        return sorted(self._traces.get(trace_id, []), key=lambda span: span.start_time)
+
+    def list_traces(self, thread_id: str | None = None, limit: int = 50) -> list[list[Span]]:
+        traces = []
+        for spans in reversed(list(self._traces.values())):
+            if thread_id is not None and not any(span.thread_id == thread_id for span in spans):
+                continue
+            traces.append(sorted(spans, key=lambda span: span.start_time))
+            if len(traces) >= limit:
+                break
+        return traces
+
+
+@dataclass
+class JsonlFileExporter:
+    """Appends finished spans to a JSONL file from a background thread, so the event loop never blocks on disk."""
+
+    path: Path
+
+    def __post_init__(self):
+        self.path = Path(self.path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._queue: queue.SimpleQueue[Span | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._write_loop, name="trace-jsonl-writer", daemon=True)
+        self._thread.start()
+
+    def export(self, span: Span):
+        self._queue.put(span)
+
+    def shutdown(self):
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+    def _write_loop(self):
+        with self.path.open("a", encoding="utf-8") as f:
+            while (span := self._queue.get()) is not None:
+                f.write(json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n")
+                if self._queue.empty():
+                    f.flush()
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+@dataclass
+class Tracer:
+    """Creates spans and hands finished spans to the configured exporters.
+
+    The current span is tracked in a context variable, so spans opened inside graph nodes, tool calls and
+    checkpoint writes nest under the request span even across asyncio tasks. The `thread_id` of the root span
+    is inherited by all of its children.
+
+    Example:
+        >>> with TRACER.span("run_react_agent", thread_id="thread-123"):
+        ...     with TRACER.span("tool", tool="ncl_search"):
+        ...         ...
+    """
+
+    exporters: Sequence[SpanExporter] = field(default_factory=lambda: [RingBufferExporter()])
+    enabled: bool = True
+
+    @property
+    def ring_buffer(self) -> RingBufferExporter | None:
+        return next((exporter for exporter in self.exporters if isinstance(exporter, RingBufferExporter)), None)
+
+    @contextmanager
+    def span(self, name: str, thread_id: str | None = None, **attributes: Any) -> Iterator[Span | None]:
+        if not self.enabled:
+            yield None
+            return
+
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else os.urandom(8).hex(),
+            span_id=os.urandom(8).hex(),
+            parent_id=parent.span_id if parent else None,
+            thread_id=thread_id or (parent.thread_id if parent else None),
+            start_time=time.time(),
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "error"
+            span.set_attribute("error", repr(e))
+            raise
+        finally:
+            span.duration_ms = round((time.perf_counter() - start) * 1000, 3)
+            try:
+                _current_span.reset(token)
+            except ValueError:
+                # An abandoned async generator can be finalized from another context, the span is still exported.
+                pass
+            for exporter in self.exporters:
+                exporter.export(span)
+
+
+TRACER = Tracer()
+
+
+def configure_tracing(enabled: bool = True, max_traces: int = 1000, jsonl_path: str | Path | None = None) -> Tracer:
+    """Replaces the exporters of the global tracer."""
+    exporters: list[SpanExporter] = [RingBufferExporter(max_traces=max_traces)]
+    if jsonl_path:
+        exporters.append(JsonlFileExporter(path=Path(jsonl_path)))
+    TRACER.exporters = exporters
+    TRACER.enabled = enabled
+    return TRACER
+
+
+def traced_node(node: str, func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Wraps an async graph node so each execution is recorded as a span."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with TRACER.span(f"node:{node}"):
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+def _thread_id(config: RunnableConfig | None) -> str | None:
+    return (config or {}).get("configurable", {}).get("thread_id")
+
+
+class TracingCheckpointSaver(BaseCheckpointSaver):
+    """A checkpointer proxy that records every checkpoint read and write of the wrapped saver as a span."""
+
+    def __init__(self, checkpointer: BaseCheckpointSaver):
+        """Wraps `checkpointer`, sharing its serializer."""
+        super().__init__(serde=checkpointer.serde)
+        self.checkpointer = checkpointer
+
+    @property
+    def config_specs(self) -> list:
+        return self.checkpointer.config_specs
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        with TRACER.span("checkpoint:get", thread_id=_thread_id(config)):
+            return self.checkpointer.get_tuple(config)
+
+    def list(self, config: RunnableConfig | None, **kwargs: Any) -> Iterator[CheckpointTuple]:
+        return self.checkpointer.list(config, **kwargs)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        with TRACER.span("checkpoint:put", thread_id=_thread_id(config), channels=len(new_versions)):
+            return self.checkpointer.put(config, checkpoint, metadata, new_versions)
+
+    def put_writes(self, config: RunnableConfig, writes: Sequence[tuple[str, Any]], task_id: str, task_path: str = ""):
+        with TRACER.span("checkpoint:put_writes", thread_id=_thread_id(config), writes=len(writes)):
+            return self.checkpointer.put_writes(config, writes, task_id, task_path)
+
+    def delete_thread(self, thread_id: str):
+        return self.checkpointer.delete_thread(thread_id)
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        with TRACER.span("checkpoint:get", thread_id=_thread_id(config)):
+            return await self.checkpointer.aget_tuple(config)
+
+    async def alist(self, config: RunnableConfig | None, **kwargs: Any) -> AsyncIterator[CheckpointTuple]:
+        async for checkpoint_tuple in self.checkpointer.alist(config, **kwargs):
+            yield checkpoint_tuple
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        with TRACER.span("checkpoint:put", thread_id=_thread_id(config), channels=len(new_versions)):
+            return await self.checkpointer.aput(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self, config: RunnableConfig, writes: Sequence[tuple[str, Any]], task_id: str, task_path: str = ""
+    ):
+        with TRACER.span("checkpoint:put_writes", thread_id=_thread_id(config), writes=len(writes)):
+            return await self.checkpointer.aput_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str):
+        return await self.checkpointer.adelete_thread(thread_id)
+
+    def get_next_version(self, current: Any, channel: None) -> Any:
+        return self.checkpointer.get_next_version(current, channel)
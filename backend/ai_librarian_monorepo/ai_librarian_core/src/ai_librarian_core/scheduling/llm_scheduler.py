@@ -0,0 +1,319 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Literal
+
+from ai_librarian_core.observability.metrics import (
+    LLM_IN_FLIGHT,
+    LLM_QUEUE_DEPTH,
+    LLM_QUEUE_SECONDS,
+    LLM_REJECTED_REQUESTS,
+)
+from langchain_core.messages import BaseMessage
+
+Priority = Literal["interactive", "batch"]
+
+# Admission order, a queued interactive request always goes before a queued batch request.
+PRIORITIES: tuple[Priority, ...] = ("interactive", "batch")
+
+
+@dataclass(frozen=True)
+class ProviderLimits:
+    """The budget of one chat model provider, shared by all of its models.
+
+    Attributes:
+        max_concurrency (int): The maximum number of requests in flight at once (default: 16).
+        tokens_per_minute (int | None): The token budget per minute, unlimited when None (default: None).
+    """
+
+    max_concurrency: int = 16
+    tokens_per_minute: int | None = None
+
+    def per_worker(self, workers: int) -> "ProviderLimits":
+        """The share of one of `workers` processes, a provider's budget belongs to the account, not the process."""
+        return ProviderLimits(
+            max_concurrency=max(1, self.max_concurrency // workers),
+            tokens_per_minute=self.tokens_per_minute // workers if self.tokens_per_minute else None,
+        )
+
+
+# Token budgets depend on the account's usage tier, so only concurrency is capped by default.
+DEFAULT_PROVIDER_LIMITS: dict[str, ProviderLimits] = {
+    "openai": ProviderLimits(max_concurrency=32),
+    "anthropic": ProviderLimits(max_concurrency=16),
+    "google_genai": ProviderLimits(max_concurrency=16),
+    "groq": ProviderLimits(max_concurrency=8),
+}
+
+
+@dataclass
+class LLMOverloadedError(Exception):
+    """Raised instead of queuing a chat model request when the provider's queue is already too deep."""
+
+    provider: str
+    retry_after: int
+
+    def __str__(self) -> str:
+        return f"Too many queued requests for {self.provider}, retry after {self.retry_after}s."
+
+
+def estimate_tokens(messages: Sequence[BaseMessage], max_tokens: int | None) -> int:
+    """Estimates the tokens a request counts against a provider's budget, its input plus the output it may produce.
+
+    Like providers do, the full `max_tokens` is reserved up front, the unused part is given back once the actual
+    usage is known.
+    """
+    # Roughly four characters per token.
+    return sum(len(str(message.content)) for message in messages) // 4 + (max_tokens or 0)
+
+
+@dataclass
+class Admission:
+    """A granted chat model request. Set `used_tokens` to the actual usage to settle the reservation.
+
+    Attributes:
+        provider (str): The provider the request was admitted to.
+        reserved_tokens (int): The tokens reserved at admission.
+        used_tokens (int | None): The tokens the request actually used, if known.
+    """
+
+    provider: str
+    reserved_tokens: int
+    used_tokens: int | None = None
+
+
+@dataclass
+class _Waiter:
+    future: asyncio.Future
+    tokens: int
+    enqueued_at: float
+
+
+@dataclass
+class _ProviderState:
+    limits: ProviderLimits
+    tokens: float
+    updated_at: float
+    in_flight: int = 0
+    queued: int = 0
+    # Per priority, the waiters of each thread in arrival order. Threads take turns, one request at a time.
+    queues: dict[Priority, OrderedDict[str, deque[_Waiter]]] = field(
+        default_factory=lambda: {priority: OrderedDict() for priority in PRIORITIES}
+    )
+    timer: asyncio.TimerHandle | None = None
+    # Moving average of how long a request holds its slot, used to estimate Retry-After.
+    service_seconds: float = 2.0
+
+
+@dataclass
+class LLMScheduler:
+    """Admits chat model requests within per-provider concurrency and tokens-per-minute budgets.
+
+    Requests over budget wait in a queue per provider instead of hitting the provider and its 429s. The queue serves
+    interactive requests before batch ones and, within a priority, the threads in turns, so one busy thread cannot
+    starve the others. When a provider's queue already holds `max_queue_depth[priority]` requests, new requests of
+    that priority are rejected with `LLMOverloadedError` right away, which the API answers with 503 and Retry-After.
+
+    Attributes:
+        limits (dict[str, ProviderLimits]): The budget of each provider, by the prefix of the model name.
+        default_limits (ProviderLimits): The budget of providers missing from `limits`.
+        max_queue_depth (dict[Priority, int]): The queued requests per provider above which requests of a priority
+            are rejected, lower for batch so it is shed first.
+
+    Example:
+        >>> scheduler = LLMScheduler(limits={"openai": ProviderLimits(max_concurrency=8, tokens_per_minute=200_000)})
+        >>> async with scheduler.admit("openai:gpt-4o-mini", thread_id, tokens=1500) as admission:
+        ...     response = await llm.ainvoke(messages)
+        ...     admission.used_tokens = response.usage_metadata["total_tokens"]
+    """
+
+    limits: dict[str, ProviderLimits] = field(default_factory=lambda: dict(DEFAULT_PROVIDER_LIMITS))
+    default_limits: ProviderLimits = field(default_factory=ProviderLimits)
+    max_queue_depth: dict[Priority, int] = field(default_factory=lambda: {"interactive": 256, "batch": 64})
+
+    def __post_init__(self):
+        for provider, limits in {**self.limits, "default": self.default_limits}.items():
+            if limits.max_concurrency < 1:
+                raise ValueError(f"max_concurrency of {provider} must be at least 1.")
+        self._providers: dict[str, _ProviderState] = {}
+
+    @staticmethod
+    def provider(model: str) -> str:
+        return model.split(":", 1)[0]
+
+    def check(self, model: str, priority: Priority = "interactive"):
+        """Raises `LLMOverloadedError` if a request for `model` would be rejected right now."""
+        provider = self.provider(model)
+        state = self._state(provider)
+        if state.queued >= self.max_queue_depth[priority]:
+            LLM_REJECTED_REQUESTS.labels(provider=provider, priority=priority).inc()
+            raise LLMOverloadedError(provider=provider, retry_after=self._retry_after(state))
+
+    @asynccontextmanager
+    async def admit(
+        self, model: str, thread_id: str, priority: Priority = "interactive", tokens: int = 0
+    ) -> AsyncIterator[Admission]:
+        """Waits for a slot and the tokens of one request to `model`, and frees the slot on exit.
+
+        Args:
+            model (str): The chat model, its provider is the part before the first ":".
+            thread_id (str): The conversation the request belongs to, threads take turns in the queue.
+            priority (Priority): "interactive" for requests a user is waiting on, "batch" for the rest.
+            tokens (int): The tokens to reserve, see `estimate_tokens`.
+
+        Raises:
+            LLMOverloadedError: If the provider's queue is too deep for `priority`.
+        """
+        self.check(model, priority)
+        provider = self.provider(model)
+        state = self._state(provider)
+        admission = Admission(provider=provider, reserved_tokens=tokens)
+
+        self._refill(state)
+        if state.queued == 0 and self._can_run(state, tokens):
+            self._start(state, provider, tokens)
+        else:
+            waiter = _Waiter(
+                future=asyncio.get_running_loop().create_future(), tokens=tokens, enqueued_at=time.monotonic()
+            )
+            state.queues[priority].setdefault(thread_id, deque()).append(waiter)
+            state.queued += 1
+            LLM_QUEUE_DEPTH.labels(provider=provider, priority=priority).inc()
+            try:
+                await waiter.future
+            except asyncio.CancelledError:
+                if waiter.future.done() and not waiter.future.cancelled():
+                    # Granted just before the cancellation, the slot and the unused tokens are handed on.
+                    admission.used_tokens = 0
+                    self._finish(state, provider, admission, started_at=time.monotonic())
+                else:
+                    self._remove(state, provider, priority, thread_id, waiter)
+                raise
+            LLM_QUEUE_SECONDS.labels(provider=provider, priority=priority).observe(
+                time.monotonic() - waiter.enqueued_at
+            )
+
+        started_at = time.monotonic()
+        try:
+            yield admission
+        finally:
+            self._finish(state, provider, admission, started_at)
+
+    @asynccontextmanager
+    async def admit_now(self, model: str, tokens: int = 0) -> AsyncIterator[Admission | None]:
+        """Admits a request to `model` only if it can start right away, yields None instead of queuing it.
+
+        Meant for optional requests like hedged ones, which would only add load once they have to wait their turn
+        behind the requests in the queue.
+
+        Args:
+            model (str): The chat model, its provider is the part before the first ":".
+            tokens (int): The tokens to reserve, see `estimate_tokens`.
+        """
+        provider = self.provider(model)
+        state = self._state(provider)
+        self._refill(state)
+        if state.queued or not self._can_run(state, tokens):
+            yield None
+            return
+        self._start(state, provider, tokens)
+        admission = Admission(provider=provider, reserved_tokens=tokens)
+        started_at = time.monotonic()
+        try:
+            yield admission
+        finally:
+            self._finish(state, provider, admission, started_at)
+
+    def _state(self, provider: str) -> _ProviderState:
+        state = self._providers.get(provider)
+        if state is None:
+            limits = self.limits.get(provider, self.default_limits)
+            state = _ProviderState(
+                limits=limits, tokens=float(limits.tokens_per_minute or 0), updated_at=time.monotonic()
+            )
+            self._providers[provider] = state
+        return state
+
+    def _refill(self, state: _ProviderState):
+        now = time.monotonic()
+        if state.limits.tokens_per_minute:
+            capacity = state.limits.tokens_per_minute
+            state.tokens = min(capacity, state.tokens + (now - state.updated_at) * capacity / 60)
+        state.updated_at = now
+
+    def _can_run(self, state: _ProviderState, tokens: int) -> bool:
+        if state.in_flight >= state.limits.max_concurrency:
+            return False
+        if not state.limits.tokens_per_minute:
+            return True
+        # A request larger than the whole budget still runs once the bucket is full.
+        return state.tokens >= min(tokens, state.limits.tokens_per_minute)
+
+    def _start(self, state: _ProviderState, provider: str, tokens: int):
+        state.in_flight += 1
+        if state.limits.tokens_per_minute:
+            state.tokens -= tokens
+        LLM_IN_FLIGHT.labels(provider=provider).inc()
+
+    def _finish(self, state: _ProviderState, provider: str, admission: Admission, started_at: float):
+        state.in_flight -= 1
+        LLM_IN_FLIGHT.labels(provider=provider).dec()
+        state.service_seconds += 0.1 * (time.monotonic() - started_at - state.service_seconds)
+        if state.limits.tokens_per_minute and admission.used_tokens is not None:
+            # Settles the reservation, a request that used more than reserved leaves the bucket in debt.
+            state.tokens += admission.reserved_tokens - admission.used_tokens
+        self._dispatch(state, provider)
+
+    def _remove(self, state: _ProviderState, provider: str, priority: Priority, thread_id: str, waiter: _Waiter):
+        waiters = state.queues[priority].get(thread_id)
+        if waiters is None or waiter not in waiters:
+            return
+        waiters.remove(waiter)
+        if not waiters:
+            del state.queues[priority][thread_id]
+        state.queued -= 1
+        LLM_QUEUE_DEPTH.labels(provider=provider, priority=priority).dec()
+        self._dispatch(state, provider)
+
+    def _dispatch(self, state: _ProviderState, provider: str):
+        """Admits queued requests in priority and round-robin order while the budget allows."""
+        self._refill(state)
+        while state.queued:
+            priority: Priority = next(priority for priority in PRIORITIES if state.queues[priority])
+            thread_id, waiters = next(iter(state.queues[priority].items()))
+            waiter = waiters[0]
+            if not waiter.future.done() and not self._can_run(state, waiter.tokens):
+                if state.in_flight < state.limits.max_concurrency:
+                    self._wake_up_for_tokens(state, provider, waiter.tokens)
+                return
+
+            waiters.popleft()
+            # The thread goes to the back of the line, behind the other threads of its priority.
+            del state.queues[priority][thread_id]
+            if waiters:
+                state.queues[priority][thread_id] = waiters
+            state.queued -= 1
+            LLM_QUEUE_DEPTH.labels(provider=provider, priority=priority).dec()
+            # A waiter cancelled while waiting for its turn is dropped.
+            if not waiter.future.done():
+                self._start(state, provider, waiter.tokens)
+                waiter.future.set_result(None)
+
+    def _wake_up_for_tokens(self, state: _ProviderState, provider: str, tokens: int):
+        if state.timer is not None and not state.timer.cancelled():
+            state.timer.cancel()
+        capacity = state.limits.tokens_per_minute
+        if not capacity:
+            return
+        seconds = (min(tokens, capacity) - state.tokens) * 60 / capacity
+        state.timer = asyncio.get_running_loop().call_later(max(seconds, 0.01), self._dispatch, state, provider)
+
+    def _retry_after(self, state: _ProviderState) -> int:
+        drain_seconds = state.queued / state.limits.max_concurrency * state.service_seconds
+        if state.limits.tokens_per_minute and state.tokens < 0:
+            drain_seconds = max(drain_seconds, -state.tokens * 60 / state.limits.tokens_per_minute)
+        return max(1, math.ceil(drain_seconds))
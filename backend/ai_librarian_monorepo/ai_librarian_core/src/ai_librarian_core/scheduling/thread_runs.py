@@ -0,0 +1,245 @@
+import asyncio
+import contextlib
+import sqlite3
+import time
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal
+
+from ai_librarian_core.observability.metrics import ACTIVE_THREAD_RUNS, THREAD_RUN_CONFLICTS
+
+RunPolicy = Literal["queue", "reject", "cancel"]
+
+
+@dataclass
+class ThreadBusyError(Exception):
+    """Raised when a thread already has a run and the policy rejects the new one, or a queued run waited too long."""
+
+    thread_id: str
+
+    def __str__(self) -> str:
+        return f"Thread {self.thread_id} already has a run in progress."
+
+
+@dataclass
+class ThreadTurn:
+    """A run holding its thread.
+
+    Attributes:
+        thread_id (str): The thread of the run.
+        preempted (bool): Whether an earlier run of the thread was cancelled for this one, its last turn may have
+            been cut off between a tool call and its result.
+    """
+
+    thread_id: str
+    preempted: bool = False
+
+
+@dataclass
+class SQLiteThreadLeases:
+    """Time-limited leases on threads in a SQLite file shared by the workers of one host.
+
+    A lease is renewed while its run is going and expires `ttl_seconds` after a worker died without releasing it.
+    Another worker may ask the holder to cancel its run, the holder sees the request on its next renewal.
+
+    Attributes:
+        path (str): The SQLite file, e.g. next to a shared SQLite checkpointer.
+        ttl_seconds (float): How long a lease lasts without renewal (default: 30).
+        renew_seconds (float): How often a held lease is renewed, which is also how long a cancel request may take
+            to be seen (default: 1).
+    """
+
+    path: str
+    ttl_seconds: float = 30
+    renew_seconds: float = 1
+
+    def __post_init__(self):
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.closing(self._connect()) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS thread_leases ("
+                "thread_id TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL, "
+                "cancel_requested INTEGER NOT NULL DEFAULT 0)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5, isolation_level=None)
+
+    def _execute(self, sql: str, *parameters: object) -> int:
+        with contextlib.closing(self._connect()) as connection:
+            return connection.execute(sql, parameters).rowcount
+
+    async def acquire(self, thread_id: str, owner: str) -> bool:
+        now = time.time()
+        # Expired leases of other workers are taken over, every acquisition also sweeps a few of them away.
+        await asyncio.to_thread(
+            self._execute,
+            "DELETE FROM thread_leases WHERE rowid IN (SELECT rowid FROM thread_leases WHERE expires_at < ? LIMIT 16)",
+            now,
+        )
+        return bool(
+            await asyncio.to_thread(
+                self._execute,
+                "INSERT INTO thread_leases (thread_id, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (thread_id) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at, "
+                "cancel_requested = 0 WHERE thread_leases.expires_at < ?",
+                thread_id,
+                owner,
+                now + self.ttl_seconds,
+                now,
+            )
+        )
+
+    async def renew(self, thread_id: str, owner: str) -> bool:
+        """Extends the lease, returns False if it was lost or another worker asked to cancel the run."""
+        return bool(
+            await asyncio.to_thread(
+                self._execute,
+                "UPDATE thread_leases SET expires_at = ? WHERE thread_id = ? AND owner = ? AND cancel_requested = 0",
+                time.time() + self.ttl_seconds,
+                thread_id,
+                owner,
+            )
+        )
+
+    async def request_cancel(self, thread_id: str):
+        await asyncio.to_thread(
+            self._execute, "UPDATE thread_leases SET cancel_requested = 1 WHERE thread_id = ?", thread_id
+        )
+
+    async def release(self, thread_id: str, owner: str):
+        await asyncio.to_thread(
+            self._execute, "DELETE FROM thread_leases WHERE thread_id = ? AND owner = ?", thread_id, owner
+        )
+
+
+@dataclass
+class _ThreadSlot:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    holder: asyncio.Task | None = None
+    waiters: set[asyncio.Task] = field(default_factory=set)
+
+
+@dataclass
+class ThreadRunCoordinator:
+    """Lets one run at a time work on a conversation thread.
+
+    A second run of a busy thread, e.g. a double-submitted question, is handled by `policy`:
+
+    - "queue": waits for the earlier run, up to `queue_timeout_seconds`.
+    - "reject": fails right away with `ThreadBusyError`.
+    - "cancel": cancels the earlier run and the runs queued behind it, the newest question wins.
+
+    Only threads with a run in progress or queued hold state in memory, it is dropped when the last run leaves, so
+    the cost does not grow with the number of threads ever seen. Runs in other worker processes are coordinated
+    through `leases` when the workers share a checkpointer.
+
+    Attributes:
+        policy (RunPolicy): What a run does when its thread is busy (default: "queue").
+        queue_timeout_seconds (float): How long a queued run waits before `ThreadBusyError` (default: 60).
+        leases (SQLiteThreadLeases | None): Leases shared with the other workers, in-process only when None.
+        poll_seconds (float): How often a run waiting for another worker's lease checks it (default: 0.1).
+
+    Example:
+        >>> coordinator = ThreadRunCoordinator(policy="cancel")
+        >>> async with coordinator.run(thread_id) as turn:
+        ...     await graph.ainvoke(state, config)
+    """
+
+    policy: RunPolicy = "queue"
+    queue_timeout_seconds: float = 60
+    leases: SQLiteThreadLeases | None = None
+    poll_seconds: float = 0.1
+
+    def __post_init__(self):
+        self._slots: dict[str, _ThreadSlot] = {}
+        ACTIVE_THREAD_RUNS.set_function(lambda: float(len(self._slots)))
+
+    def is_busy(self, thread_id: str) -> bool:
+        """Whether the thread has a run in this process."""
+        return thread_id in self._slots
+
+    @asynccontextmanager
+    async def run(self, thread_id: str) -> AsyncIterator[ThreadTurn]:
+        """Holds `thread_id` for the current task until the block exits.
+
+        Raises:
+            ThreadBusyError: If the policy is "reject" and the thread is busy, or a queued run timed out.
+            asyncio.CancelledError: If a later run of the thread cancelled this one.
+        """
+        task = asyncio.current_task()
+        assert task is not None, "ThreadRunCoordinator.run must be entered from a task."
+        turn = ThreadTurn(thread_id=thread_id)
+        slot = self._slots.setdefault(thread_id, _ThreadSlot())
+        if slot.holder is not None or slot.waiters:
+            THREAD_RUN_CONFLICTS.labels(policy=self.policy).inc()
+            if self.policy == "reject":
+                raise ThreadBusyError(thread_id)
+            if self.policy == "cancel":
+                for earlier in (slot.holder, *slot.waiters):
+                    if earlier is not None:
+                        earlier.cancel()
+                turn.preempted = slot.holder is not None
+
+        slot.waiters.add(task)
+        try:
+            async with asyncio.timeout(self.queue_timeout_seconds):
+                await slot.lock.acquire()
+        except TimeoutError:
+            raise ThreadBusyError(thread_id) from None
+        finally:
+            slot.waiters.discard(task)
+            self._drop_if_idle(thread_id, slot)
+        slot.holder = task
+
+        owner = uuid.uuid4().hex
+        leases = self.leases
+        renewal = None
+        try:
+            if leases is not None:
+                turn.preempted |= await self._acquire_lease(leases, thread_id, owner)
+                renewal = asyncio.create_task(self._renew_lease(leases, thread_id, owner, task))
+            yield turn
+        finally:
+            try:
+                if leases is not None and renewal is not None:
+                    renewal.cancel()
+                    await asyncio.shield(leases.release(thread_id, owner))
+            finally:
+                # Released even if this run is cancelled while the lease is released, e.g. by a third run.
+                slot.holder = None
+                slot.lock.release()
+                self._drop_if_idle(thread_id, slot)
+
+    def _drop_if_idle(self, thread_id: str, slot: _ThreadSlot):
+        if not slot.lock.locked() and not slot.waiters and self._slots.get(thread_id) is slot:
+            del self._slots[thread_id]
+
+    async def _acquire_lease(self, leases: SQLiteThreadLeases, thread_id: str, owner: str) -> bool:
+        """Waits for the thread's lease across workers, returns whether another worker's run was cancelled."""
+        preempted = False
+        deadline = time.monotonic() + self.queue_timeout_seconds
+        while not await leases.acquire(thread_id, owner):
+            if self.policy == "reject":
+                THREAD_RUN_CONFLICTS.labels(policy=self.policy).inc()
+                raise ThreadBusyError(thread_id)
+            if self.policy == "cancel" and not preempted:
+                THREAD_RUN_CONFLICTS.labels(policy=self.policy).inc()
+                await leases.request_cancel(thread_id)
+                preempted = True
+            if time.monotonic() > deadline:
+                raise ThreadBusyError(thread_id)
+            await asyncio.sleep(self.poll_seconds)
+        return preempted
+
+    async def _renew_lease(self, leases: SQLiteThreadLeases, thread_id: str, owner: str, task: asyncio.Task):
+        while True:
+            await asyncio.sleep(leases.renew_seconds)
+            if not await leases.renew(thread_id, owner):
+                # Another worker took the thread over, this run stops where it is.
+                task.cancel()
+                return
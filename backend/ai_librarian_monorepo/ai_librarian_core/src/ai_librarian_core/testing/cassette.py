@@ -0,0 +1,475 @@
+"""Record and replay of chat model and tool traffic.
+
+A cassette is a JSONL file, gzip-compressed when the path ends in `.gz`, with one line per chat model call or tool
+call. Chat model lines keep the input messages, every streamed chunk and the offset at which it arrived. Tool lines
+keep the arguments, the output and the duration. Recording wraps the real chat model and tools. Replaying swaps
+them for stand-ins that serve the recorded responses, either with the original timings or as fast as possible, so
+a captured session can be re-run against a new version of the graph, SSE layer or checkpointer.
+
+Example:
+    >>> recorder = CassetteRecorder(path="logs/session.jsonl.gz")
+    >>> agent = AsyncReactAgent(
+    ...     tools=recorder.record_tools(get_built_in_tools()),
+    ...     chat_model_factory=recorder.chat_model_factory(),
+    ... )
+    >>> ...
+    >>> cassette = Cassette.load("logs/session.jsonl.gz")
+    >>> agent = AsyncReactAgent(tools=cassette.replay_tools(), chat_model_factory=cassette.chat_model_factory())
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import queue
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO, cast
+
+from ai_librarian_core.models.llm_config import LLMConfig
+from langchain.chat_models import init_chat_model
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    AsyncCallbackManagerForToolRun,
+    CallbackManagerForLLMRun,
+    CallbackManagerForToolRun,
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    BaseMessageChunk,
+    message_chunk_to_message,
+    message_to_dict,
+    messages_from_dict,
+)
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.tools import BaseTool, ToolException
+from langchain_core.tools.base import ArgsSchema
+from langgraph.config import get_config
+from pydantic import ConfigDict, Field, model_validator
+
+
+class CassetteError(Exception):
+    pass
+
+
+class CassetteMissError(CassetteError):
+    pass
+
+
+def _open(path: Path, mode: str) -> TextIO:
+    if path.suffix == ".gz":
+        return cast(TextIO, gzip.open(path, mode + "t", encoding="utf-8"))
+    return cast(TextIO, path.open(mode, encoding="utf-8"))
+
+
+def messages_key(messages: Sequence[BaseMessage]) -> str:
+    """Hashes the parts of a conversation that decide the model's answer, ignoring random message ids."""
+    parts = [
+        [
+            message.type,
+            message.content,
+            [[tc["name"], tc["args"]] for tc in getattr(message, "tool_calls", [])],
+            getattr(message, "tool_call_id", None),
+        ]
+        for message in messages
+    ]
+    return hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def tool_key(name: str, args: dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps([name, args], sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _thread_id() -> str | None:
+    # Streaming calls get no run manager, the thread id is read from the config of the running graph node instead.
+    try:
+        return get_config().get("configurable", {}).get("thread_id")
+    except RuntimeError:
+        return None
+
+
+@dataclass
+class CassetteRecorder:
+    """Appends every recorded interaction to a cassette file from a background thread.
+
+    Attributes:
+        path (Path): The cassette file, appended to if it already exists.
+    """
+
+    path: Path
+
+    def __post_init__(self):
+        self.path = Path(self.path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._queue: queue.SimpleQueue[dict | None] = queue.SimpleQueue()
+        self._recorded_schemas: set[str] = set()
+        self._thread = threading.Thread(target=self._write_loop, name="cassette-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, record: dict[str, Any]):
+        self._queue.put(record)
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+    def _write_loop(self):
+        with _open(self.path, "a") as f:
+            while (record := self._queue.get()) is not None:
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                if self._queue.empty():
+                    f.flush()
+
+    def chat_model_factory(
+        self, factory: Callable[[LLMConfig], BaseChatModel] | None = None
+    ) -> Callable[[LLMConfig], BaseChatModel]:
+        """Wraps the chat models built by `factory`, `init_chat_model` by default, so their traffic is recorded."""
+
+        def build(llm_config: LLMConfig) -> BaseChatModel:
+            if factory is not None:
+                llm = factory(llm_config)
+            else:
+                llm = init_chat_model(
+                    model=llm_config.model, temperature=llm_config.temperature, max_tokens=llm_config.max_tokens
+                )
+            return RecordingChatModel(llm=llm, recorder=self, model=llm_config.model)
+
+        return build
+
+    def record_tools(self, tools: list[BaseTool]) -> list["RecordingTool"]:
+        return [RecordingTool(tool=tool, recorder=self, name=tool.name, description=tool.description) for tool in tools]
+
+
+# The wrapped model must not report to the graph's callbacks, or every streamed chunk would be emitted twice.
+_UNTRACED: RunnableConfig = {"callbacks": []}
+
+
+class RecordingChatModel(BaseChatModel):
+    """Forwards calls to the wrapped chat model and records the input messages and every response chunk."""
+
+    llm: Runnable
+    recorder: CassetteRecorder
+    model: str = ""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @property
+    def _llm_type(self) -> str:
+        return "recording"
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> "RecordingChatModel":
+        if not isinstance(self.llm, BaseChatModel):
+            raise CassetteError("The recorded chat model already has its tools bound.")
+        return self.model_copy(update={"llm": self.llm.bind_tools(tools, **kwargs)})
+
+    def _record(self, messages: list[BaseMessage], chunks: list[tuple[float, BaseMessage]], thread_id: str | None):
+        self.recorder.write(
+            {
+                "kind": "llm",
+                "model": self.model,
+                "thread_id": thread_id,
+                "key": messages_key(messages),
+                "started_at": time.time(),
+                "messages": [message_to_dict(message) for message in messages],
+                "chunks": [{"t": round(offset, 4), "message": message_to_dict(chunk)} for offset, chunk in chunks],
+            }
+        )
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        start = time.perf_counter()
+        message = self.llm.invoke(messages, _UNTRACED, stop=stop, **kwargs)
+        self._record(messages, [(time.perf_counter() - start, message)], _thread_id())
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        start = time.perf_counter()
+        message = await self.llm.ainvoke(messages, _UNTRACED, stop=stop, **kwargs)
+        self._record(messages, [(time.perf_counter() - start, message)], _thread_id())
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        start = time.perf_counter()
+        chunks = []
+        for chunk in self.llm.stream(messages, _UNTRACED, stop=stop, **kwargs):
+            chunks.append((time.perf_counter() - start, chunk))
+            yield ChatGenerationChunk(message=chunk)
+        self._record(messages, chunks, _thread_id())
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        start = time.perf_counter()
+        chunks = []
+        async for chunk in self.llm.astream(messages, _UNTRACED, stop=stop, **kwargs):
+            chunks.append((time.perf_counter() - start, chunk))
+            yield ChatGenerationChunk(message=chunk)
+        self._record(messages, chunks, _thread_id())
+
+
+class RecordingTool(BaseTool):
+    """Forwards calls to the wrapped tool and records the arguments, output and duration."""
+
+    tool: BaseTool
+    recorder: CassetteRecorder
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def inherit_tool_metadata(cls, values: dict) -> dict:
+        tool: BaseTool = values["tool"]
+        values.setdefault("name", tool.name)
+        values.setdefault("description", tool.description)
+        values.setdefault("args_schema", tool.args_schema)
+        return values
+
+    def _record(self, args: dict[str, Any], output: Any, duration: float, error: str | None = None):
+        record = {
+            "kind": "tool",
+            "name": self.name,
+            "key": tool_key(self.name, args),
+            "started_at": time.time(),
+            "args": args,
+            "output": output,
+            "error": error,
+            "duration": round(duration, 4),
+        }
+        # The arguments schema is only needed once per tool to rebuild a stand-in tool for replay.
+        if self.name not in self.recorder._recorded_schemas:
+            self.recorder._recorded_schemas.add(self.name)
+            record["args_schema"] = self.tool.get_input_jsonschema()
+        self.recorder.write(record)
+
+    def _run(self, run_manager: CallbackManagerForToolRun | None = None, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            output = self.tool.invoke(kwargs, {"callbacks": run_manager.get_child() if run_manager else None})
+        except Exception as e:
+            self._record(kwargs, None, time.perf_counter() - start, error=str(e))
+            raise
+        self._record(kwargs, output, time.perf_counter() - start)
+        return output
+
+    async def _arun(self, run_manager: AsyncCallbackManagerForToolRun | None = None, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            output = await self.tool.ainvoke(kwargs, {"callbacks": run_manager.get_child() if run_manager else None})
+        except Exception as e:
+            self._record(kwargs, None, time.perf_counter() - start, error=str(e))
+            raise
+        self._record(kwargs, output, time.perf_counter() - start)
+        return output
+
+
+@dataclass
+class Cassette:
+    """The interactions of a recorded cassette, indexed for replay.
+
+    Attributes:
+        records (list[dict]): The recorded chat model and tool calls in recording order.
+        realtime (bool): Whether to replay with the recorded timings instead of as fast as possible (default: True).
+    """
+
+    records: list[dict[str, Any]] = field(default_factory=list)
+    realtime: bool = True
+
+    def __post_init__(self):
+        self._llm_calls: dict[str, deque[dict]] = defaultdict(deque)
+        self._tool_calls: dict[str, deque[dict]] = defaultdict(deque)
+        for record in self.records:
+            calls = self._llm_calls if record["kind"] == "llm" else self._tool_calls
+            calls[record["key"]].append(record)
+
+    @classmethod
+    def load(cls, path: str | Path, realtime: bool = True) -> "Cassette":
+        with _open(Path(path), "r") as f:
+            return cls(records=[json.loads(line) for line in f if line.strip()], realtime=realtime)
+
+    def _take(self, calls: dict[str, deque[dict]], key: str, description: str) -> dict:
+        recorded = calls.get(key)
+        if not recorded:
+            raise CassetteMissError(f"No recorded response for {description}.")
+        # Identical calls are served in recording order, the last one is reused once they run out.
+        return recorded.popleft() if len(recorded) > 1 else recorded[0]
+
+    def take_llm_call(self, messages: Sequence[BaseMessage]) -> dict:
+        return self._take(self._llm_calls, messages_key(messages), f"a conversation of {len(messages)} messages")
+
+    def take_tool_call(self, name: str, args: dict[str, Any]) -> dict:
+        return self._take(self._tool_calls, tool_key(name, args), f"{name} with {args}")
+
+    def sessions(self) -> dict[str, list[BaseMessage]]:
+        """Returns the user messages of each recorded thread in order, for re-running the sessions."""
+        sessions: dict[str, list[BaseMessage]] = {}
+        for record in self.records:
+            if record["kind"] != "llm" or record.get("thread_id") is None:
+                continue
+            turns = sessions.setdefault(record["thread_id"], [])
+            human_messages = [message for message in messages_from_dict(record["messages"]) if message.type == "human"]
+            turns.extend(human_messages[len(turns) :])
+        return sessions
+
+    def chat_model_factory(self) -> Callable[[LLMConfig], BaseChatModel]:
+        return lambda llm_config: ReplayChatModel(cassette=self)
+
+    def replay_tools(self) -> list["ReplayTool"]:
+        tools = {}
+        for record in self.records:
+            if record["kind"] == "tool" and record["name"] not in tools and "args_schema" in record:
+                tools[record["name"]] = ReplayTool(
+                    name=record["name"],
+                    description=f"Replays the recorded calls of {record['name']}.",
+                    args_schema=record["args_schema"],
+                    cassette=self,
+                )
+        return list(tools.values())
+
+
+class ReplayChatModel(BaseChatModel):
+    """Serves the recorded response chunks for a conversation, raising `CassetteMissError` if there is none."""
+
+    cassette: Cassette
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @property
+    def _llm_type(self) -> str:
+        return "replay"
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> "ReplayChatModel":
+        return self
+
+    def _chunks(self, messages: list[BaseMessage]) -> list[tuple[float, BaseMessage]]:
+        record = self.cassette.take_llm_call(messages)
+        return [(chunk["t"], messages_from_dict([chunk["message"]])[0]) for chunk in record["chunks"]]
+
+    @staticmethod
+    def _merge(chunks: list[tuple[float, BaseMessage]]) -> AIMessage:
+        merged: BaseMessageChunk = _as_chunk(chunks[0][1])
+        for _, chunk in chunks[1:]:
+            merged += _as_chunk(chunk)
+        message = message_chunk_to_message(merged)
+        if not isinstance(message, AIMessage):
+            raise CassetteError(f"Expected recorded AIMessage chunks, but got {type(message).__name__}.")
+        return message
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        chunks = self._chunks(messages)
+        if self.cassette.realtime:
+            time.sleep(chunks[-1][0])
+        return ChatResult(generations=[ChatGeneration(message=self._merge(chunks))])
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        chunks = self._chunks(messages)
+        if self.cassette.realtime:
+            await asyncio.sleep(chunks[-1][0])
+        return ChatResult(generations=[ChatGeneration(message=self._merge(chunks))])
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        start = time.perf_counter()
+        for offset, chunk in self._chunks(messages):
+            if self.cassette.realtime and (delay := offset - (time.perf_counter() - start)) > 0:
+                time.sleep(delay)
+            yield ChatGenerationChunk(message=_as_chunk(chunk))
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        start = time.perf_counter()
+        for offset, chunk in self._chunks(messages):
+            if self.cassette.realtime and (delay := offset - (time.perf_counter() - start)) > 0:
+                await asyncio.sleep(delay)
+            yield ChatGenerationChunk(message=_as_chunk(chunk))
+
+
+def _as_chunk(message: BaseMessage) -> AIMessageChunk:
+    if isinstance(message, AIMessageChunk):
+        return message
+    # A call recorded without streaming is replayed as a single chunk.
+    return AIMessageChunk(
+        content=message.content,
+        tool_call_chunks=[
+            {"name": tc["name"], "args": json.dumps(tc["args"]), "id": tc["id"], "index": i}
+            for i, tc in enumerate(getattr(message, "tool_calls", []))
+        ],
+        usage_metadata=getattr(message, "usage_metadata", None),
+        response_metadata=message.response_metadata,
+    )
+
+
+class ReplayTool(BaseTool):
+    """Serves the recorded output of a tool call, raising `CassetteMissError` if there is none."""
+
+    cassette: Cassette
+    args_schema: ArgsSchema | None = Field(default_factory=dict)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def _output(self, record: dict) -> Any:
+        if record["error"] is not None:
+            raise ToolException(record["error"])
+        return record["output"]
+
+    def _run(self, run_manager: CallbackManagerForToolRun | None = None, **kwargs: Any) -> Any:
+        record = self.cassette.take_tool_call(self.name, kwargs)
+        if self.cassette.realtime:
+            time.sleep(record["duration"])
+        return self._output(record)
+
+    async def _arun(self, run_manager: AsyncCallbackManagerForToolRun | None = None, **kwargs: Any) -> Any:
+        record = self.cassette.take_tool_call(self.name, kwargs)
+        if self.cassette.realtime:
+            await asyncio.sleep(record["duration"])
+        return self._output(record)
@@ -0,0 +1,194 @@
+import asyncio
+import json
+import random
+import time
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Any
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, HumanMessage
+from langchain_core.messages.ai import UsageMetadata
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import Field
+
+_ANSWER_WORDS = (
+    "The National Central Library holds several editions of this title, and the most recent one is available "
+    "for loan at the main branch in Taipei."
+).split()
+
+
+class FakeProviderError(Exception):
+    """Raised by `ScriptedChatModel` to simulate a failing provider."""
+
+
+def _count_tokens(text: str) -> int:
+    # Roughly four characters per token, close enough for relative measurements.
+    return max(1, len(text) // 4)
+
+
+class ScriptedChatModel(BaseChatModel):
+    """A deterministic chat model that plays a fixed tool-calling script at a configurable speed.
+
+    For each user message the model first asks for `tool_rounds` rounds of tool calls, calling every tool in
+    `tool_names` at once with the user message as the query, and then streams an answer of `response_tokens`
+    tokens. The script only depends on the conversation, so one instance can serve many concurrent threads.
+    Nothing leaves the process, which makes it suitable for benchmarks and load tests.
+
+    Attributes:
+        tool_names (list[str]): The tools called in each tool round (default: no tools).
+        tool_rounds (int): The number of tool-calling turns before the answer (default: 1).
+        response_tokens (int): The number of tokens in the final answer (default: 50).
+        time_to_first_token (float): The number of seconds before the first chunk (default: 0.2).
+        tokens_per_second (float | None): The streaming rate, unthrottled when None (default: 50).
+        model_name (str): The model name reported in the response metadata (default: "scripted").
+        error_rate (float): The share of calls failing with `FakeProviderError` before the first chunk (default: 0).
+        spike_rate (float): The share of calls whose first chunk is `spike_seconds` late, like a provider under
+            load (default: 0).
+        spike_seconds (float): The extra delay of a latency spike (default: 2.0).
+
+    Example:
+        >>> llm = ScriptedChatModel(tool_names=["ncl_search"], response_tokens=20, tokens_per_second=None)
+        >>> agent = AsyncReactAgent(tools=get_stub_tools(), chat_model_factory=lambda llm_config: llm)
+    """
+
+    tool_names: list[str] = Field(default_factory=list)
+    tool_rounds: int = Field(default=1, ge=0)
+    response_tokens: int = Field(default=50, ge=1)
+    time_to_first_token: float = Field(default=0.2, ge=0)
+    tokens_per_second: float | None = Field(default=50.0, gt=0)
+    model_name: str = "scripted"
+    error_rate: float = Field(default=0.0, ge=0, le=1)
+    spike_rate: float = Field(default=0.0, ge=0, le=1)
+    spike_seconds: float = Field(default=2.0, ge=0)
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> "ScriptedChatModel":
+        return self
+
+    def _next_turn(self, messages: list[BaseMessage]) -> tuple[list[dict], list[str], UsageMetadata]:
+        """Returns the tool calls or the answer tokens of the next turn, and its token usage."""
+        last_human_index = max((i for i, m in enumerate(messages) if isinstance(m, HumanMessage)), default=-1)
+        tool_rounds_done = sum(1 for m in messages[last_human_index + 1 :] if isinstance(m, AIMessage) and m.tool_calls)
+        query = messages[last_human_index].text() if last_human_index >= 0 else ""
+        input_tokens = sum(_count_tokens(str(m.content)) for m in messages)
+
+        if self.tool_names and tool_rounds_done < self.tool_rounds:
+            tool_calls = [
+                {"name": name, "args": {"query": query}, "id": f"call-{len(messages)}-{i}", "type": "tool_call"}
+                for i, name in enumerate(self.tool_names)
+            ]
+            output_tokens = sum(_count_tokens(json.dumps(tool_call["args"])) + 5 for tool_call in tool_calls)
+            return (
+                tool_calls,
+                [],
+                UsageMetadata(
+                    input_tokens=input_tokens, output_tokens=output_tokens, total_tokens=input_tokens + output_tokens
+                ),
+            )
+
+        tokens = [
+            _ANSWER_WORDS[i % len(_ANSWER_WORDS)] + (" " if i < self.response_tokens - 1 else "")
+            for i in range(self.response_tokens)
+        ]
+        return (
+            [],
+            tokens,
+            UsageMetadata(
+                input_tokens=input_tokens,
+                output_tokens=self.response_tokens,
+                total_tokens=input_tokens + self.response_tokens,
+            ),
+        )
+
+    def _response_metadata(self, finish_reason: str) -> dict[str, str]:
+        return {"finish_reason": finish_reason, "model_name": self.model_name}
+
+    def _to_message(self, tool_calls: list[dict], tokens: list[str], usage: UsageMetadata) -> AIMessage:
+        return AIMessage(
+            content="".join(tokens),
+            tool_calls=tool_calls,
+            usage_metadata=usage,
+            response_metadata=self._response_metadata("tool_calls" if tool_calls else "stop"),
+        )
+
+    def _first_token_seconds(self) -> float:
+        if self.error_rate and random.random() < self.error_rate:
+            raise FakeProviderError(f"{self.model_name} is unavailable.")
+        if self.spike_rate and random.random() < self.spike_rate:
+            return self.time_to_first_token + self.spike_seconds
+        return self.time_to_first_token
+
+    def _generation_seconds(self, tokens: list[str]) -> float:
+        return self._first_token_seconds() + (len(tokens) / self.tokens_per_second if self.tokens_per_second else 0)
+
+    def _iter_chunks(self, tool_calls: list[dict], tokens: list[str], usage: UsageMetadata) -> Iterator[AIMessageChunk]:
+        if tool_calls:
+            yield AIMessageChunk(
+                content="",
+                tool_call_chunks=[
+                    {"name": tc["name"], "args": json.dumps(tc["args"]), "id": tc["id"], "index": i}
+                    for i, tc in enumerate(tool_calls)
+                ],
+            )
+        for token in tokens:
+            yield AIMessageChunk(content=token)
+        # Like OpenAI, the finish reason and usage arrive in a final chunk without content.
+        yield AIMessageChunk(
+            content="",
+            usage_metadata=usage,
+            response_metadata=self._response_metadata("tool_calls" if tool_calls else "stop"),
+        )
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        tool_calls, tokens, usage = self._next_turn(messages)
+        time.sleep(self._generation_seconds(tokens))
+        return ChatResult(generations=[ChatGeneration(message=self._to_message(tool_calls, tokens, usage))])
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        tool_calls, tokens, usage = self._next_turn(messages)
+        await asyncio.sleep(self._generation_seconds(tokens))
+        return ChatResult(generations=[ChatGeneration(message=self._to_message(tool_calls, tokens, usage))])
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        tool_calls, tokens, usage = self._next_turn(messages)
+        time.sleep(self._first_token_seconds())
+        for i, chunk in enumerate(self._iter_chunks(tool_calls, tokens, usage)):
+            if i and chunk.content and self.tokens_per_second:
+                time.sleep(1 / self.tokens_per_second)
+            yield ChatGenerationChunk(message=chunk)
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        tool_calls, tokens, usage = self._next_turn(messages)
+        await asyncio.sleep(self._first_token_seconds())
+        for i, chunk in enumerate(self._iter_chunks(tool_calls, tokens, usage)):
+            if i and chunk.content and self.tokens_per_second:
+                await asyncio.sleep(1 / self.tokens_per_second)
+            yield ChatGenerationChunk(message=chunk)
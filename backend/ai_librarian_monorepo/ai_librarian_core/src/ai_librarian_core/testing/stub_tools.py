@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel, Field
+
+# Typical latencies in seconds of the upstream services behind the built-in tools.
+DEFAULT_STUB_LATENCIES: dict[str, float] = {
+    "date_time": 0.0,
+    "ncl_search": 1.5,
+    "catalog_search": 1.5,
+    "local_catalog": 0.01,
+    "google_books": 0.4,
+    "google_search": 0.5,
+    "duckduckgo_results_json": 0.5,
+    "wikipedia": 0.3,
+    "arxiv": 0.6,
+    "youtube_search": 0.4,
+    "open_weather_map": 0.2,
+}
+
+
+class StubToolInput(BaseModel):
+    query: str = Field(description="The query.")
+
+
+class StubTool(BaseTool):
+    """A stand-in for a built-in tool that waits for a fixed latency and returns a deterministic payload.
+
+    Attributes:
+        latency (float): The number of seconds each call takes (default: 0.1).
+        output_size (int): The number of characters in the returned payload (default: 2000).
+    """
+
+    description: str = "A stub tool that returns a fixed payload after a fixed latency."
+    args_schema: type[BaseModel] = StubToolInput
+    latency: float = Field(default=0.1, ge=0)
+    output_size: int = Field(default=2000, ge=0)
+
+    def _output(self, query: str) -> str:
+        header = f"{self.name} results for {query}: "
+        return (header + "lorem ipsum " * (self.output_size // 12 + 1))[: max(self.output_size, len(header))]
+
+    def _run(self, query: str) -> str:
+        time.sleep(self.latency)
+        return self._output(query)
+
+    async def _arun(self, query: str) -> str:
+        await asyncio.sleep(self.latency)
+        return self._output(query)
+
+
+def get_stub_tools(latencies: dict[str, float] | None = None, output_size: int = 2000) -> list[StubTool]:
+    """Returns a stub for each built-in tool, using `DEFAULT_STUB_LATENCIES` unless overridden."""
+    latencies = DEFAULT_STUB_LATENCIES | (latencies or {})
+    return [StubTool(name=name, latency=latency, output_size=output_size) for name, latency in latencies.items()]
@@ -0,0 +1,28 @@
+from ai_librarian_core.wrapper.arxiv import AsyncArxivAPIWrapper
+from langchain_community.tools import ArxivQueryRun
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun
+from pydantic import Field
+
+
+class AsyncArxivQueryRun(ArxivQueryRun):
+    """LangChain's arXiv tool with a native async implementation.
+
+    The inherited `ArxivQueryRun` only runs synchronously, so inside the async graph every call held a thread of the
+    default executor. `_arun` sends the query through the shared pooled client, `_run` still uses `api_wrapper`.
+
+    Example:
+        >>> tool = AsyncArxivQueryRun()
+        >>> print(await tool.ainvoke({"query": "1605.08386"}))
+        Published: 2016-05-26
+        Title: Heat-bath random walks with Markov bases
+        ...
+    """
+
+    async_api_wrapper: AsyncArxivAPIWrapper = Field(default_factory=AsyncArxivAPIWrapper)
+
+    async def _arun(
+        self,
+        query: str,
+        run_manager: AsyncCallbackManagerForToolRun | None = None,
+    ) -> str:
+        return await self.async_api_wrapper.arun(query)
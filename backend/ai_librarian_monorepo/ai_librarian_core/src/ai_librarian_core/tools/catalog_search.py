@@ -0,0 +1,217 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from functools import partial
+
+import arxiv
+from ai_librarian_core.catalog.index import SQLiteCatalogIndex
+from ai_librarian_core.catalog.records import CatalogRecord, merge_records, records_from_google_books, records_from_ncl
+from ai_librarian_core.catalog.rendering import RecordRenderer
+from ai_librarian_core.wrapper.arxiv import AsyncArxivAPIWrapper
+from ai_librarian_core.wrapper.google_books import GoogleBooksAPIWrapper
+from ai_librarian_core.wrapper.ncl_search import AsyncNCLSearch, NCLCrawlerSearchNoResultsError, NCLSearch
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+from langchain_core.tools import BaseTool, ToolException
+from pydantic import BaseModel, Field, ValidationError
+
+
+def _default_google_books() -> GoogleBooksAPIWrapper | None:
+    try:
+        return GoogleBooksAPIWrapper()
+    except ValidationError:
+        return None
+
+
+@dataclass
+class CatalogSearchResult:
+    """The merged records of a catalog search and the sources that failed.
+
+    Attributes:
+        records (list[CatalogRecord]): The merged records, best ranked first.
+        failed (dict[str, str]): The error of each source that failed or timed out.
+    """
+
+    records: list[CatalogRecord]
+    failed: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def notes(self) -> list[str]:
+        if not self.failed:
+            return []
+        return ["Unavailable catalogs: " + ", ".join(f"{source} ({error})" for source, error in self.failed.items())]
+
+
+class CatalogSearchInput(BaseModel):
+    """The input of the CatalogSearch tool."""
+
+    query: str = Field(description="The title, author, ISBN or topic of the books to find.")
+
+
+class CatalogSearchRun(BaseTool):
+    """A tool searching the NCL catalog, Google Books and arXiv at once and merging their results.
+
+    One call replaces a chain of `ncl_search`, `google_books` and `arxiv` calls, each of which costs the agent a
+    chat model turn. The sources are queried concurrently, records found by several of them are merged by ISBN or
+    by normalized title and author, and the merged list is ranked by reciprocal rank fusion. A failing or slow
+    source is left out and reported at the end of the results, the other sources are still returned.
+
+    Attributes:
+        top_k_results (int): The number of merged records returned (default: 10).
+        source_timeout (float): The number of seconds a source may take before it is left out (default: 10).
+        google_books (GoogleBooksAPIWrapper | None): Left out when no Google API key is configured.
+        arxiv_max_results (int): The number of arXiv papers searched (default: 5).
+        catalog_index (SQLiteCatalogIndex | None): Where every record found is upserted, so `local_catalog` can
+            answer the next lookup without the remote catalogs.
+        renderer (RecordRenderer): Renders the merged records within the tool's token budget.
+
+    Example:
+        >>> tool = CatalogSearchRun()
+        >>> print(tool.invoke({"query": "Artificial Intelligence: A Modern Approach"}))
+        1. Artificial intelligence : a modern approach | Stuart Russell | 2021 | ISBN 9780134610993 | [ncl, ...
+        2. Artificial Intelligence | Stuart Russell, Peter Norvig | 2016 | ISBN 9781292153964 | [google_books] ...
+        ...
+    """
+
+    name: str = "catalog_search"
+    description: str = (
+        "A tool searching the Taiwan National Central Library(NCL, 國家圖書館) catalog, Google Books and arXiv at "
+        "once. Use it first to find or recommend books and papers, instead of calling the catalogs one by one. "
+        "Returns one merged list with the title, authors, year, ISBN, the catalogs that hold each record and a link."
+    )
+    args_schema: type[BaseModel] = CatalogSearchInput
+    top_k_results: int = Field(default=10, ge=1, le=30)
+    source_timeout: float = Field(default=10, gt=0)
+    ncl_search: NCLSearch = Field(default_factory=NCLSearch)
+    async_ncl_search: AsyncNCLSearch = Field(default_factory=AsyncNCLSearch)
+    google_books: GoogleBooksAPIWrapper | None = Field(default_factory=_default_google_books)
+    arxiv_max_results: int = Field(default=5, ge=1, le=20)
+    async_arxiv: AsyncArxivAPIWrapper = Field(default_factory=AsyncArxivAPIWrapper)
+    catalog_index: SQLiteCatalogIndex | None = None
+    renderer: RecordRenderer = Field(default_factory=RecordRenderer)
+
+    def _search_ncl(self, query: str) -> list[CatalogRecord]:
+        try:
+            return records_from_ncl(self.ncl_search.search(query))
+        except NCLCrawlerSearchNoResultsError:
+            return []
+
+    async def _asearch_ncl(self, query: str) -> list[CatalogRecord]:
+        try:
+            return records_from_ncl(await self.async_ncl_search.asearch(query))
+        except NCLCrawlerSearchNoResultsError:
+            return []
+
+    def _search_google_books(self, google_books: GoogleBooksAPIWrapper, query: str) -> list[CatalogRecord]:
+        return records_from_google_books(google_books.search(query))
+
+    def _search_arxiv(self, query: str) -> list[CatalogRecord]:
+        search = arxiv.Search(query=query, max_results=self.arxiv_max_results)
+        return [
+            CatalogRecord(
+                title=result.title,
+                authors=", ".join(author.name for author in result.authors),
+                year=str(result.published.year),
+                links={"arxiv": result.entry_id},
+            )
+            for result in arxiv.Client().results(search)
+        ]
+
+    async def _asearch_arxiv(self, query: str) -> list[CatalogRecord]:
+        return [
+            CatalogRecord(
+                title=paper["title"],
+                authors=", ".join(paper["authors"]),
+                year=paper["published"][:4],
+                links={"arxiv": paper["entry_id"]},
+            )
+            for paper in await self.async_arxiv.asearch(query, max_results=self.arxiv_max_results)
+        ]
+
+    def _merge(self, results: dict[str, list[CatalogRecord]], failed: dict[str, str]) -> CatalogSearchResult:
+        if failed and not results:
+            raise ToolException(
+                "Every catalog failed: " + ", ".join(f"{source} ({error})" for source, error in failed.items())
+            )
+        return CatalogSearchResult(records=merge_records(results, self.top_k_results), failed=failed)
+
+    def search(self, query: str) -> CatalogSearchResult:
+        """Searches the sources concurrently and merges their records, which are also upserted into the index.
+
+        Raises:
+            ToolException: If every source failed.
+        """
+        searches: dict[str, Callable[[str], list[CatalogRecord]]] = {
+            "ncl": self._search_ncl,
+            "arxiv": self._search_arxiv,
+        }
+        if self.google_books is not None:
+            searches["google_books"] = partial(self._search_google_books, self.google_books)
+        results, failed = {}, {}
+        executor = ThreadPoolExecutor(max_workers=len(searches), thread_name_prefix="catalog-search")
+        futures = {source: executor.submit(search, query) for source, search in searches.items()}
+        # The deadline is shared, the sources run at the same time.
+        deadline = time.monotonic() + self.source_timeout
+        try:
+            for source, future in futures.items():
+                try:
+                    results[source] = future.result(timeout=max(0, deadline - time.monotonic()))
+                except FutureTimeoutError:
+                    failed[source] = "timed out"
+                except Exception as e:
+                    failed[source] = type(e).__name__
+        finally:
+            # A timed out source is abandoned instead of waited for.
+            executor.shutdown(wait=False, cancel_futures=True)
+        if self.catalog_index is not None:
+            self.catalog_index.upsert([record for records in results.values() for record in records])
+        return self._merge(results, failed)
+
+    async def asearch(self, query: str) -> CatalogSearchResult:
+        """Searches the sources concurrently and merges their records, which are also upserted into the index.
+
+        Raises:
+            ToolException: If every source failed.
+        """
+        searches = {
+            "ncl": self._asearch_ncl(query),
+            "arxiv": self._asearch_arxiv(query),
+        }
+        if self.google_books is not None:
+            searches["google_books"] = asyncio.to_thread(self._search_google_books, self.google_books, query)
+        outcomes = await asyncio.gather(
+            *(asyncio.wait_for(search, timeout=self.source_timeout) for search in searches.values()),
+            return_exceptions=True,
+        )
+        results, failed = {}, {}
+        for source, outcome in zip(searches, outcomes, strict=True):
+            if isinstance(outcome, TimeoutError):
+                failed[source] = "timed out"
+            elif isinstance(outcome, Exception):
+                failed[source] = type(outcome).__name__
+            else:
+                results[source] = outcome
+        if self.catalog_index is not None:
+            await self.catalog_index.aupsert([record for records in results.values() for record in records])
+        return self._merge(results, failed)
+
+    def _render(self, query: str, result: CatalogSearchResult) -> str:
+        return self.renderer.render(
+            self.name, result.records, empty=f"No books or papers could be found for: {query}", notes=result.notes
+        )
+
+    def _run(
+        self,
+        query: str,
+        run_manager: CallbackManagerForToolRun | None = None,
+    ) -> str:
+        return self._render(query, self.search(query))
+
+    async def _arun(
+        self,
+        query: str,
+        run_manager: AsyncCallbackManagerForToolRun | None = None,
+    ) -> str:
+        return self._render(query, await self.asearch(query))
@@ -0,0 +1,60 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+# NCL launches a headless Chromium per call, the rest are rate-limited third-party APIs.
+DEFAULT_TOOL_CONCURRENCY_LIMITS: dict[str, int] = {
+    "ncl_search": 2,
+    "catalog_search": 2,
+    "local_catalog": 2,
+    "google_books": 4,
+    "google_search": 4,
+    "duckduckgo_results_json": 2,
+    "wikipedia": 4,
+    "arxiv": 2,
+    "youtube_search": 2,
+    "open_weather_map": 4,
+}
+
+
+@dataclass
+class ToolConcurrencyLimiter:
+    """Bounds how many tool calls may run at the same time.
+
+    A global semaphore caps the total number of in-flight tool calls across every agent run in the process,
+    and optional per-tool semaphores cap individual tools that are expensive or rate-limited upstream.
+
+    Attributes:
+        max_concurrency (int): The maximum number of tool calls running at once across all tools (default: 8).
+        per_tool_limits (dict[str, int]): The maximum number of concurrent calls per tool name.
+            Tools missing from this mapping are only bound by the global limit.
+
+    Example:
+        >>> limiter = ToolConcurrencyLimiter(max_concurrency=4, per_tool_limits={"ncl_search": 1})
+        >>> async with limiter.limit("ncl_search"):
+        ...     await tool.ainvoke({"query": "Python"})
+    """
+
+    max_concurrency: int = 8
+    per_tool_limits: dict[str, int] = field(default_factory=lambda: dict(DEFAULT_TOOL_CONCURRENCY_LIMITS))
+
+    def __post_init__(self):
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self._global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._tool_semaphores = {
+            tool_name: asyncio.Semaphore(limit) for tool_name, limit in self.per_tool_limits.items()
+        }
+
+    @asynccontextmanager
+    async def limit(self, tool_name: str) -> AsyncIterator[None]:
+        tool_semaphore = self._tool_semaphores.get(tool_name)
+        if tool_semaphore is None:
+            async with self._global_semaphore:
+                yield
+            return
+
+        # Wait for the per-tool slot first so a saturated tool does not hold global slots while queuing.
+        async with tool_semaphore, self._global_semaphore:
+            yield
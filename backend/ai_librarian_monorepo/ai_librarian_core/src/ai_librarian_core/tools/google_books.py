@@ -1,3 +1,5 @@
+from ai_librarian_core.catalog.records import records_from_google_books
+from ai_librarian_core.catalog.rendering import RecordRenderer
 from ai_librarian_core.wrapper.google_books import GoogleBooksAPIWrapper
 from langchain_core.callbacks import CallbackManagerForToolRun
 from langchain_core.tools import BaseTool
@@ -20,13 +22,13 @@ class GoogleBooksQueryRun(BaseTool):
         description (str): Description of the tool's functionality
         api_wrapper (GoogleBooksAPIWrapper): Wrapper instance for Google Books API
         args_schema (type[BaseModel]): Schema for input validation
+        renderer (RecordRenderer): Renders the books, with their descriptions cut short, within the token budget
 
     Example:
         >>> tool = GoogleBooksQueryRun(api_wrapper=GoogleBooksAPIWrapper(google_api_key="your_google_api_key"))
         >>> result = tool.invoke({"query": "python"})
         >>> print(result)
-        Here are 5 suggestions for books related to Python Programming:
-        1. "Python Crash Course" by Eric Matthes: A hands-on guide...
+        1. Python Crash Course | Eric Matthes | 2019 | ISBN 9781593279288 | [google_books] | https://... | A hands-on…
         ...
     """
 
@@ -40,6 +42,7 @@ class GoogleBooksQueryRun(BaseTool):
     )
     api_wrapper: GoogleBooksAPIWrapper = Field(default_factory=GoogleBooksAPIWrapper)
     args_schema: type[BaseModel] = GoogleBooksQueryInput
+    renderer: RecordRenderer = Field(default_factory=RecordRenderer)
 
     def _run(
         self,
@@ -47,4 +50,8 @@ class GoogleBooksQueryRun(BaseTool):
         run_manager: CallbackManagerForToolRun | None = None,
     ) -> str:
         """Use the Google Books tool."""
-        return self.api_wrapper.run(query)
+        return self.renderer.render(
+            self.name,
+            records_from_google_books(self.api_wrapper.search(query)),
+            empty=f"Sorry no books could be found for your query: {query}",
+        )
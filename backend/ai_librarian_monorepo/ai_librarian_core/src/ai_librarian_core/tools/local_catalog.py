@@ -0,0 +1,92 @@
+from ai_librarian_core.catalog.index import SQLiteCatalogIndex
+from ai_librarian_core.catalog.records import CatalogRecord
+from ai_librarian_core.catalog.rendering import RecordRenderer
+from ai_librarian_core.observability.metrics import LOCAL_CATALOG_LOOKUPS
+from ai_librarian_core.tools.catalog_search import CatalogSearchInput, CatalogSearchResult, CatalogSearchRun
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+from langchain_core.tools import BaseTool, ToolException
+from langchain_core.tools.base import ArgsSchema
+from pydantic import Field
+
+
+class LocalCatalogRun(BaseTool):
+    """A tool answering book lookups from the local catalog index, searching the remote catalogs only when needed.
+
+    The index holds every record `catalog_search` returned before, so a repeated lookup is answered in milliseconds
+    instead of the seconds the NCL crawler and the APIs take. The remote catalogs are searched, and the index
+    refreshed, when fewer than `min_results` fresh records match. If they fail, the stale local records are
+    returned rather than an error.
+
+    Attributes:
+        catalog_index (SQLiteCatalogIndex): The local index, filled by `remote`.
+        remote (CatalogSearchRun): The search run when the local records are insufficient or stale.
+        min_results (int): The number of fresh local records needed to skip the remote search (default: 3).
+        top_k_results (int): The number of local records returned (default: 10).
+        renderer (RecordRenderer): Renders the records within the tool's token budget.
+
+    Example:
+        >>> index = SQLiteCatalogIndex("data/catalog.sqlite")
+        >>> tool = LocalCatalogRun(catalog_index=index, remote=CatalogSearchRun(catalog_index=index))
+        >>> print(tool.invoke({"query": "人工智慧"}))
+        1. 人工智慧 : 現代方法 | Stuart Russell, Peter Norvig | 2021 | [ncl] | https://aleweb.ncl.edu.tw/...
+        ...
+    """
+
+    name: str = "local_catalog"
+    description: str = (
+        "A tool looking books and papers up in the library's local catalog index, built from earlier catalog "
+        "searches, and searching the NCL(國家圖書館), Google Books and arXiv catalogs only when it holds too few. "
+        "Use it first for titles, authors and ISBNs. Returns the title, authors, year, ISBN, catalogs and a link."
+    )
+    args_schema: ArgsSchema | None = CatalogSearchInput
+    catalog_index: SQLiteCatalogIndex
+    remote: CatalogSearchRun
+    min_results: int = Field(default=3, ge=1)
+    top_k_results: int = Field(default=10, ge=1, le=30)
+    renderer: RecordRenderer = Field(default_factory=RecordRenderer)
+
+    def _enough(self, records: list[CatalogRecord]) -> bool:
+        fresh = sum(self.catalog_index.is_fresh(record) for record in records)
+        return fresh >= min(self.min_results, self.top_k_results)
+
+    def _fallback(self, records: list[CatalogRecord], error: ToolException) -> str:
+        if not records:
+            raise error
+        LOCAL_CATALOG_LOOKUPS.labels(result="stale").inc()
+        return self.renderer.render(
+            self.name, records, notes=[f"The remote catalogs failed, these records may be outdated: {error}"]
+        )
+
+    def _remote(self, query: str, result: CatalogSearchResult) -> str:
+        LOCAL_CATALOG_LOOKUPS.labels(result="remote").inc()
+        return self.renderer.render(
+            self.name, result.records, empty=f"No books or papers could be found for: {query}", notes=result.notes
+        )
+
+    def _run(
+        self,
+        query: str,
+        run_manager: CallbackManagerForToolRun | None = None,
+    ) -> str:
+        records = self.catalog_index.search(query, self.top_k_results)
+        if self._enough(records):
+            LOCAL_CATALOG_LOOKUPS.labels(result="hit").inc()
+            return self.renderer.render(self.name, records)
+        try:
+            return self._remote(query, self.remote.search(query))
+        except ToolException as e:
+            return self._fallback(records, e)
+
+    async def _arun(
+        self,
+        query: str,
+        run_manager: AsyncCallbackManagerForToolRun | None = None,
+    ) -> str:
+        records = await self.catalog_index.asearch(query, self.top_k_results)
+        if self._enough(records):
+            LOCAL_CATALOG_LOOKUPS.labels(result="hit").inc()
+            return self.renderer.render(self.name, records)
+        try:
+            return self._remote(query, await self.remote.asearch(query))
+        except ToolException as e:
+            return self._fallback(records, e)
@@ -1,3 +1,5 @@
+from ai_librarian_core.catalog.records import records_from_ncl
+from ai_librarian_core.catalog.rendering import RecordRenderer
 from ai_librarian_core.wrapper.ncl_search import AsyncNCLSearch, NCLSearch
 from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from langchain_core.tools import BaseTool
@@ -13,15 +15,15 @@ class NCLSearchInput(BaseModel):
 class NCLSearchRun(BaseTool):
     """A tool for searching the Taiwan National Central Library(NCL, 國家圖書館) catalog.
 
-    This tool allows searching books in the NCL catalog by keywords. It returns a formatted
-    string containing book information including title, author and link.
+    This tool allows searching books in the NCL catalog by keywords. It returns one compact line per book
+    containing the title, author and link, rendered within the tool's token budget by `renderer`.
 
     Example:
         >>> ncl_search_tool = NCLSearchRun()
         >>> result = ncl_search_tool.invoke({"query": "Artificial Intelligence"})
         >>> print(result)
-        1. Artificial Intelligence: A Modern Approach (Stuart Russell) - https://aleweb.ncl.edu.tw/F/...
-        2. Artificial Intelligence and Deep Learning (Ian Goodfellow) - https://aleweb.ncl.edu.tw/F/...
+        1. Artificial Intelligence: A Modern Approach | Stuart Russell | [ncl] | https://aleweb.ncl.edu.tw/F/...
+        2. Artificial Intelligence and Deep Learning | Ian Goodfellow | [ncl] | https://aleweb.ncl.edu.tw/F/...
         ...
     """
 
@@ -34,17 +36,18 @@ class NCLSearchRun(BaseTool):
     ncl_search: NCLSearch = Field(default_factory=NCLSearch)
     async_ncl_search: AsyncNCLSearch = Field(default_factory=AsyncNCLSearch)
     args_schema: type[BaseModel] = NCLSearchInput
+    renderer: RecordRenderer = Field(default_factory=RecordRenderer)
 
     def _run(
         self,
         query: str,
         run_manager: CallbackManagerForToolRun | None = None,
     ) -> str:
-        return self.ncl_search.run(query)
+        return self.renderer.render(self.name, records_from_ncl(self.ncl_search.search(query)))
 
     async def _arun(
         self,
         query: str,
         run_manager: AsyncCallbackManagerForToolRun | None = None,
     ) -> str:
-        return await self.async_ncl_search.arun(query)
+        return self.renderer.render(self.name, records_from_ncl(await self.async_ncl_search.asearch(query)))
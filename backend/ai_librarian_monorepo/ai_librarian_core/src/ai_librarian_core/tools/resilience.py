@@ -0,0 +1,292 @@
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from enum import StrEnum, auto
+from typing import Any
+
+import httpx
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+from langchain_core.tools import BaseTool, ToolException
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+DEFAULT_TOOL_TIMEOUT = 10.0
+
+# Hard deadlines in seconds, tuned so one slow upstream cannot stall a whole agent turn.
+DEFAULT_TOOL_TIMEOUTS: dict[str, float] = {
+    "date_time": 1.0,
+    "ncl_search": 12.0,
+    "catalog_search": 12.0,
+    "local_catalog": 12.0,
+    "google_books": 8.0,
+    "google_search": 8.0,
+    "duckduckgo_results_json": 6.0,
+    "wikipedia": 8.0,
+    "arxiv": 8.0,
+    "youtube_search": 6.0,
+    "open_weather_map": 5.0,
+}
+
+# Sync tool calls are moved to this pool so they can be abandoned once their deadline expires. An abandoned call
+# keeps its thread until the tool returns, so the pool is capped and calls fail fast once every thread is taken
+# instead of piling up behind hung upstreams.
+MAX_SYNC_TOOL_THREADS = 32
+_sync_executor = ThreadPoolExecutor(max_workers=MAX_SYNC_TOOL_THREADS, thread_name_prefix="resilient-tool")
+_sync_slots = threading.BoundedSemaphore(MAX_SYNC_TOOL_THREADS)
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """Whether an error says the tool's upstream is unhealthy: a timeout, a transport error or a 5xx response.
+
+    Other errors, e.g. invalid arguments or a `ToolException` for an empty result, do not count towards opening the
+    circuit breaker.
+    """
+    # `requests` and `httpx` errors carry the response, `urllib` errors are the response.
+    response = getattr(error, "response", None)
+    status_code = getattr(response, "status_code", None) if response is not None else getattr(error, "code", None)
+    if isinstance(status_code, int):
+        return status_code >= 500
+    # `requests` and `urllib` errors are `OSError`s.
+    return isinstance(error, TimeoutError | OSError | httpx.TransportError)
+
+
+class CircuitState(StrEnum):
+    CLOSED = auto()
+    OPEN = auto()
+    HALF_OPEN = auto()
+
+
+@dataclass
+class CircuitBreaker:
+    """A consecutive-failure circuit breaker.
+
+    The breaker starts closed. After `failure_threshold` consecutive failures it opens and rejects calls
+    immediately. Once `recovery_timeout` seconds have passed it becomes half-open and lets up to
+    `half_open_max_calls` probe calls through: a successful probe closes it again, a failed probe re-opens it.
+
+    Attributes:
+        name (str): The name of the protected resource, usually the tool name.
+        failure_threshold (int): The number of consecutive failures that opens the breaker (default: 3).
+        recovery_timeout (float): The number of seconds the breaker stays open before probing (default: 30).
+        half_open_max_calls (int): The number of concurrent probe calls allowed while half-open (default: 1).
+        clock (Callable[[], float]): The monotonic clock used to measure the recovery timeout.
+    """
+
+    name: str
+    failure_threshold: int = 3
+    recovery_timeout: float = 30.0
+    half_open_max_calls: int = 1
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._half_open_calls = 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._refresh_state()
+            return self._state
+
+    @property
+    def consecutive_failures(self) -> int:
+        return self._consecutive_failures
+
+    @property
+    def retry_after(self) -> float:
+        """The number of seconds until the breaker starts probing again, 0 if it is not open."""
+        with self._lock:
+            self._refresh_state()
+            if self._state != CircuitState.OPEN or self._opened_at is None:
+                return 0.0
+            return max(0.0, self._opened_at + self.recovery_timeout - self.clock())
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            self._refresh_state()
+            if self._state == CircuitState.CLOSED:
+                return True
+            if self._state == CircuitState.HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+                self._half_open_calls += 1
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._half_open_calls = 0
+
+    def release(self):
+        """Ends a call that said nothing about the resource's health, e.g. one rejected for its arguments."""
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._half_open_calls = max(0, self._half_open_calls - 1)
+
+    def record_failure(self):
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == CircuitState.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                self._state = CircuitState.OPEN
+                self._opened_at = self.clock()
+                self._half_open_calls = 0
+
+    def reset(self):
+        self.record_success()
+
+    def _refresh_state(self):
+        if (
+            self._state == CircuitState.OPEN
+            and self._opened_at is not None
+            and self.clock() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_calls = 0
+
+
+class ResilientTool(BaseTool):
+    """A tool wrapper that adds a hard deadline and a circuit breaker to another tool.
+
+    The wrapper keeps the name, description and arguments schema of the wrapped tool, so it can replace the
+    tool transparently in `bind_tools` and the agent graph. Timeouts and errors are returned as a compact JSON
+    error in a `ToolMessage` with `status="error"`, which lets the LLM route around the failing tool instead of
+    waiting for it. Only timeouts, transport errors and 5xx responses count as breaker failures. While the breaker is
+    open, calls fail fast without touching the wrapped tool.
+
+    Attributes:
+        tool (BaseTool): The wrapped tool.
+        timeout (float): The hard deadline in seconds for a single call.
+        breaker (CircuitBreaker): The circuit breaker guarding the wrapped tool.
+
+    Example:
+        >>> tool = ResilientTool(tool=NCLSearchRun(), timeout=12)
+        >>> tool.invoke({"query": "Python"})  # Fails fast once NCL keeps timing out.
+    """
+
+    tool: BaseTool
+    timeout: float = Field(default=DEFAULT_TOOL_TIMEOUT, gt=0)
+    breaker: CircuitBreaker
+    handle_tool_error: bool | str | Callable[[ToolException], str] | None = True
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def inherit_tool_metadata(cls, values: dict) -> dict:
+        tool: BaseTool = values["tool"]
+        values.setdefault("name", tool.name)
+        values.setdefault("description", tool.description)
+        values.setdefault("args_schema", tool.args_schema)
+        values.setdefault("breaker", CircuitBreaker(name=tool.name))
+        return values
+
+    def _run(self, run_manager: CallbackManagerForToolRun | None = None, **kwargs: Any) -> Any:
+        self._check_breaker()
+        if not _sync_slots.acquire(blocking=False):
+            self.breaker.release()
+            raise self._tool_error("saturated", "Too many tool calls are still running, retry later.")
+        callbacks = run_manager.get_child() if run_manager else None
+        future = _sync_executor.submit(self.tool.invoke, kwargs, {"callbacks": callbacks})
+        # The slot is freed once the call returns, not when its deadline expires.
+        future.add_done_callback(lambda _: _sync_slots.release())
+        try:
+            result = future.result(timeout=self.timeout)
+        except FutureTimeoutError as e:
+            self.breaker.record_failure()
+            raise self._tool_error("timeout", f"No response within {self.timeout:g}s.") from e
+        except Exception as e:
+            raise self._handle_error(e) from e
+        self.breaker.record_success()
+        return result
+
+    async def _arun(self, run_manager: AsyncCallbackManagerForToolRun | None = None, **kwargs: Any) -> Any:
+        self._check_breaker()
+        callbacks = run_manager.get_child() if run_manager else None
+        try:
+            result = await asyncio.wait_for(self.tool.ainvoke(kwargs, {"callbacks": callbacks}), self.timeout)
+        except asyncio.CancelledError:
+            # The run was cancelled, e.g. the client left, which says nothing about the tool. A half-open probe
+            # slot still has to be freed or the breaker would reject the tool for good.
+            self.breaker.release()
+            raise
+        except TimeoutError as e:
+            self.breaker.record_failure()
+            raise self._tool_error("timeout", f"No response within {self.timeout:g}s.") from e
+        except Exception as e:
+            raise self._handle_error(e) from e
+        self.breaker.record_success()
+        return result
+
+    def _handle_error(self, error: Exception) -> ToolException:
+        if is_upstream_failure(error):
+            self.breaker.record_failure()
+        elif isinstance(error, ToolException):
+            # The upstream answered, e.g. with no results.
+            self.breaker.record_success()
+        else:
+            self.breaker.release()
+        return self._tool_error("tool_error", str(error) or type(error).__name__)
+
+    def _check_breaker(self):
+        if not self.breaker.allow_request():
+            raise self._tool_error(
+                "circuit_open",
+                f"{self.name} is temporarily unavailable after repeated failures. "
+                f"Use another tool or retry in {self.breaker.retry_after:.0f}s.",
+            )
+
+    def _tool_error(self, error: str, message: str) -> ToolException:
+        return ToolException(json.dumps({"error": error, "tool": self.name, "message": message}, ensure_ascii=False))
+
+
+def make_resilient(
+    tools: list[BaseTool],
+    timeouts: dict[str, float] | None = None,
+    failure_threshold: int = 3,
+    recovery_timeout: float = 30.0,
+) -> list[BaseTool]:
+    """Wraps every tool with a `ResilientTool` using per-tool deadlines."""
+    timeouts = DEFAULT_TOOL_TIMEOUTS if timeouts is None else timeouts
+    resilient_tools: list[BaseTool] = [
+        tool
+        if isinstance(tool, ResilientTool)
+        else ResilientTool(
+            tool=tool,
+            name=tool.name,
+            description=tool.description,
+            timeout=timeouts.get(tool.name, DEFAULT_TOOL_TIMEOUT),
+            breaker=CircuitBreaker(
+                name=tool.name, failure_threshold=failure_threshold, recovery_timeout=recovery_timeout
+            ),
+        )
+        for tool in tools
+    ]
+    return resilient_tools
+
+
+class CircuitBreakerSnapshot(BaseModel):
+    """A point-in-time view of a tool's circuit breaker."""
+
+    name: str = Field(description="The name of the tool guarded by the breaker.", examples=["ncl_search"])
+    state: CircuitState = Field(description="The current state of the breaker.", examples=[CircuitState.CLOSED])
+    consecutive_failures: int = Field(description="The number of consecutive failed calls.", examples=[0])
+    retry_after: float = Field(description="Seconds until an open breaker starts probing again.", examples=[0.0])
+    timeout: float = Field(description="The hard deadline in seconds for a single call.", examples=[12.0])
+
+    @classmethod
+    def from_tool(cls, tool: ResilientTool) -> "CircuitBreakerSnapshot":
+        return cls(
+            name=tool.name,
+            state=tool.breaker.state,
+            consecutive_failures=tool.breaker.consecutive_failures,
+            retry_after=round(tool.breaker.retry_after, 3),
+            timeout=tool.timeout,
+        )
@@ -0,0 +1,109 @@
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+from ai_librarian_core.cache.answer_cache import hashed_ngram_embedding, normalize_question
+from langchain_core.tools import BaseTool
+
+# Extra words indexed with each tool's description, including the Chinese a patron of the NCL is likely to use.
+DEFAULT_TOOL_KEYWORDS: dict[str, str] = {
+    "date_time": "date time today now tomorrow day week month year 日期 時間 今天 明天 現在 星期 幾點",
+    "ncl_search": "book books library catalog borrow author title isbn novel 書 書籍 圖書館 館藏 借書 作者 小說",
+    "catalog_search": (
+        "book books paper papers library catalog borrow author title isbn novel research "
+        "書 書籍 論文 圖書館 館藏 借書 作者"
+    ),
+    "local_catalog": (
+        "book books paper papers library catalog borrow author title isbn novel 書 書籍 論文 圖書館 館藏 借書 作者"
+    ),
+    "google_books": "book books author title isbn publisher novel edition 書 書籍 作者 出版社 小說",
+    "google_search": "search web website news latest online 搜尋 網路 網站 新聞 最新",
+    "duckduckgo_results_json": "search web website news current events latest 搜尋 網路 新聞 最新",
+    "wikipedia": "history person people place company biography facts 維基 歷史 人物 地方 公司",
+    "arxiv": "paper papers research scientific physics mathematics computer science machine learning 論文 研究 科學",
+    "youtube_search": "video videos youtube watch channel lecture 影片 頻道 教學",
+    "open_weather_map": "weather temperature rain forecast humidity wind umbrella 天氣 氣溫 溫度 下雨 預報",
+}
+
+
+@dataclass
+class ToolSelector:
+    """Picks the tools worth binding for a question with a local keyword and embedding index over the tools.
+
+    A tool scores the cosine similarity between the question and its name, description and keywords, plus
+    `keyword_weight` for every one of its keywords found in the question. Every bound tool costs input tokens on
+    every hop of the ReAct loop, so binding only the few that match the question shrinks the prompt. A question that
+    matches no tool at all, like "hi", keeps every tool bound.
+
+    Attributes:
+        top_k (int): The number of best matching tools to bind (default: 3).
+        min_score (float): The score a tool needs to be picked (default: 0.05).
+        keyword_weight (float): The score added per keyword of a tool found in the question (default: 0.2).
+        always_include (frozenset[str]): Tools bound on every call, e.g. cheap ones the model often needs.
+        keywords (dict[str, str]): Extra words indexed with the description of each tool, by tool name.
+        embed (Callable[[str], np.ndarray]): Embeds a normalized text as a unit vector
+            (default: `hashed_ngram_embedding`).
+
+    Example:
+        >>> selector = ToolSelector(top_k=2)
+        >>> [tool.name for tool in selector.select(tools, "Is it going to rain tomorrow?")]
+        ['date_time', 'open_weather_map']
+    """
+
+    top_k: int = 3
+    min_score: float = 0.05
+    keyword_weight: float = 0.2
+    always_include: frozenset[str] = frozenset()
+    keywords: dict[str, str] = field(default_factory=lambda: dict(DEFAULT_TOOL_KEYWORDS))
+    embed: Callable[[str], np.ndarray] = hashed_ngram_embedding
+
+    def __post_init__(self):
+        if self.top_k < 1:
+            raise ValueError("top_k must be at least 1.")
+        self._index_names: tuple[str, ...] = ()
+        self._index: np.ndarray | None = None
+        self._keyword_sets: list[frozenset[str]] = []
+
+    def select(self, tools: Sequence[BaseTool], query: str, required: Iterable[str] = ()) -> list[BaseTool]:
+        """Returns the tools to bind for `query`, in their original order.
+
+        Args:
+            tools (Sequence[BaseTool]): All tools of the agent.
+            query (str): The latest user question.
+            required (Iterable[str]): Names of tools that must stay bound, e.g. tools already called in the thread.
+        """
+        normalized = normalize_question(query)
+        if not normalized or len(tools) <= self.top_k:
+            return list(tools)
+
+        scores = self._tool_index(tools) @ self.embed(normalized)
+        words = set(normalized.split())
+        for index, keywords in enumerate(self._keyword_sets):
+            # Chinese is not split into words, so its keywords are matched as substrings.
+            hits = sum(1 for keyword in keywords if (keyword in words if keyword.isascii() else keyword in normalized))
+            scores[index] += self.keyword_weight * hits
+        best = [index for index in np.argsort(-scores)[: self.top_k] if scores[index] >= self.min_score]
+        if not best:
+            return list(tools)
+
+        names = {tools[index].name for index in best} | self.always_include | set(required)
+        return [tool for tool in tools if tool.name in names]
+
+    def _tool_index(self, tools: Sequence[BaseTool]) -> np.ndarray:
+        names = tuple(tool.name for tool in tools)
+        if self._index is None or names != self._index_names:
+            documents = [
+                normalize_question(
+                    f"{tool.name.replace('_', ' ')} {tool.description} {self.keywords.get(tool.name, '')}"
+                )
+                for tool in tools
+            ]
+            self._index = np.stack([self.embed(document) for document in documents])
+            self._keyword_sets = [
+                frozenset(
+                    normalize_question(f"{tool.name.replace('_', ' ')} {self.keywords.get(tool.name, '')}").split()
+                )
+                for tool in tools
+            ]
+            self._index_names = names
+        return self._index
@@ -1,36 +1,57 @@
+from ai_librarian_core.catalog.index import SQLiteCatalogIndex
+from ai_librarian_core.catalog.rendering import RecordRenderer
+from ai_librarian_core.tools.arxiv import AsyncArxivQueryRun
+from ai_librarian_core.tools.catalog_search import CatalogSearchRun
 from ai_librarian_core.tools.date_time import DateTimeTool
 from ai_librarian_core.tools.google_books import GoogleBooksQueryRun
 from ai_librarian_core.tools.google_search import SchemaedGoogleSearchRun
+from ai_librarian_core.tools.local_catalog import LocalCatalogRun
 from ai_librarian_core.tools.ncl_search import NCLSearchRun
 from ai_librarian_core.tools.open_weather_map import SchemaedOpenWeatherMapQueryRun
+from ai_librarian_core.tools.resilience import make_resilient
+from ai_librarian_core.tools.wikipedia import AsyncWikipediaQueryRun
 from ai_librarian_core.tools.youtube import SchemaedYouTubeSearchTool
-from langchain_community.tools import (
-    ArxivQueryRun,
-    DuckDuckGoSearchResults,
-)
-from langchain_community.tools.wikipedia.tool import WikipediaQueryRun
-from langchain_community.utilities import WikipediaAPIWrapper
+from langchain_community.tools import DuckDuckGoSearchResults
 from langchain_core.tools import BaseTool
 from langchain_google_community import GoogleSearchAPIWrapper
 from pydantic import ValidationError
 
 
-def get_built_in_tools() -> list[BaseTool]:
-    tools = [
+def get_built_in_tools(
+    resilient: bool = True,
+    catalog_index: SQLiteCatalogIndex | None = None,
+    renderer: RecordRenderer | None = None,
+) -> list[BaseTool]:
+    """Initializes every built-in tool whose credentials are available.
+
+    Args:
+        resilient (bool): Whether to wrap each tool with a hard deadline and a circuit breaker (default: True).
+        catalog_index (SQLiteCatalogIndex | None): The local catalog index `catalog_search` fills, which also adds
+            the `local_catalog` tool (default: None).
+        renderer (RecordRenderer | None): Renders the records of the book and catalog tools (default: None, the
+            default `RecordRenderer`).
+    """
+    # Every tool shares one renderer, the tools' own default when none is given.
+    renderer = renderer or RecordRenderer()
+    catalog_search = CatalogSearchRun(catalog_index=catalog_index, renderer=renderer)
+    tools: list[BaseTool] = [
         DateTimeTool(),
-        ArxivQueryRun(),
+        AsyncArxivQueryRun(),
         DuckDuckGoSearchResults(),
         SchemaedYouTubeSearchTool(),
-        NCLSearchRun(),
-        WikipediaQueryRun(api_wrapper=WikipediaAPIWrapper()),
+        NCLSearchRun(renderer=renderer),
+        catalog_search,
+        AsyncWikipediaQueryRun(),
     ]
+    if catalog_index is not None:
+        tools.append(LocalCatalogRun(catalog_index=catalog_index, remote=catalog_search, renderer=renderer))
 
     try:
         tools.append(SchemaedGoogleSearchRun(api_wrapper=GoogleSearchAPIWrapper()))
     except ValidationError:
         pass
     try:
-        tools.append(GoogleBooksQueryRun())
+        tools.append(GoogleBooksQueryRun(renderer=renderer))
     except ValidationError:
         pass
     try:
@@ -38,4 +59,4 @@ def get_built_in_tools() -> list[BaseTool]:
     except ValidationError:
         pass
 
-    return tools
+    return make_resilient(tools) if resilient else tools
@@ -0,0 +1,36 @@
+from ai_librarian_core.wrapper.wikipedia import AsyncWikipediaAPIWrapper
+from langchain_community.tools.wikipedia.tool import WikipediaQueryRun
+from langchain_community.utilities import WikipediaAPIWrapper
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun
+from pydantic import Field
+
+
+class AsyncWikipediaQueryRun(WikipediaQueryRun):
+    """LangChain's Wikipedia tool with a native async implementation.
+
+    The inherited `WikipediaQueryRun` only runs synchronously, so inside the async graph every call held a thread
+    of the default executor for a search and two page requests per result. `_arun` fetches the search and the
+    summaries in one request through the shared pooled client, `_run` still uses `api_wrapper`.
+
+    Example:
+        >>> tool = AsyncWikipediaQueryRun(async_api_wrapper=AsyncWikipediaAPIWrapper(lang="zh"))
+        >>> print(await tool.ainvoke({"query": "國家圖書館"}))
+        Page: 國家圖書館 (臺灣)
+        Summary: 國家圖書館是中華民國的國家圖書館...
+    """
+
+    # `wiki_client` is set to the `wikipedia` package by the wrapper's validator, the other arguments match the
+    # defaults of `AsyncWikipediaAPIWrapper` so `_run` and `_arun` return the same results.
+    api_wrapper: WikipediaAPIWrapper = Field(
+        default_factory=lambda: WikipediaAPIWrapper(
+            wiki_client=None, top_k_results=3, lang="en", load_all_available_meta=False, doc_content_chars_max=4000
+        )
+    )
+    async_api_wrapper: AsyncWikipediaAPIWrapper = Field(default_factory=AsyncWikipediaAPIWrapper)
+
+    async def _arun(
+        self,
+        query: str,
+        run_manager: AsyncCallbackManagerForToolRun | None = None,
+    ) -> str:
+        return await self.async_api_wrapper.arun(query)
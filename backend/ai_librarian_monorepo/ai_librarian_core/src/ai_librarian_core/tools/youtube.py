@@ -1,9 +1,25 @@
+from ai_librarian_core.wrapper.youtube import AsyncYouTubeSearch
 from langchain_community.tools import YouTubeSearchTool
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun
 from pydantic import BaseModel, Field
 
 
 class YouTubeSearchInput(BaseModel):
     query: str = Field(description="The query to search for on YouTube.")
 
+
 class SchemaedYouTubeSearchTool(YouTubeSearchTool):
     args_schema: type[BaseModel] = YouTubeSearchInput
+    # Searches without holding a thread in the async graph, `_run` still uses the `youtube-search` package.
+    async_youtube_search: AsyncYouTubeSearch = Field(default_factory=AsyncYouTubeSearch)
+
+    async def _arun(
+        self,
+        query: str,
+        run_manager: AsyncCallbackManagerForToolRun | None = None,
+    ) -> str:
+        # The same input as `_run`, an optional number of results may follow the query after a comma.
+        values = query.split(",")
+        num_results = int(values[1]) if len(values) > 1 else 2
+        videos = await self.async_youtube_search.asearch(values[0], max_results=num_results)
+        return str(["https://www.youtube.com" + video["url_suffix"] for video in videos])
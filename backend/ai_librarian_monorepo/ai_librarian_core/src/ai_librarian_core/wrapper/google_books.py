@@ -1,4 +1,6 @@
 import requests
+from ai_librarian_core.catalog.records import records_from_google_books
+from ai_librarian_core.catalog.rendering import RecordRenderer
 from langchain_core.utils import get_from_dict_or_env
 from pydantic import BaseModel, Field, model_validator
 
@@ -37,28 +39,31 @@ class GoogleBooksAPIWrapper(BaseModel):
     Modifications:
         1. Added null checks for volumeInfo fields (title, authors, description, infoLink)
         2. Fixed index out of range error when authors list is empty
+        3. Rendered as compact records by `RecordRenderer` instead of prose with full descriptions
 
     Args:
         google_api_key(str): API key for accessing Google Books API
         top_k_results(int): Maximum number of book results to return (default: 5)
+        request_timeout(float): Timeout in seconds for the HTTP request (default: 8)
 
     Attributes:
         google_api_key(str): API key for accessing Google Books API
         top_k_results(int): Maximum number of book results to return (default: 5)
+        request_timeout(float): Timeout in seconds for the HTTP request (default: 8)
 
     Returns:
-        str: A formatted string containing book search results with title, authors, summary and source link
+        str: One compact line per book with its title, authors, year, ISBN, link and a shortened summary
 
     Example:
         >>> api_wrapper=GoogleBooksAPIWrapper(google_api_key=your_google_api_key, top_k_results=5)
         >>> print(api_wrapper.run("AI"))
-        Here are 5 suggestions for books related to AI:
-        1. "AI Superpowers" by Kai-Fu Lee: An analysis of AI's future...
+        1. AI Superpowers | Kai-Fu Lee | 2018 | ISBN 9781328546395 | [google_books] | https://... | An analysis…
         ...
     """
 
     google_api_key: str | None = None
     top_k_results: int = Field(default=5, ge=1, le=20)
+    request_timeout: float = Field(default=8, gt=0)
 
     @model_validator(mode="before")
     @classmethod
@@ -70,6 +75,14 @@ class GoogleBooksAPIWrapper(BaseModel):
         return values
 
     def run(self, query: str) -> str:
+        return RecordRenderer().render(
+            "google_books",
+            records_from_google_books(self.search(query)),
+            empty=f"Sorry no books could be found for your query: {query}",
+        )
+
+    def search(self, query: str) -> list[dict]:
+        """Returns the raw volumes found for `query`, each with its `volumeInfo`."""
         params = (
             ("q", query),
             ("maxResults", self.top_k_results),
@@ -77,7 +90,7 @@ class GoogleBooksAPIWrapper(BaseModel):
         )
 
         try:
-            response = requests.get(GOOGLE_BOOKS_API_URL, params=params)
+            response = requests.get(GOOGLE_BOOKS_API_URL, params=params, timeout=self.request_timeout)
             response.raise_for_status()
             json = response.json()
 
@@ -98,37 +111,4 @@ class GoogleBooksAPIWrapper(BaseModel):
         except Exception as e:
             raise GoogleBooksAPIWrapperError("An unexpected error occurred while trying to retrieve books.") from e
 
-        return self._format(query, json.get("items", []))
-
-    def _format(self, query: str, books: list) -> str:
-        if not books:
-            return f"Sorry no books could be found for your query: {query}"
-
-        start = f"Here are {len(books)} suggestions for books related to {query}:"
-
-        results = []
-        results.append(start)
-        i = 1
-
-        for book in books:
-            volume_info = book["volumeInfo"]
-            title = volume_info.get("title", "Unknown Title")
-            authors = self._format_authors(volume_info.get("authors", []))
-            summary = volume_info.get("description", "No summary available")
-            source = volume_info.get("infoLink", "No source available")
-
-            desc = f'{i}. "{title}" by {authors}: {summary}\n'
-            desc += f"You can read more at {source}"
-            results.append(desc)
-
-            i += 1
-
-        return "\n\n".join(results)
-
-    def _format_authors(self, authors: list) -> str:
-        if not authors:
-            return "Unknown Author"
-        elif len(authors) == 1:
-            return authors[0]
-        else:
-            return "{} and {}".format(", ".join(authors[:-1]), authors[-1])
+        return json.get("items", [])
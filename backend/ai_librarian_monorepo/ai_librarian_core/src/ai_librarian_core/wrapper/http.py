@@ -0,0 +1,56 @@
+import asyncio
+import weakref
+
+import httpx
+
+# Calls beyond `max_connections` wait for a pooled connection instead of opening one socket each. Every connection
+# may be kept alive, otherwise a burst of calls closes and reopens connections as they are handed over.
+DEFAULT_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=30)
+DEFAULT_TIMEOUT = httpx.Timeout(10)
+# Wikipedia asks API clients to identify themselves, requests with a generic user agent may be blocked.
+USER_AGENT = "ai-librarian (https://github.com/youkwan/ai-librarian)"
+
+_limits = DEFAULT_LIMITS
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Returns the pooled `httpx.AsyncClient` shared by the async wrappers on the running event loop.
+
+    The Wikipedia, arXiv and YouTube wrappers send their requests through this client, so concurrent tool calls
+    reuse a few keep-alive connections instead of holding a thread and a new connection each. Connections belong to
+    the event loop they were opened on, every loop gets its own client.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _clients[loop] = httpx.AsyncClient(
+            headers={"User-Agent": USER_AGENT},
+            timeout=DEFAULT_TIMEOUT,
+            limits=_limits,
+            follow_redirects=True,
+        )
+    return client
+
+
+def configure_async_client(max_connections: int):
+    """Sets the connection pool size of the clients created from now on, e.g. one worker's share of the host's.
+
+    Raises:
+        ValueError: If `max_connections` is less than 1.
+    """
+    global _limits
+    if max_connections < 1:
+        raise ValueError("max_connections must be at least 1.")
+    _limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=DEFAULT_LIMITS.keepalive_expiry,
+    )
+
+
+async def aclose_async_client():
+    """Closes the shared client of the running event loop, e.g. when the API shuts down."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -1,5 +1,9 @@
+import asyncio
 import urllib.parse
+import weakref
 
+from ai_librarian_core.catalog.records import records_from_ncl
+from ai_librarian_core.catalog.rendering import RecordRenderer
 from playwright.async_api import (
     BrowserContext as AsyncBrowserContext,
 )
@@ -16,6 +20,37 @@ from playwright.sync_api import BrowserContext, Page, TimeoutError, sync_playwri
 from pydantic import BaseModel, Field
 
 NCL_ENTRY_URL = "https://aleweb.ncl.edu.tw/F"
+# Every search runs its own headless Chromium. Both ncl_search and catalog_search search the NCL, so the pool bounds
+# the browsers of the whole process, searches beyond it wait for a browser to close.
+DEFAULT_BROWSER_POOL_SIZE = 2
+
+_browser_pool_size = DEFAULT_BROWSER_POOL_SIZE
+_browser_slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+
+
+def configure_browser_pool(size: int):
+    """Sets how many Chromium browsers the async searches run at once, e.g. one worker's share of the host's.
+
+    Raises:
+        ValueError: If `size` is less than 1.
+    """
+    global _browser_pool_size
+    if size < 1:
+        raise ValueError("size must be at least 1.")
+    _browser_pool_size = size
+    _browser_slots.clear()
+
+
+def _browser_slot() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    slots = _browser_slots.get(loop)
+    if slots is None:
+        slots = _browser_slots[loop] = asyncio.Semaphore(_browser_pool_size)
+    return slots
+
+
+def _render(books: list[dict[str, str]]) -> str:
+    return RecordRenderer().render("ncl_search", records_from_ncl(books))
 
 
 class NCLCrawlerError(Exception):
@@ -152,24 +187,26 @@ class NCLSearch(BaseNCLSearch):
                     break
         return results
 
+    def search(self, query: str) -> list[dict[str, str]]:
+        """Returns the books found for `query`, each with its title, author and link."""
+        return self._process_workflow(query)
+
     def run(self, query: str) -> str:
-        results = self._process_workflow(query)
-        return "\n".join(
-            [f"{i + 1}. {result['title']} ({result['author']}) - {result['link']}" for i, result in enumerate(results)]
-        )
+        return _render(self.search(query))
 
 
 class AsyncNCLSearch(BaseNCLSearch):
     """An asynchronous search tool for the National Central Library (NCL) catalog."""
 
+    async def asearch(self, query: str) -> list[dict[str, str]]:
+        """Returns the books found for `query`, each with its title, author and link."""
+        return await self._aprocess_workflow(query)
+
     async def arun(self, query: str) -> str:
-        results = await self._aprocess_workflow(query)
-        return "\n".join(
-            [f"{i + 1}. {result['title']} ({result['author']}) - {result['link']}" for i, result in enumerate(results)]
-        )
+        return _render(await self.asearch(query))
 
     async def _aprocess_workflow(self, query: str) -> list[dict[str, str]]:
-        async with async_playwright() as p:
+        async with _browser_slot(), async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             context = await browser.new_context()
             page = await context.new_page()
@@ -0,0 +1,72 @@
+from ai_librarian_core.wrapper.http import get_async_client
+from pydantic import BaseModel, Field
+
+WIKIPEDIA_API_URL = "https://{lang}.wikipedia.org/w/api.php"
+WIKIPEDIA_MAX_QUERY_LENGTH = 300
+
+
+class AsyncWikipediaAPIWrapper(BaseModel):
+    """An asynchronous Wikipedia API wrapper returning the summaries of the top pages found for a query.
+
+    It returns the same output as LangChain's `WikipediaAPIWrapper`, which sends a search request and then two
+    requests per page with the `wikipedia` package. Here the search and the summaries of every page found are
+    fetched in one request, using the search as a generator of the extracts query, through the shared pooled client.
+
+    Original WikipediaAPIWrapper class:
+        https://github.com/langchain-ai/langchain-community/blob/main/libs/community/langchain_community/utilities/wikipedia.py
+
+    Attributes:
+        top_k_results (int): The number of pages returned (default: 3, max: 20, the extracts of one request).
+        lang (str): The language edition of Wikipedia searched (default: "en").
+        doc_content_chars_max (int): The length the output is cut to (default: 4000).
+        request_timeout (float): Timeout in seconds for the HTTP request (default: 8).
+
+    Example:
+        >>> wrapper = AsyncWikipediaAPIWrapper(lang="zh")
+        >>> print(await wrapper.arun("國家圖書館"))
+        Page: 國家圖書館 (臺灣)
+        Summary: 國家圖書館是中華民國的國家圖書館...
+    """
+
+    top_k_results: int = Field(default=3, ge=1, le=20)
+    lang: str = "en"
+    doc_content_chars_max: int = Field(default=4000, ge=1)
+    request_timeout: float = Field(default=8, gt=0)
+
+    async def asearch(self, query: str) -> list[dict[str, str]]:
+        """Returns the pages found for `query`, best ranked first, each with its title and summary.
+
+        Disambiguation pages are left out, like the `wikipedia` package's `DisambiguationError` pages.
+        """
+        response = await get_async_client().get(
+            WIKIPEDIA_API_URL.format(lang=self.lang),
+            params={
+                "action": "query",
+                "format": "json",
+                "formatversion": 2,
+                "generator": "search",
+                "gsrsearch": query[:WIKIPEDIA_MAX_QUERY_LENGTH],
+                "gsrlimit": self.top_k_results,
+                "gsrnamespace": 0,
+                "prop": "extracts|pageprops",
+                "exintro": 1,
+                "explaintext": 1,
+                "exlimit": self.top_k_results,
+                "ppprop": "disambiguation",
+                "redirects": 1,
+            },
+            timeout=self.request_timeout,
+        )
+        response.raise_for_status()
+        pages = sorted(response.json().get("query", {}).get("pages", []), key=lambda page: page.get("index", 0))
+        return [
+            {"title": page["title"], "summary": page["extract"]}
+            for page in pages
+            if page.get("extract") and "disambiguation" not in page.get("pageprops", {})
+        ]
+
+    async def arun(self, query: str) -> str:
+        summaries = [f"Page: {page['title']}\nSummary: {page['summary']}" for page in await self.asearch(query)]
+        if not summaries:
+            return "No good Wikipedia Search Result was found"
+        return "\n\n".join(summaries)[: self.doc_content_chars_max]
@@ -0,0 +1,67 @@
+import json
+
+from ai_librarian_core.wrapper.http import get_async_client
+from langchain_core.tools import ToolException
+from pydantic import BaseModel, Field
+
+YOUTUBE_SEARCH_URL = "https://youtube.com/results"
+INITIAL_DATA_MARKER = "ytInitialData"
+
+
+class AsyncYouTubeSearch(BaseModel):
+    """An asynchronous YouTube search returning the videos of the results page.
+
+    It parses the results page the way the `youtube-search` package used by LangChain's `YouTubeSearchTool` does,
+    but fetches it through the shared pooled client instead of a new `requests` connection on a thread.
+
+    Attributes:
+        retries (int): The times the page is fetched again when it lacks the search results (default: 3).
+        request_timeout (float): Timeout in seconds for each HTTP request (default: 6).
+
+    Example:
+        >>> search = AsyncYouTubeSearch()
+        >>> videos = await search.asearch("library tour", max_results=2)
+        >>> videos[0]["url_suffix"]
+        '/watch?v=...'
+    """
+
+    retries: int = Field(default=3, ge=0)
+    request_timeout: float = Field(default=6, gt=0)
+
+    async def asearch(self, query: str, max_results: int | None = None) -> list[dict[str, str]]:
+        """Returns the videos found for `query`, each with its id, title, channel and url suffix.
+
+        Raises:
+            ToolException: If no attempt returned a page with the search results.
+        """
+        client = get_async_client()
+        for _ in range(self.retries + 1):
+            response = await client.get(
+                YOUTUBE_SEARCH_URL, params={"search_query": query}, timeout=self.request_timeout
+            )
+            response.raise_for_status()
+            if INITIAL_DATA_MARKER in response.text:
+                return self._parse_html(response.text)[:max_results]
+        raise ToolException(f"YouTube returned no search results page for {query!r} after {self.retries + 1} attempts")
+
+    def _parse_html(self, html: str) -> list[dict[str, str]]:
+        start = html.index(INITIAL_DATA_MARKER) + len(INITIAL_DATA_MARKER) + 3
+        data = json.loads(html[start : html.index("};", start) + 1])
+        sections = data["contents"]["twoColumnSearchResultsRenderer"]["primaryContents"]["sectionListRenderer"]
+        for section in sections["contents"]:
+            videos = [
+                {
+                    "id": video["videoId"],
+                    "title": video.get("title", {}).get("runs", [{}])[0].get("text"),
+                    "channel": video.get("longBylineText", {}).get("runs", [{}])[0].get("text"),
+                    "url_suffix": video.get("navigationEndpoint", {})
+                    .get("commandMetadata", {})
+                    .get("webCommandMetadata", {})
+                    .get("url", f"/watch?v={video['videoId']}"),
+                }
+                for item in section.get("itemSectionRenderer", {}).get("contents", [])
+                if (video := item.get("videoRenderer"))
+            ]
+            if videos:
+                return videos
+        return []
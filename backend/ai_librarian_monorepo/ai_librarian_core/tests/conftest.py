@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+import pytest
+
+
+@dataclass
+class FakeClock:
+    """A clock that only moves when a test sets `now`."""
+
+    now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def sqlite_path(tmp_path) -> str:
+    """A database file that every store opened in the same test shares."""
+    return str(tmp_path / "test.sqlite")
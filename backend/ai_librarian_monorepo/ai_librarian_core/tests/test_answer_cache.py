@@ -0,0 +1,73 @@
+from ai_librarian_core.cache.answer_cache import AnswerCache, CachedAnswer, normalize_question
+from ai_librarian_core.models.used_tool import UsedTool
+from langchain_core.messages import AIMessage
+
+MODEL = "gpt-4o-mini"
+
+
+def _answer(content: str, tools: tuple[str, ...] = ()) -> CachedAnswer:
+    return CachedAnswer(AIMessage(content), used_tools=[UsedTool(name=tool, output="") for tool in tools])
+
+
+def test_normalize_question_ignores_case_punctuation_and_whitespace():
+    assert normalize_question("  What are the Opening   hours?! ") == "what are the opening hours"
+    assert normalize_question("ＡＢＣ") == "abc"
+
+
+def test_exact_mode_matches_normalized_questions_per_model():
+    cache = AnswerCache()
+    assert cache.store("What are the opening hours?", MODEL, _answer("9am to 9pm."))
+    answer = cache.lookup("what are the opening hours", MODEL)
+    assert answer is not None and answer.message.content == "9am to 9pm."
+    assert cache.lookup("what are the opening hours", "gpt-4o") is None
+    assert cache.lookup("what are your opening hours", MODEL) is None
+
+
+def test_semantic_mode_matches_similar_questions():
+    cache = AnswerCache(mode="semantic")
+    cache.store("What are the opening hours?", MODEL, _answer("9am to 9pm."))
+    answer = cache.lookup("what are your opening hours", MODEL)
+    assert answer is not None and answer.message.content == "9am to 9pm."
+    assert cache.lookup("how do I renew a book", MODEL) is None
+    assert cache.lookup("what are your opening hours", "gpt-4o") is None
+
+
+def test_semantic_mode_requires_the_same_numbers():
+    cache = AnswerCache(mode="semantic")
+    cache.store("books about world war 1", MODEL, _answer("All Quiet on the Western Front."))
+    assert cache.lookup("books about world war 2", MODEL) is None
+
+
+def test_entries_expire_after_their_ttl(clock):
+    cache = AnswerCache(ttl_seconds=60, clock=clock)
+    cache.store("opening hours", MODEL, _answer("9am to 9pm."))
+    cache.store("parking", MODEL, _answer("Level B2."), ttl_seconds=10)
+    clock.now = 30
+    assert cache.lookup("parking", MODEL) is None
+    assert cache.lookup("opening hours", MODEL) is not None
+    clock.now = 60
+    assert cache.lookup("opening hours", MODEL) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = AnswerCache(mode="semantic", max_entries=2)
+    cache.store("opening hours", MODEL, _answer("9am to 9pm."))
+    cache.store("parking", MODEL, _answer("Level B2."))
+    cache.lookup("opening hours", MODEL)
+    cache.store("wifi password", MODEL, _answer("Ask the front desk."))
+    assert len(cache) == 2
+    assert cache.lookup("parking", MODEL) is None
+    assert cache.lookup("opening hours", MODEL) is not None
+    assert cache.lookup("wifi password", MODEL) is not None
+
+
+def test_uncacheable_answers_are_not_stored():
+    cache = AnswerCache()
+    assert not cache.store("what time is it", MODEL, _answer("It is noon.", tools=("date_time",)))
+    assert not cache.store("opening hours", MODEL, _answer(""))
+    assert not cache.store(
+        "opening hours", MODEL, CachedAnswer(AIMessage("", tool_calls=[{"name": "wikipedia", "args": {}, "id": "1"}]))
+    )
+    assert not cache.store("?!", MODEL, _answer("Nothing to ask."))
+    assert len(cache) == 0
@@ -0,0 +1,64 @@
+import asyncio
+import time
+import zlib
+
+import pytest
+from ai_librarian_core.blobs import store as blob_store
+from ai_librarian_core.blobs.offload import BLOB_METADATA_KEY, ToolOutputOffloader
+from ai_librarian_core.blobs.store import SQLiteBlobStore
+from langchain_core.messages import ToolMessage
+
+PAGE = "The National Central Library is the national library of Taiwan. " * 100
+
+
+def test_blobs_are_stored_once_by_content(sqlite_path):
+    store = SQLiteBlobStore(sqlite_path)
+    blob_id = store.put(PAGE)
+    assert blob_id == SQLiteBlobStore.blob_id(PAGE)
+    assert asyncio.run(store.aput(PAGE)) == blob_id
+    assert store.get(blob_id) == PAGE
+    assert asyncio.run(store.aget("missing")) is None
+    assert store.size_bytes() == len(zlib.compress(PAGE.encode()))
+
+
+def test_the_size_is_read_when_the_store_is_opened(sqlite_path):
+    SQLiteBlobStore(sqlite_path).put(PAGE)
+    store = SQLiteBlobStore(sqlite_path)
+    assert store.size_bytes() == len(zlib.compress(PAGE.encode()))
+    store.put("Another page.")
+    assert store.size_bytes() == len(zlib.compress(PAGE.encode())) + len(zlib.compress(b"Another page."))
+
+
+def test_expired_blobs_are_swept_by_later_writes(sqlite_path, monkeypatch):
+    monkeypatch.setattr(blob_store, "SWEEP_INTERVAL_SECONDS", -1)
+    store = SQLiteBlobStore(sqlite_path, ttl_seconds=0.01)
+    expired = store.put(PAGE)
+    time.sleep(0.02)
+    store.put("Another page.")
+    assert store.get(expired) is None
+    assert store.size_bytes() == len(zlib.compress(b"Another page."))
+
+
+def _tool_message(content: str, status: str = "success") -> ToolMessage:
+    return ToolMessage(content=content, name="wikipedia", tool_call_id="call-1", status=status)
+
+
+def test_long_outputs_are_offloaded_with_a_preview(sqlite_path):
+    offloader = ToolOutputOffloader(store=SQLiteBlobStore(sqlite_path), max_inline_chars=100, preview_chars=10)
+    message = asyncio.run(offloader.offload(_tool_message(PAGE)))
+    assert message.content == f"{PAGE[:10]}\n[Truncated, {len(PAGE) - 10} more characters not shown.]"
+    assert message.tool_call_id == "call-1"
+    assert offloader.store.get(message.response_metadata[BLOB_METADATA_KEY]) == PAGE
+
+
+def test_short_outputs_and_errors_are_kept_whole(sqlite_path):
+    offloader = ToolOutputOffloader(store=SQLiteBlobStore(sqlite_path), max_inline_chars=100, preview_chars=10)
+    short, error = _tool_message("Founded in 1933."), _tool_message(PAGE, status="error")
+    assert asyncio.run(offloader.offload(short)) is short
+    assert asyncio.run(offloader.offload(error)) is error
+    assert offloader.store.size_bytes() == 0
+
+
+def test_the_preview_must_fit_inline(sqlite_path):
+    with pytest.raises(ValueError, match="preview_chars"):
+        ToolOutputOffloader(store=SQLiteBlobStore(sqlite_path), max_inline_chars=10, preview_chars=20)
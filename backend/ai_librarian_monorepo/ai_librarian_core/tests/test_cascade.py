@@ -0,0 +1,83 @@
+import asyncio
+from collections.abc import Collection
+
+import pytest
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
+from ai_librarian_core.agents.react.base import ReactAgentError
+from ai_librarian_core.agents.react.cascade import MODEL_METADATA_KEY, ModelCascade
+from ai_librarian_core.models.llm_config import LLMConfig, Model
+from ai_librarian_core.testing.fake_chat_model import ScriptedChatModel
+from ai_librarian_core.testing.stub_tools import get_stub_tools
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.tools import BaseTool
+from langgraph.checkpoint.memory import InMemorySaver
+
+FAST_MODEL = Model.LLAMA_3_1_8B_INSTANT
+STRONG_MODEL = Model.OPENAI_GPT_4O
+
+
+def _agent(cascade: ModelCascade, failing: Collection[str] = ()) -> AsyncReactAgent:
+    def chat_model_factory(llm_config: LLMConfig) -> ScriptedChatModel:
+        model = str(llm_config.model)
+        return ScriptedChatModel(
+            tool_names=["wikipedia"],
+            model_name=model,
+            error_rate=1.0 if model in failing else 0.0,
+            response_tokens=5,
+            time_to_first_token=0,
+            tokens_per_second=None,
+        )
+
+    tools: list[BaseTool] = [*get_stub_tools({"wikipedia": 0})]
+    return AsyncReactAgent(
+        tools=tools,
+        checkpointer=InMemorySaver(),
+        chat_model_factory=chat_model_factory,
+        model_cascade=cascade,
+    )
+
+
+def _answered_by(agent: AsyncReactAgent) -> str:
+    llm_config = LLMConfig(model=STRONG_MODEL, cascade=True)
+    answer, _ = asyncio.run(
+        agent.run([HumanMessage("Who founded the National Central Library?")], llm_config=llm_config)
+    )
+    return answer.response_metadata[MODEL_METADATA_KEY]
+
+
+def test_tiers_end_with_the_requested_model():
+    cascade = ModelCascade(fast_models=[FAST_MODEL, STRONG_MODEL])
+    assert cascade.tiers(LLMConfig(model=STRONG_MODEL, cascade=True)) == [FAST_MODEL, STRONG_MODEL]
+    assert cascade.tiers(LLMConfig(model=STRONG_MODEL)) == [STRONG_MODEL]
+
+
+def test_tool_errors_of_the_last_hop_escalate():
+    cascade = ModelCascade()
+    ok = ToolMessage("Found it.", tool_call_id="1")
+    failed = ToolMessage("Timed out.", tool_call_id="2", status="error")
+    assert cascade.should_escalate_after_tools([HumanMessage("q"), AIMessage(""), failed, ok])
+    assert not cascade.should_escalate_after_tools([failed, AIMessage(""), ok])
+    assert not ModelCascade(signals=frozenset({"error"})).should_escalate_after_tools([failed])
+
+
+def test_empty_answers_and_negative_self_checks_are_signals():
+    cascade = ModelCascade()
+    assert cascade.answer_signal(AIMessage("  ")) == "empty_answer"
+    assert cascade.answer_signal(AIMessage("", tool_calls=[{"name": "wikipedia", "args": {}, "id": "1"}])) is None
+    assert cascade.answer_signal(AIMessage("In 1933.")) is None
+    assert ModelCascade.passed_self_check(AIMessage("YES"))
+    assert not ModelCascade.passed_self_check(AIMessage(" no."))
+
+
+def test_fast_model_answers_when_it_succeeds():
+    assert _answered_by(_agent(ModelCascade(fast_models=[FAST_MODEL]))) == FAST_MODEL
+
+
+def test_provider_errors_escalate_to_the_requested_model():
+    assert _answered_by(_agent(ModelCascade(fast_models=[FAST_MODEL]), failing={FAST_MODEL})) == STRONG_MODEL
+
+
+def test_disabled_signals_do_not_escalate():
+    agent = _agent(ModelCascade(fast_models=[FAST_MODEL], signals=frozenset()), failing={FAST_MODEL})
+    with pytest.raises(ReactAgentError):
+        _answered_by(agent)
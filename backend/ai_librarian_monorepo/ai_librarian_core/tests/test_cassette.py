@@ -0,0 +1,76 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
+from ai_librarian_core.agents.react.base import ReactAgentError
+from ai_librarian_core.models.llm_config import LLMConfig
+from ai_librarian_core.testing.cassette import Cassette, CassetteMissError, CassetteRecorder
+from ai_librarian_core.testing.fake_chat_model import ScriptedChatModel
+from ai_librarian_core.testing.stub_tools import StubTool
+from langchain_core.messages import AIMessageChunk, BaseMessage, HumanMessage
+from langchain_core.tools import BaseTool
+from langgraph.checkpoint.memory import InMemorySaver
+
+QUESTION = "Who founded the National Central Library?"
+
+
+def _scripted_model(llm_config: LLMConfig) -> ScriptedChatModel:
+    return ScriptedChatModel(tool_names=["wikipedia"], response_tokens=8, time_to_first_token=0, tokens_per_second=None)
+
+
+def _record(path: Path) -> tuple[str, list[str]]:
+    recorder = CassetteRecorder(path=path)
+    tools: list[BaseTool] = [*recorder.record_tools([StubTool(name="wikipedia", latency=0, output_size=100)])]
+    agent = AsyncReactAgent(
+        tools=tools,
+        checkpointer=InMemorySaver(),
+        chat_model_factory=recorder.chat_model_factory(_scripted_model),
+    )
+    try:
+        answer, used_tools = asyncio.run(agent.run([HumanMessage(QUESTION)], thread_id="recorded"))
+    finally:
+        recorder.close()
+    return answer.text(), [used_tool.name for used_tool in used_tools]
+
+
+def _replay_agent(cassette: Cassette) -> AsyncReactAgent:
+    tools: list[BaseTool] = [*cassette.replay_tools()]
+    return AsyncReactAgent(tools=tools, checkpointer=InMemorySaver(), chat_model_factory=cassette.chat_model_factory())
+
+
+@pytest.mark.parametrize("file_name", ["session.jsonl", "session.jsonl.gz"])
+def test_recorded_session_replays_the_same_answer(tmp_path: Path, file_name: str):
+    path = tmp_path / file_name
+    recorded_answer, recorded_tools = _record(path)
+
+    cassette = Cassette.load(path, realtime=False)
+    assert [record["kind"] for record in cassette.records] == ["llm", "tool", "llm"]
+    assert [message.text() for message in cassette.sessions()["recorded"]] == [QUESTION]
+
+    answer, used_tools = asyncio.run(_replay_agent(cassette).run([HumanMessage(QUESTION)]))
+    assert answer.text() == recorded_answer != ""
+    assert [used_tool.name for used_tool in used_tools] == recorded_tools == ["wikipedia"]
+
+
+def test_replay_streams_the_recorded_chunks(tmp_path: Path):
+    recorded_answer, _ = _record(tmp_path / "session.jsonl")
+    agent = _replay_agent(Cassette.load(tmp_path / "session.jsonl", realtime=False))
+
+    async def streamed_answer() -> str:
+        chunks: list[BaseMessage] = []
+        async for chunk, metadata in await agent.stream([HumanMessage(QUESTION)]):
+            if isinstance(chunk, AIMessageChunk) and metadata["langgraph_node"] == "invoke_llm":
+                chunks.append(chunk)
+        return "".join(chunk.text() for chunk in chunks)
+
+    assert asyncio.run(streamed_answer()) == recorded_answer
+
+
+def test_unrecorded_conversation_is_a_miss(tmp_path: Path):
+    _record(tmp_path / "session.jsonl")
+    agent = _replay_agent(Cassette.load(tmp_path / "session.jsonl", realtime=False))
+
+    with pytest.raises(ReactAgentError) as error:
+        asyncio.run(agent.run([HumanMessage("A question nobody asked.")]))
+    assert isinstance(error.value.__cause__, CassetteMissError)
@@ -0,0 +1,75 @@
+import asyncio
+
+from ai_librarian_core.catalog.index import SQLiteCatalogIndex
+from ai_librarian_core.catalog.records import CatalogRecord, normalize_isbn
+
+AIMA_ISBN = normalize_isbn("0-13-604259-7")
+AIMA = CatalogRecord(
+    title="Artificial Intelligence: A Modern Approach",
+    authors="Russell, Stuart J.",
+    year="2010",
+    isbn=AIMA_ISBN,
+    links={"google_books": "https://books.google.com/aima"},
+)
+AIMA_ZH = CatalogRecord(title="人工智慧 : 現代方法", authors="羅素", links={"ncl": "https://ncl.edu.tw/aima"})
+
+
+def test_upserted_records_are_found_by_their_terms(sqlite_path):
+    index = SQLiteCatalogIndex(sqlite_path)
+    index.upsert([AIMA, AIMA_ZH])
+    assert [record.title for record in index.search("modern artificial")] == [AIMA.title]
+    assert [record.title for record in index.search("人工智慧")] == [AIMA_ZH.title]
+    assert index.search("russell")[0].isbn == AIMA_ISBN
+    assert index.search("machine learning") == []
+
+
+def test_isbns_are_looked_up_in_any_format(sqlite_path):
+    index = SQLiteCatalogIndex(sqlite_path)
+    index.upsert([AIMA])
+    [record] = index.search("978-0136042594")
+    assert record.title == AIMA.title and record.updated_at is not None
+    assert index.search("0136042597") == [record]
+
+
+def test_short_terms_are_ignored(sqlite_path):
+    index = SQLiteCatalogIndex(sqlite_path)
+    index.upsert([AIMA])
+    assert index.search("AI") == []
+    assert len(index.search("AI modern")) == 1
+
+
+def test_returned_records_merge_their_links_and_keep_their_count(sqlite_path):
+    index = SQLiteCatalogIndex(sqlite_path)
+    index.upsert([AIMA, AIMA_ZH])
+    again = AIMA.model_copy(update={"authors": "", "links": {"ncl": "https://ncl.edu.tw/aima-en"}})
+    asyncio.run(index.aupsert([again, again]))
+    [record] = asyncio.run(index.asearch("modern approach"))
+    assert record.links == {"google_books": "https://books.google.com/aima", "ncl": "https://ncl.edu.tw/aima-en"}
+    assert record.authors == AIMA.authors
+    assert index.count() == 2
+
+
+def test_the_count_is_read_when_the_index_is_opened(sqlite_path):
+    SQLiteCatalogIndex(sqlite_path).upsert([AIMA, AIMA_ZH])
+    index = SQLiteCatalogIndex(sqlite_path)
+    assert index.count() == 2
+    index.upsert([CatalogRecord(title="Deep Learning", authors="Goodfellow, Ian")])
+    assert index.count() == 3
+
+
+def test_records_go_stale(sqlite_path):
+    index = SQLiteCatalogIndex(sqlite_path, stale_after_seconds=0)
+    index.upsert([AIMA])
+    [record] = index.search("modern approach")
+    assert not index.is_fresh(record)
+    assert SQLiteCatalogIndex(sqlite_path).is_fresh(record)
+    assert not index.is_fresh(AIMA)
+
+
+def test_the_same_book_under_an_isbn_and_a_title_is_returned_once(sqlite_path):
+    index = SQLiteCatalogIndex(sqlite_path)
+    without_isbn = CatalogRecord(title=AIMA.title, authors="Stuart Russell", links={"ncl": "https://ncl.edu.tw/aima"})
+    index.upsert([AIMA, without_isbn])
+    assert index.count() == 2
+    [record] = index.search("modern approach")
+    assert record.isbn == AIMA_ISBN and set(record.links) == {"google_books", "ncl"}
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+from ai_librarian_core.catalog.records import CatalogRecord
+from ai_librarian_core.tools.catalog_search import CatalogSearchResult, CatalogSearchRun
+from ai_librarian_core.wrapper.google_books import GoogleBooksAPIWrapper
+from langchain_core.tools import ToolException
+from pydantic import ConfigDict, Field
+
+AIMA_NCL = CatalogRecord(
+    title="Artificial intelligence : a modern approach", authors="Russell, Stuart", links={"ncl": "ncl/aima"}
+)
+AIMA_GOOGLE = CatalogRecord(
+    title="Artificial Intelligence: A Modern Approach",
+    authors="Stuart Russell, Peter Norvig",
+    year="2021",
+    isbn="9780134610993",
+    links={"google_books": "google/aima"},
+)
+DEEP_LEARNING = CatalogRecord(title="Deep Learning", authors="Ian Goodfellow", links={"google_books": "google/dl"})
+RED_CHAMBER = CatalogRecord(title="紅樓夢", authors="曹雪芹", links={"ncl": "ncl/red-chamber"})
+ATTENTION = CatalogRecord(
+    title="Attention Is All You Need", authors="Ashish Vaswani", year="2017", links={"arxiv": "arxiv/attention"}
+)
+
+
+class CannedCatalogSearch(CatalogSearchRun):
+    """Serves fixed records, or raises a fixed error, for each catalog."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    canned: dict[str, list[CatalogRecord] | Exception] = Field(default_factory=dict)
+
+    def _canned(self, source: str) -> list[CatalogRecord]:
+        outcome = self.canned[source]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def _search_ncl(self, query: str) -> list[CatalogRecord]:
+        return self._canned("ncl")
+
+    async def _asearch_ncl(self, query: str) -> list[CatalogRecord]:
+        return self._canned("ncl")
+
+    def _search_google_books(self, google_books: GoogleBooksAPIWrapper, query: str) -> list[CatalogRecord]:
+        return self._canned("google_books")
+
+    def _search_arxiv(self, query: str) -> list[CatalogRecord]:
+        return self._canned("arxiv")
+
+    async def _asearch_arxiv(self, query: str) -> list[CatalogRecord]:
+        return self._canned("arxiv")
+
+
+def _tool(**canned: list[CatalogRecord] | Exception) -> CannedCatalogSearch:
+    return CannedCatalogSearch(canned=canned, google_books=GoogleBooksAPIWrapper(google_api_key="test"))
+
+
+def _search(tool: CatalogSearchRun, asynchronous: bool) -> CatalogSearchResult:
+    return asyncio.run(tool.asearch("ai")) if asynchronous else tool.search("ai")
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_records_held_by_several_catalogs_are_merged(asynchronous: bool):
+    result = _search(_tool(ncl=[AIMA_NCL], google_books=[AIMA_GOOGLE], arxiv=[]), asynchronous)
+
+    assert len(result.records) == 1
+    assert result.records[0].sources == ["ncl", "google_books"]
+    assert result.records[0].isbn == AIMA_GOOGLE.isbn
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_records_are_ranked_by_reciprocal_rank_fusion(asynchronous: bool):
+    tool = _tool(
+        ncl=[RED_CHAMBER, AIMA_NCL],
+        google_books=[DEEP_LEARNING, AIMA_GOOGLE],
+        arxiv=[ATTENTION],
+    )
+
+    result = _search(tool, asynchronous)
+
+    # Second in two catalogs beats first in one, ties keep the order of the catalogs.
+    assert [record.title for record in result.records] == [
+        AIMA_NCL.title,
+        RED_CHAMBER.title,
+        ATTENTION.title,
+        DEEP_LEARNING.title,
+    ]
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_failed_catalogs_are_noted_and_the_rest_returned(asynchronous: bool):
+    result = _search(_tool(ncl=RuntimeError("down"), google_books=[DEEP_LEARNING], arxiv=[]), asynchronous)
+
+    assert [record.title for record in result.records] == [DEEP_LEARNING.title]
+    assert result.notes == ["Unavailable catalogs: ncl (RuntimeError)"]
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_every_catalog_failing_raises(asynchronous: bool):
+    tool = _tool(ncl=RuntimeError("down"), google_books=ConnectionError("refused"), arxiv=ValueError("bad"))
+
+    with pytest.raises(ToolException, match="Every catalog failed") as error:
+        _search(tool, asynchronous)
+    for source in ("ncl (RuntimeError)", "google_books (ConnectionError)", "arxiv (ValueError)"):
+        assert source in str(error.value)
@@ -0,0 +1,50 @@
+import asyncio
+
+from ai_librarian_core.tools.concurrency import ToolConcurrencyLimiter
+
+
+async def _peak_concurrency(limiter: ToolConcurrencyLimiter, tool_names: list[str]) -> dict[str, int]:
+    running: dict[str, int] = {"total": 0}
+    peak: dict[str, int] = {"total": 0}
+
+    async def call(tool_name: str):
+        async with limiter.limit(tool_name):
+            for key in ("total", tool_name):
+                running[key] = running.get(key, 0) + 1
+                peak[key] = max(peak.get(key, 0), running[key])
+            await asyncio.sleep(0.01)
+            for key in ("total", tool_name):
+                running[key] -= 1
+
+    await asyncio.gather(*(call(tool_name) for tool_name in tool_names))
+    return peak
+
+
+def test_global_limit_caps_calls_across_tools():
+    limiter = ToolConcurrencyLimiter(max_concurrency=3, per_tool_limits={})
+    peak = asyncio.run(_peak_concurrency(limiter, ["wikipedia", "arxiv"] * 5))
+    assert peak["total"] == 3
+
+
+def test_per_tool_limit_caps_a_single_tool():
+    limiter = ToolConcurrencyLimiter(max_concurrency=8, per_tool_limits={"ncl_search": 1})
+    peak = asyncio.run(_peak_concurrency(limiter, ["ncl_search"] * 4 + ["wikipedia"] * 4))
+    assert peak["ncl_search"] == 1
+    assert peak["wikipedia"] == 4
+
+
+def test_saturated_tool_does_not_hold_global_slots():
+    limiter = ToolConcurrencyLimiter(max_concurrency=2, per_tool_limits={"ncl_search": 1})
+    finished: list[str] = []
+
+    async def call(tool_name: str):
+        async with limiter.limit(tool_name):
+            await asyncio.sleep(0.01)
+        finished.append(tool_name)
+
+    async def main():
+        await asyncio.gather(*(call(tool_name) for tool_name in ["ncl_search"] * 4 + ["wikipedia"]))
+
+    asyncio.run(main())
+    # Queued `ncl_search` calls wait on their own semaphore, so `wikipedia` takes the free global slot right away.
+    assert finished.index("wikipedia") < 2
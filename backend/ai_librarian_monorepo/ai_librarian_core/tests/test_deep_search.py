@@ -0,0 +1,47 @@
+import asyncio
+
+import httpx
+from ai_librarian_core.agents.deep_search.asynchronous import AsyncDeepSearchAgent
+from ai_librarian_core.observability.metrics import TOOL_CALL_ERRORS
+from ai_librarian_core.testing.fake_chat_model import ScriptedChatModel
+from ai_librarian_core.testing.stub_tools import StubTool
+from ai_librarian_core.tools.resilience import make_resilient
+from langchain_core.messages import HumanMessage
+from langchain_core.tools import StructuredTool
+from langgraph.checkpoint.memory import InMemorySaver
+
+
+def _broken_catalog(query: str) -> str:
+    """Searches a catalog that is down."""
+    raise httpx.ConnectError("refused")
+
+
+def _agent() -> AsyncDeepSearchAgent:
+    llm = ScriptedChatModel(response_tokens=5, time_to_first_token=0, tokens_per_second=None)
+    broken = StructuredTool.from_function(_broken_catalog, name="broken_catalog")
+    return AsyncDeepSearchAgent(
+        tools=make_resilient([StubTool(name="wikipedia", latency=0, output_size=100), broken]),
+        checkpointer=InMemorySaver(),
+        chat_model_factory=lambda llm_config: llm,
+        max_sub_queries=1,
+    )
+
+
+def test_searches_every_tool_and_answers_from_the_sources():
+    answer, used_tools = asyncio.run(_agent().run([HumanMessage("Books on Taiwanese aboriginal myths")]))
+    assert answer.text()
+    assert [used_tool.name for used_tool in used_tools] == ["wikipedia"]
+    assert (used_tools[0].output or "").startswith("wikipedia results for")
+
+
+def test_failed_tools_are_counted_and_left_out_of_the_sources():
+    errors = TOOL_CALL_ERRORS.labels(tool="broken_catalog")
+    before = errors.value
+
+    async def main():
+        return [event async for event in await _agent().stream([HumanMessage("Books on Taiwanese myths")])]
+
+    searched = {event.data["tool"]: event.data for event in asyncio.run(main()) if event.event == "searched"}
+    assert searched["wikipedia"]["error"] is None
+    assert '"error": "tool_error"' in searched["broken_catalog"]["error"]
+    assert errors.value == before + 1
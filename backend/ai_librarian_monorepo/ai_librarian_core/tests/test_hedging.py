@@ -0,0 +1,129 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from ai_librarian_core.agents.react.cascade import MODEL_METADATA_KEY
+from ai_librarian_core.agents.react.hedging import HedgedChatModel, HedgePolicy
+from ai_librarian_core.observability.metrics import HEDGE_WINNERS, HEDGED_REQUESTS
+from ai_librarian_core.scheduling.llm_scheduler import LLMScheduler, ProviderLimits
+from ai_librarian_core.testing.fake_chat_model import ScriptedChatModel
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun
+from langchain_core.messages import BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGenerationChunk
+from pydantic import Field
+
+PRIMARY = "openai:primary"
+BACKUP = "anthropic:backup"
+
+
+class ClosableChatModel(ScriptedChatModel):
+    """Records the models whose streams were closed before they finished."""
+
+    closed: list[str] = Field(default_factory=list)
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        finished = False
+        try:
+            async for chunk in super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                yield chunk
+            finished = True
+        finally:
+            if not finished:
+                self.closed.append(self.model_name)
+
+
+def _model(name: str, time_to_first_token: float, error_rate: float = 0.0) -> ClosableChatModel:
+    return ClosableChatModel(
+        model_name=name,
+        time_to_first_token=time_to_first_token,
+        error_rate=error_rate,
+        response_tokens=5,
+        tokens_per_second=None,
+    )
+
+
+def _hedged(
+    primary: ClosableChatModel,
+    backup: ClosableChatModel,
+    deadline: float,
+    scheduler: LLMScheduler | None = None,
+) -> HedgedChatModel:
+    return HedgedChatModel(
+        primary=primary,
+        primary_model=PRIMARY,
+        backup=backup,
+        backup_model=BACKUP,
+        policy=HedgePolicy(initial_deadline=deadline, min_deadline=0),
+        scheduler=scheduler,
+    )
+
+
+def _answered_by(hedged: HedgedChatModel) -> tuple[str, float]:
+    start = time.perf_counter()
+    response = asyncio.run(hedged.ainvoke([HumanMessage(content="Who wrote Dream of the Red Chamber?")]))
+    return response.response_metadata[MODEL_METADATA_KEY], time.perf_counter() - start
+
+
+def test_backup_answers_when_the_primary_misses_the_deadline():
+    hedges = HEDGED_REQUESTS.labels(model=PRIMARY, backup=BACKUP, trigger="deadline")
+    wins = HEDGE_WINNERS.labels(model=BACKUP)
+    hedges_before, wins_before = hedges.value, wins.value
+
+    answered_by, seconds = _answered_by(_hedged(_model(PRIMARY, 5), _model(BACKUP, 0), deadline=0.05))
+
+    assert answered_by == BACKUP
+    assert seconds < 1
+    assert hedges.value == hedges_before + 1
+    assert wins.value == wins_before + 1
+
+
+def test_primary_error_fails_over_to_the_backup_right_away():
+    hedges = HEDGED_REQUESTS.labels(model=PRIMARY, backup=BACKUP, trigger="error")
+    before = hedges.value
+
+    answered_by, seconds = _answered_by(_hedged(_model(PRIMARY, 0, error_rate=1), _model(BACKUP, 0), deadline=10))
+
+    assert answered_by == BACKUP
+    assert seconds < 1
+    assert hedges.value == before + 1
+
+
+def test_losing_stream_is_closed():
+    primary, backup = _model(PRIMARY, 5), _model(BACKUP, 0)
+
+    _answered_by(_hedged(primary, backup, deadline=0.05))
+
+    assert primary.closed == [PRIMARY]
+    assert backup.closed == []
+
+
+def test_backup_is_skipped_when_its_provider_has_no_free_slot():
+    scheduler = LLMScheduler(limits={"anthropic": ProviderLimits(max_concurrency=1)})
+    hedged = _hedged(_model(PRIMARY, 0.2), _model(BACKUP, 0), deadline=0.05, scheduler=scheduler)
+
+    async def answer_while_backup_provider_is_busy() -> str:
+        async with scheduler.admit(BACKUP, thread_id="other"):
+            response = await hedged.ainvoke([HumanMessage(content="hello")])
+        return response.response_metadata[MODEL_METADATA_KEY]
+
+    assert asyncio.run(answer_while_backup_provider_is_busy()) == PRIMARY
+
+
+def test_backup_slot_is_given_back_after_the_request():
+    scheduler = LLMScheduler(limits={"anthropic": ProviderLimits(max_concurrency=1)})
+    hedged = _hedged(_model(PRIMARY, 5), _model(BACKUP, 0), deadline=0.05, scheduler=scheduler)
+
+    async def answer_then_admit() -> bool:
+        response = await hedged.ainvoke([HumanMessage(content="hello")])
+        assert response.response_metadata[MODEL_METADATA_KEY] == BACKUP
+        async with scheduler.admit_now(BACKUP) as admission:
+            return admission is not None
+
+    assert asyncio.run(answer_then_admit())
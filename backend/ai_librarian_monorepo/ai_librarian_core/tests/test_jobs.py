@@ -0,0 +1,149 @@
+import asyncio
+import time
+
+import pytest
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
+from ai_librarian_core.jobs.runner import JobQueueFullError, JobRunner
+from ai_librarian_core.jobs.store import Job, SQLiteJobStore
+from ai_librarian_core.models.llm_config import LLMConfig
+from ai_librarian_core.models.used_tool import UsedTool
+from ai_librarian_core.testing.fake_chat_model import ScriptedChatModel
+from ai_librarian_core.testing.stub_tools import get_stub_tools
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.tools import BaseTool
+from langgraph.checkpoint.memory import InMemorySaver
+
+QUESTION = "Who founded the National Central Library?"
+
+
+def _job(job_id: str, created_at: float) -> Job:
+    return Job(
+        id=job_id,
+        thread_id=f"thread-{job_id}",
+        messages=[HumanMessage(QUESTION)],
+        llm_config=LLMConfig(),
+        created_at=created_at,
+    )
+
+
+def _runner(sqlite_path: str, **kwargs) -> JobRunner:
+    llm = ScriptedChatModel(tool_names=["wikipedia"], response_tokens=5, time_to_first_token=0, tokens_per_second=None)
+    tools: list[BaseTool] = [*get_stub_tools({"wikipedia": 0.01}, output_size=100)]
+    agent = AsyncReactAgent(tools=tools, checkpointer=InMemorySaver(), chat_model_factory=lambda llm_config: llm)
+    return JobRunner(agent=agent, store=SQLiteJobStore(sqlite_path), poll_seconds=0.05, **kwargs)
+
+
+def test_store_round_trips_jobs_and_claims_them_once(sqlite_path):
+    store = SQLiteJobStore(sqlite_path)
+
+    async def main():
+        await store.add(_job("second", created_at=2))
+        await store.add(_job("first", created_at=1))
+        job = await store.get("first")
+        assert job is not None and job.messages[0].content == QUESTION and job.status == "queued"
+        assert await store.count("queued") == 2
+
+        claimed = await store.claim("worker-a")
+        assert claimed is not None and claimed.id == "first" and claimed.status == "running"
+        assert claimed.started_at is not None
+        second = await store.claim("worker-b")
+        assert second is not None and second.id == "second"
+        assert await store.claim("worker-a") is None
+
+        claimed.status, claimed.answer = "succeeded", AIMessage("In 1933.")
+        claimed.used_tools = [UsedTool(name="wikipedia", output="Founded in 1933.")]
+        assert not await store.finish(claimed, "worker-b")
+        assert await store.finish(claimed, "worker-a")
+        finished = await store.get("first")
+        assert finished is not None and finished.is_finished
+        assert finished.answer is not None and finished.answer.content == "In 1933."
+        assert finished.used_tools == claimed.used_tools
+
+    asyncio.run(main())
+
+
+def test_store_cancels_queued_jobs_and_flags_running_ones(sqlite_path):
+    store = SQLiteJobStore(sqlite_path)
+
+    async def main():
+        await store.add(_job("running", created_at=1))
+        await store.add(_job("queued", created_at=2))
+        await store.claim("worker")
+        assert await store.heartbeat("running", "worker")
+
+        queued = await store.request_cancel("queued")
+        assert queued is not None and queued.status == "cancelled" and queued.expires_at is not None
+        running = await store.request_cancel("running")
+        assert running is not None and running.status == "running"
+        assert not await store.heartbeat("running", "worker")
+
+    asyncio.run(main())
+
+
+def test_store_sweep_fails_stale_jobs_and_deletes_expired_ones(sqlite_path):
+    store = SQLiteJobStore(sqlite_path, result_ttl_seconds=0)
+
+    async def main():
+        await store.add(_job("stale", created_at=1))
+        await store.add(_job("done", created_at=2))
+        await store.claim("worker")
+        done = await store.claim("worker")
+        assert done is not None
+        done.status = "succeeded"
+        await store.finish(done, "worker")
+        await store.add_event("done", "succeeded", {})
+
+        assert await store.sweep(stale_before=time.time() + 1) == ["stale"]
+        stale = await store.get("stale")
+        assert stale is not None and stale.status == "failed"
+        assert await store.get("done") is None
+        assert await store.events("done") == []
+
+    asyncio.run(main())
+
+
+def test_store_reads_events_after_a_sequence_number(sqlite_path):
+    store = SQLiteJobStore(sqlite_path)
+
+    async def main():
+        first = await store.add_event("job", "queued", {})
+        await store.add_event("other", "queued", {})
+        await store.add_event("job", "tool_chosen", {"name": "wikipedia"})
+        events = await store.events("job", after=first)
+        assert [(event.event, event.data) for event in events] == [("tool_chosen", {"name": "wikipedia"})]
+
+    asyncio.run(main())
+
+
+def test_runner_runs_a_job_and_streams_its_progress(sqlite_path):
+    runner = _runner(sqlite_path)
+
+    async def main():
+        await runner.start()
+        try:
+            job = await runner.submit([HumanMessage(QUESTION)], "thread", LLMConfig())
+            events = [event async for event in runner.events(job.id)]
+            finished = await runner.get(job.id)
+        finally:
+            await runner.stop()
+        assert [event.event for event in events] == ["queued", "running", "tool_chosen", "tool_output", "succeeded"]
+        assert events[2].data == {"name": "wikipedia"}
+        assert finished is not None and finished.status == "succeeded"
+        assert finished.answer is not None and finished.answer.text() == events[-1].data["answer"]
+        assert [used_tool.name for used_tool in finished.used_tools] == ["wikipedia"]
+
+    asyncio.run(main())
+
+
+def test_runner_cancels_queued_jobs_and_rejects_a_full_queue(sqlite_path):
+    runner = _runner(sqlite_path, max_queued_jobs=1)
+
+    async def main():
+        job = await runner.submit([HumanMessage(QUESTION)], "thread", LLMConfig())
+        with pytest.raises(JobQueueFullError):
+            await runner.submit([HumanMessage(QUESTION)], "thread", LLMConfig())
+        cancelled = await runner.cancel(job.id)
+        assert cancelled is not None and cancelled.status == "cancelled"
+        assert [event.event async for event in runner.events(job.id)] == ["queued", "cancelled"]
+
+    asyncio.run(main())
@@ -0,0 +1,164 @@
+import asyncio
+import time
+
+import pytest
+from ai_librarian_core.scheduling.llm_scheduler import LLMOverloadedError, LLMScheduler, Priority, ProviderLimits
+
+MODEL = "openai:gpt-4o-mini"
+
+
+def _scheduler(max_concurrency: int = 1, tokens_per_minute: int | None = None, **kwargs) -> LLMScheduler:
+    return LLMScheduler(
+        limits={"openai": ProviderLimits(max_concurrency=max_concurrency, tokens_per_minute=tokens_per_minute)},
+        **kwargs,
+    )
+
+
+async def _admitted_order(scheduler: LLMScheduler, requests: list[tuple[str, Priority]]) -> list[str]:
+    """Queues `requests` behind a running one and returns the order they are admitted in."""
+    order: list[str] = []
+    release = asyncio.Event()
+
+    async def hold():
+        async with scheduler.admit(MODEL, "holder"):
+            await release.wait()
+
+    async def request(thread_id: str, priority: Priority, index: int):
+        async with scheduler.admit(MODEL, thread_id, priority=priority):
+            order.append(f"{thread_id}{index}")
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    tasks = [asyncio.create_task(request(thread_id, priority, i)) for i, (thread_id, priority) in enumerate(requests)]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(holder, *tasks)
+    return order
+
+
+async def _admit(scheduler: LLMScheduler, tokens: int):
+    async with scheduler.admit(MODEL, "b", tokens=tokens):
+        pass
+
+
+def test_in_flight_requests_are_capped_per_provider():
+    scheduler = _scheduler(max_concurrency=2)
+    running = peak = 0
+
+    async def request(model: str):
+        nonlocal running, peak
+        async with scheduler.admit(model, "thread"):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    async def main():
+        await asyncio.gather(*(request(MODEL) for _ in range(5)))
+
+    asyncio.run(main())
+    assert peak == 2
+
+
+def test_interactive_requests_go_before_batch_requests():
+    order = asyncio.run(_admitted_order(_scheduler(), [("a", "batch"), ("b", "batch"), ("c", "interactive")]))
+    assert order == ["c2", "a0", "b1"]
+
+
+def test_threads_take_turns_within_a_priority():
+    requests: list[tuple[str, Priority]] = [
+        ("a", "interactive"),
+        ("a", "interactive"),
+        ("a", "interactive"),
+        ("b", "interactive"),
+    ]
+    order = asyncio.run(_admitted_order(_scheduler(), requests))
+    assert order == ["a0", "b3", "a1", "a2"]
+
+
+def test_requests_beyond_the_queue_depth_are_rejected():
+    scheduler = _scheduler(max_queue_depth={"interactive": 2, "batch": 1})
+
+    async def main():
+        release = asyncio.Event()
+
+        async def hold(thread_id: str):
+            async with scheduler.admit(MODEL, thread_id):
+                await release.wait()
+
+        tasks = [asyncio.create_task(hold(f"thread-{i}")) for i in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(LLMOverloadedError) as error:
+            scheduler.check(MODEL, "batch")
+        assert error.value.provider == "openai" and error.value.retry_after >= 1
+        scheduler.check(MODEL, "interactive")
+        tasks.append(asyncio.create_task(hold("thread-2")))
+        await asyncio.sleep(0)
+        with pytest.raises(LLMOverloadedError):
+            async with scheduler.admit(MODEL, "thread-3"):
+                pass
+        # Other providers have their own queue.
+        scheduler.check("groq:llama-3.1-8b-instant", "batch")
+        release.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiters_leave_the_queue():
+    scheduler = _scheduler()
+
+    async def main():
+        release = asyncio.Event()
+
+        async def hold():
+            async with scheduler.admit(MODEL, "holder"):
+                await release.wait()
+
+        async def request(thread_id: str) -> str:
+            async with scheduler.admit(MODEL, thread_id):
+                return thread_id
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        cancelled, waiting = asyncio.create_task(request("a")), asyncio.create_task(request("b"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        await holder
+        assert await asyncio.wait_for(waiting, 1) == "b"
+        assert cancelled.cancelled()
+
+    asyncio.run(main())
+
+
+def test_unused_reserved_tokens_are_given_back():
+    scheduler = _scheduler(max_concurrency=4, tokens_per_minute=6000)
+
+    async def main() -> float:
+        release = asyncio.Event()
+
+        async def first():
+            async with scheduler.admit(MODEL, "a", tokens=6000) as admission:
+                await release.wait()
+                admission.used_tokens = 100
+
+        task = asyncio.create_task(first())
+        await asyncio.sleep(0)
+        start = time.monotonic()
+        second = asyncio.create_task(_admit(scheduler, tokens=1000))
+        await asyncio.sleep(0.02)
+        assert not second.done()
+        release.set()
+        await task
+        await second
+        return time.monotonic() - start
+
+    # Without the refund the second request would wait about ten seconds for the bucket to refill.
+    assert asyncio.run(main()) < 1
+
+
+def test_per_worker_limits_split_the_budget():
+    assert ProviderLimits(max_concurrency=8, tokens_per_minute=9000).per_worker(4) == ProviderLimits(2, 2250)
+    assert ProviderLimits(max_concurrency=2).per_worker(4) == ProviderLimits(1, None)
@@ -0,0 +1,51 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from ai_librarian_core.wrapper import http, ncl_search
+from ai_librarian_core.wrapper.http import aclose_async_client, configure_async_client, get_async_client
+from ai_librarian_core.wrapper.ncl_search import DEFAULT_BROWSER_POOL_SIZE, AsyncNCLSearch, configure_browser_pool
+
+
+@pytest.fixture(autouse=True)
+def _restore_pool_sizes():
+    yield
+    http._limits = http.DEFAULT_LIMITS
+    configure_browser_pool(DEFAULT_BROWSER_POOL_SIZE)
+
+
+def test_configured_limits_apply_to_new_clients():
+    async def max_connections() -> int:
+        client = get_async_client()
+        try:
+            return client._transport._pool._max_connections  # type: ignore[attr-defined]
+        finally:
+            await aclose_async_client()
+
+    configure_async_client(max_connections=4)
+    assert asyncio.run(max_connections()) == 4
+
+
+def test_browser_pool_caps_concurrent_searches(monkeypatch: pytest.MonkeyPatch):
+    running = peak = 0
+
+    @asynccontextmanager
+    async def fake_playwright():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("no browser here")
+            yield
+        finally:
+            running -= 1
+
+    monkeypatch.setattr(ncl_search, "async_playwright", fake_playwright)
+    configure_browser_pool(size=2)
+
+    async def search_all():
+        return await asyncio.gather(*(AsyncNCLSearch().asearch("python") for _ in range(6)), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in asyncio.run(search_all()))
+    assert peak == 2
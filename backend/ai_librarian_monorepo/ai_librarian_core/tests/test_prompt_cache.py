@@ -0,0 +1,62 @@
+from ai_librarian_core.cache.prompt_cache import CACHE_CONTROL, cache_friendly_messages, cache_friendly_tools
+from ai_librarian_core.testing.stub_tools import StubTool
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.tools import BaseTool
+
+ANTHROPIC = "anthropic:claude-3-5-haiku-latest"
+OPENAI = "openai:gpt-4o-mini"
+
+
+def _tool_names(tools: list[BaseTool | dict]) -> list[str]:
+    return [tool["name"] if isinstance(tool, dict) else tool.name for tool in tools]
+
+
+def _conversation() -> list[BaseMessage]:
+    return [
+        HumanMessage(content="Find books about tea."),
+        SystemMessage(content="You are a librarian."),
+        AIMessage(content="Here are three books."),
+        SystemMessage(content="You are a librarian."),
+        SystemMessage(content="Answer in English."),
+        HumanMessage(content="Which one is the newest?"),
+    ]
+
+
+def test_tools_are_sorted_by_name_whatever_order_they_come_in():
+    tools = [StubTool(name=name) for name in ("wikipedia", "arxiv", "ncl_search")]
+    assert _tool_names(cache_friendly_tools(tools, OPENAI)) == ["arxiv", "ncl_search", "wikipedia"]
+    assert _tool_names(cache_friendly_tools(tools[::-1], OPENAI)) == ["arxiv", "ncl_search", "wikipedia"]
+
+
+def test_distinct_system_prompts_lead_as_one_message():
+    messages = cache_friendly_messages(_conversation(), OPENAI)
+    assert isinstance(messages[0], SystemMessage)
+    assert messages[0].content == "You are a librarian.\n\nAnswer in English."
+    assert [type(message) for message in messages[1:]] == [HumanMessage, AIMessage, HumanMessage]
+
+
+def test_anthropic_breakpoints_mark_the_last_tool_the_system_prompt_and_the_latest_question():
+    tools = cache_friendly_tools([StubTool(name="wikipedia"), StubTool(name="arxiv")], ANTHROPIC)
+    assert isinstance(tools[0], BaseTool)
+    assert isinstance(tools[-1], dict)
+    assert tools[-1]["name"] == "wikipedia" and tools[-1]["cache_control"] == CACHE_CONTROL
+
+    system, first_question, answer, latest_question = cache_friendly_messages(_conversation(), ANTHROPIC)
+    assert system.content == [
+        {"type": "text", "text": "You are a librarian.\n\nAnswer in English.", "cache_control": CACHE_CONTROL}
+    ]
+    assert first_question.content == "Find books about tea."
+    assert answer.content == "Here are three books."
+    assert latest_question.content == [
+        {"type": "text", "text": "Which one is the newest?", "cache_control": CACHE_CONTROL}
+    ]
+
+
+def test_other_providers_get_no_breakpoints():
+    tools = cache_friendly_tools([StubTool(name="wikipedia")], OPENAI)
+    assert all(isinstance(tool, BaseTool) for tool in tools)
+
+    anthropic_messages = cache_friendly_messages(_conversation(), ANTHROPIC)
+    failed_over = cache_friendly_messages(anthropic_messages, OPENAI)
+    assert failed_over[-1].content == [{"type": "text", "text": "Which one is the newest?"}]
+    assert all("cache_control" not in str(message.content) for message in failed_over[1:])
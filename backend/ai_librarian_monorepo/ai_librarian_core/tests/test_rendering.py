@@ -0,0 +1,56 @@
+from ai_librarian_core.catalog.records import CatalogRecord
+from ai_librarian_core.catalog.rendering import RecordRenderer, estimate_tokens, truncate_tokens
+
+RECORD = CatalogRecord(
+    title="Artificial Intelligence: A Modern Approach",
+    authors="Stuart Russell, Peter Norvig",
+    year="2010",
+    isbn="9780136042594",
+    links={"google_books": "https://books.google.com/aima", "ncl": "https://ncl.edu.tw/aima"},
+    description="The leading   textbook\nin artificial intelligence.",
+)
+
+
+def _records(count: int) -> list[CatalogRecord]:
+    return [RECORD.model_copy(update={"title": f"Book {i}"}) for i in range(count)]
+
+
+def test_token_estimates_count_cjk_characters_as_one_token():
+    assert estimate_tokens("abcdefgh") == 2
+    assert estimate_tokens("人工智慧") == 4
+    assert truncate_tokens("abcdefgh", 2) == "abcdefgh"
+    assert truncate_tokens("人工智慧 現代方法", 2) == "人工…"
+
+
+def test_records_render_their_fields_on_one_line():
+    assert RecordRenderer().render_record(RECORD) == (
+        "Artificial Intelligence: A Modern Approach | Stuart Russell, Peter Norvig | 2010 | ISBN 9780136042594 | "
+        "[google_books, ncl] | https://ncl.edu.tw/aima | The leading textbook in artificial intelligence."
+    )
+
+
+def test_fields_are_projected_and_empty_values_skipped():
+    renderer = RecordRenderer(fields=("title", "isbn", "link"))
+    record = CatalogRecord(title="人工智慧", links={"google_books": "https://books.google.com/ai"})
+    assert renderer.render_record(record) == "人工智慧 | https://books.google.com/ai"
+
+
+def test_descriptions_are_cut_to_their_token_limit():
+    renderer = RecordRenderer(fields=("description",), max_description_tokens=3)
+    assert renderer.render_record(RECORD) == "The leading…"
+
+
+def test_records_beyond_the_token_budget_are_left_out():
+    renderer = RecordRenderer(fields=("title",), token_budgets={"ncl_search": 9})
+    assert renderer.render("ncl_search", _records(5)) == (
+        "1. Book 0\n2. Book 1\n3. Book 2\n(2 more records left out of the token budget)"
+    )
+    assert renderer.render("ncl_search", _records(1), notes=["x" * 100]).startswith("1. Book 0\n")
+
+
+def test_empty_results_and_notes():
+    renderer = RecordRenderer()
+    assert renderer.render("ncl_search", []) == ""
+    assert renderer.render("ncl_search", [], empty="No books found.", notes=["google_books failed."]) == (
+        "No books found.\ngoogle_books failed."
+    )
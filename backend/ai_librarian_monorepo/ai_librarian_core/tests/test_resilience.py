@@ -0,0 +1,140 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from ai_librarian_core.testing.stub_tools import StubTool
+from ai_librarian_core.tools.resilience import CircuitBreaker, CircuitState, ResilientTool, make_resilient
+from langchain_core.messages import ToolMessage
+from langchain_core.tools import BaseTool, StructuredTool, ToolException
+
+
+def _failing_tool(error: Exception) -> StructuredTool:
+    def search(query: str) -> str:
+        """Searches for the query."""
+        raise error
+
+    return StructuredTool.from_function(search, name="search")
+
+
+def _wrap(tool: BaseTool, timeout: float = 1, failure_threshold: int = 3) -> ResilientTool:
+    return ResilientTool(
+        tool=tool,
+        name=tool.name,
+        description=tool.description,
+        timeout=timeout,
+        breaker=CircuitBreaker(name=tool.name, failure_threshold=failure_threshold),
+    )
+
+
+def _call(tool: ResilientTool) -> ToolMessage:
+    return tool.invoke({"type": "tool_call", "id": "call-1", "name": tool.name, "args": {"query": "library"}})
+
+
+def _error(message: ToolMessage) -> dict[str, str]:
+    assert message.status == "error"
+    return json.loads(str(message.content))
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(name="search", failure_threshold=2)
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow_request()
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker(name="search", failure_threshold=2)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_half_open_breaker_lets_one_probe_through(clock):
+    breaker = CircuitBreaker(name="search", failure_threshold=1, recovery_timeout=30, clock=clock)
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.retry_after == 20
+    clock.now = 30
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.release()
+    assert breaker.allow_request()
+
+
+def test_failed_probe_reopens_and_successful_probe_closes(clock):
+    breaker = CircuitBreaker(name="search", failure_threshold=1, recovery_timeout=30, clock=clock)
+    breaker.record_failure()
+    clock.now = 30
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    clock.now = 60
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_timeout_returns_an_error_message_and_counts_as_a_failure():
+    tool = _wrap(StubTool(name="search", latency=1), timeout=0.05)
+    message = asyncio.run(
+        tool.ainvoke({"type": "tool_call", "id": "call-1", "name": "search", "args": {"query": "library"}})
+    )
+    assert _error(message)["error"] == "timeout"
+    assert tool.breaker.consecutive_failures == 1
+
+
+def test_transport_errors_open_the_breaker():
+    tool = _wrap(_failing_tool(httpx.ConnectError("refused")), failure_threshold=2)
+    _call(tool)
+    _call(tool)
+    message = _call(tool)
+    assert tool.breaker.state == CircuitState.OPEN
+    assert _error(message)["error"] == "circuit_open"
+
+
+def test_empty_results_do_not_open_the_breaker():
+    tool = _wrap(_failing_tool(ToolException("No results")), failure_threshold=1)
+    message = _call(tool)
+    assert _error(message) == {"error": "tool_error", "tool": "search", "message": "No results"}
+    assert tool.breaker.state == CircuitState.CLOSED
+
+
+def test_make_resilient_keeps_the_tool_metadata():
+    stub = StubTool(name="wikipedia", latency=0)
+    [tool] = make_resilient([stub], timeouts={"wikipedia": 3})
+    assert isinstance(tool, ResilientTool)
+    assert (tool.name, tool.description, tool.args_schema, tool.timeout) == (
+        "wikipedia",
+        stub.description,
+        stub.args_schema,
+        3,
+    )
+    assert make_resilient([tool]) == [tool]
+    assert tool.invoke({"query": "library"}) == stub.invoke({"query": "library"})
+
+
+def test_cancelled_probe_frees_its_slot(clock):
+    tool = ResilientTool(
+        tool=StubTool(name="search", latency=10),
+        name="search",
+        description="A slow search.",
+        breaker=CircuitBreaker(name="search", failure_threshold=1, recovery_timeout=30, clock=clock),
+    )
+    tool.breaker.record_failure()
+    clock.now = 30
+
+    async def main():
+        probe = asyncio.create_task(tool.ainvoke({"query": "library"}))
+        await asyncio.sleep(0.01)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+    asyncio.run(main())
+    assert tool.breaker.state == CircuitState.HALF_OPEN
+    assert tool.breaker.allow_request()
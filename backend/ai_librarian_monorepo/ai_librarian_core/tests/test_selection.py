@@ -0,0 +1,41 @@
+from ai_librarian_core.testing.stub_tools import get_stub_tools
+from ai_librarian_core.tools.selection import ToolSelector
+
+TOOLS = get_stub_tools()
+
+
+def _names(selector: ToolSelector, query: str, **kwargs) -> list[str]:
+    return [tool.name for tool in selector.select(TOOLS, query, **kwargs)]
+
+
+def test_picks_the_matching_tools_in_their_original_order():
+    assert _names(ToolSelector(top_k=2), "Is it going to rain tomorrow?") == ["date_time", "open_weather_map"]
+
+
+def test_matches_chinese_keywords():
+    assert "open_weather_map" in _names(ToolSelector(top_k=2), "明天台北會下雨嗎")
+
+
+def test_keeps_every_tool_when_nothing_matches():
+    assert _names(ToolSelector(), "hi") == [tool.name for tool in TOOLS]
+    assert _names(ToolSelector(), "?!") == [tool.name for tool in TOOLS]
+
+
+def test_keeps_required_and_always_included_tools():
+    selector = ToolSelector(top_k=1, always_include=frozenset({"date_time"}))
+    assert _names(selector, "weather forecast", required=["wikipedia"]) == [
+        "date_time",
+        "wikipedia",
+        "open_weather_map",
+    ]
+
+
+def test_keeps_every_tool_when_there_are_at_most_top_k():
+    assert ToolSelector(top_k=3).select(TOOLS[:3], "weather") == TOOLS[:3]
+
+
+def test_reindexes_when_the_tools_change():
+    selector = ToolSelector(top_k=1)
+    assert _names(selector, "weather forecast") == ["open_weather_map"]
+    tools = [tool for tool in TOOLS if tool.name != "open_weather_map"]
+    assert "open_weather_map" not in [tool.name for tool in selector.select(tools, "weather forecast")]
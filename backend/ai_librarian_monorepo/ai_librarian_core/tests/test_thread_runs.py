@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+from ai_librarian_core.scheduling.thread_runs import (
+    RunPolicy,
+    SQLiteThreadLeases,
+    ThreadBusyError,
+    ThreadRunCoordinator,
+    ThreadTurn,
+)
+
+
+async def _hold(coordinator: ThreadRunCoordinator, thread_id: str, events: list[str], name: str, seconds: float = 0.02):
+    async with coordinator.run(thread_id):
+        events.append(f"{name} start")
+        await asyncio.sleep(seconds)
+        events.append(f"{name} end")
+
+
+def test_queue_policy_runs_one_turn_at_a_time():
+    coordinator = ThreadRunCoordinator(policy="queue")
+    events: list[str] = []
+
+    async def main():
+        first = asyncio.create_task(_hold(coordinator, "thread", events, "first"))
+        await asyncio.sleep(0)
+        assert coordinator.is_busy("thread")
+        await asyncio.gather(first, _hold(coordinator, "thread", events, "second"))
+
+    asyncio.run(main())
+    assert events == ["first start", "first end", "second start", "second end"]
+    assert not coordinator.is_busy("thread")
+
+
+def test_different_threads_run_concurrently():
+    coordinator = ThreadRunCoordinator(policy="reject")
+    events: list[str] = []
+
+    async def main():
+        await asyncio.gather(_hold(coordinator, "a", events, "a"), _hold(coordinator, "b", events, "b"))
+
+    asyncio.run(main())
+    assert events[:2] == ["a start", "b start"]
+
+
+def test_reject_policy_raises_for_a_busy_thread():
+    coordinator = ThreadRunCoordinator(policy="reject")
+
+    async def main():
+        first = asyncio.create_task(_hold(coordinator, "thread", [], "first"))
+        await asyncio.sleep(0)
+        with pytest.raises(ThreadBusyError, match="thread"):
+            await _hold(coordinator, "thread", [], "second")
+        await first
+
+    asyncio.run(main())
+
+
+def test_cancel_policy_preempts_the_earlier_run():
+    coordinator = ThreadRunCoordinator(policy="cancel")
+
+    async def main() -> ThreadTurn:
+        first = asyncio.create_task(_hold(coordinator, "thread", [], "first", seconds=10))
+        await asyncio.sleep(0)
+        async with coordinator.run("thread") as turn:
+            assert first.cancelled()
+        return turn
+
+    assert asyncio.run(main()).preempted
+
+
+def test_queued_run_times_out():
+    coordinator = ThreadRunCoordinator(policy="queue", queue_timeout_seconds=0.01)
+
+    async def main():
+        first = asyncio.create_task(_hold(coordinator, "thread", [], "first", seconds=0.1))
+        await asyncio.sleep(0)
+        with pytest.raises(ThreadBusyError):
+            await _hold(coordinator, "thread", [], "second")
+        await first
+
+    asyncio.run(main())
+    assert not coordinator.is_busy("thread")
+
+
+def _worker(path: str, policy: RunPolicy) -> ThreadRunCoordinator:
+    # Coordinators sharing the leases file behave like the workers of one host.
+    leases = SQLiteThreadLeases(path=path, renew_seconds=0.01)
+    return ThreadRunCoordinator(policy=policy, queue_timeout_seconds=1, leases=leases, poll_seconds=0.01)
+
+
+def test_leases_reject_runs_of_other_workers(sqlite_path):
+    first_worker, second_worker = _worker(sqlite_path, "reject"), _worker(sqlite_path, "reject")
+
+    async def main():
+        first = asyncio.create_task(_hold(first_worker, "thread", [], "first", seconds=0.1))
+        await asyncio.sleep(0.02)
+        with pytest.raises(ThreadBusyError):
+            await _hold(second_worker, "thread", [], "second")
+        await first
+        await _hold(second_worker, "thread", [], "third")
+
+    asyncio.run(main())
+
+
+def test_leases_cancel_runs_of_other_workers(sqlite_path):
+    first_worker, second_worker = _worker(sqlite_path, "cancel"), _worker(sqlite_path, "cancel")
+
+    async def main() -> ThreadTurn:
+        first = asyncio.create_task(_hold(first_worker, "thread", [], "first", seconds=10))
+        await asyncio.sleep(0.02)
+        async with second_worker.run("thread") as turn:
+            assert first.cancelled()
+        return turn
+
+    assert asyncio.run(main()).preempted
+
+
+class SlowReleaseLeases(SQLiteThreadLeases):
+    async def release(self, thread_id: str, owner: str):
+        await asyncio.sleep(0.05)
+        await super().release(thread_id, owner)
+
+
+def test_run_cancelled_while_releasing_its_lease_frees_the_thread(sqlite_path):
+    leases = SlowReleaseLeases(path=sqlite_path, renew_seconds=0.01)
+    coordinator = ThreadRunCoordinator(policy="cancel", leases=leases, poll_seconds=0.01)
+
+    async def main():
+        first = asyncio.create_task(_hold(coordinator, "thread", [], "first", seconds=10))
+        await asyncio.sleep(0.02)
+        first.cancel()
+        await asyncio.sleep(0.01)
+        # Cancelled again while its lease is being released, like a third run would.
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert not coordinator.is_busy("thread")
+        await asyncio.sleep(0.06)
+        await asyncio.wait_for(_hold(coordinator, "thread", [], "second"), 1)
+
+    asyncio.run(main())
@@ -0,0 +1,30 @@
+from collections.abc import Callable
+
+import pytest
+from ai_librarian_core.cache.answer_cache import AnswerCache
+from ai_librarian_core.catalog.rendering import RecordRenderer
+from ai_librarian_core.scheduling.llm_scheduler import LLMScheduler, ProviderLimits
+from ai_librarian_core.tools.concurrency import ToolConcurrencyLimiter
+from ai_librarian_core.tools.selection import ToolSelector
+from ai_librarian_core.wrapper.http import configure_async_client
+from ai_librarian_core.wrapper.ncl_search import configure_browser_pool
+
+INVALID_SETTINGS: dict[str, tuple[Callable[[], object], str]] = {
+    "tool concurrency": (lambda: ToolConcurrencyLimiter(max_concurrency=0), "max_concurrency must be"),
+    "llm concurrency": (
+        lambda: LLMScheduler(limits={"openai": ProviderLimits(max_concurrency=0)}),
+        "max_concurrency of openai must be",
+    ),
+    "selected tools": (lambda: ToolSelector(top_k=0), "top_k must be"),
+    "description tokens": (lambda: RecordRenderer(max_description_tokens=-1), "max_description_tokens must not be"),
+    "cached answers": (lambda: AnswerCache(max_entries=0), "max_entries must be"),
+    "cache ttl": (lambda: AnswerCache(ttl_seconds=0), "ttl_seconds must be"),
+    "http pool": (lambda: configure_async_client(max_connections=0), "max_connections must be"),
+    "browser pool": (lambda: configure_browser_pool(size=0), "size must be"),
+}
+
+
+@pytest.mark.parametrize(("build", "message"), INVALID_SETTINGS.values(), ids=INVALID_SETTINGS.keys())
+def test_out_of_range_settings_are_rejected(build: Callable[[], object], message: str):
+    with pytest.raises(ValueError, match=message):
+        build()
@@ -0,0 +1,73 @@
+"""Drives `AsyncReactAgent` in-process with a scripted fake chat model and stub tools.
+
+Every conversation streams `--turns` user messages through `agent.stream`. Each turn asks for one round of tool
+calls followed by a streamed answer, so the graph, tool fan-out, checkpointer and message streaming are all
+exercised without network access or API keys.
+
+Usage:
+    uv run python benchmarks/agent_load.py --conversations 200 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import time
+
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
+from ai_librarian_core.observability.metrics import checkpointer_size_bytes
+from fake_agent import add_fake_agent_args, build_fake_agent
+from langchain_core.messages import AIMessageChunk, HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from report import LoadReport
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--conversations", type=int, default=100, help="Number of conversation threads.")
+    parser.add_argument("--turns", type=int, default=2, help="User messages per conversation.")
+    parser.add_argument("--concurrency", type=int, default=50, help="Conversations running at the same time.")
+    add_fake_agent_args(parser)
+    parser.add_argument("--trace-memory", action="store_true", help="Report Python heap per thread (slower).")
+    return parser.parse_args()
+
+
+async def run_conversation(agent: AsyncReactAgent, index: int, turns: int, report: LoadReport):
+    thread_id = f"bench-{index}"
+    for turn in range(turns):
+        start = time.perf_counter()
+        first_token_at = None
+        try:
+            stream = await agent.stream([HumanMessage(content=f"books about topic {index}-{turn}")], thread_id)
+            async for message, _ in stream:
+                if isinstance(message, AIMessageChunk) and message.content:
+                    first_token_at = first_token_at or time.perf_counter()
+                    report.output_tokens += 1
+        except Exception:
+            report.errors += 1
+            continue
+        report.latencies.append(time.perf_counter() - start)
+        if first_token_at is not None:
+            report.ttfts.append(first_token_at - start)
+
+
+async def main():
+    args = parse_args()
+    checkpointer = InMemorySaver()
+    agent = build_fake_agent(args, checkpointer)
+
+    report = LoadReport(name=f"AsyncReactAgent, {args.conversations} conversations x {args.turns} turns")
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def bounded(index: int):
+        async with semaphore:
+            await run_conversation(agent, index, args.turns, report)
+
+    report.start(trace_memory=args.trace_memory)
+    await asyncio.gather(*(bounded(i) for i in range(args.conversations)))
+    report.stop()
+    report.threads = args.conversations
+    report.checkpointer_bytes = checkpointer_size_bytes(checkpointer)
+    report.print()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,105 @@
+"""Replays a skewed mix of frequently asked questions through `AsyncReactAgent` with the answer cache off, exact and
+semantic, using the scripted fake chat model and stub tools.
+
+Every question is asked in a few wordings and popular questions are asked far more often than rare ones, like the
+traffic of a library help desk. Each request opens a new thread, so all of them are cacheable.
+
+Usage:
+    uv run python benchmarks/answer_cache.py --requests 500 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
+from ai_librarian_core.cache.answer_cache import AnswerCache
+from ai_librarian_core.observability.metrics import ANSWER_CACHE_LOOKUPS, checkpointer_size_bytes
+from fake_agent import add_fake_agent_args, build_fake_agent
+from langchain_core.messages import AIMessageChunk, HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from report import LoadReport
+
+FAQ = [
+    ["What are the opening hours?", "what are your opening hours", "What are the library opening hours?"],
+    ["How do I borrow an e-book?", "how do i borrow an ebook", "How do I borrow e-books?"],
+    ["How do I renew a book?", "how can I renew my books", "How do I renew books online?"],
+    ["Where can I return books after hours?", "where do I return books after hours"],
+    ["How many books can I borrow at once?", "how many books can i borrow"],
+    ["圖書館幾點開門？", "圖書館幾點開門", "請問圖書館幾點開門"],
+    ["How do I apply for a library card?", "how do i get a library card"],
+    ["Can I reserve a study room?", "how do I reserve a study room"],
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=300, help="Questions asked per mode.")
+    parser.add_argument("--concurrency", type=int, default=20, help="Questions in flight at the same time.")
+    parser.add_argument("--unique-rate", type=float, default=0.2, help="Share of one-off questions that never repeat.")
+    parser.add_argument("--threshold", type=float, default=0.85, help="Similarity threshold of the semantic mode.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the question mix.")
+    add_fake_agent_args(parser)
+    return parser.parse_args()
+
+
+def question_mix(args: argparse.Namespace) -> list[str]:
+    rng = random.Random(args.seed)
+    # Zipf-like popularity: the first question is asked about twice as often as the second one, and so on.
+    weights = [1 / (rank + 1) for rank in range(len(FAQ))]
+    questions = []
+    for index in range(args.requests):
+        if rng.random() < args.unique_rate:
+            questions.append(f"Do you have books about topic {index}?")
+        else:
+            questions.append(rng.choice(rng.choices(FAQ, weights=weights)[0]))
+    return questions
+
+
+async def ask(agent: AsyncReactAgent, index: int, question: str, report: LoadReport):
+    start = time.perf_counter()
+    first_token_at = None
+    stream = await agent.stream([HumanMessage(content=question)], f"faq-{index}")
+    async for message, _ in stream:
+        if isinstance(message, AIMessageChunk) and message.content:
+            first_token_at = first_token_at or time.perf_counter()
+            report.output_tokens += 1
+    report.latencies.append(time.perf_counter() - start)
+    if first_token_at is not None:
+        report.ttfts.append(first_token_at - start)
+
+
+async def run_mode(mode: str, questions: list[str], args: argparse.Namespace):
+    checkpointer = InMemorySaver()
+    agent = build_fake_agent(args, checkpointer)
+    if mode != "off":
+        agent.answer_cache = AnswerCache(mode=mode, similarity_threshold=args.threshold)
+    report = LoadReport(name=f"answer cache {mode}, {len(questions)} questions")
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def bounded(index: int, question: str):
+        async with semaphore:
+            await ask(agent, index, question, report)
+
+    misses_before = ANSWER_CACHE_LOOKUPS.labels(result="miss").value
+    report.start()
+    await asyncio.gather(*(bounded(index, question) for index, question in enumerate(questions)))
+    report.stop()
+    report.threads = len(questions)
+    report.checkpointer_bytes = checkpointer_size_bytes(checkpointer)
+    report.print()
+    if agent.answer_cache is not None:
+        hits = len(questions) - (ANSWER_CACHE_LOOKUPS.labels(result="miss").value - misses_before)
+        print(f"hit rate:       {hits / len(questions):.1%} ({len(agent.answer_cache)} answers cached)")
+
+
+async def main():
+    args = parse_args()
+    questions = question_mix(args)
+    for mode in ("off", "exact", "semantic"):
+        await run_mode(mode, questions, args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
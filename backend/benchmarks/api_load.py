@@ -0,0 +1,113 @@
+"""Drives the FastAPI `/v1/react/stream` endpoint in-process with a scripted fake chat model and stub tools.
+
+Requests are sent straight to the ASGI app, without sockets, and the time of every SSE body chunk is recorded,
+so the numbers include routing, validation, the agent graph and SSE serialization but no network. The API still
+loads its settings, so `ai_librarian_apis/.env` must exist, but no real API key is needed.
+
+Usage:
+    uv run python benchmarks/api_load.py --requests 200 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "unused")
+
+from ai_librarian_apis.main import app  # noqa: E402
+from ai_librarian_apis.utils.deps import get_react_agent  # noqa: E402
+from ai_librarian_core.observability.metrics import checkpointer_size_bytes  # noqa: E402
+from fake_agent import add_fake_agent_args, build_fake_agent  # noqa: E402
+from langgraph.checkpoint.memory import InMemorySaver  # noqa: E402
+from report import LoadReport  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=100, help="Number of stream requests.")
+    parser.add_argument("--concurrency", type=int, default=50, help="Requests in flight at the same time.")
+    add_fake_agent_args(parser)
+    parser.add_argument("--trace-memory", action="store_true", help="Report Python heap per thread (slower).")
+    return parser.parse_args()
+
+
+async def stream_request(index: int, report: LoadReport):
+    body = json.dumps(
+        {"thread_id": f"bench-{index}", "messages": [{"role": "user", "content": f"books about topic {index}"}]}
+    ).encode()
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/v1/react/stream",
+        "raw_path": b"/v1/react/stream",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        "client": ("127.0.0.1", 0),
+        "server": ("testserver", 80),
+    }
+    request_sent = False
+    response_done = asyncio.Event()
+    start = time.perf_counter()
+    first_token_at = None
+    status = 0
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal first_token_at, status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunk = message.get("body", b"")
+            if chunk.startswith((b"event: llm_start", b"event: llm_delta")):
+                first_token_at = first_token_at or time.perf_counter()
+                report.output_tokens += 1
+            if not message.get("more_body", False):
+                response_done.set()
+
+    await app(scope, receive, send)
+    if status != 200:
+        report.errors += 1
+        return
+    report.latencies.append(time.perf_counter() - start)
+    if first_token_at is not None:
+        report.ttfts.append(first_token_at - start)
+
+
+async def main():
+    args = parse_args()
+    checkpointer = InMemorySaver()
+    # The agent built in lifespan is swapped for one backed by the fake model and stubs.
+    agent = build_fake_agent(args, checkpointer)
+    app.dependency_overrides[get_react_agent] = lambda: agent
+
+    report = LoadReport(name=f"POST /v1/react/stream, {args.requests} requests")
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def bounded(index: int):
+        async with semaphore:
+            await stream_request(index, report)
+
+    async with app.router.lifespan_context(app):
+        report.start(trace_memory=args.trace_memory)
+        await asyncio.gather(*(bounded(i) for i in range(args.requests)))
+        report.stop()
+    report.threads = args.requests
+    report.checkpointer_bytes = checkpointer_size_bytes(checkpointer)
+    report.print()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
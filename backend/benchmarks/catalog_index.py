@@ -0,0 +1,99 @@
+"""Measures the size of the local catalog index and how fast it ingests and answers lookups.
+
+Synthetic English and Chinese book records, the mix NCL and Google Books return, are upserted in batches of one
+catalog search. The file size is reported after the ingest, lookups by title words, author, Chinese title and ISBN
+are timed against it, and a second ingest of the same records measures the incremental upserts of catalog searches
+returning books the index already holds. Compare the lookup latencies with the seconds of `catalog_search`.
+
+Usage:
+    uv run python benchmarks/catalog_index.py --records 100000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from ai_librarian_core.catalog.index import SQLiteCatalogIndex
+from ai_librarian_core.catalog.records import CatalogRecord
+from report import percentile
+
+WORDS = (
+    "artificial intelligence modern approach history taiwan learning deep machine python programming data science "
+    "statistics economics philosophy novel poetry architecture biology chemistry physics music travel cooking"
+).split()
+CHINESE_WORDS = (
+    "人工智慧 臺灣 歷史 機器學習 程式設計 資料科學 統計 經濟 哲學 小說 詩集 建築 生物 化學 物理 音樂 旅行".split()
+)
+SURNAMES = "Smith Chen Wang Lin Lee Huang Murakami Russell Norvig Garcia 吳 王 林 陳 張 李".split()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100_000, help="Records ingested.")
+    parser.add_argument("--batch-size", type=int, default=30, help="Records upserted per catalog search.")
+    parser.add_argument("--lookups", type=int, default=2000, help="Lookups timed per kind.")
+    return parser.parse_args()
+
+
+def make_record(i: int, rng: random.Random) -> CatalogRecord:
+    if i % 2:
+        title = "".join(rng.sample(CHINESE_WORDS, 3)) + f" 第{i}冊"
+    else:
+        title = " ".join(rng.sample(WORDS, 4)).capitalize() + f" volume {i}"
+    isbn = f"978{i:09d}"
+    isbn += str((10 - sum(int(digit) * (3 if j % 2 else 1) for j, digit in enumerate(isbn)) % 10) % 10)
+    return CatalogRecord(
+        title=title,
+        authors=f"{rng.choice(SURNAMES)} {i}",
+        year=str(rng.randint(1950, 2025)),
+        isbn=isbn if i % 3 else None,
+        links={"ncl": f"https://aleweb.ncl.edu.tw/F/{i}"},
+    )
+
+
+def ingest(index: SQLiteCatalogIndex, records: list[CatalogRecord], batch_size: int) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(records), batch_size):
+        index.upsert(records[i : i + batch_size])
+    return time.perf_counter() - start
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(0)
+    records = [make_record(i, rng) for i in range(args.records)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "catalog.sqlite")
+        index = SQLiteCatalogIndex(path)
+        seconds = ingest(index, records, args.batch_size)
+        size = sum(os.path.getsize(file) for file in (path, f"{path}-wal") if os.path.exists(file))
+        print(f"== {index.count()} records, {size / 2**20:.1f} MiB, batches of {args.batch_size}")
+        print(f"ingest          {args.records / seconds:>9.0f} records/s")
+        seconds = ingest(index, records, args.batch_size)
+        print(f"re-upsert       {args.records / seconds:>9.0f} records/s")
+
+        lookups = {
+            "title words": lambda: " ".join(rng.sample(WORDS, 2)),
+            "author": lambda: records[rng.randrange(0, args.records, 2)].authors,
+            "chinese title": lambda: rng.choice(CHINESE_WORDS[:1] + CHINESE_WORDS[3:6]),
+            "isbn": lambda: records[rng.randrange(0, args.records, 3) + 1].isbn or "",
+        }
+        for kind, make_query in lookups.items():
+            latencies = []
+            hits = 0
+            for _ in range(args.lookups):
+                query = make_query()
+                start = time.perf_counter()
+                hits += bool(index.search(query))
+                latencies.append(time.perf_counter() - start)
+            print(
+                f"{kind:<15} p50={percentile(latencies, 50) * 1000:.2f}ms p99={percentile(latencies, 99) * 1000:.2f}ms "
+                f"hits={hits / args.lookups:.0%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
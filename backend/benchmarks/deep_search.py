@@ -0,0 +1,83 @@
+"""Compares the wall time of a deep search against the same research done through the ReAct loop.
+
+Both agents send `--sub-queries` queries to the five catalog and web tools, stubbed with their typical latencies,
+and use a scripted chat model, so no network access or API key is needed. The ReAct agent researches one query per
+tool round, each round waiting for a chat model turn and the slowest tool. `AsyncDeepSearchAgent` plans all queries
+in one call, searches them at once and summarizes the sources in parallel batches.
+
+Usage:
+    uv run python benchmarks/deep_search.py --sub-queries 4 --questions 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from ai_librarian_core.agents.deep_search.asynchronous import (
+    DEFAULT_SEARCH_TOOLS,
+    PLAN_PROMPT,
+    AsyncDeepSearchAgent,
+)
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
+from ai_librarian_core.testing.fake_chat_model import ScriptedChatModel
+from ai_librarian_core.testing.stub_tools import get_stub_tools
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.messages.ai import UsageMetadata
+from langgraph.checkpoint.memory import InMemorySaver
+
+
+class PlanningChatModel(ScriptedChatModel):
+    """Answers the deep search planning prompt with `sub_queries` queries, everything else like its parent."""
+
+    sub_queries: int = 4
+
+    def _next_turn(self, messages: list[BaseMessage]) -> tuple[list[dict], list[str], UsageMetadata]:
+        prefix = PLAN_PROMPT.split("{", 1)[0]
+        if not (isinstance(messages[0], SystemMessage) and messages[0].text().startswith(prefix)):
+            return super()._next_turn(messages)
+        tokens = [f"search query {i}\n" for i in range(self.sub_queries)]
+        return [], tokens, UsageMetadata(input_tokens=100, output_tokens=len(tokens), total_tokens=100 + len(tokens))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sub-queries", type=int, default=4, help="Queries researched per question.")
+    parser.add_argument("--questions", type=int, default=5, help="Questions asked one after another per agent.")
+    parser.add_argument("--ttft", type=float, default=0.5, help="Seconds before the fake model's first chunk.")
+    parser.add_argument("--tokens-per-second", type=float, default=100, help="Streaming rate of the fake model.")
+    return parser.parse_args()
+
+
+async def measure(agent: AsyncReactAgent | AsyncDeepSearchAgent, questions: int) -> list[float]:
+    seconds = []
+    for i in range(questions):
+        start = time.perf_counter()
+        await agent.run([HumanMessage(content=f"Books and papers on topic {i}")], f"thread-{i}")
+        seconds.append(time.perf_counter() - start)
+    return seconds
+
+
+async def main():
+    args = parse_args()
+    tools = [tool for tool in get_stub_tools() if tool.name in DEFAULT_SEARCH_TOOLS]
+    model = {"time_to_first_token": args.ttft, "tokens_per_second": args.tokens_per_second, "response_tokens": 50}
+
+    react_llm = ScriptedChatModel(tool_names=[tool.name for tool in tools], tool_rounds=args.sub_queries, **model)
+    react_agent = AsyncReactAgent(
+        tools=tools, checkpointer=InMemorySaver(), chat_model_factory=lambda llm_config: react_llm
+    )
+    deep_search_llm = PlanningChatModel(sub_queries=args.sub_queries, **model)
+    deep_search_agent = AsyncDeepSearchAgent(
+        tools=tools, checkpointer=InMemorySaver(), chat_model_factory=lambda llm_config: deep_search_llm
+    )
+
+    calls = args.sub_queries * len(tools)
+    print(f"== {args.sub_queries} queries x {len(tools)} tools = {calls} tool calls per question")
+    for name, agent in (("react", react_agent), ("deep_search", deep_search_agent)):
+        seconds = await measure(agent, args.questions)
+        print(f"{name:<12}    median={statistics.median(seconds):.2f}s max={max(seconds):.2f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,34 @@
+"""Builds an `AsyncReactAgent` backed by the scripted fake chat model and stub tools from command line options."""
+
+import argparse
+
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
+from ai_librarian_core.testing.fake_chat_model import ScriptedChatModel
+from ai_librarian_core.testing.stub_tools import DEFAULT_STUB_LATENCIES, get_stub_tools
+from langgraph.checkpoint.base import BaseCheckpointSaver
+
+
+def add_fake_agent_args(parser: argparse.ArgumentParser):
+    group = parser.add_argument_group("fake agent")
+    group.add_argument("--tools", default="ncl_search,wikipedia", help="Comma-separated tools called per turn.")
+    group.add_argument("--tool-latency-scale", type=float, default=0.1, help="Multiplier for the stub latencies.")
+    group.add_argument("--ttft", type=float, default=0.05, help="Seconds before the fake model's first chunk.")
+    group.add_argument(
+        "--tokens-per-second", type=float, default=500, help="Streaming rate of the fake model, 0 for unthrottled."
+    )
+    group.add_argument("--response-tokens", type=int, default=100, help="Tokens per answer.")
+
+
+def build_fake_agent(args: argparse.Namespace, checkpointer: BaseCheckpointSaver) -> AsyncReactAgent:
+    llm = ScriptedChatModel(
+        tool_names=[name for name in args.tools.split(",") if name],
+        time_to_first_token=args.ttft,
+        tokens_per_second=args.tokens_per_second or None,
+        response_tokens=args.response_tokens,
+    )
+    latencies = {name: latency * args.tool_latency_scale for name, latency in DEFAULT_STUB_LATENCIES.items()}
+    return AsyncReactAgent(
+        tools=get_stub_tools(latencies),
+        checkpointer=checkpointer,
+        chat_model_factory=lambda llm_config: llm,
+    )
@@ -0,0 +1,64 @@
+"""Serves the API on a local port with the scripted fake chat model and stub tools instead of real providers.
+
+Used as the target of `sse_load.py` and `worker_scaling.py`. With `--workers`, every worker process builds its own
+fake agent with an in-memory checkpointer, so a thread is only remembered by the worker that served it. The API
+still loads its settings, so `ai_librarian_apis/.env` must exist, but no real API key is needed.
+
+Usage:
+    uv run python benchmarks/fake_server.py --port 8765 --tokens-per-second 50
+    uv run python benchmarks/fake_server.py --port 8765 --workers 4
+"""
+
+import argparse
+import json
+import os
+import sys
+
+os.environ.setdefault("OPENAI_API_KEY", "unused")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import uvicorn  # noqa: E402
+from ai_librarian_apis.main import create_app as create_api_app  # noqa: E402
+from ai_librarian_apis.utils.deps import get_react_agent  # noqa: E402
+from fake_agent import add_fake_agent_args, build_fake_agent  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from langgraph.checkpoint.memory import InMemorySaver  # noqa: E402
+
+# The command line options, passed on to the worker processes.
+ARGS_ENV = "FAKE_SERVER_ARGS"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes, each with its own fake agent.")
+    add_fake_agent_args(parser)
+    return parser.parse_args(argv)
+
+
+def create_app() -> FastAPI:
+    """Builds the API with the fake agent, called in every worker process."""
+    args = parse_args(json.loads(os.environ.get(ARGS_ENV, "[]")))
+    agent = build_fake_agent(args, InMemorySaver())
+    app = create_api_app()
+    app.dependency_overrides[get_react_agent] = lambda: agent
+    return app
+
+
+def main():
+    args = parse_args()
+    os.environ[ARGS_ENV] = json.dumps(sys.argv[1:])
+    uvicorn.run(
+        "fake_server:create_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        log_level="warning",
+        backlog=4096,
+    )
+
+
+if __name__ == "__main__":
+    main()
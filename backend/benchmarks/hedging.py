@@ -0,0 +1,124 @@
+"""Streams questions through `AsyncReactAgent` while the primary provider has latency spikes and errors, without and
+with hedging to a backup provider.
+
+Both providers are local `ScriptedChatModel`s chosen by model name, the primary one is faster but a share of its
+requests start `--spike-seconds` late or fail before the first token. The agent calls no tools, so the measured time
+to first token is the chat model's.
+
+Usage:
+    uv run python benchmarks/hedging.py --requests 300 --spike-rate 0.05 --error-rate 0.02
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
+from ai_librarian_core.agents.react.hedging import HedgePolicy
+from ai_librarian_core.models.llm_config import LLMConfig, Model
+from ai_librarian_core.observability.metrics import HEDGE_WINNERS, HEDGED_REQUESTS, checkpointer_size_bytes
+from ai_librarian_core.testing.fake_chat_model import ScriptedChatModel
+from langchain_core.messages import AIMessageChunk, HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from report import LoadReport
+
+PRIMARY = Model.OPENAI_GPT_4O_MINI
+BACKUP = Model.ANTHROPIC_CLAUDE_3_5_HAIKU
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=300, help="Questions streamed per mode.")
+    parser.add_argument("--concurrency", type=int, default=20, help="Questions in flight at the same time.")
+    parser.add_argument("--primary-ttft", type=float, default=0.1, help="Usual first token delay of the primary.")
+    parser.add_argument("--backup-ttft", type=float, default=0.2, help="First token delay of the backup.")
+    parser.add_argument("--spike-rate", type=float, default=0.05, help="Share of primary requests with a spike.")
+    parser.add_argument("--spike-seconds", type=float, default=3.0, help="Extra first token delay of a spike.")
+    parser.add_argument("--error-rate", type=float, default=0.02, help="Share of primary requests that fail.")
+    parser.add_argument("--percentile", type=float, default=95, help="Percentile of the hedging deadline.")
+    parser.add_argument("--initial-deadline", type=float, default=0.5, help="Deadline before enough samples.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the spikes and errors.")
+    return parser.parse_args()
+
+
+def build_agent(args: argparse.Namespace, hedged: bool) -> AsyncReactAgent:
+    models = {
+        PRIMARY: ScriptedChatModel(
+            time_to_first_token=args.primary_ttft,
+            spike_rate=args.spike_rate,
+            spike_seconds=args.spike_seconds,
+            error_rate=args.error_rate,
+            model_name="primary",
+        ),
+        BACKUP: ScriptedChatModel(time_to_first_token=args.backup_ttft, model_name="backup"),
+    }
+    return AsyncReactAgent(
+        tools=[],
+        checkpointer=InMemorySaver(),
+        chat_model_factory=lambda llm_config: models[llm_config.model],
+        hedge_policy=(
+            HedgePolicy(backups={PRIMARY: BACKUP}, percentile=args.percentile, initial_deadline=args.initial_deadline)
+            if hedged
+            else None
+        ),
+    )
+
+
+def hedged_count() -> float:
+    return sum(
+        HEDGED_REQUESTS.labels(model=PRIMARY, backup=BACKUP, trigger=trigger).value for trigger in ("deadline", "error")
+    )
+
+
+async def ask(agent: AsyncReactAgent, index: int, report: LoadReport):
+    start = time.perf_counter()
+    first_token_at = None
+    try:
+        stream = await agent.stream([HumanMessage(content=f"question {index}")], llm_config=LLMConfig(model=PRIMARY))
+        async for message, _ in stream:
+            if isinstance(message, AIMessageChunk) and message.content:
+                first_token_at = first_token_at or time.perf_counter()
+                report.output_tokens += 1
+    except Exception:
+        report.errors += 1
+        return
+    report.latencies.append(time.perf_counter() - start)
+    if first_token_at is not None:
+        report.ttfts.append(first_token_at - start)
+
+
+async def run_mode(args: argparse.Namespace, hedged: bool):
+    random.seed(args.seed)
+    agent = build_agent(args, hedged)
+    report = LoadReport(name=f"{'hedged' if hedged else 'primary only'}, {args.requests} questions")
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def bounded(index: int):
+        async with semaphore:
+            await ask(agent, index, report)
+
+    hedges_before = hedged_count()
+    backup_wins_before = HEDGE_WINNERS.labels(model=BACKUP).value
+    report.start()
+    await asyncio.gather(*(bounded(index) for index in range(args.requests)))
+    report.stop()
+    report.threads = args.requests
+    report.checkpointer_bytes = checkpointer_size_bytes(agent.checkpointer)
+    report.print()
+    if hedged:
+        print(
+            f"hedged:         {(hedged_count() - hedges_before) / args.requests:.1%} of requests, "
+            f"{HEDGE_WINNERS.labels(model=BACKUP).value - backup_wins_before:.0f} answered by the backup, "
+            f"deadline now {agent.hedge_policy.deadline(PRIMARY) * 1000:.0f}ms"
+        )
+
+
+async def main():
+    args = parse_args()
+    for hedged in (False, True):
+        await run_mode(args, hedged)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
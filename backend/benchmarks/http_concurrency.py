@@ -0,0 +1,257 @@
+"""Measures the threads and sockets 100 concurrent Wikipedia, arXiv and YouTube calls use, sync wrappers vs async.
+
+A local server in a child process answers the Wikipedia API, the arXiv API and the YouTube results page after a
+fixed latency, so no network access is needed. Every tool is called `--calls` times at once with `ainvoke`, first
+as LangChain's synchronous tool, which the async graph runs on the default thread pool, then as the native async
+tool using the shared `httpx.AsyncClient`. The peak threads and open sockets of this process are sampled during
+the calls, the server counts the connections and requests it accepted. Sockets are counted in `/proc/self/fd`,
+so the socket columns need Linux.
+
+Usage:
+    uv run python benchmarks/http_concurrency.py --calls 100 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import arxiv
+import requests
+import wikipedia
+import youtube_search
+from ai_librarian_core.tools.arxiv import AsyncArxivQueryRun
+from ai_librarian_core.tools.wikipedia import AsyncWikipediaQueryRun
+from ai_librarian_core.tools.youtube import SchemaedYouTubeSearchTool
+from ai_librarian_core.wrapper import arxiv as arxiv_wrapper
+from ai_librarian_core.wrapper import wikipedia as wikipedia_wrapper
+from ai_librarian_core.wrapper import youtube as youtube_wrapper
+from ai_librarian_core.wrapper.http import aclose_async_client
+from langchain_community.tools import ArxivQueryRun, WikipediaQueryRun
+from langchain_community.tools.youtube.search import YouTubeSearchTool
+from langchain_community.utilities import WikipediaAPIWrapper
+
+SUMMARY = "The National Central Library is the national library of Taiwan, founded in 1933. " * 4
+ARXIV_ENTRY = """<entry>
+<id>http://arxiv.org/abs/1605.0838{i}v1</id><updated>2016-05-26T17:59:46Z</updated>
+<published>2016-05-26T17:59:46Z</published><title>Heat-bath random walks with Markov bases {i}</title>
+<summary>{summary}</summary><author><name>Caprice Stanley</name></author><author><name>Tobias Windisch</name></author>
+<link href="http://arxiv.org/abs/1605.0838{i}v1" rel="alternate" type="text/html"/>
+<arxiv:primary_category term="math.CO" scheme="http://arxiv.org/schemas/atom"/>
+<category term="math.CO" scheme="http://arxiv.org/schemas/atom"/>
+</entry>"""
+ARXIV_FEED = (
+    '<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom" '
+    'xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/" xmlns:arxiv="http://arxiv.org/schemas/atom">'
+    "<title>arXiv Query</title><id>http://arxiv.org/api/query</id><updated>2016-05-27T00:00:00-04:00</updated>"
+    "<opensearch:totalResults>3</opensearch:totalResults><opensearch:startIndex>0</opensearch:startIndex>"
+    "<opensearch:itemsPerPage>3</opensearch:itemsPerPage>"
+    + "".join(ARXIV_ENTRY.format(i=i, summary=SUMMARY) for i in range(3))
+    + "</feed>"
+)
+YOUTUBE_DATA = {
+    "contents": {
+        "twoColumnSearchResultsRenderer": {
+            "primaryContents": {
+                "sectionListRenderer": {
+                    "contents": [
+                        {
+                            "itemSectionRenderer": {
+                                "contents": [
+                                    {
+                                        "videoRenderer": {
+                                            "videoId": f"video{i}",
+                                            "title": {"runs": [{"text": f"Library tour {i}"}]},
+                                            "longBylineText": {"runs": [{"text": "National Central Library"}]},
+                                            "navigationEndpoint": {
+                                                "commandMetadata": {"webCommandMetadata": {"url": f"/watch?v=video{i}"}}
+                                            },
+                                        }
+                                    }
+                                    for i in range(5)
+                                ]
+                            }
+                        }
+                    ]
+                }
+            }
+        }
+    }
+}
+YOUTUBE_PAGE = f"<html><script>var ytInitialData = {json.dumps(YOUTUBE_DATA)};</script></html>"
+
+
+class ClientArxivQueryRun(ArxivQueryRun):
+    """`ArxivQueryRun` searching with `arxiv.Client`, as `Search.results` is gone from newer `arxiv` releases."""
+
+    def _run(self, query: str, run_manager=None) -> str:
+        search = arxiv.Search(query=query, max_results=self.api_wrapper.top_k_results)
+        return "\n\n".join(
+            f"Title: {result.title}\nSummary: {result.summary}" for result in arxiv.Client().results(search)
+        )
+
+
+def wikipedia_response(params: dict[str, str]) -> dict:
+    if params.get("generator") == "search":
+        pages = [
+            {"pageid": i, "title": f"Page {i}", "index": i + 1, "extract": SUMMARY}
+            for i in range(int(params["gsrlimit"]))
+        ]
+        return {"query": {"pages": pages}}
+    if params.get("list") == "search":
+        return {"query": {"search": [{"title": f"Page {i}"} for i in range(int(params["srlimit"]))]}}
+    # The `wikipedia` package fetches a page's info and then its summary.
+    if params.get("prop") == "extracts":
+        return {"query": {"pages": {"1": {"extract": SUMMARY}}}}
+    title = params["titles"]
+    return {"query": {"pages": {"1": {"pageid": 1, "title": title, "fullurl": f"https://wiki/{title}"}}}}
+
+
+class BenchmarkHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Read by the constructor when it starts listening, the default backlog of 5 drops connections of a burst.
+    request_queue_size = 1024
+
+
+def serve(port: int, latency: float, connections, requests_served, ready):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            with connections.get_lock():
+                connections.value += 1
+
+        def do_GET(self):
+            time.sleep(latency)
+            url = urllib.parse.urlsplit(self.path)
+            params = dict(urllib.parse.parse_qsl(url.query))
+            if url.path == "/w/api.php":
+                body, content_type = json.dumps(wikipedia_response(params)).encode(), "application/json"
+            elif url.path == "/api/query":
+                body, content_type = ARXIV_FEED.encode(), "application/atom+xml"
+            else:
+                body, content_type = YOUTUBE_PAGE.encode(), "text/html"
+            with requests_served.get_lock():
+                requests_served.value += 1
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = BenchmarkHTTPServer(("127.0.0.1", port), Handler)
+    ready.set()
+    server.serve_forever()
+
+
+def point_at(base_url: str):
+    """Sends every wrapper's requests to the local server instead of Wikipedia, arXiv and YouTube."""
+    wikipedia.wikipedia.API_URL = f"{base_url}/w/api.php"
+    arxiv.Client.query_url_format = f"{base_url}/api/query?{{}}"
+    youtube_get = requests.get
+    youtube_search.requests = type(
+        "Requests",
+        (),
+        {
+            "get": staticmethod(
+                lambda url, **kwargs: youtube_get(url.replace("https://youtube.com", base_url), **kwargs)
+            )
+        },
+    )
+    wikipedia_wrapper.WIKIPEDIA_API_URL = f"{base_url}/w/api.php"
+    arxiv_wrapper.ARXIV_API_URL = f"{base_url}/api/query"
+    youtube_wrapper.YOUTUBE_SEARCH_URL = f"{base_url}/results"
+
+
+def open_sockets() -> int:
+    count = 0
+    for fd in os.listdir("/proc/self/fd"):
+        try:
+            count += os.readlink(f"/proc/self/fd/{fd}").startswith("socket:")
+        except OSError:
+            pass
+    return count
+
+
+async def measure(tool, calls: int, connections, requests_served) -> dict[str, float]:
+    peak = {"threads": 0, "sockets": 0}
+    done = asyncio.Event()
+
+    async def sample():
+        while not done.is_set():
+            peak["threads"] = max(peak["threads"], threading.active_count() - threads_before)
+            peak["sockets"] = max(peak["sockets"], open_sockets() - sockets_before)
+            await asyncio.sleep(0.002)
+
+    # A new default executor and client, so threads and connections are not reused from the previous tool.
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor())
+    await aclose_async_client()
+    threads_before, sockets_before = threading.active_count(), open_sockets()
+    connections.value = requests_served.value = 0
+    sampler = asyncio.create_task(sample())
+    start = time.perf_counter()
+    outputs = await asyncio.gather(*(tool.ainvoke({"query": f"library {i}"}) for i in range(calls)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await sampler
+    assert all(outputs), f"{tool.name} returned an empty output"
+    return {**peak, "connections": connections.value, "requests": requests_served.value, "seconds": elapsed}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=100, help="Concurrent calls of each tool.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds the server takes per request.")
+    parser.add_argument("--port", type=int, default=8766)
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+    connections, requests_served, ready = (
+        multiprocessing.Value("i", 0),
+        multiprocessing.Value("i", 0),
+        multiprocessing.Event(),
+    )
+    server = multiprocessing.Process(
+        target=serve, args=(args.port, args.latency, connections, requests_served, ready), daemon=True
+    )
+    server.start()
+    ready.wait()
+    tools = {
+        "wikipedia": (WikipediaQueryRun(api_wrapper=WikipediaAPIWrapper()), AsyncWikipediaQueryRun()),
+        "arxiv": (ClientArxivQueryRun(), AsyncArxivQueryRun()),
+        "youtube_search": (YouTubeSearchTool(), SchemaedYouTubeSearchTool()),
+    }
+    # After the tools, `WikipediaAPIWrapper` sets the `wikipedia` package's API url to its language.
+    point_at(f"http://127.0.0.1:{args.port}")
+    print(
+        f"== {args.calls} concurrent calls per tool, {args.latency * 1000:.0f}ms per request, "
+        f"{ThreadPoolExecutor()._max_workers} default executor threads"
+    )
+    try:
+        for name, (sync_tool, async_tool) in tools.items():
+            for kind, tool in (("sync", sync_tool), ("async", async_tool)):
+                result = await measure(tool, args.calls, connections, requests_served)
+                print(
+                    f"{name:<15} {kind:<5} threads={result['threads']:>3}  sockets={result['sockets']:>3}  "
+                    f"connections={result['connections']:>4}  requests={result['requests']:>4}  "
+                    f"wall={result['seconds']:.2f}s"
+                )
+    finally:
+        await aclose_async_client()
+        server.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
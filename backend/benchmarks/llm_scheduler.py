@@ -0,0 +1,104 @@
+"""Sends a burst of interactive and batch questions through `AsyncReactAgent` with a scripted provider limited by
+`LLMScheduler`, and measures queue waits per priority, shed requests and fairness between threads.
+
+The burst starts with the batch questions, then the interactive ones arrive while the batch backlog is queued. A
+second run queues many requests of one thread before a single request of another thread, to show that threads take
+turns instead of waiting behind each other.
+
+Usage:
+    uv run python benchmarks/llm_scheduler.py --batch 200 --interactive 50 --max-concurrency 8
+"""
+
+import argparse
+import asyncio
+import time
+
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
+from ai_librarian_core.models.llm_config import LLMConfig, Model
+from ai_librarian_core.scheduling.llm_scheduler import LLMOverloadedError, LLMScheduler, ProviderLimits
+from ai_librarian_core.testing.fake_chat_model import ScriptedChatModel
+from langchain_core.messages import HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from report import percentile
+
+MODEL = Model.OPENAI_GPT_4O_MINI
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch", type=int, default=200, help="Batch questions sent first.")
+    parser.add_argument("--interactive", type=int, default=50, help="Interactive questions sent after them.")
+    parser.add_argument("--max-concurrency", type=int, default=8, help="Requests the provider allows in flight.")
+    parser.add_argument("--tokens-per-minute", type=int, default=None, help="Token budget of the provider.")
+    parser.add_argument("--max-queue-depth", type=int, default=150, help="Queued requests before batch is shed.")
+    parser.add_argument("--ttft", type=float, default=0.1, help="Seconds before the fake model's first chunk.")
+    return parser.parse_args()
+
+
+def build_agent(args: argparse.Namespace) -> AsyncReactAgent:
+    llm = ScriptedChatModel(time_to_first_token=args.ttft, tokens_per_second=500, response_tokens=50)
+    scheduler = LLMScheduler(
+        limits={"openai": ProviderLimits(args.max_concurrency, args.tokens_per_minute)},
+        max_queue_depth={"interactive": args.max_queue_depth * 2, "batch": args.max_queue_depth},
+    )
+    return AsyncReactAgent(
+        tools=[], checkpointer=InMemorySaver(), chat_model_factory=lambda llm_config: llm, llm_scheduler=scheduler
+    )
+
+
+async def ask(agent: AsyncReactAgent, thread_id: str, priority: str, seconds: list[float]) -> bool:
+    start = time.perf_counter()
+    try:
+        await agent.run(
+            [HumanMessage(content=f"question of {thread_id}")], thread_id, LLMConfig(model=MODEL), priority=priority
+        )
+    except LLMOverloadedError:
+        return False
+    seconds.append(time.perf_counter() - start)
+    return True
+
+
+async def priorities(args: argparse.Namespace):
+    agent = build_agent(args)
+    seconds = {"batch": [], "interactive": []}
+    batch = [asyncio.create_task(ask(agent, f"batch-{i}", "batch", seconds["batch"])) for i in range(args.batch)]
+    await asyncio.sleep(0.05)
+    interactive = [
+        asyncio.create_task(ask(agent, f"user-{i}", "interactive", seconds["interactive"]))
+        for i in range(args.interactive)
+    ]
+    batch_done = await asyncio.gather(*batch)
+    interactive_done = await asyncio.gather(*interactive)
+
+    print(f"== {args.batch} batch then {args.interactive} interactive, max_concurrency={args.max_concurrency}")
+    for priority, done in (("batch", batch_done), ("interactive", interactive_done)):
+        print(
+            f"{priority:<12}    {sum(done)} answered, {len(done) - sum(done)} shed, latency "
+            f"p50={percentile(seconds[priority], 50) * 1000:.0f}ms p99={percentile(seconds[priority], 99) * 1000:.0f}ms"
+        )
+
+
+async def fairness(args: argparse.Namespace):
+    scheduler = LLMScheduler(limits={"openai": ProviderLimits(max_concurrency=1)})
+    finished: list[str] = []
+
+    async def request(thread_id: str):
+        async with scheduler.admit(MODEL, thread_id):
+            await asyncio.sleep(0.01)
+        finished.append(thread_id)
+
+    tasks = [asyncio.create_task(request("busy")) for _ in range(20)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(request("quiet")))
+    await asyncio.gather(*tasks)
+    print(f"fairness:       the quiet thread finished {finished.index('quiet') + 1} of {len(finished)}")
+
+
+async def main():
+    args = parse_args()
+    await priorities(args)
+    await fairness(args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
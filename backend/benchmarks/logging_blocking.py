@@ -0,0 +1,118 @@
+"""Measures how long log calls block the event loop with direct and queued handlers.
+
+Emits a burst of log records from a coroutine while a ticker task measures event loop lag, once with the
+handlers called on the event loop thread and once through the `QueueHandler` used by the API. stderr is
+redirected to one of two sinks:
+
+- "file": a temporary file, a fast local disk. A write costs a few microseconds, the queue only adds the hand-over
+  and the listener thread competing for the GIL, so it is not faster here.
+- "stalling": a stream that blocks for `--stall-ms` on every `--stall-every`-th write, like a full stderr pipe, a
+  slow terminal or a log shipper applying back pressure. A direct log call waits out the stall on the event loop,
+  a queued one does not.
+
+Usage:
+    uv run python benchmarks/logging_blocking.py --records 5000 --stall-ms 5 --stall-every 50
+"""
+
+import argparse
+import asyncio
+import io
+import logging
+import statistics
+import sys
+import tempfile
+import time
+from typing import TextIO
+
+from ai_librarian_apis.core.logger import _stop_queue_listener, setup_logging
+
+TICK_INTERVAL = 0.001
+
+
+class StallingSink(io.StringIO):
+    """A text stream that blocks for `stall_seconds` on every `every`-th write and discards the text."""
+
+    def __init__(self, stall_seconds: float, every: int):
+        """Initializes the sink with the length and frequency of its stalls."""
+        super().__init__()
+        self.stall_seconds = stall_seconds
+        self.every = every
+        self.writes = 0
+
+    def write(self, s: str) -> int:
+        self.writes += 1
+        if self.writes % self.every == 0:
+            time.sleep(self.stall_seconds)
+        return len(s)
+
+
+async def ticker(lags: list[float], stop: asyncio.Event):
+    while not stop.is_set():
+        expected = time.perf_counter() + TICK_INTERVAL
+        await asyncio.sleep(TICK_INTERVAL)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def emit(logger: logging.Logger, records: int, latencies: list[float]):
+    for i in range(records):
+        start = time.perf_counter()
+        logger.info("retrieved %d results for query %r", i, "Python", extra={"thread_id": "bench"})
+        latencies.append(time.perf_counter() - start)
+        if i % 10 == 0:
+            await asyncio.sleep(0)
+
+
+async def measure(queued: bool, records: int) -> tuple[list[float], list[float]]:
+    setup_logging(level="INFO", queued=queued)
+    logger = logging.getLogger("benchmark")
+    latencies: list[float] = []
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker_task = asyncio.create_task(ticker(lags, stop))
+    await emit(logger, records, latencies)
+    stop.set()
+    await ticker_task
+    _stop_queue_listener()
+    return latencies, lags
+
+
+def percentile(values: list[float], q: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1] * 1_000_000
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=5000, help="Log records emitted per run.")
+    parser.add_argument("--stall-ms", type=float, default=5, help="How long the stalling sink blocks a write.")
+    parser.add_argument("--stall-every", type=int, default=50, help="Every how many writes the stalling sink blocks.")
+    return parser.parse_args()
+
+
+async def run(sink: TextIO, records: int) -> dict[str, tuple[list[float], list[float]]]:
+    stderr = sys.stderr
+    sys.stderr = sink
+    try:
+        return {mode: await measure(queued=mode == "queued", records=records) for mode in ("direct", "queued")}
+    finally:
+        sys.stderr = stderr
+
+
+async def main():
+    args = parse_args()
+    with tempfile.TemporaryFile("w") as file_sink:
+        sinks: dict[str, TextIO] = {
+            "file": file_sink,
+            "stalling": StallingSink(stall_seconds=args.stall_ms / 1000, every=args.stall_every),
+        }
+        for sink_name, sink in sinks.items():
+            print(f"== {sink_name} sink, {args.records} records")
+            for mode, (latencies, lags) in (await run(sink, args.records)).items():
+                print(
+                    f"{mode:>6}: log call p50={percentile(latencies, 50):.1f}us p99={percentile(latencies, 99):.1f}us "
+                    f"max={max(latencies) * 1_000_000:.0f}us, "
+                    f"loop lag p99={percentile(lags, 99) / 1000:.2f}ms max={max(lags) * 1000:.2f}ms"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
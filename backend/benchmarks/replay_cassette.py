@@ -0,0 +1,80 @@
+"""Replays a recorded cassette against the current `AsyncReactAgent`.
+
+The user messages of every recorded thread are sent again, while the chat model and tools are served from the
+cassette. With `--realtime` the recorded model and tool timings are kept, so latency changes come from the graph,
+checkpointer and streaming code under test. Without it everything is served as fast as possible, which isolates
+their CPU cost. Record a cassette by setting `CASSETTE_RECORD_PATH` for the API.
+
+Usage:
+    uv run python benchmarks/replay_cassette.py logs/session.jsonl.gz --realtime --concurrency 20
+"""
+
+import argparse
+import asyncio
+import time
+
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
+from ai_librarian_core.observability.metrics import checkpointer_size_bytes
+from ai_librarian_core.testing.cassette import Cassette
+from langchain_core.messages import AIMessageChunk, BaseMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from report import LoadReport
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cassette", help="Path to a .jsonl or .jsonl.gz cassette.")
+    parser.add_argument("--realtime", action="store_true", help="Keep the recorded model and tool timings.")
+    parser.add_argument("--concurrency", type=int, default=20, help="Threads replayed at the same time.")
+    parser.add_argument("--trace-memory", action="store_true", help="Report Python heap per thread (slower).")
+    return parser.parse_args()
+
+
+async def replay_thread(agent: AsyncReactAgent, thread_id: str, turns: list[BaseMessage], report: LoadReport):
+    for message in turns:
+        start = time.perf_counter()
+        first_token_at = None
+        try:
+            stream = await agent.stream([message], thread_id)
+            async for chunk, _ in stream:
+                if isinstance(chunk, AIMessageChunk) and chunk.content:
+                    first_token_at = first_token_at or time.perf_counter()
+                    report.output_tokens += 1
+        except Exception as e:
+            print(f"{thread_id}: {e!r}")
+            report.errors += 1
+            return
+        report.latencies.append(time.perf_counter() - start)
+        if first_token_at is not None:
+            report.ttfts.append(first_token_at - start)
+
+
+async def main():
+    args = parse_args()
+    cassette = Cassette.load(args.cassette, realtime=args.realtime)
+    sessions = cassette.sessions()
+    checkpointer = InMemorySaver()
+    agent = AsyncReactAgent(
+        tools=cassette.replay_tools(),
+        checkpointer=checkpointer,
+        chat_model_factory=cassette.chat_model_factory(),
+    )
+
+    mode = "realtime" if args.realtime else "as fast as possible"
+    report = LoadReport(name=f"Replay of {len(sessions)} threads, {mode}")
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def bounded(thread_id: str, turns: list[BaseMessage]):
+        async with semaphore:
+            await replay_thread(agent, thread_id, turns, report)
+
+    report.start(trace_memory=args.trace_memory)
+    await asyncio.gather(*(bounded(thread_id, turns) for thread_id, turns in sessions.items()))
+    report.stop()
+    report.threads = len(sessions)
+    report.checkpointer_bytes = checkpointer_size_bytes(checkpointer)
+    report.print()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
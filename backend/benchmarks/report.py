@@ -0,0 +1,68 @@
+"""Shared measurement and reporting helpers for the load benchmarks."""
+
+import math
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return float("nan")
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[round(q) - 1]
+
+
+@dataclass
+class LoadReport:
+    """Collects per-request measurements of one benchmark run and prints a summary."""
+
+    name: str
+    latencies: list[float] = field(default_factory=list)
+    ttfts: list[float] = field(default_factory=list)
+    output_tokens: int = 0
+    errors: int = 0
+    threads: int = 0
+    checkpointer_bytes: float = float("nan")
+    heap_bytes: float = float("nan")
+
+    def __post_init__(self):
+        self._wall_start = self._cpu_start = 0.0
+        self.wall_seconds = self.cpu_seconds = 0.0
+
+    def start(self, trace_memory: bool = False):
+        if trace_memory:
+            tracemalloc.start()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    def stop(self):
+        self.wall_seconds = time.perf_counter() - self._wall_start
+        self.cpu_seconds = time.process_time() - self._cpu_start
+        if tracemalloc.is_tracing():
+            self.heap_bytes = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+    def print(self):
+        requests = len(self.latencies)
+        threads = max(self.threads, 1)
+        print(f"== {self.name}")
+        print(f"requests:       {requests} ({self.errors} errors) in {self.wall_seconds:.2f}s")
+        print(
+            f"throughput:     {requests / self.wall_seconds:.1f} req/s, "
+            f"{self.output_tokens / self.wall_seconds:.0f} tok/s"
+        )
+        print(
+            f"latency:        p50={percentile(self.latencies, 50) * 1000:.0f}ms "
+            f"p99={percentile(self.latencies, 99) * 1000:.0f}ms"
+        )
+        print(
+            f"ttft:           p50={percentile(self.ttfts, 50) * 1000:.0f}ms "
+            f"p99={percentile(self.ttfts, 99) * 1000:.0f}ms"
+        )
+        print(f"cpu per token:  {self.cpu_seconds / max(self.output_tokens, 1) * 1_000_000:.0f}us")
+        print(f"checkpoint/thr: {self.checkpointer_bytes / threads / 1024:.1f}KiB")
+        if not math.isnan(self.heap_bytes):
+            print(f"heap/thread:    {self.heap_bytes / threads / 1024:.1f}KiB")
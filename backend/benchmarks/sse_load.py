@@ -0,0 +1,183 @@
+"""Opens many concurrent `/v1/react/stream` connections against a running server, like a fleet of kiosks.
+
+Every simulated user waits for a random think time, sends a message of random length on its own thread and reads
+the SSE stream to the end. A share of the users hangs up mid-stream on purpose. The server's RSS and open
+streams are scraped from `/metrics` once per second. Run it against `fake_server.py` to measure the capacity of
+one worker without provider latency or cost, or pass `--spawn-server` to start one.
+
+Usage:
+    uv run python benchmarks/sse_load.py --spawn-server --users 1000 --duration 60 --think-time 2
+    uv run python benchmarks/sse_load.py --url http://127.0.0.1:8765 --users 2000 --disconnect-rate 0.1
+"""
+
+import argparse
+import asyncio
+import random
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+from report import percentile
+
+WORDS = "library book borrow return opening hours renew e-book catalog author novel history science".split()
+
+
+@dataclass
+class SSELoadStats:
+    requests: int = 0
+    completed: int = 0
+    hung_up: int = 0
+    dropped: int = 0
+    events: int = 0
+    ttfts: list[float] = field(default_factory=list)
+    rss_samples: list[float] = field(default_factory=list)
+    max_active_streams: float = 0.0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:8765", help="Base URL of the server under test.")
+    parser.add_argument("--users", type=int, default=500, help="Number of concurrent simulated users.")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to keep sending requests.")
+    parser.add_argument("--ramp-up", type=float, default=5, help="Seconds over which the users are started.")
+    parser.add_argument("--think-time", type=float, default=1.0, help="Mean seconds between two messages of a user.")
+    parser.add_argument("--min-words", type=int, default=3, help="Minimum words per message.")
+    parser.add_argument("--max-words", type=int, default=40, help="Maximum words per message.")
+    parser.add_argument("--disconnect-rate", type=float, default=0.05, help="Share of streams abandoned midway.")
+    parser.add_argument("--timeout", type=float, default=120, help="Seconds before a stream counts as dropped.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for think times, messages and hang-ups.")
+    parser.add_argument("--spawn-server", action="store_true", help="Start fake_server.py on the --url port.")
+    return parser.parse_args()
+
+
+async def stream_once(client: httpx.AsyncClient, user: int, rng: random.Random, args, stats: SSELoadStats):
+    words = rng.choices(WORDS, k=rng.randint(args.min_words, args.max_words))
+    body = {"thread_id": f"kiosk-{user}", "messages": [{"role": "user", "content": " ".join(words)}]}
+    hang_up_after = rng.randint(1, 20) if rng.random() < args.disconnect_rate else None
+    start = time.perf_counter()
+    events = 0
+    stats.requests += 1
+    try:
+        async with client.stream("POST", "/v1/react/stream", json=body) as response:
+            if response.status_code != 200:
+                stats.dropped += 1
+                return
+            async for line in response.aiter_lines():
+                if not line.startswith("event: "):
+                    continue
+                events += 1
+                stats.events += 1
+                event = line.removeprefix("event: ")
+                if event == "llm_start":
+                    stats.ttfts.append(time.perf_counter() - start)
+                if event == "llm_end":
+                    stats.completed += 1
+                    return
+                if hang_up_after is not None and events >= hang_up_after:
+                    stats.hung_up += 1
+                    return
+        # The server closed the stream before the answer was finished.
+        stats.dropped += 1
+    except httpx.HTTPError:
+        stats.dropped += 1
+
+
+async def run_user(client: httpx.AsyncClient, user: int, deadline: float, args, stats: SSELoadStats):
+    rng = random.Random(args.seed * 100_003 + user)
+    await asyncio.sleep(args.ramp_up * user / max(args.users, 1))
+    while True:
+        await asyncio.sleep(rng.expovariate(1 / args.think_time) if args.think_time > 0 else 0)
+        if time.perf_counter() >= deadline:
+            return
+        await stream_once(client, user, rng, args, stats)
+
+
+async def scrape_server(client: httpx.AsyncClient, stats: SSELoadStats, stop: asyncio.Event):
+    while not stop.is_set():
+        try:
+            text = (await client.get("/metrics")).text
+            if match := re.search(r"^process_resident_memory_bytes (\S+)$", text, re.MULTILINE):
+                stats.rss_samples.append(float(match.group(1)))
+            if match := re.search(r'^ai_librarian_active_streams\{endpoint="stream"\} (\S+)$', text, re.MULTILINE):
+                stats.max_active_streams = max(stats.max_active_streams, float(match.group(1)))
+        except httpx.HTTPError:
+            pass
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=1)
+        except TimeoutError:
+            pass
+
+
+async def wait_for_server(url: str, max_wait: float = 60):
+    deadline = time.perf_counter() + max_wait
+    async with httpx.AsyncClient(base_url=url) as client:
+        while time.perf_counter() < deadline:
+            try:
+                if (await client.get("/")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.5)
+    raise TimeoutError(f"Server at {url} did not come up within {max_wait:.0f}s.")
+
+
+def print_report(stats: SSELoadStats, elapsed: float, args):
+    mib = 1024 * 1024
+    print(f"== {args.users} users for {elapsed:.1f}s, think time {args.think_time}s")
+    print(f"streams:        {stats.requests} started, {stats.completed} completed, {stats.hung_up} hung up by client")
+    print(f"dropped:        {stats.dropped} ({stats.dropped / max(stats.requests, 1):.1%})")
+    print(f"events:         {stats.events} ({stats.events / elapsed:.0f}/s)")
+    print(
+        f"ttft:           p50={percentile(stats.ttfts, 50) * 1000:.0f}ms "
+        f"p90={percentile(stats.ttfts, 90) * 1000:.0f}ms p99={percentile(stats.ttfts, 99) * 1000:.0f}ms"
+    )
+    if stats.rss_samples:
+        print(
+            f"server rss:     start={stats.rss_samples[0] / mib:.0f}MiB peak={max(stats.rss_samples) / mib:.0f}MiB "
+            f"end={stats.rss_samples[-1] / mib:.0f}MiB"
+        )
+    print(f"open streams:   peak={stats.max_active_streams:.0f}")
+
+
+async def run(args: argparse.Namespace):
+    await wait_for_server(args.url)
+    stats = SSELoadStats()
+    limits = httpx.Limits(max_connections=args.users + 1, max_keepalive_connections=args.users + 1)
+    timeout = httpx.Timeout(args.timeout, connect=30)
+    async with (
+        httpx.AsyncClient(base_url=args.url, limits=limits, timeout=timeout) as client,
+        httpx.AsyncClient(base_url=args.url) as metrics_client,
+    ):
+        stop = asyncio.Event()
+        scraper = asyncio.create_task(scrape_server(metrics_client, stats, stop))
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(*(run_user(client, user, deadline, args, stats) for user in range(args.users)))
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await scraper
+    print_report(stats, elapsed, args)
+
+
+def main():
+    args = parse_args()
+    server = None
+    if args.spawn_server:
+        port = httpx.URL(args.url).port or 80
+        server = subprocess.Popen(
+            [sys.executable, str(Path(__file__).with_name("fake_server.py")), "--port", str(port)]
+        )
+    try:
+        asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
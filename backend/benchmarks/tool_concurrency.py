@@ -0,0 +1,60 @@
+"""Measures the wall time of one multi-tool turn against the sequential baseline.
+
+Runs the `tools` step of `AsyncReactAgent` on an `AIMessage` that requests several tool calls at once,
+using stub tools that sleep for a fixed latency, so no network access or API key is needed.
+
+Usage:
+    uv run python benchmarks/tool_concurrency.py
+"""
+
+import asyncio
+import time
+
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
+from ai_librarian_core.agents.react.state import MessagesState
+from ai_librarian_core.testing.stub_tools import StubTool
+from ai_librarian_core.tools.concurrency import ToolConcurrencyLimiter
+from langchain_core.messages import AIMessage
+
+TOOL_LATENCIES = {
+    "ncl_search": 1.5,
+    "google_books": 0.4,
+    "wikipedia": 0.3,
+    "arxiv": 0.6,
+    "duckduckgo_results_json": 0.5,
+}
+
+
+def build_state(calls_per_tool: int) -> MessagesState:
+    tool_calls = [
+        {"name": name, "args": {"query": "Python"}, "id": f"call-{name}-{i}", "type": "tool_call"}
+        for name in TOOL_LATENCIES
+        for i in range(calls_per_tool)
+    ]
+    return MessagesState(messages=[AIMessage(content="", tool_calls=tool_calls)])
+
+
+async def measure(limiter: ToolConcurrencyLimiter, calls_per_tool: int) -> float:
+    tools = [StubTool(name=name, latency=latency) for name, latency in TOOL_LATENCIES.items()]
+    agent = AsyncReactAgent(tools=tools, tool_limiter=limiter)
+    state = build_state(calls_per_tool)
+
+    start = time.perf_counter()
+    result = await agent._execute_tools(state, config={})
+    elapsed = time.perf_counter() - start
+    assert len(result["messages"]) == len(state.messages[-1].tool_calls)
+    return elapsed
+
+
+async def main():
+    for calls_per_tool in (1, 2):
+        sequential = await measure(ToolConcurrencyLimiter(max_concurrency=1, per_tool_limits={}), calls_per_tool)
+        concurrent = await measure(ToolConcurrencyLimiter(), calls_per_tool)
+        print(
+            f"{len(TOOL_LATENCIES) * calls_per_tool} tool calls: "
+            f"sequential={sequential:.2f}s concurrent={concurrent:.2f}s speedup={sequential / concurrent:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
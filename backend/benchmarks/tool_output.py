@@ -0,0 +1,137 @@
+"""Measures how many tokens and checkpoint bytes the compact tool records save over the former prose outputs.
+
+Synthetic Google Books volumes, with descriptions as long as the API returns, and NCL books are rendered the way
+`GoogleBooksAPIWrapper._format` and `NCLSearch.run` used to and by `RecordRenderer`. Every tool output is sent
+again on each later hop of the ReAct loop, so the tokens are also reported over `--hops` hops. The checkpoint size
+is measured by running `AsyncReactAgent` with a scripted chat model and tools returning either output.
+
+Usage:
+    uv run python benchmarks/tool_output.py --hops 4 --conversations 20
+"""
+
+import argparse
+import asyncio
+import random
+
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
+from ai_librarian_core.catalog.records import records_from_google_books, records_from_ncl
+from ai_librarian_core.catalog.rendering import RecordRenderer, estimate_tokens
+from ai_librarian_core.observability.metrics import checkpointer_size_bytes
+from ai_librarian_core.testing.fake_chat_model import ScriptedChatModel
+from ai_librarian_core.testing.stub_tools import StubTool
+from langchain_core.messages import HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+SENTENCE = (
+    "This book offers a comprehensive introduction to the theory and practice of the field, with worked examples, "
+    "exercises and case studies drawn from research and industry. "
+)
+CHINESE_SENTENCE = "本書深入淺出地介紹此領域的理論與實務，並提供大量範例、習題與來自研究及產業的案例分析。"
+
+
+class FixedOutputTool(StubTool):
+    """A stub tool returning `output` instead of a generated payload."""
+
+    output: str = ""
+
+    def _output(self, query: str) -> str:
+        return self.output
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--books", type=int, default=10, help="Books returned per tool call.")
+    parser.add_argument("--hops", type=int, default=4, help="Chat model calls after the tool call in one turn.")
+    parser.add_argument("--conversations", type=int, default=20, help="Threads run to measure checkpoint size.")
+    parser.add_argument("--max-description-tokens", type=int, default=40, help="Description tokens kept per book.")
+    return parser.parse_args()
+
+
+def make_volumes(count: int, rng: random.Random) -> list[dict]:
+    volumes = []
+    for i in range(count):
+        chinese = i % 2
+        description = (CHINESE_SENTENCE if chinese else SENTENCE) * rng.randint(3, 8)
+        volumes.append(
+            {
+                "volumeInfo": {
+                    "title": f"機器學習實務 第{i}版" if chinese else f"Machine Learning in Practice, Edition {i}",
+                    "authors": ["王小明", "林美華"] if chinese else ["Jane Smith", "John Doe"],
+                    "publishedDate": f"{2000 + i}-05-01",
+                    "industryIdentifiers": [{"type": "ISBN_13", "identifier": f"978{i:010d}"}],
+                    "description": description,
+                    "infoLink": f"https://books.google.com/books?id=volume{i}&dq=machine+learning&hl=&source=gbs_api",
+                }
+            }
+        )
+    return volumes
+
+
+def make_ncl_books(count: int) -> list[dict[str, str]]:
+    return [
+        {
+            "title": f"機器學習實務 = Machine learning in practice / 王小明著 第{i}版",
+            "author": "王小明",
+            "link": f"https://aleweb.ncl.edu.tw/F/ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-{i:05d}?func=full-set-set&set_entry=0",
+        }
+        for i in range(count)
+    ]
+
+
+def prose_google_books(query: str, volumes: list[dict]) -> str:
+    """The output of the former `GoogleBooksAPIWrapper._format`."""
+    results = [f"Here are {len(volumes)} suggestions for books related to {query}:"]
+    for i, volume in enumerate(volumes):
+        info = volume["volumeInfo"]
+        authors = info["authors"]
+        authors = authors[0] if len(authors) == 1 else "{} and {}".format(", ".join(authors[:-1]), authors[-1])
+        results.append(f'{i + 1}. "{info["title"]}" by {authors}: {info["description"]}\n')
+        results[-1] += f"You can read more at {info['infoLink']}"
+    return "\n\n".join(results)
+
+
+def prose_ncl(books: list[dict[str, str]]) -> str:
+    """The output of the former `NCLSearch.run`."""
+    return "\n".join(f"{i + 1}. {book['title']} ({book['author']}) - {book['link']}" for i, book in enumerate(books))
+
+
+async def checkpoint_bytes(outputs: dict[str, str], conversations: int) -> float:
+    tools = [FixedOutputTool(name=name, latency=0, output=output) for name, output in outputs.items()]
+    llm = ScriptedChatModel(
+        tool_names=list(outputs), tool_rounds=1, time_to_first_token=0, tokens_per_second=None, response_tokens=50
+    )
+    checkpointer = InMemorySaver()
+    agent = AsyncReactAgent(tools=tools, checkpointer=checkpointer, chat_model_factory=lambda llm_config: llm)
+    for i in range(conversations):
+        await agent.run([HumanMessage(content=f"Books about machine learning {i}")], f"thread-{i}")
+    return checkpointer_size_bytes(checkpointer) / conversations
+
+
+async def main():
+    args = parse_args()
+    query = "machine learning"
+    volumes = make_volumes(args.books, random.Random(0))
+    books = make_ncl_books(args.books)
+    renderer = RecordRenderer(max_description_tokens=args.max_description_tokens)
+    outputs = {
+        "prose": {"google_books": prose_google_books(query, volumes), "ncl_search": prose_ncl(books)},
+        "records": {
+            "google_books": renderer.render("google_books", records_from_google_books(volumes)),
+            "ncl_search": renderer.render("ncl_search", records_from_ncl(books)),
+        },
+    }
+
+    print(f"== {args.books} books per call, each output re-sent on {args.hops} hops")
+    for name, tool_outputs in outputs.items():
+        tokens = {tool: estimate_tokens(output) for tool, output in tool_outputs.items()}
+        shown = sum(line[:1].isdigit() for line in tool_outputs["google_books"].splitlines())
+        per_thread = await checkpoint_bytes(tool_outputs, args.conversations)
+        print(
+            f"{name:<8} google_books={tokens['google_books']:>5} tok ({shown} books)  "
+            f"ncl_search={tokens['ncl_search']:>5} tok  "
+            f"per turn={sum(tokens.values()) * args.hops:>6} tok  checkpoint/thr={per_thread / 1024:.1f}KiB"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,109 @@
+"""Measures the checkpoint, memory and event bytes saved by keeping long tool outputs in the blob store.
+
+Threads ask about one of `--topics` topics, the stub `wikipedia` and `duckduckgo_results_json` tools return a page
+of `--page-chars` characters per topic, the way a Wikipedia article or a page of web results would. `AsyncReactAgent`
+is run with a scripted chat model, once keeping the outputs whole and once with a `ToolOutputOffloader`. Reported
+are the checkpoint bytes per thread, the Python heap held by the checkpointer, the bytes of the `tool_output` events
+and, for the offloaded run, the blob store size, where a page fetched by many threads is stored once.
+
+Usage:
+    uv run python benchmarks/tool_output_offload.py --conversations 50 --topics 5 --page-chars 20000
+"""
+
+import argparse
+import asyncio
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
+from ai_librarian_core.blobs.offload import ToolOutputOffloader
+from ai_librarian_core.blobs.store import SQLiteBlobStore
+from ai_librarian_core.models.used_tool import UsedTool
+from ai_librarian_core.observability.metrics import checkpointer_size_bytes
+from ai_librarian_core.testing.fake_chat_model import ScriptedChatModel
+from ai_librarian_core.testing.stub_tools import StubTool
+from langchain_core.messages import HumanMessage, ToolMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+PARAGRAPH = (
+    "The library was founded in the nineteenth century and holds one of the largest collections of rare books, "
+    "manuscripts and maps in the region. Its reading rooms are open to the public, and its catalog has been digitized "
+    "in several stages since the nineteen nineties. "
+)
+
+
+class PageTool(StubTool):
+    """A stub tool returning a long page about the topic of the query."""
+
+    def _output(self, query: str) -> str:
+        header = f"Page: {query}\nSummary: "
+        return (header + PARAGRAPH * (self.output_size // len(PARAGRAPH) + 1))[: self.output_size]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--conversations", type=int, default=50, help="Threads run, one question each.")
+    parser.add_argument("--topics", type=int, default=5, help="Distinct topics, threads on a topic get the same pages.")
+    parser.add_argument("--page-chars", type=int, default=20000, help="Characters of each tool output.")
+    parser.add_argument("--max-inline-chars", type=int, default=4000, help="Outputs above this length are offloaded.")
+    parser.add_argument("--preview-chars", type=int, default=2000, help="Characters of an offloaded output kept.")
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace, offloader: ToolOutputOffloader | None) -> dict[str, float]:
+    tools = [
+        PageTool(name=name, latency=0, output_size=args.page_chars) for name in ("wikipedia", "duckduckgo_results_json")
+    ]
+    llm = ScriptedChatModel(
+        tool_names=[tool.name for tool in tools],
+        tool_rounds=1,
+        time_to_first_token=0,
+        tokens_per_second=None,
+        response_tokens=50,
+    )
+    checkpointer = InMemorySaver()
+    agent = AsyncReactAgent(
+        tools=tools,
+        checkpointer=checkpointer,
+        chat_model_factory=lambda llm_config: llm,
+        tool_output_offloader=offloader,
+    )
+    event_bytes = 0
+    tracemalloc.start()
+    for i in range(args.conversations):
+        stream = await agent.stream([HumanMessage(content=f"Topic {i % args.topics}")], f"thread-{i}")
+        async for message, _ in stream:
+            if isinstance(message, ToolMessage):
+                event_bytes += len(UsedTool.from_message(message).model_dump_json(exclude_none=True).encode())
+    heap, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "checkpoint": checkpointer_size_bytes(checkpointer) / args.conversations,
+        "heap": heap,
+        "events": event_bytes / args.conversations,
+        "blobs": offloader.store.size_bytes() if offloader else 0,
+    }
+
+
+async def main():
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        store = SQLiteBlobStore(str(Path(directory) / "blobs.sqlite"))
+        offloader = ToolOutputOffloader(
+            store=store, max_inline_chars=args.max_inline_chars, preview_chars=args.preview_chars
+        )
+        results = {"inline": await run(args, None), "offloaded": await run(args, offloader)}
+
+    raw = args.conversations * 2 * args.page_chars
+    print(f"== {args.conversations} threads on {args.topics} topics, 2 tool outputs of {args.page_chars} chars each")
+    for name, result in results.items():
+        print(
+            f"{name:<9} checkpoint/thr={result['checkpoint'] / 1024:>7.1f}KiB  heap={result['heap'] / 2**20:>6.2f}MiB  "
+            f"tool_output events/thr={result['events'] / 1024:>6.1f}KiB  blob store={result['blobs'] / 1024:.1f}KiB"
+        )
+    print(f"outputs fetched={raw / 1024:.0f}KiB, stored once per distinct page and compressed")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+"""Measures how much prompt the per-question tool selection saves, how often it keeps the right tool and what it costs.
+
+The built-in tools are created with placeholder credentials so all of them are indexed. For every labelled question
+the selected tools are compared with the tool a librarian would call, and the tool schemas bound to the chat model
+are sized in tokens (about four characters each, the way they are sent in an OpenAI request). Binding is timed for
+the first chat model, a new tool subset and a subset found in the agent's (config, tool subset) cache.
+
+Usage:
+    uv run python benchmarks/tool_selection.py --top-k 3
+"""
+
+import argparse
+import json
+import os
+import time
+
+for name in ("GOOGLE_API_KEY", "GOOGLE_CSE_ID", "OPENWEATHERMAP_API_KEY", "OPENAI_API_KEY"):
+    os.environ.setdefault(name, "unused")
+
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent  # noqa: E402
+from ai_librarian_core.models.llm_config import LLMConfig  # noqa: E402
+from ai_librarian_core.tools.selection import ToolSelector  # noqa: E402
+from ai_librarian_core.tools.tools import get_built_in_tools  # noqa: E402
+from langchain_core.messages import HumanMessage  # noqa: E402
+from langchain_core.utils.function_calling import convert_to_openai_tool  # noqa: E402
+from report import percentile  # noqa: E402
+
+QUESTIONS = [
+    ("Do you have books by Haruki Murakami?", "ncl_search"),
+    ("Find a book about the history of Taiwan", "ncl_search"),
+    ("圖書館有村上春樹的小說嗎", "ncl_search"),
+    ("Who published the first edition of The Hobbit?", "google_books"),
+    ("Is it going to rain tomorrow in Taipei?", "open_weather_map"),
+    ("今天台北天氣如何", "open_weather_map"),
+    ("recent papers on graph neural networks", "arxiv"),
+    ("請推薦機器學習的論文", "arxiv"),
+    ("Who was Sun Yat-sen?", "wikipedia"),
+    ("youtube videos about learning python", "youtube_search"),
+    ("what is the latest news about the election", "duckduckgo_results_json"),
+    ("What time is it?", "date_time"),
+    ("What day of the week is it today?", "date_time"),
+    ("hi", None),
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top-k", type=int, default=3, help="Number of best matching tools bound.")
+    parser.add_argument("--repeat", type=int, default=1000, help="Selections timed per question.")
+    return parser.parse_args()
+
+
+def schema_tokens(tools) -> int:
+    return sum(len(json.dumps(convert_to_openai_tool(tool))) for tool in tools) // 4
+
+
+def main():
+    args = parse_args()
+    tools = get_built_in_tools()
+    selector = ToolSelector(top_k=args.top_k)
+    all_tokens = schema_tokens(tools)
+
+    print(f"== {len(tools)} tools, {all_tokens} schema tokens when all are bound, top_k={args.top_k}")
+    selected_tokens = []
+    select_seconds = []
+    found = labelled = 0
+    for question, expected in QUESTIONS:
+        selected = selector.select(tools, question)
+        names = [tool.name for tool in selected]
+        tokens = schema_tokens(selected)
+        selected_tokens.append(tokens)
+        if expected is not None:
+            labelled += 1
+            found += expected in names
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            selector.select(tools, question)
+        select_seconds.append((time.perf_counter() - start) / args.repeat)
+        mark = "-" if expected is None else ("ok" if expected in names else "MISS")
+        print(f"{mark:>4} {tokens:>4} tok  {question[:45]:<45} {', '.join(names)}")
+
+    mean_tokens = sum(selected_tokens) / len(selected_tokens)
+    print(f"recall:         {found}/{labelled} questions kept the expected tool")
+    print(
+        f"schema tokens:  {mean_tokens:.0f} per call on average vs {all_tokens} "
+        f"({1 - mean_tokens / all_tokens:.0%} saved on every hop)"
+    )
+    print(
+        f"select:         p50={percentile(select_seconds, 50) * 1e6:.0f}us "
+        f"p99={percentile(select_seconds, 99) * 1e6:.0f}us"
+    )
+
+    agent = AsyncReactAgent(tools=tools, tool_selector=selector)
+    llm_config = LLMConfig()
+    timings = []
+    for question, _ in (QUESTIONS[0], QUESTIONS[4], QUESTIONS[4]):
+        subset = agent._select_tools([HumanMessage(content=question)])
+        start = time.perf_counter()
+        agent._init_llm(llm_config, subset)
+        timings.append(time.perf_counter() - start)
+    print(
+        f"bind:           first model {timings[0] * 1000:.1f}ms, new subset {timings[1] * 1000:.1f}ms, "
+        f"cached subset {timings[2] * 1e6:.0f}us"
+    )
+
+
+if __name__ == "__main__":
+    main()
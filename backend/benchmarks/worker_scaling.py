@@ -0,0 +1,118 @@
+"""Measures how the API's throughput scales with its worker processes on the fake-model harness.
+
+For every worker count, `fake_server.py` is started with that many workers and `--concurrency` clients stream
+questions back to back for `--duration` seconds. The fake model streams unthrottled by default, so a worker is bound
+by its CPU, routing, the agent graph and SSE serialization, and the speedup shows how well the workers use the
+cores. Scaling stops at the number of cores, which is printed along with the results.
+
+Usage:
+    uv run python benchmarks/worker_scaling.py --workers 1,2,4 --concurrency 64 --duration 20
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+from report import percentile
+from sse_load import wait_for_server
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts to measure.")
+    parser.add_argument("--concurrency", type=int, default=64, help="Clients streaming at the same time.")
+    parser.add_argument("--duration", type=float, default=20, help="Seconds of load per worker count.")
+    parser.add_argument("--warm-up", type=float, default=3, help="Seconds of load before measuring.")
+    parser.add_argument("--port", type=int, default=8766, help="Port of the spawned servers.")
+    parser.add_argument("--tokens-per-second", type=float, default=0, help="Streaming rate, 0 for unthrottled.")
+    parser.add_argument("--ttft", type=float, default=0, help="Seconds before the fake model's first chunk.")
+    parser.add_argument("--tools", default="ncl_search,wikipedia", help="Comma-separated tools called per turn.")
+    parser.add_argument("--tool-latency-scale", type=float, default=0, help="Multiplier for the stub latencies.")
+    return parser.parse_args()
+
+
+async def stream_once(client: httpx.AsyncClient, index: int) -> bool:
+    body = {"thread_id": f"scaling-{index}", "messages": [{"role": "user", "content": f"books about topic {index}"}]}
+    async with client.stream("POST", "/v1/react/stream", json=body) as response:
+        if response.status_code != 200:
+            return False
+        async for line in response.aiter_lines():
+            if line == "event: llm_end":
+                return True
+    return False
+
+
+async def load(url: str, concurrency: int, warm_up: float, duration: float) -> tuple[int, int, list[float]]:
+    """Streams from `concurrency` clients, returns the completed and failed streams and latencies after warm-up."""
+    completed = failed = 0
+    latencies: list[float] = []
+    measure_from = time.perf_counter() + warm_up
+    deadline = measure_from + duration
+    counter = iter(range(sys.maxsize))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async def client_loop(client: httpx.AsyncClient):
+        nonlocal completed, failed
+        while (start := time.perf_counter()) < deadline:
+            try:
+                ok = await stream_once(client, next(counter))
+            except httpx.HTTPError:
+                ok = False
+            if start < measure_from:
+                continue
+            if ok:
+                completed += 1
+                latencies.append(time.perf_counter() - start)
+            else:
+                failed += 1
+
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=httpx.Timeout(60, connect=30)) as client:
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+    return completed, failed, latencies
+
+
+def measure(args: argparse.Namespace, workers: int) -> float:
+    url = f"http://127.0.0.1:{args.port}"
+    command = [
+        sys.executable,
+        str(Path(__file__).with_name("fake_server.py")),
+        f"--port={args.port}",
+        f"--workers={workers}",
+        f"--tokens-per-second={args.tokens_per_second}",
+        f"--ttft={args.ttft}",
+        f"--tools={args.tools}",
+        f"--tool-latency-scale={args.tool_latency_scale}",
+    ]
+    server = subprocess.Popen(command)
+    try:
+        asyncio.run(wait_for_server(url))
+        completed, failed, latencies = asyncio.run(load(url, args.concurrency, args.warm_up, args.duration))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+    throughput = completed / args.duration
+    print(
+        f"workers={workers:<3} {throughput:8.1f} req/s  {failed} failed  latency "
+        f"p50={percentile(latencies, 50) * 1000:.0f}ms p99={percentile(latencies, 99) * 1000:.0f}ms"
+    )
+    return throughput
+
+
+def main():
+    args = parse_args()
+    counts = [int(count) for count in args.workers.split(",")]
+    print(f"== {args.concurrency} clients, {args.duration:.0f}s per worker count, {os.cpu_count()} cores")
+    results = {workers: measure(args, workers) for workers in counts}
+    baseline = results[counts[0]] / counts[0]
+    for workers, throughput in results.items():
+        speedup = throughput / baseline
+        print(f"workers={workers:<3} speedup {speedup:.2f}x, {speedup / workers:.0%} of linear")
+
+
+if __name__ == "__main__":
+    main()